@@ -0,0 +1,166 @@
+"""
+EBL Engine - Archive and Stream Sources
+EBL files read straight from zip/tar archives or from a framed stdin stream
+
+Nothing is extracted to disk. A Member is a name plus a way to read its bytes.
+Archive members are read on demand, and the batch runner sends those bytes to
+a worker through its pipe. Stdin members arrive with their bytes already
+loaded.
+
+Two stdin framings are understood, told apart by the first byte:
+- NDJSON: one {"path": "...", "text": "..."} object per line ("name" also
+  accepted, as in the validation service)
+- Length-prefixed: a header line "<byte length> <path>", then exactly that
+  many bytes of UTF-8 text, repeated
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
+
+from vertical_sniffer import SNIFF_BYTES
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: str) -> bool:
+    return path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+@dataclass
+class Member:
+    """One EBL file inside an archive or stream"""
+    path: str
+    size: int
+    opener: Optional[Callable[[], BinaryIO]] = None
+    data: Optional[bytes] = None
+    signature: Optional[Tuple[int, int]] = None  # Change detector for the result cache
+
+    def read(self) -> bytes:
+        if self.data is not None:
+            return self.data
+        with self.opener() as f:
+            return f.read()
+
+    def head(self, size: int = SNIFF_BYTES) -> bytes:
+        if self.data is not None:
+            return self.data[:size]
+        with self.opener() as f:
+            return f.read(size)
+
+    def load(self):
+        """Keep the bytes in memory (for sources that cannot be re-read cheaply)"""
+        self.data = self.read()
+
+
+class Archive:
+    """Members of a zip or tar archive whose names end in suffix"""
+
+    def __init__(self, path: str, suffix: str = '.ebl'):
+        self.path = path
+        self.members: List[Member] = []
+        if zipfile.is_zipfile(path):
+            self._handle = zipfile.ZipFile(path)
+            # Random access is cheap in a zip, so members can go largest first
+            self.sequential = False
+            for info in self._handle.infolist():
+                if not info.is_dir() and info.filename.endswith(suffix):
+                    self.members.append(Member(info.filename, info.file_size,
+                                               opener=lambda info=info: self._handle.open(info),
+                                               signature=(info.CRC, info.file_size)))
+        else:
+            self._handle = tarfile.open(path)
+            # Seeking backwards in a compressed tar means decompressing from the
+            # start again, so compressed tars are read in archive order
+            self.sequential = isinstance(self._handle.fileobj, (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile))
+            for info in self._handle.getmembers():
+                if info.isfile() and info.name.endswith(suffix):
+                    self.members.append(Member(info.name, info.size,
+                                               opener=lambda info=info: self._handle.extractfile(info),
+                                               signature=(int(info.mtime), info.size)))
+
+    def close(self):
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_ndjson(stream: BinaryIO) -> Iterator[Member]:
+    """Members from NDJSON lines of {"path": ..., "text": ...}"""
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            path = record.get('path') or record.get('name') or f"stdin{number}"
+            data = record['text'].encode('utf-8')
+        except (ValueError, KeyError, AttributeError) as e:
+            raise ValueError(f"Invalid NDJSON record on line {number}: {e}") from None
+        yield Member(path, len(data), data=data)
+
+
+def read_length_prefixed(stream: BinaryIO) -> Iterator[Member]:
+    """Members from "<length> <path>\\n" headers each followed by length bytes"""
+    while True:
+        header = stream.readline()
+        if not header:
+            return
+        if not header.strip():
+            continue
+        length, _, path = header.decode('utf-8').strip().partition(' ')
+        try:
+            size = int(length)
+        except ValueError:
+            raise ValueError(f"Invalid length-prefixed header: {header[:80]!r}") from None
+        data = stream.read(size)
+        if len(data) != size:
+            raise ValueError(f"Stream ended inside {path or 'unnamed member'}: "
+                             f"expected {size} bytes, got {len(data)}")
+        yield Member(path or f"stdin{size}", size, data=data)
+
+
+def read_stream_members(stream: BinaryIO) -> Iterator[Member]:
+    """NDJSON or length-prefixed members, detected from the first non-blank byte"""
+    first = b''
+    while True:
+        first = stream.read(1)
+        if not first or not first.isspace():
+            break
+    if not first:
+        return iter(())
+    rest = _Prepended(first, stream)
+    return read_ndjson(rest) if first == b'{' else read_length_prefixed(rest)
+
+
+class _Prepended:
+    """A binary stream with some already-read bytes put back in front"""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self.prefix = prefix
+        self.stream = stream
+
+    def readline(self) -> bytes:
+        prefix, self.prefix = self.prefix, b''
+        if prefix.endswith(b'\n'):
+            return prefix
+        return prefix + self.stream.readline()
+
+    def read(self, size: int) -> bytes:
+        prefix, self.prefix = self.prefix[:size], self.prefix[size:]
+        return prefix + self.stream.read(size - len(prefix)) if size > len(prefix) else prefix
+
+    def __iter__(self):
+        while True:
+            line = self.readline()
+            if not line:
+                return
+            yield line
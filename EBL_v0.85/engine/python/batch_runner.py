@@ -0,0 +1,515 @@
+"""
+EBL Engine - Batch Runner
+Validates many EBL files on a pool of worker processes, largest work first
+
+Files are dispatched in order of estimated cost, most expensive first, so
+the giant files start early instead of leaving one worker parsing a straggler
+at the end of the run. The estimate comes from the file's last recorded
+validation time (scaled by its size change) in the result cache, or from its
+size at the cache's median seconds-per-byte.
+
+With a per-file budget, a worker still busy with one file when the budget runs
+out is killed, the file is reported as timed out and a fresh worker takes its
+place. The result cache also skips files whose content and dictionary have not
+changed since the last run.
+
+Zip and tar archives are validated in place. Their members are read when
+dispatched and sent to the worker through its pipe, with no temp files. "-"
+reads NDJSON or length-prefixed members from stdin, validated as they
+arrive. Results carry the member path (see archive_sources.py).
+
+With --coverage, workers also count the dictionary names each file uses and
+the parent merges the counts into a ranked report and a CSV (see
+dictionary_coverage.py).
+
+Usage:
+    python batch_runner.py [--workers N] [--budget SECONDS] [--cache FILE] [--no-cache]
+                           [--vertical NAME] [--shared-dictionaries] [--coverage CSV] [--json]
+                           <file_dir_archive_or_-> [...]
+"""
+
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from archive_sources import Archive, Member, is_archive, read_stream_members
+from parse_limits import InputLimitError
+from vertical_engine import STREAM_THRESHOLD_BYTES, ParserNotGeneratedError, VerticalEngine, VerticalReport
+
+DEFAULT_CACHE = '.ebl-batch-cache.json'
+DEFAULT_SECONDS_PER_BYTE = 1e-5
+
+
+def file_signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def collect_files(targets: Iterable[str], suffix: str = '.ebl') -> List[str]:
+    """Files given directly plus every *suffix file below given directories"""
+    files = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            files.extend(str(p) for p in sorted(path.rglob(f'*{suffix}')))
+        else:
+            files.append(str(path))
+    return list(dict.fromkeys(str(Path(f).resolve()) for f in files))
+
+
+class ResultCache:
+    """Per-file results and timings from earlier runs, persisted as JSON"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+    def seconds_per_byte(self) -> float:
+        """Median validation cost per byte over all cached timings"""
+        rates = sorted(e['seconds'] / e['signature'][1] for e in self.entries.values()
+                       if e['seconds'] > 0 and e['signature'][1] > 0)
+        return rates[len(rates) // 2] if rates else DEFAULT_SECONDS_PER_BYTE
+
+    def estimate(self, path: str, size: int, rate: float) -> float:
+        """Expected validation seconds for a file of the given size"""
+        entry = self.entries.get(path)
+        if entry and entry['signature'][1] > 0:
+            return entry['seconds'] * size / entry['signature'][1]
+        return size * rate
+
+    def lookup(self, path: str, signature: Tuple[int, int], vertical: str,
+               dictionary_signature: Tuple[int, int], requires: Iterable[str] = ()) -> Optional[Dict]:
+        """Cached result if neither the file nor its dictionary changed and it has the required keys"""
+        entry = self.entries.get(path)
+        if (entry and tuple(entry['signature']) == signature and entry['vertical'] == vertical
+                and tuple(entry['dictionary']) == dictionary_signature
+                and entry['result'] is not None and all(key in entry['result'] for key in requires)):
+            return entry['result']
+        return None
+
+    def record(self, path: str, signature: Tuple[int, int], vertical: str,
+               dictionary_signature: Tuple[int, int], seconds: float, result: Optional[Dict]):
+        self.entries[path] = {
+            'signature': list(signature),
+            'vertical': vertical,
+            'dictionary': list(dictionary_signature),
+            'seconds': seconds,
+            'result': result,
+        }
+
+
+@dataclass
+class WorkItem:
+    """One file to validate"""
+    path: str
+    vertical: str
+    signature: Tuple[int, int]
+    dictionary_signature: Tuple[int, int]
+    cost: float  # Estimated seconds
+    member: Optional[Member] = None  # Archive/stream member instead of a file on disk
+
+
+@dataclass
+class FileResult:
+    """Outcome of one file"""
+    path: str
+    vertical: Optional[str]
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    cached: bool = False
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.result and self.result.get('valid'))
+
+    def to_dict(self) -> Dict:
+        return {'path': self.path, 'vertical': self.vertical, 'seconds': round(self.seconds, 4),
+                'cached': self.cached, 'timedOut': self.timed_out, 'error': self.error, 'result': self.result}
+
+
+_worker_engine = None
+
+
+def worker_engine() -> VerticalEngine:
+    """The engine of this worker process, created on first use"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = VerticalEngine()
+    return _worker_engine
+
+
+def validate_path(path: str, vertical: str) -> Dict:
+    """Default worker task: full validation of one file, lexed from its memory map"""
+    return worker_engine().validate_file_to_dict(vertical, path)
+
+
+def validate_member(path: str, data: bytes, vertical: str) -> Dict:
+    """Default worker task for archive/stream members: full validation of their bytes"""
+    worker_engine()
+    if len(data) > STREAM_THRESHOLD_BYTES:
+        try:
+            return _worker_engine.validate_stream(
+                vertical, io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')).to_dict()
+        except ParserNotGeneratedError:
+            pass
+        except InputLimitError as e:
+            return VerticalReport(vertical, errors=[e.issue]).to_dict()
+    return _worker_engine.validate_to_dict(vertical, data.decode('utf-8'))
+
+
+def _worker_main(conn: Connection, task: Callable[[str, str], Dict],
+                 member_task: Callable[[str, bytes, str], Dict], segments: Optional[Dict[str, str]]):
+    """Worker process loop: one (path, vertical, data) in, one (result, error, seconds) out"""
+    global _worker_engine
+    if segments:
+        from shared_dictionary import attach_dictionaries
+        _worker_engine = VerticalEngine()
+        attach_dictionaries(_worker_engine, segments)
+    while True:
+        try:
+            item = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if item is None:
+            return
+        path, vertical, data = item
+        started = time.perf_counter()
+        try:
+            result = task(path, vertical) if data is None else member_task(path, data, vertical)
+            conn.send((result, None, time.perf_counter() - started))
+        except Exception as e:
+            conn.send((None, f"{type(e).__name__}: {e}", time.perf_counter() - started))
+
+
+class _Worker:
+    """A worker process and the item it is working on"""
+
+    def __init__(self, context, task: Callable[[str, str], Dict], member_task: Callable[[str, bytes, str], Dict],
+                 segments: Optional[Dict[str, str]] = None):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child, task, member_task, segments), daemon=True)
+        self.process.start()
+        child.close()
+        self.item: Optional[WorkItem] = None
+        self.started = 0.0
+
+    def submit(self, item: WorkItem):
+        self.item = item
+        self.started = time.monotonic()
+        data = item.member.read() if item.member else None
+        if item.member:
+            item.member.data = None  # The worker has the bytes now
+        self.conn.send((item.path, item.vertical, data))
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class BatchRunner:
+    """Validates a set of files, largest estimated cost first"""
+
+    def __init__(self, workers: Optional[int] = None, budget: Optional[float] = None,
+                 cache: Optional[ResultCache] = None, engine: Optional[VerticalEngine] = None,
+                 task: Callable[[str, str], Dict] = validate_path, shared_dictionaries: bool = False,
+                 member_task: Callable[[str, bytes, str], Dict] = validate_member,
+                 requires: Iterable[str] = ()):
+        """
+        Args:
+            workers: Worker processes (default: CPU count)
+            budget: Wall-clock seconds per file before its worker is killed
+            cache: Result cache for timings and unchanged files
+            engine: Engine used to sniff verticals and locate dictionaries
+            task: Function run in the worker for each (path, vertical)
+            shared_dictionaries: Compile the needed dictionaries once into
+                shared memory instead of loading them in every worker
+            member_task: Function run in the worker for each archive/stream
+                member, as (path, data, vertical)
+            requires: Result keys the tasks add (e.g. 'coverage'); cached
+                results without them are run again
+        """
+        self.workers = workers or os.cpu_count() or 2
+        self.budget = budget
+        self.cache = cache or ResultCache()
+        self.engine = engine or VerticalEngine()
+        self.task = task
+        self.member_task = member_task
+        self.requires = tuple(requires)
+        self.shared_dictionaries = shared_dictionaries
+        self._context = multiprocessing.get_context()
+
+    def plan(self, paths: Iterable[str], vertical: Optional[str] = None) -> Tuple[List[WorkItem], List[FileResult]]:
+        """Work items sorted by estimated cost (descending) and results known up front"""
+        rate = self.cache.seconds_per_byte()
+        items, known = [], []
+        for path in paths:
+            try:
+                signature = file_signature(path)
+                file_vertical = vertical or self.engine.detect_vertical(path)
+                dictionary_signature = file_signature(str(self.engine.dictionary_path(file_vertical)))
+            except (OSError, ValueError) as e:
+                known.append(FileResult(path, vertical, error=str(e)))
+                continue
+            cached = self.cache.lookup(path, signature, file_vertical, dictionary_signature, self.requires)
+            if cached is not None:
+                known.append(FileResult(path, file_vertical, result=cached, cached=True))
+                continue
+            cost = self.cache.estimate(path, signature[1], rate)
+            items.append(WorkItem(path, file_vertical, signature, dictionary_signature, cost))
+        items.sort(key=lambda item: item.cost, reverse=True)
+        return items, known
+
+    def _member_item(self, member: Member, vertical: Optional[str], rate: float) -> Tuple[Optional[WorkItem],
+                                                                                           Optional[FileResult]]:
+        try:
+            member_vertical = vertical or self.engine.sniffer.sniff_text(
+                member.head().decode('utf-8', errors='ignore')).vertical
+            if member_vertical is None:
+                raise ValueError(f"Cannot detect the vertical of {member.path}; pass it explicitly")
+            dictionary_signature = file_signature(str(self.engine.dictionary_path(member_vertical)))
+        except (OSError, ValueError) as e:
+            return None, FileResult(member.path, vertical, error=str(e))
+        signature = member.signature or (0, member.size)
+        if member.signature:
+            cached = self.cache.lookup(member.path, signature, member_vertical, dictionary_signature,
+                                       self.requires)
+            if cached is not None:
+                return None, FileResult(member.path, member_vertical, result=cached, cached=True)
+        cost = self.cache.estimate(member.path, member.size, rate)
+        return WorkItem(member.path, member_vertical, signature, dictionary_signature, cost, member), None
+
+    def plan_members(self, members: Iterable[Member],
+                     vertical: Optional[str] = None) -> Tuple[List[WorkItem], List[FileResult]]:
+        """Like plan, for archive members (sniffed from their first bytes)"""
+        rate = self.cache.seconds_per_byte()
+        items, known = [], []
+        for member in members:
+            item, result = self._member_item(member, vertical, rate)
+            if item:
+                items.append(item)
+            else:
+                known.append(result)
+        items.sort(key=lambda item: item.cost, reverse=True)
+        return items, known
+
+    def run(self, paths: Iterable[str], vertical: Optional[str] = None) -> List[FileResult]:
+        """Validate files, returning results in completion order"""
+        items, results = self.plan(paths, vertical)
+        return self._execute(iter(items), results, len(items), {item.vertical for item in items})
+
+    def run_members(self, members: Iterable[Member], vertical: Optional[str] = None,
+                    ordered: bool = True) -> List[FileResult]:
+        """
+        Validate archive or stream members, returning results in completion order
+
+        ordered plans all members up front, largest first. Otherwise members
+        are taken from the iterable only as workers become free, which keeps
+        stdin and compressed tars to one pass and one member per worker in memory.
+        """
+        if ordered:
+            items, results = self.plan_members(members, vertical)
+            return self._execute(iter(items), results, len(items), {item.vertical for item in items})
+
+        results: List[FileResult] = []
+        rate = self.cache.seconds_per_byte()
+
+        def arriving() -> Iterator[WorkItem]:
+            for member in members:
+                member.load()  # Sniffing and sending must not read the source twice
+                item, result = self._member_item(member, vertical, rate)
+                if item:
+                    yield item
+                else:
+                    results.append(result)
+
+        verticals = [vertical] if vertical else self.engine.verticals()
+        return self._execute(arriving(), results, self.workers, verticals)
+
+    def _execute(self, pending: Iterator[WorkItem], results: List[FileResult], count: int,
+                 verticals: Iterable[str]) -> List[FileResult]:
+        """Run work items on the pool; count bounds the number of workers started"""
+        shared = None
+        if self.shared_dictionaries and count:
+            from shared_dictionary import SharedMemoryDictionaries
+            shared = SharedMemoryDictionaries.from_engine(self.engine, sorted(verticals))
+        segments = shared.segments if shared else None
+
+        def new_worker() -> _Worker:
+            return _Worker(self._context, self.task, self.member_task, segments)
+
+        pool: List[_Worker] = [new_worker() for _ in range(min(self.workers, count))]
+        exhausted = False
+
+        def finish(worker: _Worker, result: FileResult, seconds: float):
+            item = worker.item
+            worker.item = None
+            result.seconds = seconds
+            results.append(result)
+            if result.error is None or result.timed_out:
+                # Timeouts are recorded too so the file is scheduled first next time
+                self.cache.record(item.path, item.signature, item.vertical, item.dictionary_signature,
+                                  seconds, result.result)
+
+        try:
+            while True:
+                for worker in pool:
+                    if worker.item is None and not exhausted:
+                        item = next(pending, None)
+                        if item is None:
+                            exhausted = True
+                        else:
+                            worker.submit(item)
+
+                busy = [w for w in pool if w.item]
+                if not busy:
+                    break
+                timeout = None
+                if self.budget is not None:
+                    now = time.monotonic()
+                    timeout = max(0.0, min(w.started + self.budget - now for w in busy))
+
+                ready = wait([w.conn for w in busy], timeout)
+                for i, worker in enumerate(pool):
+                    if worker.item is None:
+                        continue
+                    item = worker.item
+                    if worker.conn in ready:
+                        try:
+                            result, error, seconds = worker.conn.recv()
+                        except (EOFError, OSError):
+                            finish(worker, FileResult(item.path, item.vertical, error="Worker process died"),
+                                   time.monotonic() - worker.started)
+                            worker.kill()
+                            pool[i] = new_worker()
+                            continue
+                        finish(worker, FileResult(item.path, item.vertical, result=result, error=error), seconds)
+                    elif self.budget is not None and time.monotonic() - worker.started >= self.budget:
+                        worker.kill()
+                        finish(worker, FileResult(item.path, item.vertical, timed_out=True,
+                                                  error=f"Exceeded {self.budget:g}s budget; worker killed"),
+                               time.monotonic() - worker.started)
+                        pool[i] = new_worker()
+        finally:
+            for worker in pool:
+                if worker.item:
+                    worker.kill()
+                else:
+                    worker.stop()
+            if shared:
+                shared.close()
+        return results
+
+
+def print_summary(results: List[FileResult], elapsed: float):
+    for r in sorted(results, key=lambda r: r.path):
+        if r.timed_out:
+            print(f"⏱️  {r.path}: {r.error}")
+        elif r.error:
+            print(f"❌ {r.path}: {r.error}")
+        else:
+            errors = len(r.result.get('errors', []))
+            warnings = len(r.result.get('warnings', [])) + len(r.result.get('semanticIssues', []))
+            mark = '✅' if r.ok else '❌'
+            source = 'cached' if r.cached else f"{r.seconds:.2f}s"
+            print(f"{mark} {r.path} [{r.vertical}, {source}]: {errors} errors, {warnings} warnings")
+
+    valid = sum(1 for r in results if r.ok)
+    timed_out = sum(1 for r in results if r.timed_out)
+    cached = sum(1 for r in results if r.cached)
+    print(f"\n📊 {len(results)} files in {elapsed:.2f}s: {valid} valid, {len(results) - valid} with issues, "
+          f"{timed_out} timed out, {cached} from cache")
+
+
+def main(argv: List[str]):
+    usage = ("Usage: python batch_runner.py [--workers N] [--budget SECONDS] [--cache FILE] [--no-cache]\n"
+             "                              [--vertical NAME] [--shared-dictionaries] [--coverage CSV] [--json]\n"
+             "                              <file_dir_archive_or_-> [...]")
+    options = {'--workers': None, '--budget': None, '--cache': DEFAULT_CACHE, '--vertical': None, '--coverage': None}
+    flags = set()
+    targets = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in options:
+            options[arg] = next(args, None)
+        elif arg in ('--no-cache', '--json', '--shared-dictionaries'):
+            flags.add(arg)
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            targets.append(arg)
+    if not targets:
+        print(usage)
+        sys.exit(1)
+
+    cache = ResultCache(None if '--no-cache' in flags else options['--cache'])
+    tasks = {}
+    if options['--coverage']:
+        from dictionary_coverage import coverage_member, coverage_path
+        tasks = {'task': coverage_path, 'member_task': coverage_member, 'requires': ('coverage',)}
+    runner = BatchRunner(
+        workers=int(options['--workers']) if options['--workers'] else None,
+        budget=float(options['--budget']) if options['--budget'] else None,
+        cache=cache,
+        shared_dictionaries='--shared-dictionaries' in flags,
+        **tasks,
+    )
+    vertical = options['--vertical']
+    files = [t for t in targets if t != '-' and not is_archive(t)]
+    started = time.perf_counter()
+    results = runner.run(collect_files(files), vertical) if files else []
+    for target in targets:
+        if target == '-':
+            results.extend(runner.run_members(read_stream_members(sys.stdin.buffer), vertical, ordered=False))
+        elif is_archive(target):
+            with Archive(target) as archive:
+                results.extend(runner.run_members(archive.members, vertical, ordered=not archive.sequential))
+    cache.save()
+
+    if '--json' in flags:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        print_summary(results, time.perf_counter() - started)
+    if options['--coverage']:
+        from dictionary_coverage import merge_results, report_coverage
+        report_coverage(runner.engine, merge_results(results), csv_path=options['--coverage'],
+                        quiet='--json' in flags)
+    sys.exit(0 if all(r.ok for r in results) else 1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,263 @@
+"""
+EBL Engine - Block Deduplication
+Validates each distinct top-level block once and reuses its result everywhere
+
+Repositories copy the same DataObject and Integration blocks into many files.
+Each top-level block is keyed by (vertical, dictionary version, canonical
+digest of the block), so copies that differ only in indentation or comments
+share one key. The first copy is parsed and walked alone. That walk stores the
+block's local dictionary issues, the names it defines and the cross-file
+references it makes (Entity dataRef, Relationship From/To). Later copies come
+from the store. Per file, only the cross-reference checks run again, in block
+order, together with the semantic rules, which read the whole text.
+
+Stored issue positions are relative to the block's canonical lines. When a
+copy is reused, they are mapped back onto that copy's own lines and
+indentation.
+
+Usage:
+    python block_dedup.py [--vertical NAME] [--store FILE] <file_or_dir> [...]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from antlr4 import ParseTreeWalker
+
+from canonical_hash import canonical_lines, digest_lines
+from ebl_blocks import Block, split_blocks
+from vertical_engine import VerticalEngine, VerticalReport, outside_block_issue
+from vertical_validator import ValidationIssue, VerticalDictionaryValidator
+
+# (index into the block's canonical lines, lines past that line,
+#  column: >= 0 past the indentation, < 0 absolute as -1 - column, or None)
+Position = Tuple[int, int, Optional[int]]
+
+
+@dataclass
+class BlockResult:
+    """Dictionary outcome of one distinct block, independent of where it sits"""
+    errors: List[Dict] = field(default_factory=list)    # asdict(ValidationIssue) + 'at': Position
+    warnings: List[Dict] = field(default_factory=list)
+    defines: Dict[str, List[str]] = field(default_factory=dict)  # 'dataObject'/'entity'/'itAsset' -> names
+    data_refs: List[List] = field(default_factory=list)  # [entity, dataRef, Position]
+    relationship_ends: List[List] = field(default_factory=list)  # [relationship, 'From'/'To', name, Position]
+
+
+class _BlockLayout:
+    """Maps block-relative positions to and from canonical line indexes"""
+
+    def __init__(self, block: Block):
+        self.raw = block.text.split('\n')
+        lines = canonical_lines(block.text)
+        self.lines = [number for number, _ in lines]
+        self.digest = digest_lines(lines)
+
+    def _indent(self, number: int) -> int:
+        line = self.raw[number - 1] if 0 < number <= len(self.raw) else ''
+        return len(line) - len(line.lstrip())
+
+    def relative(self, line: Optional[int], column: Optional[int]) -> Optional[Position]:
+        if line is None or not self.lines:
+            return None
+        i = max(bisect_right(self.lines, line) - 1, 0)
+        indent = self._indent(self.lines[i])
+        if column is not None:
+            # Past the indentation: relative to it. Inside it (tokens that
+            # include the indentation): absolute, stored as -1 - column.
+            column = column - indent if column >= indent else -1 - column
+        return (i, line - self.lines[i], column)
+
+    def absolute(self, position: Optional[Position], start_line: int) -> Tuple[Optional[int], Optional[int]]:
+        if position is None:
+            return None, None
+        i, past, column = position
+        number = self.lines[min(i, len(self.lines) - 1)]
+        if column is not None:
+            column = column + self._indent(number) if column >= 0 else -1 - column
+        return start_line - 1 + number + past, column
+
+
+class _BlockListener(VerticalDictionaryValidator):
+    """Dictionary listener that records cross-reference checks instead of running them"""
+
+    def reset(self):
+        super().reset()
+        self.data_refs: List[Tuple] = []
+        self.relationship_ends: List[Tuple] = []
+
+    def check_data_ref(self, entity_name, data_ref, line, column):
+        self.data_refs.append((entity_name, data_ref, line, column))
+
+    def check_relationship_end(self, rel_name, end, name, line, column):
+        self.relationship_ends.append((rel_name, end, name, line, column))
+
+
+class BlockStore:
+    """Block results by key, optionally persisted as JSON"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, BlockResult] = {}
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.entries = {k: BlockResult(**v) for k, v in json.load(f).items()}
+            except (OSError, ValueError, TypeError):
+                self.entries = {}
+
+    def get(self, key: str) -> Optional[BlockResult]:
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: BlockResult):
+        self.entries[key] = result
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({k: asdict(v) for k, v in self.entries.items()}, f)
+        os.replace(tmp, self.path)
+
+
+class DedupValidator:
+    """Dictionary and semantic validation with block results shared across files"""
+
+    def __init__(self, engine: Optional[VerticalEngine] = None, store: Optional[BlockStore] = None):
+        self.engine = engine or VerticalEngine()
+        self.store = store or BlockStore()
+        self._versions: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+    def dictionary_version(self, vertical: str) -> str:
+        """Content hash of the vertical's dictionary file, recomputed when the file changes"""
+        path = self.engine.dictionary_path(vertical)
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._versions.get(vertical)
+        if cached is None or cached[0] != signature:
+            with open(path, 'rb') as f:
+                cached = (signature, hashlib.sha256(f.read()).hexdigest()[:16])
+            self._versions[vertical] = cached
+        return cached[1]
+
+    def _validate_block(self, vertical: str, block: Block, layout: _BlockLayout) -> BlockResult:
+        listener = self.engine.dictionary_validator(vertical, listener_class=_BlockListener)
+        parsed = self.engine.parse_block(vertical, Block(block.kind, block.name, 1, block.text))
+        ParseTreeWalker().walk(listener, parsed.tree)
+
+        def stored(issue: ValidationIssue) -> Dict:
+            return {**asdict(issue), 'at': layout.relative(issue.line, issue.column)}
+
+        return BlockResult(
+            errors=[stored(i) for i in parsed.syntax_errors + listener.errors],
+            warnings=[stored(i) for i in listener.warnings],
+            defines={'dataObject': sorted(listener.defined_data_objects),
+                     'entity': sorted(listener.defined_entities),
+                     'itAsset': sorted(listener.defined_it_assets)},
+            data_refs=[[entity, ref, layout.relative(line, column)]
+                       for entity, ref, line, column in listener.data_refs],
+            relationship_ends=[[rel, end, name, layout.relative(line, column)]
+                               for rel, end, name, line, column in listener.relationship_ends],
+        )
+
+    def validate(self, vertical: str, text: str) -> VerticalReport:
+        """Validate EBL text, parsing only blocks not seen before"""
+        version = self.dictionary_version(vertical)
+        validator = self.engine.dictionary_validator(vertical)
+
+        def outside_block(line: int, text: str):
+            validator.errors.append(outside_block_issue(line, text))
+
+        for block in split_blocks(text, outside_block):
+            layout = _BlockLayout(block)
+            key = f"{vertical}:{version}:{layout.digest}"
+            result = self.store.get(key)
+            if result is None:
+                result = self._validate_block(vertical, block, layout)
+                self.store.put(key, result)
+
+            def place(position):
+                return layout.absolute(tuple(position) if position is not None else None, block.start_line)
+
+            for stored, issues in ((result.errors, validator.errors), (result.warnings, validator.warnings)):
+                for issue in stored:
+                    line, column = place(issue['at'])
+                    fields = {k: v for k, v in issue.items() if k != 'at'}
+                    issues.append(ValidationIssue(**{**fields, 'line': line, 'column': column}))
+
+            validator.defined_data_objects.update(result.defines.get('dataObject', ()))
+            validator.defined_entities.update(result.defines.get('entity', ()))
+            validator.defined_it_assets.update(result.defines.get('itAsset', ()))
+            for entity, ref, position in result.data_refs:
+                validator.check_data_ref(entity, ref, *place(position))
+            for rel, end, name, position in result.relationship_ends:
+                validator.check_relationship_end(rel, end, name, *place(position))
+
+        return VerticalReport(
+            vertical=vertical,
+            errors=validator.get_errors(),
+            warnings=validator.get_warnings(),
+            semantic_issues=self.engine.check_semantics(vertical, text),
+        )
+
+    def validate_file(self, vertical: Optional[str], path: str) -> VerticalReport:
+        vertical = vertical or self.engine.detect_vertical(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.validate(vertical, f.read())
+
+
+def main(argv: List[str]):
+    from batch_runner import collect_files
+
+    usage = "Usage: python block_dedup.py [--vertical NAME] [--store FILE] <file_or_dir> [...]"
+    options = {'--vertical': None, '--store': None}
+    targets = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in options:
+            options[arg] = next(args, None)
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            targets.append(arg)
+    if not targets:
+        print(usage)
+        sys.exit(1)
+
+    store = BlockStore(options['--store'])
+    validator = DedupValidator(store=store)
+    ok = True
+    for path in collect_files(targets):
+        try:
+            report = validator.validate_file(options['--vertical'], path)
+        except Exception as e:
+            print(f"❌ {path}: {e}")
+            ok = False
+            continue
+        ok = ok and report.is_valid
+        mark = '✅' if report.is_valid else '❌'
+        print(f"{mark} {path} [{report.vertical}]: {len(report.errors)} errors, "
+              f"{len(report.warnings) + len(report.semantic_issues)} warnings")
+    store.save()
+    total = store.hits + store.misses
+    print(f"\n📊 {total} blocks: {store.misses} validated, {store.hits} reused "
+          f"({store.hits / total:.0%})" if total else "\n📊 No blocks")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
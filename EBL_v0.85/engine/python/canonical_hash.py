@@ -0,0 +1,155 @@
+"""
+EBL Engine - Canonical Hashing
+Content hashes of EBL text that ignore formatting, at file and block level
+
+The vertical's lexer splits the text into logical lines of tokens. The source
+of each line, from its first token to its last, is then normalized: runs of
+whitespace outside string literals collapse to one space, whitespace around
+punctuation (: , { } [ ] ( ) =) is dropped, and trailing // comments are cut.
+Full-line # and // comments are dropped, and NL runs, blank lines and \\r\\n
+become one line break. Re-indenting a Schema or editing header comments
+therefore leaves the hash unchanged, while any change to a name, value or
+string literal changes it.
+
+Verticals without a generated lexer are hashed line by line, which gives the
+same result for lines that no token spans.
+
+Usage:
+    python canonical_hash.py [--blocks] [--vertical NAME] <ebl_file> [...]
+"""
+
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+from ebl_blocks import Block, split_blocks
+
+STRING_LITERAL = re.compile(r'("[^"\r\n]*")')
+WHITESPACE = re.compile(r'\s+')
+PUNCTUATION = re.compile(r'\s*([:,{}\[\]()=])\s*')
+COMMENT_LINE = ('#', '//')
+
+
+def normalize_token(text: str) -> str:
+    """Canonical text of one token (string literals are kept verbatim)"""
+    parts = STRING_LITERAL.split(text)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            out.append(part)
+            continue
+        comment = part.find('//')
+        if comment >= 0:
+            part = part[:comment]
+        out.append(PUNCTUATION.sub(r'\1', WHITESPACE.sub(' ', part)))
+        if comment >= 0:
+            break
+    return ''.join(out).strip()
+
+
+def _token_lines(text: str, lexer_class) -> Iterable[Tuple[int, List[str]]]:
+    """(line, [source from the first to the last token]) per logical line, from the lexer"""
+    lexer = lexer_class(InputStream(text))
+    lexer.removeErrorListeners()
+    nl_type = getattr(lexer_class, 'NL', None)
+    first = last = None
+    while True:
+        token = lexer.nextToken()
+        if token.type == Token.EOF:
+            break
+        if token.channel != Token.DEFAULT_CHANNEL:
+            continue
+        if first and (token.type == nl_type or token.line != last.line):
+            yield first.line, [text[first.start:last.stop + 1]]
+            first = None
+        if token.type == nl_type:
+            continue
+        if first is None:
+            first = token
+        last = token
+    if first:
+        yield first.line, [text[first.start:last.stop + 1]]
+
+
+def canonical_lines(text: str, lexer_class=None) -> List[Tuple[int, str]]:
+    """(1-based source line, canonical text) for every line with content"""
+    if lexer_class is None:
+        raw = ((number, [line]) for number, line in enumerate(text.split('\n'), 1))
+    else:
+        raw = _token_lines(text, lexer_class)
+    lines = []
+    for number, texts in raw:
+        tokens = [t for t in (normalize_token(t) for t in texts) if t]
+        if tokens and not tokens[0].startswith(COMMENT_LINE):
+            lines.append((number, ' '.join(tokens)))
+    return lines
+
+
+def digest_lines(lines: Iterable[Tuple[int, str]]) -> str:
+    h = hashlib.sha256()
+    for _, text in lines:
+        h.update(text.encode('utf-8'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+@dataclass
+class CanonicalHash:
+    """File digest plus one digest per top-level block"""
+    digest: str
+    lines: List[Tuple[int, str]]  # (source line, canonical text)
+    blocks: List[Tuple[Block, str]] = field(default_factory=list)
+
+    def block_digests(self) -> Dict[str, str]:
+        """Block key (e.g. 'DataObject:DO_SARFiling') -> digest"""
+        return {block.key: digest for block, digest in self.blocks}
+
+
+def canonical_hash(text: str, lexer_class=None) -> CanonicalHash:
+    """Canonical digests of EBL text (lexer_class None: hash line by line)"""
+    lines = canonical_lines(text, lexer_class)
+    blocks = []
+    i = 0
+    for block in split_blocks(text):
+        while i < len(lines) and lines[i][0] < block.start_line:
+            i += 1
+        j = i
+        while j < len(lines) and lines[j][0] <= block.end_line:
+            j += 1
+        blocks.append((block, digest_lines(lines[i:j])))
+        i = j
+    return CanonicalHash(digest_lines(lines), lines, blocks)
+
+
+def main(argv: List[str]):
+    from vertical_engine import VerticalEngine
+
+    args = argv[1:]
+    show_blocks = '--blocks' in args
+    vertical = None
+    if '--vertical' in args:
+        i = args.index('--vertical')
+        vertical = args[i + 1] if i + 1 < len(args) else None
+        del args[i:i + 2]
+    paths = [a for a in args if a != '--blocks']
+    if not paths or any(p.startswith('--') for p in paths):
+        print("Usage: python canonical_hash.py [--blocks] [--vertical NAME] <ebl_file> [...]")
+        sys.exit(1)
+
+    engine = VerticalEngine()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            result = engine.canonical_hash(vertical or engine.detect_vertical(path), f.read())
+        print(f"{result.digest}  {path}")
+        if show_blocks:
+            for block, digest in result.blocks:
+                print(f"  {digest[:16]}  {block.key} (line {block.start_line})")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,131 @@
+"""
+EBL Engine - Daemon Client
+Thin client for validation_daemon.py, suitable for editor save hooks and pre-commit
+
+Imports only the standard library (no antlr4, no parsers), so start-up cost is
+the Python interpreter alone.
+
+Usage:
+    python daemon_client.py [--socket PATH] [--vertical NAME] <ebl_file> [<ebl_file> ...]
+    python daemon_client.py [--socket PATH] --status
+    python daemon_client.py [--socket PATH] --shutdown
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Dict, List, Optional
+
+
+def default_socket_path() -> str:
+    """Per-user socket path shared by daemon and client"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'ebl-validator.sock')
+    return f"/tmp/ebl-validator-{os.getuid()}.sock"
+
+
+class DaemonClient:
+    """One connection to a running validation daemon"""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(socket_path or default_socket_path())
+        self._file = self._sock.makefile('rwb')
+
+    def request(self, payload: Dict) -> Dict:
+        self._file.write(json.dumps(payload).encode('utf-8') + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Validation daemon closed the connection")
+        return json.loads(line)
+
+    def validate(self, path: str, vertical: Optional[str] = None) -> Dict:
+        payload = {'cmd': 'validate', 'path': os.path.abspath(path)}
+        if vertical:
+            payload['vertical'] = vertical
+        return self.request(payload)
+
+    def status(self) -> Dict:
+        return self.request({'cmd': 'status'})
+
+    def shutdown(self) -> Dict:
+        return self.request({'cmd': 'shutdown'})
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_result(path: str, result: Dict):
+    """Compact report of one daemon result"""
+    if 'error' in result:
+        print(f"❌ {path}: {result['error']}")
+        return
+
+    issues = [('❌', i) for i in result['errors']] + [('⚠️ ', i) for i in result['warnings']]
+    icons = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+    issues += [(icons[i['severity']], i) for i in result['semanticIssues']]
+
+    status = '✅' if result['valid'] else '❌'
+    cached = ' (cached)' if result.get('cached') else ''
+    print(f"{status} {path} [{result['vertical']}]{cached}")
+    if result.get('parserError'):
+        print(f"   ⚠️  {result['parserError']}")
+    for icon, issue in issues:
+        location = f"line {issue['line']}: " if issue.get('line') else ''
+        print(f"   {icon} [{issue['rule']}] {location}{issue['message']}")
+
+
+def main(argv: List[str]) -> int:
+    socket_path = None
+    vertical = None
+    command = 'validate'
+    paths = []
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == '--socket':
+            socket_path = next(args, None)
+        elif arg == '--vertical':
+            vertical = next(args, None)
+        elif arg in ('--status', '--shutdown'):
+            command = arg[2:]
+        else:
+            paths.append(arg)
+
+    if command == 'validate' and not paths:
+        print("Usage: python daemon_client.py [--socket PATH] [--vertical NAME] <ebl_file> [<ebl_file> ...]")
+        return 1
+
+    try:
+        client = DaemonClient(socket_path)
+    except OSError as e:
+        print(f"❌ Cannot reach validation daemon: {e}")
+        print("   Start it with: python validation_daemon.py <watch_dir>")
+        return 2
+
+    with client:
+        if command != 'validate':
+            print(json.dumps(getattr(client, command)(), indent=2))
+            return 0
+        exit_code = 0
+        for path in paths:
+            result = client.validate(path, vertical)
+            print_result(path, result)
+            if 'error' in result or not result['valid']:
+                exit_code = 1
+        return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
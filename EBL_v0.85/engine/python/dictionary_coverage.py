@@ -0,0 +1,286 @@
+"""
+EBL Engine - Dictionary Coverage
+Which dictionary names a corpus uses, how often and in which files
+
+Usage is counted per actor, verb, (actor, verb) pair, DataObject and
+relationship type (see ebl_usage.py) in Counters keyed by interned IDs:
+names are interned once in canonical form, so 'LoanOfficer' and
+'loan_officer' share a counter, and pairs pack two IDs into one int. A
+Coverage serializes to a compact form (names, files and ID-keyed counts)
+that another Coverage merges by re-interning each name once. Batch workers
+send the compact coverage of each file with its result and the parent merges
+them (batch_runner.py --coverage), so scanning costs one line pass per file
+next to the parse.
+
+The report ranks used names by count and lists the dictionary names nothing
+uses, per vertical; the CSV has one row per name.
+
+Usage:
+    python dictionary_coverage.py [--vertical NAME] [--top N] [--csv FILE] <file_or_dir> [...]
+"""
+
+import csv
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from batch_runner import collect_files, validate_member, validate_path, worker_engine
+from ebl_usage import FileUsage, scan_usage
+from vertical_validator import VerticalDictionary, canonicalize
+
+KINDS = ('actor', 'verb', 'actorVerb', 'dataObject', 'relationshipType')
+KIND_TITLES = {
+    'actor': 'Actors',
+    'verb': 'Verbs',
+    'actorVerb': 'Actor-verb pairs',
+    'dataObject': 'DataObjects',
+    'relationshipType': 'Relationship types',
+}
+
+PAIR_SHIFT = 32
+PAIR_MASK = (1 << PAIR_SHIFT) - 1
+
+
+class Interner:
+    """Canonical name -> dense int ID, keeping the first spelling seen"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def id(self, name: str) -> int:
+        key = canonicalize(name)
+        name_id = self.ids.get(key)
+        if name_id is None:
+            name_id = self.ids[key] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+
+class Coverage:
+    """Usage counters of one vertical's files"""
+
+    def __init__(self):
+        self.names = Interner()
+        self.files: List[str] = []
+        self._file_ids: Dict[str, int] = {}
+        self.counts: Dict[str, Counter] = {kind: Counter() for kind in KINDS}
+        self.where: Dict[str, Dict[int, Set[int]]] = {kind: defaultdict(set) for kind in KINDS}
+
+    def _file_id(self, path: str) -> int:
+        file_id = self._file_ids.get(path)
+        if file_id is None:
+            file_id = self._file_ids[path] = len(self.files)
+            self.files.append(path)
+        return file_id
+
+    def _count(self, kind: str, key: int, file_id: int, n: int = 1):
+        self.counts[kind][key] += n
+        self.where[kind][key].add(file_id)
+
+    def add_usage(self, path: str, usage: FileUsage):
+        """Count the names one file uses"""
+        file_id = self._file_id(path)
+        intern = self.names.id
+        for process in usage.processes:
+            for actor in process.actors:
+                self._count('actor', intern(actor), file_id)
+            for action in process.actions:
+                actor, verb = intern(action.actor), intern(action.verb)
+                self._count('actor', actor, file_id)
+                self._count('verb', verb, file_id)
+                self._count('actorVerb', actor << PAIR_SHIFT | verb, file_id)
+        for name, _ in usage.data_objects:
+            self._count('dataObject', intern(name), file_id)
+        for name, _ in usage.relationship_types:
+            self._count('relationshipType', intern(name), file_id)
+
+    def to_compact(self) -> Dict:
+        """JSON- and pickle-friendly form: names, files and [key, count, file IDs] per kind"""
+        return {
+            'names': self.names.names,
+            'files': self.files,
+            'counts': {kind: [[key, count, sorted(self.where[kind][key])] for key, count in counts.items()]
+                       for kind, counts in self.counts.items() if counts},
+        }
+
+    def merge_compact(self, data: Dict):
+        """Add the counts of another Coverage's compact form"""
+        names = [self.names.id(name) for name in data['names']]
+        files = [self._file_id(path) for path in data['files']]
+        for kind, entries in data['counts'].items():
+            for key, count, file_ids in entries:
+                if kind == 'actorVerb':
+                    key = names[key >> PAIR_SHIFT] << PAIR_SHIFT | names[key & PAIR_MASK]
+                else:
+                    key = names[key]
+                self.counts[kind][key] += count
+                self.where[kind][key].update(files[f] for f in file_ids)
+
+    def merge(self, other: 'Coverage'):
+        self.merge_compact(other.to_compact())
+
+    def name(self, kind: str, key: int) -> str:
+        if kind == 'actorVerb':
+            return f"{self.names.names[key >> PAIR_SHIFT]} {self.names.names[key & PAIR_MASK]}"
+        return self.names.names[key]
+
+
+def file_coverage(path: str, usage: FileUsage) -> Dict:
+    """Compact coverage of one file"""
+    coverage = Coverage()
+    coverage.add_usage(path, usage)
+    return coverage.to_compact()
+
+
+def coverage_path(path: str, vertical: str) -> Dict:
+    """Batch worker task: validate_path plus the file's compact coverage"""
+    result = validate_path(path, vertical)
+    with open(path, 'r', encoding='utf-8') as f:
+        usage = scan_usage(f, worker_engine().rule_pack(vertical).data_object_pattern)
+    return {**result, 'coverage': file_coverage(path, usage)}
+
+
+def coverage_member(path: str, data: bytes, vertical: str) -> Dict:
+    """Batch worker task for archive/stream members: validate_member plus coverage"""
+    result = validate_member(path, data, vertical)
+    usage = scan_usage(data.decode('utf-8').split('\n'), worker_engine().rule_pack(vertical).data_object_pattern)
+    return {**result, 'coverage': file_coverage(path, usage)}
+
+
+@dataclass
+class CoverageRow:
+    """Usage of one name"""
+    kind: str
+    name: str
+    in_dictionary: bool
+    count: int
+    files: List[str]
+
+
+def dictionary_universe(dictionary: VerticalDictionary) -> Dict[str, List[str]]:
+    """Names of each kind the dictionary defines, spelled as in its JSON"""
+    data = dictionary.dict or {}
+    core, domain = data.get('core', {}), data.get('domain', {})
+    verbs = list(dict.fromkeys(dictionary.names('verb') + list(core.get('verbPermissions', {}))))
+    return {
+        'actor': dictionary.names('actor'),
+        'verb': verbs,
+        'actorVerb': [f"{actor} {verb}" for actor, granted in domain.get('actorVerbs', {}).items()
+                      for verb in granted],
+        'dataObject': dictionary.names('dataObject'),
+        'relationshipType': list(core.get('relationshipTypes', [])),
+    }
+
+
+def _canonical(kind: str, name: str) -> Tuple[str, ...]:
+    return tuple(canonicalize(part) for part in name.split(' ')) if kind == 'actorVerb' else (canonicalize(name),)
+
+
+def coverage_rows(coverage: Coverage, dictionary: VerticalDictionary) -> List[CoverageRow]:
+    """Used names ranked by count, then unused dictionary names, for every kind"""
+    universe = dictionary_universe(dictionary)
+    rows = []
+    for kind in KINDS:
+        defined = {_canonical(kind, name): name for name in universe[kind]}
+        used = set()
+        ranked = sorted(coverage.counts[kind].items(), key=lambda item: (-item[1], coverage.name(kind, item[0])))
+        for key, count in ranked:
+            name = coverage.name(kind, key)
+            canonical = _canonical(kind, name)
+            used.add(canonical)
+            files = [coverage.files[f] for f in sorted(coverage.where[kind][key])]
+            rows.append(CoverageRow(kind, defined.get(canonical, name), canonical in defined, count, files))
+        rows.extend(CoverageRow(kind, name, True, 0, []) for canonical, name in defined.items()
+                    if canonical not in used)
+    return rows
+
+
+def print_coverage_report(vertical: str, coverage: Coverage, rows: List[CoverageRow], top: int = 10):
+    """Ranked usage and unused dictionary names of each kind"""
+    print("=" * 80)
+    print(f"{vertical.upper()} DICTIONARY COVERAGE ({len(coverage.files)} files)")
+    print("=" * 80)
+    for kind in KINDS:
+        kind_rows = [r for r in rows if r.kind == kind]
+        defined = [r for r in kind_rows if r.in_dictionary]
+        used = [r for r in defined if r.count]
+        unknown = [r for r in kind_rows if not r.in_dictionary]
+        share = f" ({100 * len(used) / len(defined):.0f}%)" if defined else ''
+        print(f"\n📊 {KIND_TITLES[kind]}: {len(used)} of {len(defined)} dictionary names used{share}, "
+              f"{len(unknown)} used names not in the dictionary")
+        for i, row in enumerate([r for r in kind_rows if r.count][:top], 1):
+            mark = '' if row.in_dictionary else '  ⚠️ not in dictionary'
+            files = f"{len(row.files)} file{'s' if len(row.files) != 1 else ''}"
+            print(f"  {i:>3}. {row.name:<40} {row.count:>6} uses in {files}{mark}")
+        unused = [r.name for r in defined if not r.count]
+        if unused:
+            print(f"  🗑️  Unused ({len(unused)}): {', '.join(unused)}")
+    print("\n" + "=" * 80)
+
+
+def write_csv(path: str, rows_by_vertical: Dict[str, List[CoverageRow]]):
+    """One row per vertical and name: vertical, kind, name, inDictionary, count, files, fileList"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['vertical', 'kind', 'name', 'inDictionary', 'count', 'files', 'fileList'])
+        for vertical, rows in rows_by_vertical.items():
+            for row in rows:
+                writer.writerow([vertical, row.kind, row.name, int(row.in_dictionary), row.count,
+                                 len(row.files), ';'.join(row.files)])
+
+
+def merge_results(results: Iterable) -> Dict[str, Coverage]:
+    """Coverage per vertical from batch FileResults carrying a 'coverage' entry"""
+    coverages: Dict[str, Coverage] = {}
+    for result in results:
+        if result.result and 'coverage' in result.result:
+            coverages.setdefault(result.vertical, Coverage()).merge_compact(result.result['coverage'])
+    return coverages
+
+
+def report_coverage(engine, coverages: Dict[str, Coverage], top: int = 10, csv_path: Optional[str] = None,
+                    quiet: bool = False):
+    """Print the report of each vertical (unless quiet) and write the CSV"""
+    rows_by_vertical = {}
+    for vertical in sorted(coverages):
+        rows = coverage_rows(coverages[vertical], engine.dictionary(vertical))
+        rows_by_vertical[vertical] = rows
+        if not quiet:
+            print_coverage_report(vertical, coverages[vertical], rows, top)
+    if csv_path:
+        write_csv(csv_path, rows_by_vertical)
+        if not quiet:
+            print(f"\n💾 Coverage CSV written to {csv_path}")
+
+
+def main(argv: List[str]):
+    usage = "Usage: python dictionary_coverage.py [--vertical NAME] [--top N] [--csv FILE] <file_or_dir> [...]"
+    options = {'--vertical': None, '--top': '10', '--csv': None}
+    targets = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in options:
+            options[arg] = next(args, None)
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            targets.append(arg)
+    if not targets:
+        print(usage)
+        sys.exit(1)
+
+    engine = worker_engine()
+    coverages: Dict[str, Coverage] = {}
+    for path in collect_files(targets):
+        vertical = options['--vertical'] or engine.detect_vertical(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            usage = scan_usage(f, engine.rule_pack(vertical).data_object_pattern)
+        coverages.setdefault(vertical, Coverage()).add_usage(path, usage)
+    report_coverage(engine, coverages, int(options['--top']), options['--csv'])
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,179 @@
+"""
+EBL Engine - Dictionary Lint
+Self-consistency checks of a vertical dictionary
+
+Every check is set algebra over the canonicalized sets VerticalDictionary
+compiles. VerticalEngine runs it once per dictionary file it loads
+(VerticalEngine.dictionary_lint), so it costs nothing per validated file. Without
+it, a hole in the dictionary shows up as the same warning in every file that
+uses the name.
+
+| Rule      | Severity | Finding                                                  |
+|-----------|----------|----------------------------------------------------------|
+| DLINT-001 | error    | actorVerbs names an actor missing from domain.actors     |
+| DLINT-002 | error    | actorVerbs grants a verb missing from domain.verbs       |
+| DLINT-003 | error    | actorDataPerms names an actor missing from domain.actors |
+| DLINT-004 | error    | actorDataPerms names a DataObject missing from domain    |
+| DLINT-005 | error    | verbPermissions value other than read, write or both     |
+| DLINT-006 | warning  | domain verb without a verbPermissions entry              |
+| DLINT-007 | warning  | domain verb no actor may perform (unreachable)           |
+| DLINT-008 | warning  | actor without actorVerbs or actorDataPerms (unrestricted)|
+| DLINT-009 | warning  | names equal after canonicalize                           |
+
+Usage:
+    python dictionary_lint.py <dictionary.json | verticals_dir>...
+"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from vertical_validator import ValidationIssue, VerticalDictionary, canonicalize
+
+VERB_PERMISSION_VALUES = {'read', 'write', 'both'}
+
+# domain list -> wording
+NAME_LISTS = {'actors': 'actor', 'verbs': 'verb', 'entities': 'entity', 'dataObjects': 'DataObject'}
+
+
+def _spellings(names: Iterable[str]) -> Dict[str, List[str]]:
+    """Canonical name -> spellings, in JSON order"""
+    spellings: Dict[str, List[str]] = defaultdict(list)
+    for name in names:
+        spellings[canonicalize(name)].append(name)
+    return spellings
+
+
+def _inverse(grants: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """{actor: names} -> {name: actors}"""
+    inverse: Dict[str, Set[str]] = defaultdict(set)
+    for actor, names in grants.items():
+        for name in names:
+            inverse[name].add(actor)
+    return inverse
+
+
+def _json_spellings(domain: Dict, core: Dict) -> Dict[str, str]:
+    """Canonical name -> first spelling anywhere in the dictionary JSON"""
+    named = [core.get('verbPermissions', {}), domain.get('actorVerbs', {}), domain.get('actorDataPerms', {})]
+    named += [domain.get(key, []) for key in NAME_LISTS]
+    named += list(domain.get('actorVerbs', {}).values())
+    for perms in domain.get('actorDataPerms', {}).values():
+        named += [perms.get('read', []), perms.get('write', [])]
+    spelled: Dict[str, str] = {}
+    for names in named:
+        for name in names:
+            spelled.setdefault(canonicalize(name), name)
+    return spelled
+
+
+def lint_dictionary(dictionary: VerticalDictionary) -> List[ValidationIssue]:
+    """Self-consistency issues of a compiled dictionary, errors first"""
+    domain = dictionary.dict.get('domain', {})
+    core = dictionary.dict.get('core', {})
+    spelled = _json_spellings(domain, core)
+
+    def names(canonical: Iterable[str]) -> str:
+        return ', '.join(sorted(f"'{spelled[c]}'" for c in canonical))
+
+    errors: List[ValidationIssue] = []
+    warnings: List[ValidationIssue] = []
+
+    def error(rule: str, message: str, suggestion: str):
+        errors.append(ValidationIssue('error', rule, message, suggestion))
+
+    def warning(rule: str, message: str, suggestion: str):
+        warnings.append(ValidationIssue('warning', rule, message, suggestion))
+
+    data_actors = set(dictionary.actor_read_perms) | set(dictionary.actor_write_perms)
+    granted_verbs = _inverse(dictionary.actor_verbs)
+    read_grants = _inverse(dictionary.actor_read_perms)
+    write_grants = _inverse(dictionary.actor_write_perms)
+
+    for actor in sorted(set(dictionary.actor_verbs) - dictionary.actors):
+        error('DLINT-001', f"actorVerbs: actor '{spelled[actor]}' is not in domain.actors",
+              "Add it to domain.actors or rename the actorVerbs entry")
+    for verb in sorted(set(granted_verbs) - dictionary.verbs):
+        error('DLINT-002', f"actorVerbs: verb '{spelled[verb]}' (granted to {names(granted_verbs[verb])}) "
+                           f"is not in domain.verbs",
+              "Add it to domain.verbs or fix the spelling")
+    for actor in sorted(data_actors - dictionary.actors):
+        error('DLINT-003', f"actorDataPerms: actor '{spelled[actor]}' is not in domain.actors",
+              "Add it to domain.actors or rename the actorDataPerms entry")
+    for data_object in sorted((set(read_grants) | set(write_grants)) - dictionary.data_objects):
+        actors = read_grants.get(data_object, set()) | write_grants.get(data_object, set())
+        error('DLINT-004', f"actorDataPerms: DataObject '{spelled[data_object]}' (granted to {names(actors)}) "
+                           f"is not in domain.dataObjects",
+              "Add it to domain.dataObjects or fix the spelling")
+    for verb, permission in sorted(dictionary.verb_permissions.items()):
+        if permission not in VERB_PERMISSION_VALUES:
+            error('DLINT-005', f"verbPermissions: '{spelled[verb]}' requires '{permission}'",
+                  "Use read, write or both")
+
+    for verb in sorted(dictionary.verbs - set(dictionary.verb_permissions)):
+        warning('DLINT-006', f"Verb '{spelled[verb]}' has no verbPermissions entry",
+                "Data permissions are not checked for it; add read, write or both")
+    if dictionary.all_permitted_verbs:
+        for verb in sorted(dictionary.verbs - dictionary.all_permitted_verbs):
+            warning('DLINT-007', f"Verb '{spelled[verb]}' is not granted to any actor in actorVerbs",
+                    "Every Action using it is reported; grant it or remove it from domain.verbs")
+    for actor in sorted(dictionary.actors - {a for a, verbs in dictionary.actor_verbs.items() if verbs}
+                        - data_actors):
+        warning('DLINT-008', f"Actor '{spelled[actor]}' has no actorVerbs or actorDataPerms entry",
+                "The actor may perform any verb on any DataObject")
+
+    for key, kind in NAME_LISTS.items():
+        for variants in _spellings(domain.get(key, [])).values():
+            if len(variants) > 1:
+                warning('DLINT-009', f"domain.{key}: {', '.join(repr(v) for v in variants)} are the same {kind}",
+                        "Names are compared after canonicalize; keep one spelling")
+    for section, entries in (('core.verbPermissions', core.get('verbPermissions', {})),
+                             ('domain.actorVerbs', domain.get('actorVerbs', {})),
+                             ('domain.actorDataPerms', domain.get('actorDataPerms', {}))):
+        for variants in _spellings(entries).values():
+            if len(variants) > 1:
+                warning('DLINT-009', f"{section}: keys {', '.join(repr(v) for v in variants)} are the same name",
+                        "Only the last entry is used; merge them")
+
+    return errors + warnings
+
+
+def dictionary_paths(paths: Iterable[str]) -> List[Path]:
+    """Dictionary JSON files named directly or found under verticals/*/dictionary"""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(sorted(path.glob('*/dictionary/*.json')) or sorted(path.glob('*.json')))
+        else:
+            found.append(path)
+    return found
+
+
+def print_lint_report(dictionary_path: str, issues: List[ValidationIssue]):
+    """Print the lint issues of one dictionary"""
+    errors = [i for i in issues if i.severity == 'error']
+    warnings = [i for i in issues if i.severity == 'warning']
+    mark = '❌' if errors else '⚠️ ' if warnings else '✅'
+    print(f"{mark} {dictionary_path}: {len(errors)} errors, {len(warnings)} warnings")
+    for issue in issues:
+        print(f"  [{issue.rule}] {issue.message}")
+        if issue.suggestion:
+            print(f"     💡 {issue.suggestion}")
+
+
+def main(argv: List[str]):
+    if len(argv) < 2:
+        print("Usage: python dictionary_lint.py <dictionary.json | verticals_dir>...")
+        sys.exit(1)
+
+    failed = False
+    for path in dictionary_paths(argv[1:]):
+        issues = lint_dictionary(VerticalDictionary(str(path)))
+        print_lint_report(str(path), issues)
+        failed = failed or any(i.severity == 'error' for i in issues)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
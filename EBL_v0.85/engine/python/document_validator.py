@@ -0,0 +1,125 @@
+"""
+EBL Engine - Document Validator
+Reusable validation of in-memory documents
+
+VerticalEngine.validate builds a lexer, token stream, parser and listener for
+every file. A DocumentValidator builds them once and re-points them at each
+document: the lexer gets a new InputStream, the token stream a reset token
+source, the parser a reset token stream, and the listener drops the previous
+document's issues and definitions with reset(). Nothing touches the
+filesystem.
+
+Documents are parsed one top-level block at a time with each block's own
+start rule, as VerticalEngine.validate_stream does, and give the same report.
+
+    validator = DocumentValidator(VerticalEngine(), 'banking')
+    for report in validator.validate_many(documents):
+        print(report.is_valid)
+"""
+
+from typing import Iterable, Iterator, Optional, Union
+
+from antlr4 import CommonTokenStream, InputStream, ParseTreeWalker
+
+from ebl_blocks import Block, iter_blocks
+from mmap_stream import MmapInputStream, iter_mapped_blocks
+from parse_limits import BoundedErrorStrategy, InputLimitError, ParseLimits, check_text
+from vertical_engine import SyntaxErrorCollector, VerticalEngine, VerticalReport, outside_block_issue
+from vertical_validator import VerticalDictionary
+
+
+class ReusableParser:
+    """One lexer, token stream and parser, re-pointed at each text they parse"""
+
+    def __init__(self, lexer_class: type, parser_class: type, limits: Optional[ParseLimits] = None):
+        self.limits = limits or ParseLimits()
+        self.errors = SyntaxErrorCollector()
+        self.lexer = lexer_class(InputStream(''))
+        self.lexer.removeErrorListeners()
+        self.lexer.addErrorListener(self.errors)
+        self.tokens = CommonTokenStream(self.lexer)
+        self.parser = parser_class(self.tokens)
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(self.errors)
+        self.parser._errHandler = BoundedErrorStrategy(self.limits.max_syntax_errors)
+        self.walker = ParseTreeWalker()
+
+    def parse(self, text: Union[str, InputStream], rule: str = 'eblDefinition', start_line: int = 1):
+        """Parse text (or an InputStream) with one start rule; its syntax errors are left in self.errors.issues"""
+        self.errors.issues = []
+        self.lexer.inputStream = text if isinstance(text, InputStream) else InputStream(text)  # Also resets the lexer
+        self.lexer.line = start_line
+        self.tokens.setTokenSource(self.lexer)
+        self.parser.setTokenStream(self.tokens)
+        return getattr(self.parser, rule)()
+
+    def parse_block(self, block: Block, input_stream: Optional[InputStream] = None):
+        """Parse one top-level block (from input_stream if given), keeping file line numbers"""
+        return self.parse(input_stream or block.text, block.rule, block.start_line)
+
+    def walk(self, listener, text: Union[str, Iterable[str]], stream: Optional[MmapInputStream] = None):
+        """
+        Parse text (or its lines) block by block, walking each tree with listener
+
+        As in VerticalEngine.walk_blocks, syntax errors and lines outside any
+        block are added to listener.errors in file order; they are also left
+        in self.errors.issues. With stream, the lines are stream.iter_lines()
+        and each block is lexed from the mapping.
+        """
+        issues = []
+
+        def outside_block(line: int, text: str):
+            issues.append(outside_block_issue(line, text))
+            listener.errors.append(issues[-1])
+
+        lines = text.split('\n') if isinstance(text, str) else text
+        if stream is not None:
+            blocks = iter_mapped_blocks(stream, lines, outside_block)
+        else:
+            blocks = ((block, None) for block in iter_blocks(lines, outside_block))
+        for block, input_stream in blocks:
+            tree = self.parse_block(block, input_stream)
+            issues.extend(self.errors.issues)
+            listener.errors.extend(self.errors.issues)
+            self.walker.walk(listener, tree)
+        self.errors.issues = issues
+
+
+class DocumentValidator:
+    """Dictionary and semantic validation of many documents of one vertical"""
+
+    def __init__(self, engine: VerticalEngine, vertical: str,
+                 dictionary: Optional[VerticalDictionary] = None):
+        self.engine = engine
+        self.vertical = vertical
+        grammar = engine.grammar(vertical)
+        self.parser = ReusableParser(grammar.lexer_class, grammar.parser_class, engine.limits)
+        self.listener = engine.dictionary_validator(vertical, dictionary)
+        self.pack = engine.rule_pack(vertical)
+
+    def validate_text(self, text: str) -> VerticalReport:
+        """Validate one document; input over the engine's limits gives a single LIMIT error"""
+        self.listener.reset()
+        try:
+            check_text(text, self.engine.limits)
+            self.parser.walk(self.listener, text)
+        except InputLimitError as e:
+            return VerticalReport(self.vertical, errors=[e.issue])
+        return VerticalReport(
+            vertical=self.vertical,
+            errors=self.listener.get_errors(),
+            warnings=self.listener.get_warnings(),
+            semantic_issues=self.pack.check_semantics(text),
+        )
+
+    def validate_bytes(self, data: bytes, encoding: str = 'utf-8') -> VerticalReport:
+        """Validate one encoded document"""
+        return self.validate_text(data.decode(encoding))
+
+    def validate_many(self, documents: Iterable[Union[str, bytes]]) -> Iterator[VerticalReport]:
+        """Report of each document (text or bytes), in order, as it is validated"""
+        for document in documents:
+            if isinstance(document, bytes):
+                yield self.validate_bytes(document)
+            else:
+                yield self.validate_text(document)
@@ -0,0 +1,154 @@
+"""
+EBL Engine - Top-Level Blocks
+Splits EBL text into its top-level blocks without running the parser
+
+Every top-level construct starts at column 0 with its keyword (Metadata,
+DataObject, Entity, Process, ...) and, except Metadata and the one-line
+Import directive, ends at the brace closing its body. Each block maps to the grammar rule that parses it on its
+own, which lets callers re-parse only the blocks that changed. Column 0 is
+the indentation of the first line that is not blank or a comment, so an
+indented snippet splits like the same text at the margin.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# Block keyword -> parser rule that parses the block on its own
+TOP_LEVEL_RULES = {
+    'Import': 'importDirective',
+    'Metadata': 'metadata',
+    'DataObject': 'dataObject',
+    'Entity': 'entity',
+    'ITAsset': 'itAsset',
+    'Process': 'process',
+    'Rule': 'ruleDef',
+    'Relationship': 'relationshipDef',
+    'Report': 'report',
+    'Integration': 'integration',
+}
+
+BLOCK_START = re.compile(
+    r'^(?:(Metadata)\s*:|(' + '|'.join(k for k in TOP_LEVEL_RULES if k not in ('Import', 'Metadata')) +
+    r')\s+([A-Za-z_][A-Za-z0-9_]*))'
+)
+STRING_LITERAL = re.compile(r'"[^"\r\n]*"')
+
+# Top-level `Import: "module.ebl"` directive (see ebl_imports.py); ends Metadata
+IMPORT_START = re.compile(r'^Import\s*:')
+IMPORT_DIRECTIVE = re.compile(r'^Import\s*:\s*"([^"\r\n]+)"', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Block:
+    """One top-level block of an EBL file"""
+    kind: str            # Block keyword, e.g. 'DataObject'
+    name: Optional[str]  # Block identifier (None for Metadata), or the imported path
+    start_line: int      # 1-based line of the keyword
+    text: str            # Block source, from keyword to closing brace
+
+    @property
+    def rule(self) -> str:
+        """Parser rule for this block"""
+        return TOP_LEVEL_RULES[self.kind]
+
+    @property
+    def end_line(self) -> int:
+        return self.start_line + self.text.count('\n') - 1
+
+    @property
+    def key(self) -> str:
+        """Identity within a file, e.g. 'DataObject:DO_SARFiling'"""
+        return f"{self.kind}:{self.name}" if self.name else self.kind
+
+
+def is_comment(line: str) -> bool:
+    """True for a '#' or '//' comment line"""
+    stripped = line.lstrip()
+    return stripped.startswith('#') or stripped.startswith('//')
+
+
+def margin_of(line: str) -> Optional[str]:
+    """Leading whitespace of a line that sets the margin, None for blank and comment lines"""
+    if not line.strip() or is_comment(line):
+        return None
+    return line[:len(line) - len(line.lstrip())]
+
+
+def at_margin(line: str, margin: str) -> str:
+    """Line with the margin removed (unchanged if it is indented less)"""
+    return line[len(margin):] if line.startswith(margin) else line
+
+
+def brace_delta(line: str) -> int:
+    """Net brace depth change of a line, ignoring strings and comments"""
+    if is_comment(line):
+        return 0
+    code = STRING_LITERAL.sub('', line)
+    return code.count('{') - code.count('}')
+
+
+def iter_blocks(lines: Iterable[str], on_stray: Optional[Callable[[int, str], None]] = None) -> Iterator[Block]:
+    """
+    Yield top-level blocks as soon as they are complete
+
+    Lines may keep their trailing newline (e.g. a file object). Only the
+    current block's lines are held, so memory is bounded by the largest block.
+    Comments and blank lines between blocks belong to no block; any other line
+    there is passed to on_stray(line_number, line). A block that never closes
+    runs to the end of the input.
+    """
+    current = None  # (kind, name, start index)
+    body: List[str] = []
+    depth = 0
+    margin = None
+
+    def close() -> Block:
+        kind, name, start = current
+        while len(body) > 1 and not body[-1].strip():
+            body.pop()
+        return Block(kind, name, start + 1, '\n'.join(body) + '\n')
+
+    for i, line in enumerate(lines):
+        if line.endswith('\n'):
+            line = line[:-1]
+        if margin is None:
+            margin = margin_of(line)
+        if depth == 0:
+            top = at_margin(line, margin or '')
+            if IMPORT_START.match(top) and (not current or current[0] == 'Metadata'):
+                if current:
+                    yield close()
+                current = None
+                directive = IMPORT_DIRECTIVE.match(top)
+                yield Block('Import', directive.group(1) if directive else None, i + 1, line + '\n')
+                continue
+            match = BLOCK_START.match(top)
+            if match:
+                if current:
+                    yield close()
+                if match.group(1):
+                    current = ('Metadata', None, i)
+                else:
+                    current = (match.group(2), match.group(3), i)
+                body = []
+
+        if not current:
+            if on_stray and margin_of(line) is not None:
+                on_stray(i + 1, line)
+            continue
+        body.append(line)
+        if current[0] != 'Metadata':
+            depth += brace_delta(line)
+            if depth <= 0 and '}' in line:
+                yield close()
+                current = None
+                depth = 0
+
+    if current:
+        yield close()
+
+
+def split_blocks(text: str, on_stray: Optional[Callable[[int, str], None]] = None) -> List[Block]:
+    """Split EBL text into top-level blocks"""
+    return list(iter_blocks(text.split('\n'), on_stray))
@@ -0,0 +1,250 @@
+"""
+EBL Engine - Structural Diff
+Model-level diff of two versions of an EBL file, in linear time
+
+Each version is read into a tree of named elements in one pass over its
+lines:
+- top-level blocks ('DataObject:DO_X') and nested scopes ('Step:Review')
+- sections ('Schema', 'Actions', 'Policies', ...)
+- fields ('LoanAmount' in Schema, 'Input' in Resources) and attributes
+  ('Description', 'Trigger', 'Actors')
+- list items: Actions and other '- ...' entries, keyed by their text
+
+Element text is compared in canonical form (canonical_hash.normalize_token),
+so formatting-only edits are not changes. Each element carries a digest of
+its subtree. Matching is by key through dicts, and subtrees with equal digests
+are skipped. Cost is proportional to the size of both files, with no
+tree-edit distance.
+
+Changes are 'added', 'removed', 'modified' (the element's own text changed)
+and 'reordered' (same children in a different order, e.g. Actions).
+ModelDiff.changed_blocks lists the top-level blocks to revalidate.
+
+Usage:
+    python ebl_diff.py [--json] <old.ebl> <new.ebl>
+"""
+
+import hashlib
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from canonical_hash import normalize_token
+from ebl_blocks import brace_delta, split_blocks
+
+SCOPE_HEADER = re.compile(r'^([A-Za-z_]\w*)\s+([A-Za-z_]\w*)\s*\{')
+SECTION_HEADER = re.compile(r'^([A-Za-z][\w ]*):$')
+ATTRIBUTE = re.compile(r'^([A-Za-z][\w .-]*?)\s*:\s*(.*)$')
+
+# Section name -> kind of its '- ...' items
+ITEM_KINDS = {'Actions': 'Action'}
+
+
+@dataclass
+class Element:
+    """A named node of the EBL model"""
+    kind: str   # 'DataObject', 'Step', 'Section', 'Field', 'Attribute', 'Action', 'Item', ...
+    key: str    # Unique among its siblings
+    text: str   # Canonical text of the element's own line(s)
+    line: int
+    children: Dict[str, 'Element'] = field(default_factory=dict)
+    digest: str = ''
+
+    def add(self, child: 'Element') -> 'Element':
+        key, n = child.key, 1
+        while key in self.children:
+            n += 1
+            key = f"{child.key}#{n}"
+        child.key = key
+        self.children[key] = child
+        return child
+
+    def seal(self) -> str:
+        """Compute subtree digests bottom-up"""
+        h = hashlib.sha1(f"{self.kind}\0{self.key}\0{self.text}".encode('utf-8'))
+        for child in self.children.values():
+            h.update(child.seal().encode('ascii'))
+        self.digest = h.hexdigest()
+        return self.digest
+
+
+def _item_key(text: str) -> str:
+    return normalize_token(text[1:])
+
+
+def _parse_block(block) -> Element:
+    lines = block.text.split('\n')
+    header = normalize_token(lines[0])
+    root = Element(block.kind, block.key, header, block.start_line)
+    scopes: List[Tuple[Element, Optional[Element], int]] = []  # (scope, section, section indent)
+    scope, section, section_indent = root, None, -1
+    pending: Optional[Tuple[Element, List[str]]] = None  # Attribute spanning lines (open '[')
+
+    for offset, raw in enumerate(lines[1:], 1):
+        stripped = raw.strip()
+        if pending:
+            element, parts = pending
+            parts.append(stripped)
+            joined = ' '.join(parts)
+            if joined.count('[') <= joined.count(']'):
+                element.text = normalize_token(joined)
+                pending = None
+            continue
+        if not stripped or stripped.startswith(('#', '//')):
+            continue
+        number = block.start_line + offset
+        indent = len(raw) - len(raw.lstrip())
+        if section is not None and indent <= section_indent:
+            section = None
+        parent = section or scope
+
+        if stripped.startswith('}'):
+            if scopes:
+                scope, section, section_indent = scopes.pop()
+            continue
+
+        if brace_delta(stripped) > 0:
+            match = SCOPE_HEADER.match(stripped)
+            kind, key = (match.group(1), f"{match.group(1)}:{match.group(2)}") if match else ('Scope', stripped)
+            child = parent.add(Element(kind, key, normalize_token(stripped), number))
+            scopes.append((scope, section, section_indent))
+            scope, section, section_indent = child, None, -1
+            continue
+
+        match = SECTION_HEADER.match(stripped)
+        if match:
+            section = scope.add(Element('Section', match.group(1), '', number))
+            section_indent = indent
+            continue
+
+        if stripped.startswith('-'):
+            kind = ITEM_KINDS.get(section.key if section else '', 'Item')
+            parent.add(Element(kind, _item_key(stripped), normalize_token(stripped), number))
+            continue
+
+        match = ATTRIBUTE.match(stripped)
+        if match:
+            kind = 'Field' if section is not None else 'Attribute'
+            element = parent.add(Element(kind, match.group(1), normalize_token(stripped), number))
+            if stripped.count('[') > stripped.count(']'):
+                pending = (element, [stripped])
+            continue
+
+        parent.add(Element('Item', normalize_token(stripped), normalize_token(stripped), number))
+
+    return root
+
+
+def parse_model(text: str) -> Element:
+    """The element tree of EBL text (root kind 'File', one child per top-level block)"""
+    root = Element('File', '', '', 0)
+    for block in split_blocks(text):
+        root.add(_parse_block(block))
+    root.seal()
+    return root
+
+
+@dataclass
+class Change:
+    """One difference between the two models"""
+    op: str                 # 'added', 'removed', 'modified' or 'reordered'
+    path: List[str]         # Keys from the top-level block down
+    kind: str
+    old: Optional[str] = None
+    new: Optional[str] = None
+    old_line: Optional[int] = None
+    new_line: Optional[int] = None
+
+
+@dataclass
+class ModelDiff:
+    """All changes, in new-file order (removals after the survivors of their parent)"""
+    changes: List[Change] = field(default_factory=list)
+
+    @property
+    def changed_blocks(self) -> Set[str]:
+        """Top-level block keys with any change"""
+        return {change.path[0] for change in self.changes}
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for change in self.changes:
+            counts[change.op] = counts.get(change.op, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        return {'changedBlocks': sorted(self.changed_blocks), 'counts': self.counts(),
+                'changes': [asdict(c) for c in self.changes]}
+
+
+def diff_elements(old: Element, new: Element, path: List[str], changes: List[Change]):
+    if old.text != new.text:
+        changes.append(Change('modified', path, new.kind, old.text, new.text, old.line, new.line))
+    common = []
+    for key, child in new.children.items():
+        before = old.children.get(key)
+        if before is None:
+            changes.append(Change('added', path + [key], child.kind, None, child.text, None, child.line))
+            continue
+        common.append(key)
+        if before.digest != child.digest:
+            diff_elements(before, child, path + [key], changes)
+    for key, child in old.children.items():
+        if key not in new.children:
+            changes.append(Change('removed', path + [key], child.kind, child.text, None, child.line, None))
+    if path and common != [k for k in old.children if k in new.children]:
+        changes.append(Change('reordered', path, new.kind, None, None, old.line, new.line))
+
+
+def diff_models(old: Element, new: Element) -> ModelDiff:
+    """Changes from one parsed model to another"""
+    diff = ModelDiff()
+    if old.digest != new.digest:
+        diff_elements(old, new, [], diff.changes)
+    return diff
+
+
+def diff_texts(old_text: str, new_text: str) -> ModelDiff:
+    """Changes from one version of EBL text to another"""
+    return diff_models(parse_model(old_text), parse_model(new_text))
+
+
+OP_MARKS = {'added': '➕', 'removed': '➖', 'modified': '✏️ ', 'reordered': '🔀'}
+
+
+def print_diff(diff: ModelDiff):
+    if not diff.changes:
+        print("✅ No model changes")
+        return
+    for change in diff.changes:
+        line = change.new_line if change.new_line is not None else change.old_line
+        print(f"{OP_MARKS[change.op]} {change.op:<9} {' / '.join(change.path)} ({change.kind}, line {line})")
+        if change.op == 'modified':
+            print(f"      - {change.old}")
+            print(f"      + {change.new}")
+    counts = diff.counts()
+    print(f"\n📊 {len(diff.changes)} changes in {len(diff.changed_blocks)} blocks: "
+          + ', '.join(f"{counts.get(op, 0)} {op}" for op in OP_MARKS))
+
+
+def main(argv: List[str]):
+    args = [a for a in argv[1:] if a != '--json']
+    if len(args) != 2:
+        print("Usage: python ebl_diff.py [--json] <old.ebl> <new.ebl>")
+        sys.exit(1)
+    texts = []
+    for path in args:
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    diff = diff_texts(*texts)
+    if '--json' in argv:
+        print(json.dumps(diff.to_dict(), indent=2))
+    else:
+        print_diff(diff)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,257 @@
+"""
+EBL Engine - Imports
+Resolves `Import: "path.ebl"` directives into a graph of compiled modules
+
+An EBL file may import shared modules instead of pasting their DataObjects
+and Entities:
+
+    Metadata:
+      ...
+    Import: "shared/payments_objects.ebl"
+
+Paths are relative to the importing file. Each module is compiled once per
+resolver session: its top-level blocks are parsed with their own start rules,
+and its definitions and semantic issues are kept. Compiled modules are keyed
+by the SHA-256 of their content, so an unchanged module is never re-parsed
+and identical copies at different paths share one compiled model. Validating
+a file walks its own blocks with the definitions of all its transitive
+imports already in scope. Missing modules (IMPORT-001) and import cycles
+(IMPORT-002) are reported as errors on the directive's line. The resolved
+graph tells incremental tools which files depend on a changed module.
+
+Usage:
+    python ebl_imports.py [--vertical NAME] [--graph] <ebl_file> [...]
+"""
+
+import hashlib
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from antlr4 import ParseTreeWalker
+
+from ebl_blocks import IMPORT_DIRECTIVE, split_blocks
+from rule_packs import SemanticIssue
+from vertical_engine import ParsedBlock, VerticalEngine, VerticalReport, outside_block_issue
+from vertical_validator import ValidationIssue
+
+# Block kind -> definition kind seen by the cross-reference checks
+DEFINING_BLOCKS = {'DataObject': 'dataObject', 'Entity': 'entity', 'ITAsset': 'itAsset'}
+
+
+@dataclass
+class CompiledModule:
+    """Parsed blocks, definitions and semantic issues of one module's content"""
+    digest: str
+    imports: List[Tuple[str, int]]  # (path as written, line)
+    blocks: List[ParsedBlock]
+    outside: List[ValidationIssue]   # Lines outside any top-level block
+    defines: Dict[str, Set[str]]     # 'dataObject'/'entity'/'itAsset' -> names
+    semantic_issues: List[SemanticIssue]
+
+
+@dataclass
+class ImportGraph:
+    """Resolved imports between files (real paths)"""
+    imports: Dict[str, List[str]] = field(default_factory=dict)
+
+    def closure(self, path: str) -> List[str]:
+        """Transitive imports of a file, each once, dependencies first"""
+        seen: Set[str] = {path}
+        order: List[str] = []
+
+        def visit(node: str):
+            for target in self.imports.get(node, ()):
+                if target not in seen:
+                    seen.add(target)
+                    visit(target)
+                    order.append(target)
+
+        visit(path)
+        return order
+
+    def dependents(self, path: str) -> Set[str]:
+        """Files that import the given file, directly or transitively"""
+        reverse: Dict[str, Set[str]] = {}
+        for source, targets in self.imports.items():
+            for target in targets:
+                reverse.setdefault(target, set()).add(source)
+        found: Set[str] = set()
+        stack = [path]
+        while stack:
+            for source in reverse.get(stack.pop(), ()):
+                if source not in found:
+                    found.add(source)
+                    stack.append(source)
+        return found
+
+
+class ImportResolver:
+    """A session of compiled modules and the import graph between them"""
+
+    def __init__(self, engine: Optional[VerticalEngine] = None):
+        self.engine = engine or VerticalEngine()
+        self.graph = ImportGraph()
+        self.modules: Dict[Tuple[str, str], CompiledModule] = {}  # (vertical, digest) -> module
+        self.digests: Dict[str, str] = {}  # path -> digest of its last read content
+        self.parses = 0  # Modules compiled (cache misses)
+
+    def compile(self, vertical: str, path: str) -> CompiledModule:
+        """Compiled model of a file's current content (from cache if seen before)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        self.digests[path] = digest
+        module = self.modules.get((vertical, digest))
+        if module is None:
+            text = data.decode('utf-8')
+            outside = []
+            blocks = split_blocks(text, lambda line, stray: outside.append(outside_block_issue(line, stray)))
+            defines: Dict[str, Set[str]] = {kind: set() for kind in DEFINING_BLOCKS.values()}
+            for block in blocks:
+                if block.kind in DEFINING_BLOCKS:
+                    defines[DEFINING_BLOCKS[block.kind]].add(block.name)
+            module = CompiledModule(
+                digest=digest,
+                imports=[(m.group(1), text.count('\n', 0, m.start()) + 1)
+                         for m in IMPORT_DIRECTIVE.finditer(text)],
+                blocks=[self.engine.parse_block(vertical, block) for block in blocks],
+                outside=outside,
+                defines=defines,
+                semantic_issues=self.engine.check_semantics(vertical, text),
+            )
+            self.modules[(vertical, digest)] = module
+            self.parses += 1
+        return module
+
+    def resolve(self, vertical: str, path: str) -> List[ValidationIssue]:
+        """Compile a file and its transitive imports, updating the graph; returns import errors"""
+        issues: List[ValidationIssue] = []
+        stack: List[str] = []
+        done: Set[str] = set()
+
+        def visit(node: str, entry_line: Optional[int]):
+            # Problems inside imported modules are reported on the root
+            # file's directive that leads to them
+            stack.append(node)
+            module = self.compile(vertical, node)
+            where = '' if entry_line is None else f" (in {os.path.basename(node)})"
+            targets = []
+            for written, line in module.imports:
+                target = os.path.realpath(os.path.join(os.path.dirname(node), written))
+                at = line if entry_line is None else entry_line
+                if not os.path.isfile(target):
+                    issues.append(ValidationIssue(
+                        'error', 'IMPORT-001', f"Imported module '{written}' not found{where}",
+                        suggestion=f"Looked for {target}", line=at, column=0))
+                    continue
+                targets.append(target)
+                if target in stack:
+                    cycle = stack[stack.index(target):] + [target]
+                    issues.append(ValidationIssue(
+                        'error', 'IMPORT-002',
+                        "Import cycle: " + ' -> '.join(os.path.basename(p) for p in cycle),
+                        suggestion="Move the shared definitions into a module both files import",
+                        line=at, column=0))
+                elif target not in done:
+                    visit(target, at)
+            self.graph.imports[node] = targets
+            done.add(node)
+            stack.pop()
+
+        visit(os.path.realpath(path), None)
+        return issues
+
+    def visible_definitions(self, vertical: str, path: str) -> Dict[str, Set[str]]:
+        """Names defined by a file's transitive imports (not by the file itself)"""
+        visible: Dict[str, Set[str]] = {kind: set() for kind in DEFINING_BLOCKS.values()}
+        for target in self.graph.closure(os.path.realpath(path)):
+            module = self.modules[(vertical, self.digests[target])]
+            for kind, names in module.defines.items():
+                visible[kind] |= names
+        return visible
+
+    def invalidate(self, path: str) -> Set[str]:
+        """Forget a changed file's content; returns the files whose results depend on it"""
+        path = os.path.realpath(path)
+        self.digests.pop(path, None)
+        return self.graph.dependents(path)
+
+    def validate(self, vertical: Optional[str], path: str) -> VerticalReport:
+        """Dictionary and semantic validation of a file with its imports in scope"""
+        vertical = vertical or self.engine.detect_vertical(path)
+        import_issues = self.resolve(vertical, path)
+        real = os.path.realpath(path)
+        module = self.modules[(vertical, self.digests[real])]
+
+        validator = self.engine.dictionary_validator(vertical)
+        visible = self.visible_definitions(vertical, real)
+        validator.defined_data_objects |= visible['dataObject']
+        validator.defined_entities |= visible['entity']
+        validator.defined_it_assets |= visible['itAsset']
+        walker = ParseTreeWalker()
+        outside = iter(module.outside)
+        stray = next(outside, None)
+        for parsed in module.blocks:
+            while stray and stray.line < parsed.block.start_line:
+                validator.errors.append(stray)
+                stray = next(outside, None)
+            validator.errors.extend(parsed.syntax_errors)
+            walker.walk(validator, parsed.tree)
+        if stray:
+            validator.errors.append(stray)
+        validator.errors.extend(outside)
+
+        return VerticalReport(
+            vertical=vertical,
+            errors=import_issues + validator.get_errors(),
+            warnings=validator.get_warnings(),
+            semantic_issues=module.semantic_issues,
+        )
+
+
+def main(argv: List[str]):
+    usage = "Usage: python ebl_imports.py [--vertical NAME] [--graph] <ebl_file> [...]"
+    vertical = None
+    show_graph = False
+    paths = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == '--vertical':
+            vertical = next(args, None)
+        elif arg == '--graph':
+            show_graph = True
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            paths.append(arg)
+    if not paths:
+        print(usage)
+        sys.exit(1)
+
+    resolver = ImportResolver()
+    ok = True
+    for path in paths:
+        report = resolver.validate(vertical, path)
+        ok = ok and report.is_valid
+        mark = '✅' if report.is_valid else '❌'
+        print(f"{mark} {path} [{report.vertical}]: {len(report.errors)} errors, "
+              f"{len(report.warnings) + len(report.semantic_issues)} warnings")
+        for issue in report.errors:
+            if issue.rule.startswith('IMPORT'):
+                print(f"   line {issue.line}: [{issue.rule}] {issue.message}")
+
+    if show_graph:
+        print("\n🔗 Import graph:")
+        for source, targets in sorted(resolver.graph.imports.items()):
+            print(f"  {source}")
+            for target in targets:
+                print(f"    -> {target}")
+    print(f"\n📊 {resolver.parses} modules compiled")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,99 @@
+"""
+EBL Engine - Name Usage
+Actors, verbs, DataObjects and relationship types an EBL file uses
+
+One pass over the file's top-level blocks, without the parser, so it runs at
+line-scan speed on files of any size. Actions are read the way the
+dictionary listener reads them: '- Actor Verb ...' items of an Actions
+section, with DataObjects matched by DATA_OBJECT_PATTERN.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+from ebl_blocks import Block, iter_blocks
+from vertical_validator import DATA_OBJECT_PATTERN
+
+ACTION_ITEM = re.compile(r'^-\s*([A-Za-z_][A-Za-z0-9_]*)\s+([A-Za-z][A-Za-z0-9_]*)\b')
+ACTORS_START = re.compile(r'^Actors\s*:\s*\[(.*)$')
+SECTION_HEADER = re.compile(r'^([A-Za-z][\w ]*):$')
+RELATIONSHIP_TYPE = re.compile(r'^Type\s*:\s*([A-Za-z_]\w*)$')
+
+
+@dataclass
+class ActionUse:
+    """One '- Actor Verb ...' Action"""
+    actor: str
+    verb: str
+    line: int
+    step: Optional[str] = None
+
+
+@dataclass
+class ProcessUse:
+    """Declared actors and Actions of one Process"""
+    name: str
+    line: int
+    actors: List[str] = field(default_factory=list)
+    actions: List[ActionUse] = field(default_factory=list)
+
+
+@dataclass
+class FileUsage:
+    """Every dictionary name an EBL file refers to, with its line"""
+    processes: List[ProcessUse] = field(default_factory=list)
+    data_objects: List[Tuple[str, int]] = field(default_factory=list)
+    relationship_types: List[Tuple[str, int]] = field(default_factory=list)
+
+
+def _is_comment(line: str) -> bool:
+    return line.startswith('#') or line.startswith('//')
+
+
+def scan_process(block: Block) -> ProcessUse:
+    """Declared actors and Actions of a Process block"""
+    process = ProcessUse(block.name, block.start_line)
+    section: Optional[str] = None
+    step: Optional[str] = None
+    actors: Optional[str] = None  # Text of an Actors list still open
+    for number, raw in enumerate(block.text.split('\n'), block.start_line):
+        line = raw.strip()
+        if not line or _is_comment(line):
+            continue
+        if actors is not None or ACTORS_START.match(line):
+            actors = line if actors is None else f"{actors} {line}"
+            if ']' in actors:
+                listed = actors[actors.index('[') + 1:actors.index(']')]
+                process.actors.extend(a.strip() for a in listed.split(',') if a.strip())
+                actors = None
+            continue
+        if line.startswith('-'):
+            match = ACTION_ITEM.match(line) if section == 'Actions' else None
+            if match:
+                process.actions.append(ActionUse(match.group(1), match.group(2), number, step))
+            continue
+        header = SECTION_HEADER.match(line)
+        section = header.group(1) if header else None
+        if line.startswith('Step '):
+            step = line[5:].split('{')[0].strip()
+    return process
+
+
+def scan_usage(lines: Iterable[str], data_object_pattern: Optional[str] = None) -> FileUsage:
+    """Names used by the EBL text in lines (a file object, or text.split('\\n'))"""
+    usage = FileUsage()
+    data_object = re.compile(data_object_pattern or DATA_OBJECT_PATTERN)
+    for block in iter_blocks(lines):
+        if block.kind == 'Process':
+            usage.processes.append(scan_process(block))
+        for number, raw in enumerate(block.text.split('\n'), block.start_line):
+            line = raw.strip()
+            if _is_comment(line):
+                continue
+            usage.data_objects.extend((m.group(1), number) for m in data_object.finditer(line))
+            if block.kind == 'Relationship':
+                match = RELATIONSHIP_TYPE.match(line)
+                if match:
+                    usage.relationship_types.append((match.group(1), number))
+    return usage
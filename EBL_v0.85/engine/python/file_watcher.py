@@ -0,0 +1,151 @@
+"""
+EBL Engine - File Watcher
+Reports changed .ebl and dictionary files under a set of directories
+
+Uses Linux inotify through ctypes when available and falls back to polling
+file modification times everywhere else.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+WATCHED_SUFFIXES = ('.ebl', '.json')
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def is_watched(path: str) -> bool:
+    """Only EBL files and dictionaries trigger revalidation"""
+    return path.endswith(WATCHED_SUFFIXES)
+
+
+class PollingWatcher:
+    """Portable watcher comparing (mtime, size) snapshots"""
+
+    def __init__(self, directories: Iterable[str], interval: float = 0.5):
+        self.directories = [str(d) for d in directories]
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    if not is_watched(name):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def changes(self, timeout: float = None) -> Set[str]:
+        """Block up to `timeout` seconds and return changed or deleted paths"""
+        deadline = time.monotonic() + (self.interval if timeout is None else timeout)
+        while True:
+            snapshot = self._scan()
+            changed = {p for p, sig in snapshot.items() if self._snapshot.get(p) != sig}
+            changed |= set(self._snapshot) - set(snapshot)
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (recursive, one watch per directory)"""
+
+    def __init__(self, directories: Iterable[str]):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        for directory in directories:
+            for root, _, _ in os.walk(str(directory)):
+                self._add_watch(root)
+
+    def _add_watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _read_events(self) -> List[Tuple[str, int]]:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                del self._dirs[wd]
+                continue
+            events.append((os.path.join(directory, os.fsdecode(name)), mask))
+        return events
+
+    def changes(self, timeout: float = None) -> Set[str]:
+        """Block up to `timeout` seconds (None: forever) and return changed paths"""
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            for path, mask in self._read_events():
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_watch(path)
+                elif is_watched(path):
+                    changed.add(path)
+            # Coalesce bursts (editors write, rename and chmod on save)
+            ready, _, _ = select.select([self._fd], [], [], 0.02)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(directories: Iterable[str], polling: bool = False):
+    """inotify on Linux, polling otherwise or when inotify is unavailable"""
+    directories = [str(Path(d)) for d in directories]
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories)
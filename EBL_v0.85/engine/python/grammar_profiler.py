@@ -0,0 +1,391 @@
+"""
+EBL Engine - Grammar Profiler
+Per-decision prediction cost of a vertical's parser over a corpus
+
+At each decision point of the grammar (a subrule loop, an optional section,
+a choice of alternatives) the parser chooses an alternative. Decisions that
+one token settles are compiled into the generated parser as a plain LA(1)
+test. The others go through the ATN simulator's adaptivePredict, and a few
+of those usually account for most of the prediction cost.
+ProfilingATNSimulator records, per decision:
+- invocations and time spent in adaptivePredict
+- SLL lookahead depth (mean and max)
+- LL fallbacks (SLL conflicts retried with full context) and their lookahead
+- ambiguities and context sensitivities
+Every time the parser reaches a decision (LA(1) test or prediction) is also
+counted, through the error strategy's sync() call at the decision state.
+
+The antlr4 Python runtime has no ProfilingATNSimulator, so this one follows
+the Java runtime's. Each decision is linked back to its rule and line in the
+.g4 file, and described by the first element of each alternative. Files are
+parsed block by block, as the language server and streaming validation do,
+or whole with --whole. Every profile starts from an empty DFA cache.
+
+Usage:
+    python grammar_profiler.py [--vertical NAME] [--sort time|reached|predictions|fallbacks|lookahead]
+                               [--top N] [--whole] [--json] <file_or_dir> [...]
+"""
+
+import json
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.ATNState import RuleStopState
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.Transition import AtomTransition, RuleTransition, SetTransition
+from antlr4.dfa.DFA import DFA
+
+from ebl_blocks import split_blocks
+from parse_limits import BoundedErrorStrategy, InputLimitError
+from vertical_engine import ParserNotGeneratedError, VerticalEngine
+
+DECISION_KINDS = {
+    'StarLoopEntryState': '( )*',
+    'PlusLoopbackState': '( )+',
+    'StarBlockStartState': '( | )*',
+    'PlusBlockStartState': '( | )+',
+    'BasicBlockStartState': '( | )',
+}
+
+SORT_KEYS = {
+    'time': lambda d: d.time_ns,
+    'reached': lambda d: d.reached,
+    'predictions': lambda d: d.invocations,
+    'fallbacks': lambda d: d.ll_fallbacks,
+    'lookahead': lambda d: d.sll_max_look,
+}
+
+
+@dataclass
+class DecisionProfile:
+    """Prediction statistics of one decision"""
+    decision: int
+    rule: str
+    line: Optional[int]         # Line in the .g4 file
+    kind: str                   # '( )*', '( )+', '( | )', ...
+    alternatives: List[str]     # First element(s) of each alternative
+    reached: int = 0            # Times the parser reached the decision
+    invocations: int = 0        # Times it needed adaptivePredict
+    time_ns: int = 0
+    sll_total_look: int = 0
+    sll_max_look: int = 0
+    ll_fallbacks: int = 0
+    ll_total_look: int = 0
+    ll_max_look: int = 0
+    ambiguities: int = 0
+    context_sensitivities: int = 0
+    dfa_states: int = 0
+
+    @property
+    def sll_mean_look(self) -> float:
+        return self.sll_total_look / self.invocations if self.invocations else 0.0
+
+    @property
+    def ll_mean_look(self) -> float:
+        return self.ll_total_look / self.ll_fallbacks if self.ll_fallbacks else 0.0
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator that records per-decision statistics into DecisionProfiles"""
+
+    def __init__(self, parser, decisions: List[DecisionProfile], decision_to_dfa: List[DFA]):
+        super().__init__(parser, parser.atn, decision_to_dfa, parser.sharedContextCache)
+        self.decisions = decisions
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._current = None
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._current = profile = self.decisions[decision]
+        start = input.index
+        started = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            profile.time_ns += time.perf_counter_ns() - started
+            profile.invocations += 1
+            if self._sll_stop >= 0:
+                look = self._sll_stop - start + 1
+                profile.sll_total_look += look
+                profile.sll_max_look = max(profile.sll_max_look, look)
+            if self._ll_stop >= 0:
+                look = self._ll_stop - start + 1
+                profile.ll_fallbacks += 1
+                profile.ll_total_look += look
+                profile.ll_max_look = max(profile.ll_max_look, look)
+
+    def getExistingTargetState(self, previousD, t):
+        self._sll_stop = self._input.index
+        return super().getExistingTargetState(previousD, t)
+
+    def computeTargetState(self, dfa, previousD, t):
+        self._sll_stop = self._input.index
+        return super().computeTargetState(dfa, previousD, t)
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._ll_stop = self._input.index
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self._current.context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self._current.ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+class _DecisionCounter(BoundedErrorStrategy):
+    """Error strategy that counts the decisions reached (generated code syncs at each one)"""
+
+    def __init__(self, max_errors: int, decisions: List[DecisionProfile], decision_of: Dict[int, int]):
+        super().__init__(max_errors)
+        self.decisions = decisions
+        self.decision_of = decision_of
+
+    def sync(self, recognizer):
+        decision = self.decision_of.get(recognizer.state)
+        if decision is not None:
+            self.decisions[decision].reached += 1
+        super().sync(recognizer)
+
+
+def _first_elements(parser_class, transition) -> List[str]:
+    """Tokens and rule references an alternative can start with (epsilon-reachable)"""
+    found, stack, seen = set(), [transition], set()
+    while stack:
+        t = stack.pop()
+        if isinstance(t, RuleTransition):
+            found.add(parser_class.ruleNames[t.target.ruleIndex])
+        elif isinstance(t, (AtomTransition, SetTransition)):
+            for token in t.label:
+                names = parser_class.literalNames if token < len(parser_class.literalNames) else []
+                name = names[token] if names and names[token] != '<INVALID>' else None
+                found.add(name or parser_class.symbolicNames[token] if token >= 0 else 'EOF')
+        elif isinstance(t.target, RuleStopState):
+            found.add('<end>')
+        elif t.target.stateNumber not in seen:
+            seen.add(t.target.stateNumber)
+            stack.extend(t.target.transitions)
+    return sorted(found)
+
+
+def _rule_bodies(grammar_path: Optional[Path]) -> Dict[str, Tuple[int, List[str]]]:
+    """Rule name -> (first line number, lines up to the next rule) of a .g4 file"""
+    if grammar_path is None or not grammar_path.exists():
+        return {}
+    lines = grammar_path.read_text(encoding='utf-8').split('\n')
+    starts = [(i, m.group(1)) for i, line in enumerate(lines)
+              if (m := re.match(r'^([a-z]\w*)\s*(?::|$)', line))]
+    bodies = {}
+    for n, (i, name) in enumerate(starts):
+        end = starts[n + 1][0] if n + 1 < len(starts) else len(lines)
+        bodies[name] = (i + 1, lines[i:end])
+    return bodies
+
+
+def _locate(term: str, occurrence: int, rule_line: int, body: List[str]) -> int:
+    """Line of the occurrence-th use of term in a rule body (rule line if absent)"""
+    pattern = re.escape(term) if term.startswith("'") else rf'\b{re.escape(term)}\b'
+    hits = [rule_line + i for i, line in enumerate(body)
+            for _ in re.finditer(pattern, line.split('//')[0])]
+    if not hits:
+        return rule_line
+    return hits[min(occurrence, len(hits) - 1)]
+
+
+def describe_decisions(parser_class, grammar_path: Optional[Path]) -> List[DecisionProfile]:
+    """One empty DecisionProfile per decision, with its rule, .g4 line, kind and alternatives"""
+    bodies = _rule_bodies(grammar_path)
+    occurrences: Dict[Tuple[str, str], int] = {}
+    decisions = []
+    for number, state in enumerate(parser_class.atn.decisionToState):
+        rule = parser_class.ruleNames[state.ruleIndex]
+        alternatives = [_first_elements(parser_class, t) for t in state.transitions]
+        line = None
+        if rule in bodies:
+            rule_line, body = bodies[rule]
+            # Decisions number subrules in grammar order, so the n-th decision
+            # of a rule entered by X sits at the n-th use of X in the rule
+            term = next((t for t in alternatives[0] if t != '<end>'), rule) if alternatives else rule
+            occurrence = occurrences.get((rule, term), 0)
+            occurrences[(rule, term)] = occurrence + 1
+            line = _locate(term, occurrence, rule_line, body)
+        decisions.append(DecisionProfile(
+            decision=number, rule=rule, line=line,
+            kind=DECISION_KINDS.get(type(state).__name__, type(state).__name__),
+            alternatives=[' '.join(alt) for alt in alternatives],
+        ))
+    return decisions
+
+
+@dataclass
+class GrammarProfile:
+    """Decision profiles of one vertical's parser over a corpus"""
+    vertical: str
+    grammar_path: Optional[str]
+    decisions: List[DecisionProfile]
+    files: int = 0
+    parses: int = 0
+    parse_seconds: float = 0.0
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def predictions(self) -> int:
+        return sum(d.invocations for d in self.decisions)
+
+    @property
+    def reached(self) -> int:
+        return sum(d.reached for d in self.decisions)
+
+    def hotspots(self, sort: str = 'time', top: Optional[int] = None) -> List[DecisionProfile]:
+        """Reached decisions, most expensive first"""
+        ranked = sorted((d for d in self.decisions if d.reached or d.invocations),
+                        key=lambda d: (SORT_KEYS[sort](d), d.reached), reverse=True)
+        return ranked[:top] if top else ranked
+
+    def to_dict(self, sort: str = 'time', top: Optional[int] = None) -> Dict:
+        return {
+            'vertical': self.vertical, 'grammar': self.grammar_path, 'files': self.files,
+            'parses': self.parses, 'parseSeconds': round(self.parse_seconds, 4),
+            'decisionsReached': self.reached, 'predictions': self.predictions, 'failures': self.failures,
+            'decisions': [{**asdict(d), 'sllMeanLook': round(d.sll_mean_look, 2),
+                           'llMeanLook': round(d.ll_mean_look, 2)} for d in self.hotspots(sort, top)],
+        }
+
+
+class GrammarProfiler:
+    """Parses files with ProfilingATNSimulator, one GrammarProfile per vertical"""
+
+    def __init__(self, engine: Optional[VerticalEngine] = None, whole_files: bool = False):
+        self.engine = engine or VerticalEngine()
+        self.whole_files = whole_files
+        self.profiles: Dict[str, GrammarProfile] = {}
+        self._dfas: Dict[str, List[DFA]] = {}
+        self._decision_of: Dict[str, Dict[int, int]] = {}
+
+    def profile(self, vertical: str) -> GrammarProfile:
+        if vertical not in self.profiles:
+            parser_class = self.engine.grammar(vertical).parser_class
+            path = self.engine.grammar_path(vertical)
+            self.profiles[vertical] = GrammarProfile(
+                vertical, str(path) if path.exists() else None,
+                describe_decisions(parser_class, path))
+            states = parser_class.atn.decisionToState
+            self._dfas[vertical] = [DFA(state, i) for i, state in enumerate(states)]
+            self._decision_of[vertical] = {state.stateNumber: i for i, state in enumerate(states)}
+        return self.profiles[vertical]
+
+    def _parse(self, vertical: str, text: str, rule: str, first_line: int):
+        grammar = self.engine.grammar(vertical)
+        profile = self.profile(vertical)
+        lexer = grammar.lexer_class(InputStream(text))
+        lexer.line = first_line
+        lexer.removeErrorListeners()
+        parser = grammar.parser_class(CommonTokenStream(lexer))
+        parser.removeErrorListeners()
+        parser._errHandler = _DecisionCounter(self.engine.limits.max_syntax_errors, profile.decisions,
+                                              self._decision_of[vertical])
+        parser._interp = ProfilingATNSimulator(parser, profile.decisions, self._dfas[vertical])
+        started = time.perf_counter()
+        try:
+            getattr(parser, rule)()
+        finally:
+            profile.parse_seconds += time.perf_counter() - started
+            profile.parses += 1
+
+    def add_text(self, vertical: str, text: str, name: str = '<text>'):
+        """Parse EBL text into the vertical's profile"""
+        profile = self.profile(vertical)
+        profile.files += 1
+        try:
+            self.engine.preflight(text)
+            if self.whole_files:
+                self._parse(vertical, text, 'eblDefinition', 1)
+            else:
+                for block in split_blocks(text):
+                    self._parse(vertical, block.text, block.rule, block.start_line)
+        except InputLimitError as e:
+            profile.failures.append(f"{name}: {e}")
+
+    def add_file(self, path: str, vertical: Optional[str] = None) -> str:
+        vertical = vertical or self.engine.detect_vertical(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            self.add_text(vertical, f.read(), path)
+        return vertical
+
+    def finish(self):
+        """Record the DFA size each decision ended with"""
+        for vertical, profile in self.profiles.items():
+            for decision, dfa in zip(profile.decisions, self._dfas[vertical]):
+                decision.dfa_states = len(dfa.states)
+
+
+def print_profile(profile: GrammarProfile, sort: str = 'time', top: Optional[int] = 20):
+    grammar = Path(profile.grammar_path).name if profile.grammar_path else '(no .g4 found)'
+    print(f"\n🔬 {profile.vertical} [{grammar}]: {profile.files} files, {profile.parses} parses in "
+          f"{profile.parse_seconds:.3f}s; {profile.reached:,} decisions reached, "
+          f"{profile.predictions:,} needed adaptivePredict")
+    total_ns = sum(d.time_ns for d in profile.decisions) or 1
+    print(f"  {'dec':>4} {'rule:line':<24} {'kind':<6} {'reached':>8} {'ATN':>8} {'time ms':>8} {'%':>5} "
+          f"{'SLL avg/max':>12} {'LL':>5} {'LL avg/max':>11} {'amb':>4} {'ctx':>4} {'dfa':>4}  alternatives")
+    for d in profile.hotspots(sort, top):
+        where = f"{d.rule}:{d.line}" if d.line else d.rule
+        print(f"  {d.decision:>4} {where:<24} {d.kind:<6} {d.reached:>8,} {d.invocations:>8,} {d.time_ns / 1e6:>8.2f} "
+              f"{100 * d.time_ns / total_ns:>4.0f}% {d.sll_mean_look:>7.1f}/{d.sll_max_look:<4} "
+              f"{d.ll_fallbacks:>5} {d.ll_mean_look:>6.1f}/{d.ll_max_look:<4} {d.ambiguities:>4} "
+              f"{d.context_sensitivities:>4} {d.dfa_states:>4}  {' | '.join(d.alternatives)}")
+    for failure in profile.failures:
+        print(f"  ⚠️  {failure}")
+
+
+def main(argv: List[str]):
+    from batch_runner import collect_files
+
+    usage = ("Usage: python grammar_profiler.py [--vertical NAME] [--sort time|reached|predictions|fallbacks|lookahead] "
+             "[--top N] [--whole] [--json] <file_or_dir> [...]")
+    options = {'--vertical': None, '--sort': 'time', '--top': '20'}
+    flags = set()
+    targets = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in options:
+            options[arg] = next(args, None)
+        elif arg in ('--whole', '--json'):
+            flags.add(arg)
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            targets.append(arg)
+    if not targets or options['--sort'] not in SORT_KEYS or not (options['--top'] or '').isdigit():
+        print(usage)
+        sys.exit(1)
+    top = int(options['--top']) or None
+
+    profiler = GrammarProfiler(whole_files='--whole' in flags)
+    for path in collect_files(targets):
+        try:
+            profiler.add_file(path, options['--vertical'])
+        except (OSError, ValueError, ParserNotGeneratedError) as e:
+            print(f"⚠️  Skipped {path}: {e}", file=sys.stderr)
+    profiler.finish()
+
+    if '--json' in flags:
+        print(json.dumps([p.to_dict(options['--sort'], top) for p in profiler.profiles.values()], indent=2))
+    else:
+        for profile in profiler.profiles.values():
+            print_profile(profile, options['--sort'], top)
+    sys.exit(0 if profiler.profiles else 1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
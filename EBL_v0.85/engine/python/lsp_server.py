@@ -0,0 +1,454 @@
+"""
+EBL Engine - Language Server
+Language Server Protocol server (stdio JSON-RPC) for EBL files
+
+Documents are split into top-level blocks (ebl_blocks.py) and each block is
+parsed with its own start rule, so an edit re-parses only the blocks whose
+text changed; unchanged blocks come from a bounded per-document cache. The
+dictionary listener then walks all block trees in order, which keeps
+cross-block checks (Entity dataRef, Relationship From/To) intact.
+
+Diagnostics are published after a debounce delay on a worker thread. A newer
+edit cancels a running validation of the same document at the next block
+boundary. Completion offers dictionary actors, verbs and DataObjects.
+
+The vertical of a document is sniffed from its header (banking by default).
+
+Usage:
+    python lsp_server.py [--debounce SECONDS]
+"""
+
+import json
+import queue
+import re
+import sys
+import threading
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from antlr4 import ParseTreeWalker
+
+from ebl_blocks import Block, split_blocks
+from parse_limits import InputLimitError
+from vertical_engine import ParsedBlock, ParserNotGeneratedError, VerticalEngine, outside_block_issue
+from vertical_validator import ValidationIssue, canonicalize
+
+DEFAULT_VERTICAL = 'banking'
+
+# LSP constants
+SEVERITY = {'error': 1, 'warning': 2, 'info': 3}
+COMPLETION_KIND = {'actor': 7, 'verb': 3, 'dataObject': 6}  # Class, Function, Variable
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+REQUEST_CANCELLED = -32800
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+class ValidationCancelled(Exception):
+    """A newer document version superseded the running validation"""
+
+
+def log_exception(context: str):
+    """Log the current exception to stderr (stdout carries the protocol)"""
+    print(f"❌ {context}:", file=sys.stderr)
+    traceback.print_exc(file=sys.stderr)
+
+
+class JsonRpcStream:
+    """Content-Length framed JSON-RPC over a pair of binary streams"""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.reader = reader
+        self.writer = writer
+        self._write_lock = threading.Lock()
+
+    def read_message(self) -> Optional[Dict]:
+        """Next message, or None at end of input"""
+        length = None
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length).decode('utf-8'))
+
+    def write_message(self, message: Dict):
+        body = json.dumps(message, separators=(',', ':')).encode('utf-8')
+        with self._write_lock:
+            self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            self.writer.flush()
+
+
+def utf16_to_index(line: str, units: int) -> int:
+    """Python string index of an LSP (UTF-16) character offset within a line"""
+    if line.isascii():
+        return min(units, len(line))
+    count = 0
+    for i, ch in enumerate(line):
+        if count >= units:
+            return i
+        count += 2 if ord(ch) > 0xFFFF else 1
+    return len(line)
+
+
+def position_to_offset(text: str, line: int, character: int) -> int:
+    """Offset in text of an LSP position"""
+    offset = 0
+    for _ in range(line):
+        newline = text.find('\n', offset)
+        if newline < 0:
+            return len(text)
+        offset = newline + 1
+    end = text.find('\n', offset)
+    line_text = text[offset:] if end < 0 else text[offset:end]
+    return offset + utf16_to_index(line_text, character)
+
+
+class BlockCache:
+    """Bounded LRU of parsed blocks keyed by (rule, block text)"""
+
+    def __init__(self, max_blocks: int):
+        self.max_blocks = max_blocks
+        self._entries: 'OrderedDict[Tuple[str, str], ParsedBlock]' = OrderedDict()
+
+    def get(self, block: Block) -> Optional[ParsedBlock]:
+        parsed = self._entries.get((block.rule, block.text))
+        if parsed is not None:
+            self._entries.move_to_end((block.rule, block.text))
+        return parsed
+
+    def put(self, parsed: ParsedBlock):
+        key = (parsed.block.rule, parsed.block.text)
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_blocks:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+@dataclass
+class Document:
+    """An open text document"""
+    uri: str
+    text: str
+    version: int
+    vertical: str
+    cache: BlockCache
+    timer: Optional[threading.Timer] = None
+    parses: int = 0  # Blocks parsed so far (cache misses)
+
+    def apply_change(self, change: Dict):
+        """Apply one TextDocumentContentChangeEvent"""
+        if 'range' not in change:
+            self.text = change['text']
+            return
+        start = change['range']['start']
+        end = change['range']['end']
+        start_offset = position_to_offset(self.text, start['line'], start['character'])
+        end_offset = position_to_offset(self.text, end['line'], end['character'])
+        self.text = self.text[:start_offset] + change['text'] + self.text[end_offset:]
+
+
+class EblLanguageServer:
+    """LSP server over a JsonRpcStream"""
+
+    def __init__(self, stream: JsonRpcStream, engine: Optional[VerticalEngine] = None,
+                 debounce: float = 0.3, max_cached_blocks: int = 512):
+        self.stream = stream
+        self.engine = engine or VerticalEngine()
+        self.debounce = debounce
+        self.max_cached_blocks = max_cached_blocks
+        self.documents: Dict[str, Document] = {}
+        self._lock = threading.Lock()
+        self._pending: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self._cancelled: set = set()
+        self._shutdown = False
+        self._worker = threading.Thread(target=self._validation_worker, daemon=True)
+        self._worker.start()
+
+        self._handlers: Dict[str, Callable] = {
+            'initialize': self.initialize,
+            'initialized': lambda params: None,
+            'shutdown': self.shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didSave': lambda params: None,
+            'textDocument/didClose': self.did_close,
+            'textDocument/completion': self.completion,
+            '$/cancelRequest': self.cancel_request,
+        }
+
+    def handle(self, message: Dict) -> bool:
+        """Handle one message; returns False after 'exit'"""
+        method = message.get('method')
+        msg_id = message.get('id')
+        if method == 'exit':
+            self._pending.put(None)
+            return False
+
+        if msg_id is not None and msg_id in self._cancelled:
+            self._cancelled.discard(msg_id)
+            self.stream.write_message({'jsonrpc': '2.0', 'id': msg_id, 'error': {
+                'code': REQUEST_CANCELLED, 'message': 'Request cancelled'}})
+            return True
+
+        handler = self._handlers.get(method)
+        if handler is None:
+            if msg_id is not None:
+                self.stream.write_message({'jsonrpc': '2.0', 'id': msg_id, 'error': {
+                    'code': METHOD_NOT_FOUND, 'message': f"Unsupported method '{method}'"}})
+            return True
+
+        try:
+            result = handler(message.get('params') or {})
+        except Exception as e:
+            # One bad request must not end the session
+            log_exception(f"Request '{method}' failed")
+            if msg_id is not None:
+                self.stream.write_message({'jsonrpc': '2.0', 'id': msg_id, 'error': {
+                    'code': INTERNAL_ERROR, 'message': f"{type(e).__name__}: {e}"}})
+            return True
+        if msg_id is not None:
+            self.stream.write_message({'jsonrpc': '2.0', 'id': msg_id, 'result': result})
+        return True
+
+    def serve(self):
+        """Read and dispatch messages until 'exit' or end of input"""
+        inbox: 'queue.Queue[Optional[Dict]]' = queue.Queue()
+
+        def reader():
+            while True:
+                message = self.stream.read_message()
+                if message is not None and message.get('method') == '$/cancelRequest':
+                    # Handled on arrival so queued requests can still be cancelled
+                    self.cancel_request(message.get('params') or {})
+                    continue
+                inbox.put(message)
+                if message is None:
+                    return
+
+        threading.Thread(target=reader, daemon=True).start()
+        while True:
+            message = inbox.get()
+            if message is None or not self.handle(message):
+                break
+        # Let queued validations publish before the process exits
+        self._pending.put(None)
+        self._worker.join(timeout=5)
+
+    def initialize(self, params: Dict) -> Dict:
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': TEXT_DOCUMENT_SYNC_INCREMENTAL},
+                'completionProvider': {'triggerCharacters': [' ', '[', ',', '_']},
+            },
+            'serverInfo': {'name': 'ebl-language-server', 'version': '0.85'},
+        }
+
+    def shutdown(self, params: Dict):
+        self._shutdown = True
+        return None
+
+    def cancel_request(self, params: Dict):
+        if 'id' in params:
+            self._cancelled.add(params['id'])
+
+    def did_open(self, params: Dict):
+        item = params['textDocument']
+        vertical = self.engine.sniffer.sniff_text(item['text']).vertical or DEFAULT_VERTICAL
+        with self._lock:
+            self.documents[item['uri']] = Document(
+                uri=item['uri'], text=item['text'], version=item.get('version', 0),
+                vertical=vertical, cache=BlockCache(self.max_cached_blocks),
+            )
+        self._schedule(item['uri'])
+
+    def did_change(self, params: Dict):
+        uri = params['textDocument']['uri']
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            for change in params['contentChanges']:
+                document.apply_change(change)
+            document.version = params['textDocument'].get('version', document.version + 1)
+        self._schedule(uri)
+
+    def did_close(self, params: Dict):
+        uri = params['textDocument']['uri']
+        with self._lock:
+            document = self.documents.pop(uri, None)
+        if document and document.timer:
+            document.timer.cancel()
+        self.stream.write_message({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics',
+                                   'params': {'uri': uri, 'diagnostics': []}})
+
+    def _schedule(self, uri: str):
+        """Debounce: validate once edits have paused for `debounce` seconds"""
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            if document.timer:
+                document.timer.cancel()
+            if self.debounce <= 0:
+                document.timer = None
+                self._pending.put(uri)
+                return
+            document.timer = threading.Timer(self.debounce, self._pending.put, args=(uri,))
+            document.timer.daemon = True
+            document.timer.start()
+
+    def _validation_worker(self):
+        while True:
+            uri = self._pending.get()
+            if uri is None:
+                return
+            try:
+                self.validate_document(uri)
+            except ValidationCancelled:
+                pass
+            except Exception:
+                # Keep publishing diagnostics for the other documents
+                log_exception(f"Validation of {uri} failed")
+
+    def _snapshot(self, uri: str) -> Optional[Tuple[Document, str, int]]:
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return None
+            return document, document.text, document.version
+
+    def _check_current(self, document: Document, version: int):
+        if document.version != version or self.documents.get(document.uri) is not document:
+            raise ValidationCancelled()
+
+    def validate_document(self, uri: str) -> Optional[List[Dict]]:
+        """Validate the current version of a document and publish diagnostics"""
+        snapshot = self._snapshot(uri)
+        if snapshot is None:
+            return None
+        document, text, version = snapshot
+        issues = []
+        limited = False
+
+        try:
+            self.engine.preflight(text)
+            parsed_blocks = []
+            outside = []
+            for block in split_blocks(text, lambda line, text: outside.append(outside_block_issue(line, text))):
+                self._check_current(document, version)
+                parsed = document.cache.get(block)
+                if parsed is None or any(p is parsed for p in parsed_blocks):
+                    parsed = self.engine.parse_block(document.vertical, block)
+                    document.cache.put(parsed)
+                    document.parses += 1
+                else:
+                    parsed.move_to(block.start_line)
+                parsed_blocks.append(parsed)
+                issues.extend(parsed.syntax_errors)
+            issues.extend(outside)
+
+            validator = self.engine.dictionary_validator(document.vertical)
+            walker = ParseTreeWalker()
+            for parsed in parsed_blocks:
+                self._check_current(document, version)
+                walker.walk(validator, parsed.tree)
+            issues.extend(validator.get_errors())
+            issues.extend(validator.get_warnings())
+        except ParserNotGeneratedError as e:
+            issues.append(ValidationIssue('warning', 'PARSER', str(e), line=1, column=0))
+        except InputLimitError as e:
+            # Over a limit: publish only that diagnostic, without running the rules
+            issues = [e.issue]
+            limited = True
+
+        for issue in [] if limited else self.engine.check_semantics(document.vertical, text):
+            issues.append(ValidationIssue(issue.severity.value, issue.rule, issue.message,
+                                          suggestion=issue.suggestion, line=issue.line, column=0))
+
+        diagnostics = [self._diagnostic(text, issue) for issue in issues]
+
+        self._check_current(document, version)
+        self.stream.write_message({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics',
+                                   'params': {'uri': uri, 'version': version, 'diagnostics': diagnostics}})
+        return diagnostics
+
+    @staticmethod
+    def _diagnostic(text: str, issue: ValidationIssue) -> Dict:
+        """LSP Diagnostic spanning from the issue position to the end of its line"""
+        line = max((issue.line or 1) - 1, 0)
+        column = issue.column or 0
+        lines = text.split('\n')
+        end = len(lines[line]) if line < len(lines) else column
+        message = issue.message
+        if issue.suggestion:
+            message = f"{message}\n💡 {issue.suggestion}"
+        return {
+            'range': {'start': {'line': line, 'character': column},
+                      'end': {'line': line, 'character': max(end, column)}},
+            'severity': SEVERITY.get(issue.severity, 3),
+            'code': issue.rule,
+            'source': 'ebl',
+            'message': message,
+        }
+
+    def completion(self, params: Dict) -> Dict:
+        uri = params['textDocument']['uri']
+        position = params['position']
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return {'isIncomplete': False, 'items': []}
+            lines = document.text.split('\n')
+            vertical = document.vertical
+        line = lines[position['line']] if position['line'] < len(lines) else ''
+        prefix = line[:utf16_to_index(line, position['character'])]
+        word = re.search(r'[A-Za-z0-9_]*$', prefix).group(0)
+
+        dictionary = self.engine.dictionary(vertical)
+        preferred = set()
+        action = re.match(r'^\s*-\s*([A-Za-z_][A-Za-z0-9_]*)\s+[A-Za-z0-9_]*$', prefix)
+        if re.search(r'Actors\s*:\s*\[[^\]]*$', prefix) or re.match(r'^\s*-\s*[A-Za-z0-9_]*$', prefix):
+            kinds = ['actor']
+        elif action:
+            kinds = ['verb']
+            preferred = dictionary.actor_verbs.get(canonicalize(action.group(1)), set())
+        elif word.startswith('DO_') or re.search(r'dataRef\s*:\s*\S*$', prefix):
+            kinds = ['dataObject']
+        else:
+            kinds = ['actor', 'verb', 'dataObject']
+
+        items = []
+        lowered = word.lower()
+        for kind in kinds:
+            for name in dictionary.names(kind):
+                if lowered and not name.lower().startswith(lowered):
+                    continue
+                rank = '0' if canonicalize(name) in preferred else '1'
+                items.append({'label': name, 'kind': COMPLETION_KIND[kind], 'detail': kind,
+                              'sortText': f"{rank}{name}"})
+        return {'isIncomplete': False, 'items': items}
+
+
+def main(argv: List[str]):
+    debounce = 0.3
+    if '--debounce' in argv:
+        debounce = float(argv[argv.index('--debounce') + 1])
+    stream = JsonRpcStream(sys.stdin.buffer, sys.stdout.buffer)
+    EblLanguageServer(stream, debounce=debounce).serve()
+
+
+if __name__ == '__main__':
+    main(sys.argv)
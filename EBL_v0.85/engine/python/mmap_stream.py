@@ -0,0 +1,250 @@
+"""
+EBL Engine - Memory-Mapped Input Stream
+ANTLR InputStream over an mmapped UTF-8 file
+
+antlr4's FileStream decodes the whole file into a str and then builds a list
+with one int per code point, so a file costs several times its size before
+lexing starts. MmapInputStream maps the file instead. The file is indexed once
+in fixed-size byte segments, cut at UTF-8 character boundaries. ASCII segments
+are served straight from the mapping, since byte offset equals code point
+offset there. Non-ASCII segments are decoded on first use and kept in a small
+LRU. Indexes, LA() and getText() use code points, like InputStream, so
+lexers, token text and line/column reporting behave the same.
+
+Validation splits a file into top-level blocks from iter_lines() and lexes
+each block from window(), a view of the mapping, so neither the file nor a
+block is copied into a code point list. Line breaks are read as they are in
+the file (no newline translation).
+"""
+
+import codecs
+import mmap
+import os
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+from ebl_blocks import Block, iter_blocks
+
+SEGMENT_BYTES = 64 * 1024
+SCAN_BYTES = 4 * 1024  # Segments are indexed in slices of this size, so indexing holds no segment copy
+
+
+class MmapInputStream(InputStream):
+    """Read-only, lazily decoded InputStream over a UTF-8 file"""
+
+    def __init__(self, path: str, segment_bytes: int = SEGMENT_BYTES, cached_segments: int = 8):
+        """
+        Args:
+            path: UTF-8 file to map
+            segment_bytes: Indexing granularity; non-ASCII segments decode whole
+            cached_segments: Decoded non-ASCII segments kept at once
+        """
+        self.name = str(path)
+        self._index = 0
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = b''  # Empty files cannot be mapped
+        self._cached_segments = cached_segments
+        self._decoded: 'OrderedDict[int, str]' = OrderedDict()
+        self._index_segments(segment_bytes)
+
+    def _index_segments(self, segment_bytes: int):
+        buffer = self._buffer
+        length = len(buffer)
+        self._byte_starts: List[int] = []
+        self._cp_starts: List[int] = []
+        self._ascii: List[bool] = []
+        byte, cp = 0, 0
+        while byte < length:
+            end = min(byte + segment_bytes, length)
+            while end < length and buffer[end] & 0xC0 == 0x80:
+                end -= 1  # Never split a multi-byte character
+            if end == byte:
+                end = min(byte + segment_bytes, length)
+                while end < length and buffer[end] & 0xC0 == 0x80:
+                    end += 1
+            self._byte_starts.append(byte)
+            self._cp_starts.append(cp)
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            is_ascii = True
+            for piece_start in range(byte, end, SCAN_BYTES):
+                piece = buffer[piece_start:min(piece_start + SCAN_BYTES, end)]
+                if is_ascii and piece.isascii():
+                    cp += len(piece)
+                else:
+                    is_ascii = False
+                    cp += len(decoder.decode(piece))
+            cp += len(decoder.decode(b'', final=True))
+            self._ascii.append(is_ascii)
+            byte = end
+        self._byte_starts.append(length)
+        self._cp_starts.append(cp)  # Sentinel: end of the last segment
+        self._size = cp
+        self._all_ascii = all(self._ascii)
+        self._last = 0
+
+    def _segment_of(self, pos: int) -> int:
+        k = self._last
+        if not (self._cp_starts[k] <= pos < self._cp_starts[k + 1]):
+            k = bisect_right(self._cp_starts, pos) - 1
+            self._last = k
+        return k
+
+    def _segment_text(self, k: int) -> str:
+        text = self._decoded.get(k)
+        if text is None:
+            text = self._buffer[self._byte_starts[k]:self._byte_starts[k + 1]].decode('utf-8')
+            self._decoded[k] = text
+            if len(self._decoded) > self._cached_segments:
+                self._decoded.popitem(last=False)
+        else:
+            self._decoded.move_to_end(k)
+        return text
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # e.g., translate LA(-1) to use offset=0
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return self._code_point(pos)
+
+    def _code_point(self, pos: int) -> int:
+        if self._all_ascii:
+            return self._buffer[pos]
+        k = self._segment_of(pos)
+        if self._ascii[k]:
+            return self._buffer[self._byte_starts[k] + pos - self._cp_starts[k]]
+        return ord(self._segment_text(k)[pos - self._cp_starts[k]])
+
+    def getText(self, start: int, stop: int) -> str:
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        if self._all_ascii:
+            return self._buffer[start:stop + 1].decode('ascii')
+
+        parts = []
+        pos = start
+        while pos <= stop:
+            k = self._segment_of(pos)
+            first = self._cp_starts[k]
+            end = min(stop, self._cp_starts[k + 1] - 1)
+            if self._ascii[k]:
+                byte = self._byte_starts[k] + pos - first
+                parts.append(self._buffer[byte:byte + end - pos + 1].decode('ascii'))
+            else:
+                parts.append(self._segment_text(k)[pos - first:end - first + 1])
+            pos = end + 1
+        return ''.join(parts)
+
+    def iter_text(self, chunk_bytes: int = 1024 * 1024) -> Iterator[str]:
+        """Decoded text in chunks of about chunk_bytes, each ending at a line break"""
+        length = len(self._buffer)
+        start = 0
+        while start < length:
+            end = min(start + chunk_bytes, length)
+            if end < length:
+                newline = self._buffer.rfind(b'\n', start, end)
+                end = newline + 1 if newline >= 0 else end
+                while end < length and self._buffer[end] & 0xC0 == 0x80:
+                    end += 1
+            yield self._buffer[start:end].decode('utf-8')
+            start = end
+
+    def iter_lines(self) -> Iterator[str]:
+        """Decoded lines, each with its line break (the last one may have none)"""
+        buffer = self._buffer
+        length = len(buffer)
+        start = 0
+        while start < length:
+            end = buffer.find(b'\n', start) + 1 or length
+            yield buffer[start:end].decode('utf-8')
+            start = end
+
+    def window(self, start: int, size: int) -> 'MmapWindow':
+        """InputStream over code points [start, start + size) of the file, indexed from 0"""
+        return MmapWindow(self, start, size)
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._decoded.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+
+class MmapWindow(InputStream):
+    """Part of an MmapInputStream seen as a stream of its own (e.g. one block)"""
+
+    def __init__(self, source: MmapInputStream, start: int, size: int):
+        self.name = source.name
+        self._source = source
+        self._start = start
+        self._index = 0
+        self._size = max(0, min(size, source.size - start))
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # e.g., translate LA(-1) to use offset=0
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return self._source._code_point(self._start + pos)
+
+    def getText(self, start: int, stop: int) -> str:
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        return self._source.getText(self._start + start, self._start + stop)
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+
+def iter_mapped_blocks(stream: MmapInputStream, lines: Iterable[str],
+                       on_stray: Optional[Callable[[int, str], None]] = None
+                       ) -> Iterator[Tuple[Block, InputStream]]:
+    """
+    Top-level blocks of stream's lines (see ebl_blocks.iter_blocks), each with an InputStream to lex it from
+
+    lines are stream.iter_lines(), possibly passed through a filter that
+    looks at them. A block is lexed from a window of the mapping; a last
+    block without a final line break is lexed from its text.
+    """
+    offsets: Dict[int, int] = {}  # Line number -> code point offset, until the line's block is parsed
+
+    def numbered():
+        offset = 0
+        for number, line in enumerate(lines, 1):
+            offsets[number] = offset
+            offset += len(line)
+            yield line
+
+    for block in iter_blocks(numbered(), on_stray):
+        start = offsets[block.start_line]
+        for number in [n for n in offsets if n <= block.end_line]:
+            del offsets[number]
+        if start + len(block.text) <= stream.size:
+            yield block, stream.window(start, len(block.text))
+        else:
+            yield block, InputStream(block.text)
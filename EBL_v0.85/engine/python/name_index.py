@@ -0,0 +1,117 @@
+"""
+EBL Engine - Name Index
+Trigram index for "did you mean" suggestions over canonicalized dictionary names
+
+Lookups only touch the posting lists of the query's rarest trigrams (q-gram
+prefix filtering), so the cost of a miss grows with the number of plausible
+candidates rather than with the size of the dictionary.
+"""
+
+import heapq
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def trigrams(key: str) -> List[str]:
+    """Distinct padded trigrams of a canonical name"""
+    padded = f"  {key} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def bounded_edit_distance(a: str, b: str, bound: int) -> Optional[int]:
+    """Levenshtein distance between a and b, or None if it exceeds bound"""
+    if abs(len(a) - len(b)) > bound:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > bound:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= bound else None
+
+
+class TrigramIndex:
+    """Inverted trigram index over a fixed set of names"""
+
+    def __init__(self, names: Iterable[str], normalize: Callable[[str], str] = str.lower,
+                 max_candidates: int = 64, max_edits: int = 2, min_similarity: float = 0.6):
+        """
+        Build the index
+
+        Args:
+            names: Display names to index
+            normalize: Canonicalization applied to indexed names and queries
+            max_candidates: Cap on candidates verified with edit distance per lookup
+            max_edits: Maximum edit distance of a suggestion
+            min_similarity: Minimum 1 - distance/length for a suggestion (limits short names)
+        """
+        self.normalize = normalize
+        self.max_candidates = max_candidates
+        self.max_edits = max_edits
+        self.min_similarity = min_similarity
+        self.keys: List[str] = []
+        self.names: List[str] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        seen = set()
+        for name in names:
+            key = normalize(name)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            name_id = len(self.keys)
+            self.keys.append(key)
+            self.names.append(name)
+            for gram in trigrams(key):
+                self.postings.setdefault(gram, []).append(name_id)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def suggest(self, query: str, limit: int = 3) -> List[str]:
+        """
+        Nearest indexed names to query, closest first
+
+        Args:
+            query: Name that was not found
+            limit: Maximum number of suggestions
+
+        Returns:
+            Display names within the similarity threshold
+        """
+        return [name for name, _ in self.nearest(query, limit)]
+
+    def nearest(self, query: str, limit: int = 3) -> List[Tuple[str, int]]:
+        """Nearest indexed names with their edit distances"""
+        key = self.normalize(query or '')
+        if not key or not self.keys:
+            return []
+
+        max_distance = max(1, min(self.max_edits, int(len(key) * (1 - self.min_similarity))))
+        grams = trigrams(key)
+
+        # Each edit destroys at most 3 trigrams, so any name within max_distance
+        # must share one of the (len(grams) - required + 1) rarest query trigrams.
+        required = max(1, len(grams) - 3 * max_distance)
+        grams.sort(key=lambda g: len(self.postings.get(g, ())))
+        prefix = grams[:len(grams) - required + 1]
+
+        hits: Dict[int, int] = {}
+        for gram in prefix:
+            for name_id in self.postings.get(gram, ()):
+                hits[name_id] = hits.get(name_id, 0) + 1
+
+        candidates = heapq.nlargest(self.max_candidates, hits.items(), key=lambda item: item[1])
+
+        scored = []
+        for name_id, _ in candidates:
+            distance = bounded_edit_distance(key, self.keys[name_id], max_distance)
+            if distance is not None:
+                scored.append((distance, self.names[name_id]))
+        scored.sort()
+        return [(name, distance) for distance, name in scored[:limit]]
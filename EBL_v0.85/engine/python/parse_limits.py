@@ -0,0 +1,148 @@
+"""
+EBL Engine - Parse Limits
+Pre-flight input limits and bounded syntax-error recovery
+
+Malformed or adversarial input can keep the ANTLR runtime busy for minutes:
+- a multi-megabyte line is one free-text run, and parsing it costs minutes
+- an unterminated '{' makes the parser recover, and report an error, over
+  and over until the end of the file
+
+Before anything is lexed, the engine checks the input against ParseLimits:
+file size, line length and brace depth. A file over a limit fails at once
+with an InputLimitError that names the rule and the line. While parsing,
+BoundedErrorStrategy stops after max_syntax_errors errors instead of
+recovering through the rest of the input.
+
+Rules:
+    LIMIT-001  file larger than max_file_bytes
+    LIMIT-002  line longer than max_line_chars
+    LIMIT-003  braces nested deeper than max_brace_depth
+    LIMIT-004  more than max_syntax_errors syntax errors in one parse
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+
+from ebl_blocks import brace_delta
+from vertical_validator import ValidationIssue
+
+
+@dataclass(frozen=True)
+class ParseLimits:
+    """Upper bounds on what the engine will try to parse"""
+    max_file_bytes: int = 64 * 1024 * 1024
+    max_line_chars: int = 64 * 1024
+    max_brace_depth: int = 32
+    max_syntax_errors: int = 100
+
+
+class InputLimitError(ValueError):
+    """Input rejected by a ParseLimits check; issue holds the diagnostic"""
+
+    def __init__(self, rule: str, message: str, line: Optional[int] = None, suggestion: Optional[str] = None):
+        super().__init__(message if line is None else f"line {line}: {message}")
+        self.issue = ValidationIssue('error', rule, message, suggestion=suggestion, line=line, column=0)
+
+
+def check_size(size: int, limits: ParseLimits):
+    """Reject input of more than max_file_bytes"""
+    if size > limits.max_file_bytes:
+        raise InputLimitError(
+            'LIMIT-001', f"File is {size:,} bytes; the limit is {limits.max_file_bytes:,}",
+            suggestion="Split the file into modules (see Import:)")
+
+
+class InputGuard:
+    """
+    Line-length and brace-depth checks over text fed in any chunking
+
+    Only the unfinished last line of a chunk is kept between feeds, and never
+    more than max_line_chars of it.
+    """
+
+    def __init__(self, limits: ParseLimits):
+        self.limits = limits
+        self.line = 0       # Lines completed so far
+        self.depth = 0
+        self.chars = 0
+        self._partial = ''
+
+    def feed(self, text: str):
+        self.chars += len(text)
+        if self.chars > self.limits.max_file_bytes:
+            check_size(self.chars, self.limits)
+        pieces = text.split('\n')
+        if len(pieces) > 1:
+            self._check_line(self._partial + pieces[0])
+            for piece in pieces[1:-1]:
+                self._check_line(piece)
+            self._partial = ''
+        self._partial += pieces[-1]
+        if len(self._partial) > self.limits.max_line_chars:
+            self._too_long(self.line + 1)
+
+    def close(self):
+        if self._partial:
+            self._check_line(self._partial)
+            self._partial = ''
+
+    def _check_line(self, line: str):
+        self.line += 1
+        if len(line) > self.limits.max_line_chars and len(line.rstrip('\r')) > self.limits.max_line_chars:
+            self._too_long(self.line)
+        if '{' in line or '}' in line:
+            self.depth = max(self.depth + brace_delta(line), 0)
+            if self.depth > self.limits.max_brace_depth:
+                raise InputLimitError(
+                    'LIMIT-003', f"Braces are nested more than {self.limits.max_brace_depth} levels deep",
+                    line=self.line, suggestion="Look for '{' without a matching '}' above this line")
+
+    def _too_long(self, line: int):
+        raise InputLimitError(
+            'LIMIT-002', f"Line is longer than {self.limits.max_line_chars:,} characters",
+            line=line, suggestion="EBL statements fit on a line; check for a missing line break or binary data")
+
+
+def check_text(text: str, limits: ParseLimits):
+    """All pre-flight checks on text already in memory"""
+    # UTF-8 takes at most 4 bytes per character
+    if len(text) * 4 > limits.max_file_bytes:
+        check_size(len(text.encode('utf-8')), limits)
+    guard = InputGuard(limits)
+    guard.feed(text)
+    guard.close()
+
+
+class TooManySyntaxErrors(InputLimitError):
+    """Raised by BoundedErrorStrategy to abandon a parse"""
+
+
+class BoundedErrorStrategy(DefaultErrorStrategy):
+    """DefaultErrorStrategy that gives up after max_errors reported syntax errors"""
+
+    def __init__(self, max_errors: int):
+        super().__init__()
+        self.max_errors = max_errors
+
+    def _bail_if_over(self, recognizer):
+        count = recognizer.getNumberOfSyntaxErrors()
+        if count >= self.max_errors:
+            token = recognizer.getCurrentToken()
+            raise TooManySyntaxErrors(
+                'LIMIT-004', f"Stopped parsing after {count} syntax errors",
+                line=token.line if token is not None else None,
+                suggestion="Fix the first errors (often an unterminated block) and validate again")
+
+    def reportError(self, recognizer, e):
+        super().reportError(recognizer, e)
+        self._bail_if_over(recognizer)
+
+    def reportUnwantedToken(self, recognizer):
+        super().reportUnwantedToken(recognizer)
+        self._bail_if_over(recognizer)
+
+    def reportMissingToken(self, recognizer):
+        super().reportMissingToken(recognizer)
+        self._bail_if_over(recognizer)
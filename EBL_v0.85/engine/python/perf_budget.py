@@ -0,0 +1,236 @@
+"""
+EBL Engine - Performance Budgets
+Parse time, peak memory and parse-tree size of a corpus against stored baselines
+
+A baselines file names a vertical, example files (relative to the baselines
+file) and sizes of generated files, and holds the last recorded measurement
+of each:
+
+    {
+      "vertical": "banking",
+      "files": ["../../examples/MortgageLoanApplication.ebl"],
+      "generated": [200],
+      "tolerance": {"parseUnits": 2.5, "peakKiB": 1.5, "nodes": 1.05},
+      "baselines": {"MortgageLoanApplication.ebl": {"parseUnits": 41.2, "peakKiB": 2210, "nodes": 1978}}
+    }
+
+Every file is parsed block by block, as streaming validation and the language
+server do. Three figures are recorded per file:
+- parseUnits: parse time divided by the time of a fixed pure-Python
+  calibration loop run just before it, best of several rounds, so budgets
+  carry over between machines and clock-speed changes
+- peakKiB: the tracemalloc peak during one parse
+- nodes: the number of parse-tree nodes, which follows grammar changes exactly
+
+A measurement is over budget when it exceeds its baseline times the
+tolerance. check_budgets returns the lines of a diff for each breach, with
+the baseline, the budget and the measured value.
+
+Usage:
+    python perf_budget.py [--update] <baselines.json>
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ebl_blocks import split_blocks
+from vertical_engine import VerticalEngine
+
+DEFAULT_TOLERANCE = {'parseUnits': 2.5, 'peakKiB': 1.5, 'nodes': 1.05}
+
+GENERATED_BLOCKS = '''DataObject DO_Generated{n} {{
+  Schema:
+    Id: UUID, required, unique
+    Amount: Currency, required
+    Counterparty: String, required
+    ValueDate: Date
+    Reference: String
+  Policies:
+    - Retain 7 years
+  Resources:
+    Input: {{ Channel: API, Protocol: REST, Endpoint: "/generated/{n}", Auth: OAuth2, Format: JSON, SLA: "1s" }}
+    Output: {{ Channel: API, Protocol: REST, Endpoint: "/generated/{n}", Auth: OAuth2, Format: JSON, SLA: "1s" }}
+  erMap: Generated{n}
+}}
+
+Process GeneratedFlow{n} {{
+  Description: "Generated process {n}"
+  Actors: [PaymentProcessor, FraudAnalyst]
+  Starts With: Event Received{n}(DO_Generated{n})
+
+  Step Review{n} {{
+    Actions:
+      - PaymentProcessor Review DO_Generated{n}
+      - FraudAnalyst Screen DO_Generated{n}
+  }}
+
+  Step Settle{n} {{
+    Actions:
+      - PaymentProcessor Settle DO_Generated{n}
+  }}
+  Ends With: Event Settled{n}(DO_Generated{n})
+}}
+
+'''
+
+
+@dataclass
+class Measurement:
+    """Cost of parsing one file"""
+    parseUnits: float
+    peakKiB: int
+    nodes: int
+
+
+def _calibration_work() -> int:
+    # Dict, string and attribute traffic like the lexer's inner loop
+    counts: Dict[str, int] = {}
+    for i in range(20000):
+        key = 'k' + str(i % 97)
+        counts[key] = counts.get(key, 0) + len(key)
+    return sum(counts.values())
+
+
+def calibrate(rounds: int = 3) -> float:
+    """Seconds taken by the calibration loop on this machine (best of rounds)"""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        _calibration_work()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _timed(work) -> float:
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        work()
+        return time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def generated_text(blocks: int) -> str:
+    """Deterministic banking file of blocks DataObject/Process pairs"""
+    return ('# Domain: Banking\nMetadata:\n  Version: 0.85\n  Name: Generated\n\n'
+            + ''.join(GENERATED_BLOCKS.format(n=n) for n in range(blocks)))
+
+
+def count_nodes(tree) -> int:
+    """Rule and terminal nodes of a parse tree"""
+    count, stack = 0, [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(getattr(node, 'children', None) or ())
+    return count
+
+
+def _parse_all(engine: VerticalEngine, vertical: str, text: str) -> int:
+    return sum(count_nodes(engine.parse_block(vertical, block).tree) for block in split_blocks(text))
+
+
+def measure(engine: VerticalEngine, vertical: str, text: str, repeat: int = 5) -> Measurement:
+    """Best parse time in calibration units, tracemalloc peak and node count of text"""
+    nodes = _parse_all(engine, vertical, text)  # Also warms the grammar
+    best = float('inf')
+    for _ in range(repeat):
+        unit = calibrate()
+        best = min(best, _timed(lambda: _parse_all(engine, vertical, text)) / unit)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _parse_all(engine, vertical, text)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Measurement(round(best, 2), peak // 1024, nodes)
+
+
+class BudgetFile:
+    """A baselines file and the corpus it describes"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        self.vertical: str = self.data['vertical']
+        self.tolerance: Dict[str, float] = {**DEFAULT_TOLERANCE, **self.data.get('tolerance', {})}
+        self.baselines: Dict[str, Dict] = self.data.get('baselines', {})
+
+    def corpus(self) -> List[Tuple[str, str]]:
+        """(name, text) of every file to measure"""
+        items = []
+        for name in self.data.get('files', []):
+            path = (self.path.parent / name).resolve()
+            items.append((path.name, path.read_text(encoding='utf-8')))
+        for blocks in self.data.get('generated', []):
+            items.append((f"generated_{blocks}_blocks", generated_text(blocks)))
+        return items
+
+    def measure_all(self, engine: Optional[VerticalEngine] = None) -> Dict[str, Measurement]:
+        engine = engine or VerticalEngine()
+        return {name: measure(engine, self.vertical, text) for name, text in self.corpus()}
+
+    def save(self, measured: Dict[str, Measurement]):
+        """Record measurements as the new baselines"""
+        self.data['baselines'] = {name: asdict(m) for name, m in measured.items()}
+        self.baselines = self.data['baselines']
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+            f.write('\n')
+
+
+def check_budgets(budgets: BudgetFile, measured: Dict[str, Measurement]) -> List[str]:
+    """Diff lines for every measurement over its budget (empty when all are within)"""
+    lines = []
+    for name, measurement in measured.items():
+        baseline = budgets.baselines.get(name)
+        if baseline is None:
+            lines.append(f"{name}: no baseline; run perf_budget.py --update {budgets.path}")
+            continue
+        for metric, value in asdict(measurement).items():
+            budget = baseline[metric] * budgets.tolerance[metric]
+            if value > budget:
+                lines.append(f"{name} {metric}: {value:g} > budget {budget:g} "
+                             f"(baseline {baseline[metric]:g} x {budgets.tolerance[metric]:g}, "
+                             f"{100 * (value / baseline[metric] - 1):+.0f}% vs baseline)")
+    return lines
+
+
+def main(argv: List[str]):
+    args = [a for a in argv[1:] if a != '--update']
+    if len(args) != 1:
+        print("Usage: python perf_budget.py [--update] <baselines.json>")
+        sys.exit(1)
+
+    budgets = BudgetFile(args[0])
+    measured = budgets.measure_all()
+    print(f"{'file':<36} {'parseUnits':>10} {'peakKiB':>8} {'nodes':>7}   baseline")
+    for name, m in measured.items():
+        base = budgets.baselines.get(name)
+        shown = f"{base['parseUnits']:g} / {base['peakKiB']} / {base['nodes']}" if base else '-'
+        print(f"{name:<36} {m.parseUnits:>10g} {m.peakKiB:>8} {m.nodes:>7}   {shown}")
+
+    if '--update' in argv:
+        budgets.save(measured)
+        print(f"\n💾 Baselines written to {budgets.path}")
+        sys.exit(0)
+    breaches = check_budgets(budgets, measured)
+    for line in breaches:
+        print(f"❌ {line}")
+    print(f"\n{'❌' if breaches else '✅'} {len(breaches)} budgets exceeded")
+    sys.exit(1 if breaches else 0)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,278 @@
+"""
+EBL Engine - Rule Packs
+Data-driven per-vertical settings and semantic rules
+
+Each vertical is described by engine/rule_packs/<vertical>.json: the grammar
+and dictionary to load, the wording used in dictionary messages, and a list
+of keyword-driven semantic rules. A semantic rule fires when its `when` regex
+matches the EBL text, its optional `requires` regex (or every regex of a list)
+also matches, and its optional `unless` regex does not. With `forEach`, one
+issue is reported per distinct `when` match, in the order of the `when`
+alternatives, and `{match}` in the message is replaced by it. An
+optional segregationOfDuties entry lists conflicting verb pairs, checked per
+Process by sod_analysis.py (SOD-001, or its `rule`) after the keyword rules.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from sod_analysis import ConflictMatrix
+
+
+class Severity(Enum):
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+
+
+@dataclass
+class SemanticIssue:
+    """Represents a semantic validation issue"""
+    severity: Severity
+    rule: str
+    message: str
+    location: Optional[str] = None
+    suggestion: Optional[str] = None
+    line: Optional[int] = None  # 1-based line of the first triggering match
+
+
+def _line_of(content: str, offset: int) -> int:
+    return content.count('\n', 0, offset) + 1
+
+
+def _alternatives(pattern: str) -> List[str]:
+    """Top-level alternatives of a regex ('A|B(?:C|D)' -> ['A', 'B(?:C|D)'])"""
+    alternatives, start, depth, in_class = [], 0, 0, False
+    chars = iter(enumerate(pattern))
+    for i, c in chars:
+        if c == '\\':
+            next(chars, None)
+        elif in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == '|' and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+@dataclass
+class SemanticRule:
+    """One keyword-driven semantic rule"""
+    rule: str
+    severity: Severity
+    message: str
+    when: 're.Pattern'
+    requires: List['re.Pattern'] = field(default_factory=list)  # All must match
+    unless: Optional['re.Pattern'] = None
+    for_each: bool = False
+    suggestion: Optional[str] = None
+    order: List['re.Pattern'] = field(default_factory=list)  # `when` alternatives, in pack order
+
+    @classmethod
+    def from_data(cls, data: Dict) -> 'SemanticRule':
+        """Build a rule from its rule pack JSON entry"""
+        requires = data.get('requires') or []
+        if isinstance(requires, str):
+            requires = [requires]
+        return cls(
+            rule=data['rule'],
+            severity=Severity(data.get('severity', 'warning')),
+            message=data['message'],
+            when=re.compile(data['when']),
+            requires=[re.compile(r) for r in requires],
+            unless=re.compile(data['unless']) if data.get('unless') else None,
+            for_each=data.get('forEach', False),
+            suggestion=data.get('suggestion'),
+            order=[re.compile(a) for a in _alternatives(data['when'])] if data.get('forEach') else [],
+        )
+
+    def evaluate(self, content: str) -> List[SemanticIssue]:
+        """Issues raised by this rule for the given EBL text"""
+        if not all(r.search(content) for r in self.requires):
+            return []
+        if self.unless and self.unless.search(content):
+            return []
+
+        first_lines = {}
+        if not self.for_each:
+            match = self.when.search(content)
+            if match:
+                first_lines[match.group(0)] = _line_of(content, match.start())
+        else:
+            for match in self.when.finditer(content):
+                if match.group(0) not in first_lines:
+                    first_lines[match.group(0)] = _line_of(content, match.start())
+        return self.issues(first_lines)
+
+    def issues(self, first_lines: Dict[str, int]) -> List[SemanticIssue]:
+        """Issues for the first line of each distinct `when` match"""
+        if not first_lines:
+            return []
+        if not self.for_each:
+            line = next(iter(first_lines.values()))
+            return [SemanticIssue(self.severity, self.rule, self.message, suggestion=self.suggestion, line=line)]
+        return [
+            SemanticIssue(self.severity, self.rule, self.message.format(match=text), suggestion=self.suggestion,
+                          line=line)
+            for text, line in sorted(first_lines.items(), key=lambda item: self._rank(item[0]))
+        ]
+
+    def _rank(self, text: str) -> int:
+        """Index of the first `when` alternative that matches text"""
+        return next((k for k, alternative in enumerate(self.order) if alternative.fullmatch(text)), len(self.order))
+
+
+class SemanticScan:
+    """
+    Semantic rules over a file fed in consecutive chunks (e.g. one block at a time)
+
+    Keeps only per-rule flags and the first line of each distinct match, so
+    memory does not grow with the file. Matches spanning two chunks are not
+    seen; rule patterns are keyword-sized, so chunks should end at line
+    boundaries.
+    """
+
+    def __init__(self, rules: List[SemanticRule], segregation_of_duties: Optional['ConflictMatrix'] = None):
+        self.rules = rules
+        self._sod = segregation_of_duties.scan() if segregation_of_duties else None
+        self.line = 1  # Line number of the next chunk's first line
+        self._required = [set(range(len(rule.requires))) for rule in rules]  # Patterns not seen yet
+        self._excluded = [False] * len(rules)
+        self._first_lines: List[Dict[str, int]] = [{} for _ in rules]
+
+    def feed(self, chunk: str):
+        for k, rule in enumerate(self.rules):
+            if self._excluded[k]:
+                continue
+            if rule.unless and rule.unless.search(chunk):
+                self._excluded[k] = True
+                continue
+            pending = self._required[k]
+            for r in list(pending):
+                if rule.requires[r].search(chunk):
+                    pending.discard(r)
+
+            first_lines = self._first_lines[k]
+            if not rule.for_each:
+                if not first_lines:
+                    match = rule.when.search(chunk)
+                    if match:
+                        first_lines[match.group(0)] = self.line - 1 + _line_of(chunk, match.start())
+            else:
+                for match in rule.when.finditer(chunk):
+                    if match.group(0) not in first_lines:
+                        first_lines[match.group(0)] = self.line - 1 + _line_of(chunk, match.start())
+        if self._sod:
+            self._sod.feed(chunk)
+        self.line += chunk.count('\n')
+
+    def issues(self) -> List[SemanticIssue]:
+        issues = []
+        for k, rule in enumerate(self.rules):
+            if not self._required[k] and not self._excluded[k]:
+                issues.extend(rule.issues(self._first_lines[k]))
+        if self._sod:
+            issues.extend(self._sod.close())
+        return issues
+
+
+@dataclass
+class RulePack:
+    """Everything that differs between verticals"""
+    vertical: str
+    title: str
+    grammar: str
+    dictionary: str
+    verb_hint: Optional[str] = None
+    data_object_pattern: Optional[str] = None
+    semantic_rules: List[SemanticRule] = field(default_factory=list)
+    segregation_of_duties: Optional['ConflictMatrix'] = None
+    data: Dict = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        """Vertical name used in messages (e.g. 'banking dictionary')"""
+        return self.title.lower()
+
+    @classmethod
+    def load(cls, path: str) -> 'RulePack':
+        """Load a rule pack JSON file"""
+        from sod_analysis import ConflictMatrix
+
+        with open(path, 'r') as f:
+            data = json.load(f)
+        sod = data.get('segregationOfDuties')
+        return cls(
+            vertical=data['vertical'],
+            title=data['title'],
+            grammar=data['grammar'],
+            dictionary=data['dictionary'],
+            verb_hint=data.get('verbHint'),
+            data_object_pattern=data.get('dataObjectPattern'),
+            semantic_rules=[SemanticRule.from_data(r) for r in data.get('semanticRules', [])],
+            segregation_of_duties=ConflictMatrix.from_data(sod) if sod else None,
+            data=data,
+        )
+
+    def check_semantics(self, content: str) -> List[SemanticIssue]:
+        """Run every semantic rule of the pack"""
+        issues = []
+        for rule in self.semantic_rules:
+            issues.extend(rule.evaluate(content))
+        if self.segregation_of_duties:
+            issues.extend(self.segregation_of_duties.check_text(content))
+        return issues
+
+    def semantic_scan(self) -> SemanticScan:
+        """Incremental check_semantics for text arriving in chunks"""
+        return SemanticScan(self.semantic_rules, self.segregation_of_duties)
+
+
+def format_semantic_report(title: str, issues: List[SemanticIssue]) -> str:
+    """Generate formatted semantic validation report"""
+    report = []
+    report.append("=" * 80)
+    report.append(title)
+    report.append("=" * 80)
+
+    if not issues:
+        report.append("\n✅ SEMANTIC VALIDATION PASSED - No issues found")
+    else:
+        sections = (
+            (Severity.ERROR, "❌ ERRORS"),
+            (Severity.WARNING, "⚠️  WARNINGS"),
+            (Severity.INFO, "ℹ️  INFORMATION"),
+        )
+        for severity, heading in sections:
+            group = [i for i in issues if i.severity == severity]
+            if not group:
+                continue
+            report.append(f"\n{heading} ({len(group)}):")
+            for i, issue in enumerate(group, 1):
+                report.append(f"\n  {i}. [{issue.rule}] {issue.message}")
+                if issue.suggestion:
+                    report.append(f"     💡 {issue.suggestion}")
+
+    report.append("\n" + "=" * 80)
+    return "\n".join(report)
+
+
+def load_rule_packs(rule_pack_dir: str) -> Dict[str, RulePack]:
+    """Load every rule pack in a directory, keyed by vertical"""
+    packs = {}
+    for path in sorted(Path(rule_pack_dir).glob('*.json')):
+        pack = RulePack.load(str(path))
+        packs[pack.vertical] = pack
+    return packs
@@ -0,0 +1,375 @@
+"""
+EBL Engine - Shared-Memory Dictionaries
+Compiles vertical dictionaries once into flat shared-memory segments that pool
+workers attach to read-only
+
+Segment layout (native byte order, every section 8-byte aligned):
+
+    header     magic 'EBLD', format version, section count
+    sections   (name, offset, length) per section
+    strings    interned string table: sorted UTF-8 blob + offsets; a string's
+               ID is its rank, so sorted ID arrays are sorted by name too
+    sets       actors, verbs, entities, ... as sorted uint32 ID arrays
+    maps       actorVerbs / readPerms / writePerms: sorted actor IDs, member
+               counts and one bitset row (over string IDs) per actor
+    names      original spellings per kind, for suggestions and completion
+
+SharedDictionary exposes the same attributes and methods as VerticalDictionary,
+backed by views over the segment, so attaching costs no JSON parsing and no
+per-worker copy. Name-to-ID lookups are binary searches over the string table,
+memoized per worker for the names a worker actually sees.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Set as AbstractSet
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from vertical_validator import VerticalDictionary
+
+try:
+    import _posixshmem
+except ImportError:  # Windows: attach through SharedMemory instead
+    _posixshmem = None
+
+MAGIC = b'EBLD'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('=4sII')
+SECTION = struct.Struct('=24sQQ')
+
+SET_SECTIONS = {
+    'actors': 'actors',
+    'verbs': 'verbs',
+    'entities': 'entities',
+    'data_objects': 'dataObjects',
+    'relationship_types': 'relationshipTypes',
+    'all_permitted_verbs': 'permittedVerbs',
+    'reserved_keywords': 'reserved',
+}
+MAP_SECTIONS = {
+    'actor_verbs': 'actorVerbs',
+    'actor_read_perms': 'readPerms',
+    'actor_write_perms': 'writePerms',
+}
+NAME_KINDS = ('actor', 'verb', 'entity', 'dataObject')
+
+assert array('I').itemsize == 4
+
+
+def _ids(values: Iterable[int]) -> bytes:
+    return array('I', values).tobytes()
+
+
+def compile_dictionary(dictionary: VerticalDictionary) -> bytes:
+    """Flatten a loaded dictionary into the segment layout"""
+    sets = {attr: getattr(dictionary, attr) for attr in SET_SECTIONS}
+    maps = {attr: getattr(dictionary, attr) for attr in MAP_SECTIONS}
+    names = {kind: dictionary.names(kind) for kind in NAME_KINDS}
+
+    strings = set(dictionary.verb_permissions) | set(dictionary.verb_permissions.values())
+    for members in sets.values():
+        strings |= members
+    for mapping in maps.values():
+        for actor, members in mapping.items():
+            strings.add(actor)
+            strings |= members
+    for spelled in names.values():
+        strings.update(spelled)
+    encoded = sorted(s.encode('utf-8') for s in strings)
+    ids = {s.decode('utf-8'): i for i, s in enumerate(encoded)}
+    row_bytes = (len(encoded) + 7) // 8
+
+    offsets = [0]
+    for s in encoded:
+        offsets.append(offsets[-1] + len(s))
+    sections: List[Tuple[str, bytes]] = [('strings.offsets', _ids(offsets)), ('strings.blob', b''.join(encoded))]
+
+    for attr, name in SET_SECTIONS.items():
+        sections.append((name, _ids(sorted(ids[s] for s in sets[attr]))))
+
+    verbs = sorted(dictionary.verb_permissions, key=ids.get)
+    sections.append(('verbPerm.keys', _ids(ids[v] for v in verbs)))
+    sections.append(('verbPerm.values', _ids(ids[dictionary.verb_permissions[v]] for v in verbs)))
+
+    for attr, name in MAP_SECTIONS.items():
+        # Empty sets mean "no restriction" and are left out, like in VerticalDictionary
+        actors = sorted((a for a, members in maps[attr].items() if members), key=ids.get)
+        bits = bytearray(row_bytes * len(actors))
+        for row, actor in enumerate(actors):
+            for member in maps[attr][actor]:
+                i = ids[member]
+                bits[row * row_bytes + (i >> 3)] |= 1 << (i & 7)
+        sections.append((f'{name}.keys', _ids(ids[a] for a in actors)))
+        sections.append((f'{name}.counts', _ids(len(maps[attr][a]) for a in actors)))
+        sections.append((f'{name}.bits', bytes(bits)))
+
+    for kind in NAME_KINDS:
+        sections.append((f'names.{kind}', _ids(ids[s] for s in names[kind])))
+
+    table_end = HEADER.size + SECTION.size * len(sections)
+    offset = (table_end + 7) & ~7
+    table, body = [], bytearray()
+    for name, data in sections:
+        table.append(SECTION.pack(name.encode('ascii'), offset + len(body), len(data)))
+        body += data
+        body += b'\0' * (-len(body) % 8)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)) + b''.join(table)
+    return header + b'\0' * (offset - len(header)) + bytes(body)
+
+
+class StringTable:
+    """Interned strings of a segment, looked up by ID or by value"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+        self._ids: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _bytes(self, i: int) -> bytes:
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]])
+
+    def string(self, i: int) -> str:
+        return self._bytes(i).decode('utf-8')
+
+    def id_of(self, s: str) -> Optional[int]:
+        """ID of a string, or None if it is not interned"""
+        try:
+            return self._ids[s]
+        except KeyError:
+            pass
+        key = s.encode('utf-8')
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        i = lo if lo < len(self) and self._bytes(lo) == key else None
+        self._ids[s] = i
+        return i
+
+
+def _contains(ids: memoryview, i: Optional[int]) -> bool:
+    if i is None:
+        return False
+    j = bisect_left(ids, i)
+    return j < len(ids) and ids[j] == i
+
+
+class IdSet(AbstractSet):
+    """Read-only set of strings backed by a sorted ID array"""
+
+    def __init__(self, strings: StringTable, ids: memoryview):
+        self._strings = strings
+        self._ids = ids
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, s) -> bool:
+        return isinstance(s, str) and _contains(self._ids, self._strings.id_of(s))
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._strings.string(i) for i in self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class BitsetRow(AbstractSet):
+    """Read-only set of strings backed by one bitset row over string IDs"""
+
+    def __init__(self, strings: StringTable, bits: memoryview, count: int):
+        self._strings = strings
+        self._bits = bits
+        self._count = count
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, s) -> bool:
+        i = self._strings.id_of(s) if isinstance(s, str) else None
+        return i is not None and bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield self._strings.string(byte_index * 8 + low.bit_length() - 1)
+                byte ^= low
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class BitsetMap(Mapping):
+    """Read-only actor -> BitsetRow mapping"""
+
+    def __init__(self, strings: StringTable, keys: memoryview, counts: memoryview, bits: memoryview):
+        self._strings = strings
+        self._keys = keys
+        self._counts = counts
+        self._bits = bits
+        self._row_bytes = (len(strings) + 7) // 8
+
+    def __getitem__(self, actor: str) -> BitsetRow:
+        i = self._strings.id_of(actor) if isinstance(actor, str) else None
+        if not _contains(self._keys, i):
+            raise KeyError(actor)
+        row = bisect_left(self._keys, i)
+        start = row * self._row_bytes
+        return BitsetRow(self._strings, self._bits[start:start + self._row_bytes], self._counts[row])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._strings.string(i) for i in self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class IdMap(Mapping):
+    """Read-only string -> string mapping over parallel ID arrays"""
+
+    def __init__(self, strings: StringTable, keys: memoryview, values: memoryview):
+        self._strings = strings
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str) -> str:
+        i = self._strings.id_of(key) if isinstance(key, str) else None
+        if not _contains(self._keys, i):
+            raise KeyError(key)
+        return self._strings.string(self._values[bisect_left(self._keys, i)])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._strings.string(i) for i in self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _attach_readonly(name: str):
+    """Read-only (buffer, handle) for a segment created by SharedMemoryDictionaries"""
+    if _posixshmem is None:
+        segment = shared_memory.SharedMemory(name)
+        return segment.buf, segment
+    fd = _posixshmem.shm_open(name if name.startswith('/') else '/' + name, os.O_RDONLY, mode=0o600)
+    try:
+        mapped = mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+    return memoryview(mapped), mapped
+
+
+class SharedDictionary(VerticalDictionary):
+    """VerticalDictionary over a compiled segment; nothing is copied on attach"""
+
+    def __init__(self, buffer, handle=None):
+        """
+        Args:
+            buffer: Segment contents (bytes, memoryview or mmap)
+            handle: Object keeping the buffer mapped (closed by close())
+        """
+        view = memoryview(buffer)
+        magic, version, count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not an EBL dictionary segment (magic {magic!r}, version {version})")
+        sections = {}
+        for n in range(count):
+            name, offset, length = SECTION.unpack_from(view, HEADER.size + n * SECTION.size)
+            sections[name.rstrip(b'\0').decode('ascii')] = view[offset:offset + length]
+
+        def ids(name: str) -> memoryview:
+            return sections[name].cast('I')
+
+        self._handle = handle
+        self._view = view
+        self.dict = None
+        self.strings = StringTable(ids('strings.offsets'), sections['strings.blob'])
+        for attr, name in SET_SECTIONS.items():
+            setattr(self, attr, IdSet(self.strings, ids(name)))
+        self.verb_permissions = IdMap(self.strings, ids('verbPerm.keys'), ids('verbPerm.values'))
+        for attr, name in MAP_SECTIONS.items():
+            setattr(self, attr, BitsetMap(self.strings, ids(f'{name}.keys'), ids(f'{name}.counts'),
+                                          sections[f'{name}.bits']))
+        self._name_ids = {kind: ids(f'names.{kind}') for kind in NAME_KINDS}
+        self._name_lists: Dict[str, List[str]] = {}
+        self._name_indexes = {}
+
+    @classmethod
+    def attach(cls, segment_name: str) -> 'SharedDictionary':
+        """Attach read-only to a segment by name"""
+        buffer, handle = _attach_readonly(segment_name)
+        return cls(buffer, handle)
+
+    def names(self, kind: str) -> List[str]:
+        """Dictionary names of one kind, decoded on first use"""
+        if kind not in self._name_lists:
+            self._name_lists[kind] = [self.strings.string(i) for i in self._name_ids[kind]]
+        return self._name_lists[kind]
+
+    def name_index(self, kind: str):
+        self.names(kind)
+        return super().name_index(kind)
+
+
+class SharedMemoryDictionaries:
+    """
+    Parent-side owner of one segment per vertical
+
+    Build it before starting the pool, pass `segments` to the workers and
+    close it once the pool has shut down.
+    """
+
+    def __init__(self, dictionaries: Dict[str, VerticalDictionary]):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        try:
+            for vertical, dictionary in dictionaries.items():
+                payload = compile_dictionary(dictionary)
+                segment = shared_memory.SharedMemory(create=True, size=len(payload))
+                segment.buf[:len(payload)] = payload
+                self._segments[vertical] = segment
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def from_engine(cls, engine, verticals: Optional[Iterable[str]] = None) -> 'SharedMemoryDictionaries':
+        """Compile the default dictionary of each vertical (default: all)"""
+        return cls({v: engine.dictionary(v) for v in (verticals or engine.verticals())})
+
+    @property
+    def segments(self) -> Dict[str, str]:
+        """vertical -> segment name, picklable for worker initializers"""
+        return {vertical: segment.name for vertical, segment in self._segments.items()}
+
+    def nbytes(self) -> int:
+        return sum(segment.size for segment in self._segments.values())
+
+    def close(self):
+        for segment in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_dictionaries(engine, segments: Dict[str, str]):
+    """Install shared dictionaries into a worker's engine"""
+    for vertical, segment_name in segments.items():
+        engine.install_dictionary(vertical, SharedDictionary.attach(segment_name))
@@ -0,0 +1,369 @@
+"""
+EBL Engine - Segregation of Duties
+Actors who perform both verbs of a conflicting pair within one Process
+
+Conflicting verb pairs (Create/Approve, Originate/Underwrite, ...) come from
+the rule pack's segregationOfDuties entry. A verb of a pair also covers the
+compound verbs it starts, so Create covers CreateTransaction. Every verb
+named by a pair is one bit. Each verb an Action uses is mapped once to the
+bits it matches, and an actor's verb set in a Process is the OR of those
+masks. A pair conflicts when both of its bits are set, so a Process costs one
+OR per Action plus one AND per actor and pair, however many Actions it has.
+Actions come from the line scan in ebl_usage.py.
+
+| Rule    | Finding                                                        |
+|---------|----------------------------------------------------------------|
+| SOD-001 | An actor performs both verbs of a pair in one Process          |
+| SOD-002 | actorVerbs grants an actor both verbs of a pair (corpus report)|
+
+SOD-001 runs with the vertical's semantic rules, under the pack's `rule` id if
+it sets one (SOX-001 for banking). The corpus report checks
+every actor in actorVerbs against every Process of the given files.
+
+Usage:
+    python sod_analysis.py [--vertical NAME] [--csv FILE] <file_or_dir> [...]
+"""
+
+import csv
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ebl_blocks import BLOCK_START, Block, at_margin, brace_delta, iter_blocks, margin_of
+from ebl_usage import ActionUse, FileUsage, ProcessUse, scan_process, scan_usage
+from rule_packs import SemanticIssue, Severity
+from vertical_validator import VerticalDictionary, canonicalize
+
+PROCESS_RULE = 'SOD-001'
+GRANT_RULE = 'SOD-002'
+
+WORD_CHARS = re.compile(r'[^A-Za-z0-9_]+')
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class ConflictPair:
+    """Two verbs one actor must not both perform in a Process"""
+    first: str
+    second: str
+    first_bit: int
+    second_bit: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.first}/{self.second}"
+
+    @property
+    def mask(self) -> int:
+        return 1 << self.first_bit | 1 << self.second_bit
+
+
+@dataclass
+class SodConflict:
+    """One actor performing both verbs of a pair in one Process"""
+    process: str
+    process_line: int
+    actor: str
+    pair: ConflictPair
+    first: ActionUse   # First Action matching pair.first
+    second: ActionUse  # First Action matching pair.second
+    path: Optional[str] = None
+
+
+class ConflictMatrix:
+    """Conflicting verb pairs compiled to bit masks"""
+
+    def __init__(self, pairs: Iterable[Sequence[str]], severity: Severity = Severity.WARNING,
+                 rule: str = PROCESS_RULE):
+        self.severity = severity
+        self.rule = rule
+        self.verbs: List[str] = []  # Bit -> verb as configured
+        self._keys: List[str] = []  # Bit -> canonical verb
+        self.pairs: List[ConflictPair] = []
+        for first, second in pairs:
+            if canonicalize(first) == canonicalize(second):
+                raise ValueError(f"Conflicting verb pair '{first}/{second}' names one verb twice")
+            self.pairs.append(ConflictPair(first, second, self._bit(first), self._bit(second)))
+        self._verb_masks: Dict[str, int] = {}
+        self._conflicts: Dict[int, List[ConflictPair]] = {}
+
+    @classmethod
+    def from_data(cls, data: Dict) -> 'ConflictMatrix':
+        """Build from a rule pack's segregationOfDuties entry"""
+        return cls(data['conflicts'], Severity(data.get('severity', 'warning')), data.get('rule', PROCESS_RULE))
+
+    def _bit(self, verb: str) -> int:
+        key = canonicalize(verb)
+        if key not in self._keys:
+            self._keys.append(key)
+            self.verbs.append(verb)
+        return self._keys.index(key)
+
+    def verb_mask(self, verb: str) -> int:
+        """Bits of the pair verbs that verb is, or starts (CreateTransaction -> Create)"""
+        mask = self._verb_masks.get(verb)
+        if mask is None:
+            mask = 0
+            key = canonicalize(verb)
+            plain = WORD_CHARS.sub('', verb)  # Same length as key, case kept
+            for bit, side in enumerate(self._keys):
+                if key == side or (key.startswith(side) and not plain[len(side)].islower()):
+                    mask |= 1 << bit
+            self._verb_masks[verb] = mask
+        return mask
+
+    def conflicts(self, mask: int) -> List[ConflictPair]:
+        """Pairs whose two verbs are both in mask (memoized per mask)"""
+        if not mask & (mask - 1):
+            return []
+        pairs = self._conflicts.get(mask)
+        if pairs is None:
+            pairs = self._conflicts[mask] = [p for p in self.pairs if mask & p.mask == p.mask]
+        return pairs
+
+    def process_conflicts(self, process: ProcessUse, path: Optional[str] = None) -> List[SodConflict]:
+        """Conflicts of every actor in one Process, in order of first Action"""
+        masks: Dict[str, int] = {}
+        first_actions: Dict[Tuple[str, int], ActionUse] = {}
+        for action in process.actions:
+            verb_mask = self.verb_mask(action.verb)
+            if not verb_mask:
+                continue
+            actor = canonicalize(action.actor)
+            new = verb_mask & ~masks.get(actor, 0)
+            if new:
+                masks[actor] = masks.get(actor, 0) | new
+                for bit in _bits(new):
+                    first_actions[actor, bit] = action
+        conflicts = []
+        for actor, mask in masks.items():
+            for pair in self.conflicts(mask):
+                first, second = first_actions[actor, pair.first_bit], first_actions[actor, pair.second_bit]
+                conflicts.append(SodConflict(process.name, process.line, first.actor, pair, first, second, path))
+        return conflicts
+
+    def grant_conflicts(self, dictionary: VerticalDictionary) -> Dict[str, List[ConflictPair]]:
+        """Pairs whose two verbs actorVerbs grants to one actor, per actor as spelled in the JSON"""
+        granted = {}
+        for actor, verbs in (dictionary.dict or {}).get('domain', {}).get('actorVerbs', {}).items():
+            mask = 0
+            for verb in verbs:
+                mask |= self.verb_mask(verb)
+            pairs = self.conflicts(mask)
+            if pairs:
+                granted[actor] = pairs
+        return granted
+
+    def issue(self, conflict: SodConflict) -> SemanticIssue:
+        """SOD-001 semantic issue at the second of the two Actions"""
+        first, second = sorted((conflict.first, conflict.second), key=lambda a: a.line)
+        return SemanticIssue(
+            self.severity,
+            self.rule,
+            f"Segregation of duties: '{conflict.actor}' performs both {first.verb} (line {first.line}) "
+            f"and {second.verb} (line {second.line}) in Process {conflict.process}",
+            location=f"Process {conflict.process}",
+            suggestion=f"Assign {conflict.pair.first} and {conflict.pair.second} to different actors",
+            line=second.line,
+        )
+
+    def check_text(self, text: str) -> List[SemanticIssue]:
+        """SOD-001 issues of every Process in EBL text"""
+        issues = []
+        for block in iter_blocks(text.split('\n')):
+            if block.kind == 'Process':
+                issues.extend(self.issue(c) for c in self.process_conflicts(scan_process(block)))
+        return issues
+
+    def scan(self) -> 'SodScan':
+        """Incremental check_text for text arriving in chunks"""
+        return SodScan(self)
+
+
+class SodScan:
+    """
+    check_text over text fed in arbitrary chunks
+
+    Splits blocks as iter_blocks does, one line at a time, and holds only
+    the lines of the current Process block.
+    """
+
+    def __init__(self, matrix: ConflictMatrix):
+        self.matrix = matrix
+        self.issues: List[SemanticIssue] = []
+        self._partial = ''
+        self._line = 0        # Number of the last complete line
+        self._kind: Optional[str] = None
+        self._depth = 0
+        self._body: Optional[List[str]] = None  # Lines of the open Process block
+        self._start = 0
+        self._margin: Optional[str] = None
+
+    def feed(self, chunk: str):
+        lines = (self._partial + chunk).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._feed_line(line)
+
+    def _feed_line(self, line: str):
+        self._line += 1
+        if self._margin is None:
+            self._margin = margin_of(line)
+        if self._depth == 0:
+            match = BLOCK_START.match(at_margin(line, self._margin or ''))
+            if match:
+                self._close()
+                self._kind = 'Metadata' if match.group(1) else match.group(2)
+                if self._kind == 'Process':
+                    self._body, self._start = [], self._line
+        if self._kind is None or self._kind == 'Metadata':
+            return
+        if self._body is not None:
+            self._body.append(line)
+        self._depth += brace_delta(line)
+        if self._depth <= 0 and '}' in line:
+            self._close()
+            self._depth = 0
+
+    def _close(self):
+        if self._body:
+            for block in iter_blocks(self._body):
+                block = Block(block.kind, block.name, self._start, block.text)
+                self.issues.extend(self.matrix.issue(c) for c in self.matrix.process_conflicts(scan_process(block)))
+        self._kind, self._body = None, None
+
+    def close(self) -> List[SemanticIssue]:
+        """Issues once the whole text has been fed"""
+        if self._partial:
+            self._feed_line(self._partial)
+            self._partial = ''
+        self._close()
+        return self.issues
+
+
+@dataclass
+class SodAnalysis:
+    """Conflicts of every actor in every Process of a corpus"""
+    matrix: ConflictMatrix
+    files: int = 0
+    processes: int = 0
+    conflicts: List[SodConflict] = field(default_factory=list)
+
+    def add_usage(self, path: str, usage: FileUsage):
+        self.files += 1
+        self.processes += len(usage.processes)
+        for process in usage.processes:
+            self.conflicts.extend(self.matrix.process_conflicts(process, path))
+
+    def by_actor(self) -> Dict[str, List[SodConflict]]:
+        """Conflicts per actor (canonical name), most conflicts first"""
+        actors: Dict[str, List[SodConflict]] = defaultdict(list)
+        for conflict in self.conflicts:
+            actors[canonicalize(conflict.actor)].append(conflict)
+        return dict(sorted(actors.items(), key=lambda item: (-len(item[1]), item[0])))
+
+    def by_process(self) -> Dict[Tuple[str, str], List[SodConflict]]:
+        """Conflicts per (file, Process), in corpus order"""
+        processes: Dict[Tuple[str, str], List[SodConflict]] = defaultdict(list)
+        for conflict in self.conflicts:
+            processes[conflict.path, conflict.process].append(conflict)
+        return dict(processes)
+
+
+def print_sod_report(vertical: str, analysis: SodAnalysis, granted: Dict[str, List[ConflictPair]]):
+    """Conflicts per actor, per Process, and the grants that permit them"""
+    matrix = analysis.matrix
+    print("=" * 80)
+    print(f"{vertical.upper()} SEGREGATION OF DUTIES ({analysis.files} files, {analysis.processes} processes)")
+    print("=" * 80)
+    print(f"\n⚖️  Conflicting pairs: {', '.join(p.name for p in matrix.pairs)}")
+
+    if not analysis.conflicts:
+        print("\n✅ No actor performs both verbs of a pair in any Process")
+    else:
+        actors = analysis.by_actor()
+        print(f"\n👤 Conflicts by actor ({len(actors)}):")
+        for conflicts in actors.values():
+            processes = {(c.path, c.process) for c in conflicts}
+            print(f"\n  {conflicts[0].actor}: {len(conflicts)} conflicts in {len(processes)} processes")
+            for c in conflicts:
+                print(f"     ❌ {c.pair.name} in Process {c.process} "
+                      f"({c.path}:{c.first.line}, {c.second.line})")
+        processes = analysis.by_process()
+        print(f"\n🔀 Conflicts by process ({len(processes)}):")
+        for (path, process), conflicts in processes.items():
+            found = ', '.join(f"{c.actor} ({c.pair.name})" for c in conflicts)
+            print(f"  {path} Process {process}: {found}")
+
+    if granted:
+        print(f"\n📜 [{GRANT_RULE}] actorVerbs grants both verbs of a pair ({len(granted)} actors):")
+        for actor, pairs in granted.items():
+            print(f"  {actor}: {', '.join(p.name for p in pairs)}")
+    print("\n" + "=" * 80)
+
+
+def write_csv(path: str, analyses: Dict[str, SodAnalysis]):
+    """One row per conflict: vertical, file, process, actor, pair, the two verbs and their lines"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['vertical', 'file', 'process', 'actor', 'pair',
+                         'firstVerb', 'firstLine', 'secondVerb', 'secondLine'])
+        for vertical, analysis in analyses.items():
+            for c in analysis.conflicts:
+                writer.writerow([vertical, c.path, c.process, c.actor, c.pair.name,
+                                 c.first.verb, c.first.line, c.second.verb, c.second.line])
+
+
+def main(argv: List[str]):
+    from batch_runner import collect_files, worker_engine
+
+    usage = "Usage: python sod_analysis.py [--vertical NAME] [--csv FILE] <file_or_dir> [...]"
+    options = {'--vertical': None, '--csv': None}
+    targets = []
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in options:
+            options[arg] = next(args, None)
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(1)
+        else:
+            targets.append(arg)
+    if not targets:
+        print(usage)
+        sys.exit(1)
+
+    engine = worker_engine()
+    analyses: Dict[str, SodAnalysis] = {}
+    for path in collect_files(targets):
+        try:
+            vertical = options['--vertical'] or engine.detect_vertical(path)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            continue
+        pack = engine.rule_pack(vertical)
+        if pack.segregation_of_duties is None:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            usage = scan_usage(f, pack.data_object_pattern)
+        analyses.setdefault(vertical, SodAnalysis(pack.segregation_of_duties)).add_usage(path, usage)
+
+    for vertical in sorted(analyses):
+        analysis = analyses[vertical]
+        print_sod_report(vertical, analysis, analysis.matrix.grant_conflicts(engine.dictionary(vertical)))
+    if options['--csv']:
+        write_csv(options['--csv'], analyses)
+        print(f"\n💾 Conflict CSV written to {options['--csv']}")
+    sys.exit(1 if any(a.conflicts for a in analyses.values()) else 0)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
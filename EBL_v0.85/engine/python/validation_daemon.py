@@ -0,0 +1,253 @@
+"""
+EBL Engine - Validation Daemon
+Long-running validator with warm parsers, dictionaries and DFA caches
+
+The daemon imports the generated parsers and loads dictionaries once, watches
+the given directories and revalidates changed files in the background, so a
+client request for a saved file is usually answered from the result cache.
+Clients talk to it over a Unix socket with one JSON object per line (see
+daemon_client.py).
+
+Requests:
+    {"cmd": "validate", "path": "...", "vertical": "banking"}   # vertical optional
+    {"cmd": "status"}
+    {"cmd": "shutdown"}
+
+Usage:
+    python validation_daemon.py [--socket PATH] [--poll] <watch_dir> [<watch_dir> ...]
+"""
+
+import errno
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from daemon_client import default_socket_path
+from file_watcher import make_watcher
+from vertical_engine import ParserNotGeneratedError, VerticalEngine
+
+
+@dataclass
+class CachedResult:
+    """Validation result of one file version"""
+    signature: Tuple[int, int]  # (mtime_ns, size)
+    vertical: str
+    result: Dict
+
+
+def file_signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ValidationDaemon:
+    """Keeps an engine warm and a result cache fresh for watched files"""
+
+    def __init__(self, watch_dirs: Iterable[str] = (), engine: Optional[VerticalEngine] = None,
+                 polling: bool = False):
+        self.engine = engine or VerticalEngine()
+        self.watch_dirs = [str(Path(d).resolve()) for d in watch_dirs]
+        self.polling = polling
+        self._cache: Dict[str, CachedResult] = {}
+        self._cache_lock = threading.Lock()
+        # One validation at a time: the ANTLR DFA cache is shared by all parsers
+        self._validate_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.started = time.time()
+        self.validations = 0
+        self.cache_hits = 0
+
+    def warm_up(self, verticals: Optional[Iterable[str]] = None):
+        """Import parsers and load dictionaries ahead of the first request"""
+        for vertical in verticals or self.engine.verticals():
+            self.engine.dictionary(vertical)
+            try:
+                self.engine.grammar(vertical)
+            except ParserNotGeneratedError:
+                pass
+
+    def _validate(self, path: str, vertical: Optional[str]) -> CachedResult:
+        signature = file_signature(path)
+        vertical = vertical or self.engine.detect_vertical(path)
+        with self._validate_lock:
+            result = self.engine.validate_file_to_dict(vertical, path)
+            self.validations += 1
+        entry = CachedResult(signature, vertical, result)
+        with self._cache_lock:
+            self._cache[path] = entry
+        return entry
+
+    def validate(self, path: str, vertical: Optional[str] = None) -> Dict:
+        """Validation result of a file, from cache when the file is unchanged"""
+        path = str(Path(path).resolve())
+        with self._cache_lock:
+            entry = self._cache.get(path)
+        if entry and entry.signature == file_signature(path) and vertical in (None, entry.vertical):
+            self.cache_hits += 1
+            return {**entry.result, 'cached': True}
+        return {**self._validate(path, vertical).result, 'cached': False}
+
+    def on_changes(self, paths: Iterable[str]):
+        """Revalidate changed EBL files; reload changed dictionaries"""
+        stale_verticals = set()
+        for path in paths:
+            if path.endswith('.json'):
+                vertical = self.engine.vertical_of_dictionary(path)
+                if vertical:
+                    self.engine.reload_dictionary(vertical)
+                    stale_verticals.add(vertical)
+
+        with self._cache_lock:
+            targets = {p: e.vertical for p, e in self._cache.items() if e.vertical in stale_verticals}
+        for path in paths:
+            if path.endswith('.ebl'):
+                targets.setdefault(str(Path(path).resolve()), None)
+
+        for path, vertical in targets.items():
+            if not os.path.exists(path):
+                with self._cache_lock:
+                    self._cache.pop(path, None)
+                continue
+            try:
+                self._validate(path, vertical)
+            except (OSError, ValueError):
+                # Unreadable or unclassifiable; validated on request instead
+                pass
+
+    def status(self) -> Dict:
+        with self._cache_lock:
+            cached = len(self._cache)
+        return {
+            'uptime': round(time.time() - self.started, 1),
+            'watching': self.watch_dirs,
+            'cachedFiles': cached,
+            'validations': self.validations,
+            'cacheHits': self.cache_hits,
+        }
+
+    def watch(self):
+        """Watch loop; returns when stop() is called"""
+        if not self.watch_dirs:
+            self._stop.wait()
+            return
+        watcher = make_watcher(self.watch_dirs, polling=self.polling)
+        try:
+            while not self._stop.is_set():
+                changed = watcher.changes(timeout=0.5)
+                if changed:
+                    self.on_changes(changed)
+        finally:
+            watcher.close()
+
+    def stop(self):
+        self._stop.set()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line, one JSON response per line"""
+
+    def handle(self):
+        daemon: ValidationDaemon = self.server.daemon
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                cmd = request.get('cmd')
+                if cmd == 'validate':
+                    response = daemon.validate(request['path'], request.get('vertical'))
+                elif cmd == 'status':
+                    response = daemon.status()
+                elif cmd == 'shutdown':
+                    response = {'ok': True}
+                    daemon.stop()
+                else:
+                    response = {'error': f"Unknown command '{cmd}'"}
+            except (KeyError, OSError, ValueError) as e:
+                response = {'error': str(e)}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _socket_in_use(socket_path: str) -> bool:
+    """Whether a daemon is accepting connections on socket_path"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:  # Stale socket left by a daemon that died
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def serve(daemon: ValidationDaemon, socket_path: str, ready: Optional[threading.Event] = None):
+    """Serve requests on socket_path until the daemon is stopped"""
+    if os.path.exists(socket_path):
+        if _socket_in_use(socket_path):
+            raise OSError(errno.EADDRINUSE, "A validation daemon is already listening", socket_path)
+        os.unlink(socket_path)
+    # Create the socket owner-only (0600) rather than chmod it after bind
+    old_umask = os.umask(0o177)
+    try:
+        server = _UnixServer(socket_path, _RequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.daemon = daemon
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    if ready:
+        ready.set()
+    try:
+        daemon.watch()
+    finally:
+        server.shutdown()
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main(argv: List[str]):
+    socket_path = default_socket_path()
+    polling = False
+    watch_dirs = []
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == '--socket':
+            socket_path = next(args, socket_path)
+        elif arg == '--poll':
+            polling = True
+        else:
+            watch_dirs.append(arg)
+
+    if not watch_dirs:
+        print("Usage: python validation_daemon.py [--socket PATH] [--poll] <watch_dir> [<watch_dir> ...]")
+        sys.exit(1)
+
+    daemon = ValidationDaemon(watch_dirs, polling=polling)
+    print("🔥 Warming parsers and dictionaries...")
+    daemon.warm_up()
+    print(f"👀 Watching {', '.join(daemon.watch_dirs)}")
+    print(f"🔌 Listening on {socket_path}")
+    try:
+        serve(daemon, socket_path)
+    except KeyboardInterrupt:
+        daemon.stop()
+    except OSError as e:
+        print(f"❌ Cannot listen on {socket_path}: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
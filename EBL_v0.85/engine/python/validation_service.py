@@ -0,0 +1,491 @@
+"""
+EBL Engine - Validation Service
+Asyncio HTTP/JSON validation endpoint backed by a pool of warm worker processes
+
+Lexing, parsing and tree walking are CPU-bound, so they run in worker
+processes that import the parsers and load dictionaries once. Requests are
+queued in bounded priority lanes (interactive and bulk); when a lane is full
+the service answers 503 instead of piling up work. Every file carries a
+deadline and is dropped if it expires while queued. Results are streamed back
+as NDJSON, one line per file, in completion order.
+
+Endpoints:
+    POST /validate   {"files": [{"name": "...", "text": "..."}], "vertical": "banking", "deadlineMs": 5000,
+                      "lane": "interactive"}
+                     (or {"name": ..., "text": ...} for a single file)
+    GET  /metrics    queue depth, in-flight jobs, counters, latency and per-lane queue wait percentiles
+    GET  /health
+
+Usage:
+    python validation_service.py [--host HOST] [--port PORT] [--workers N] [--queue-size N]
+                                 [--shared-dictionaries]
+"""
+
+import asyncio
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_DEADLINE_MS = 10_000
+
+# Engine of the current worker process, created by _init_worker
+_worker_engine = None
+
+
+def _init_worker(segments: Optional[Dict[str, str]] = None):
+    """Process pool initializer: import parsers and load (or attach) dictionaries once"""
+    global _worker_engine
+    from vertical_engine import ParserNotGeneratedError, VerticalEngine
+
+    _worker_engine = VerticalEngine()
+    if segments:
+        from shared_dictionary import attach_dictionaries
+        attach_dictionaries(_worker_engine, segments)
+    for vertical in _worker_engine.verticals():
+        _worker_engine.dictionary(vertical)
+        try:
+            _worker_engine.grammar(vertical)
+        except ParserNotGeneratedError:
+            pass
+
+
+def _validate_in_worker(name: str, text: str, vertical: Optional[str]) -> Dict:
+    """Runs in a worker process"""
+    if _worker_engine is None:
+        _init_worker()
+    vertical = vertical or _worker_engine.sniffer.sniff_text(text).vertical
+    if vertical is None:
+        return {'name': name, 'error': "Cannot detect vertical; pass 'vertical'"}
+    try:
+        result = _worker_engine.validate_to_dict(vertical, text)
+    except ValueError as e:
+        return {'name': name, 'error': str(e)}
+    return {'name': name, **result}
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 2)
+
+
+@dataclass
+class Job:
+    """One file waiting for a worker"""
+    name: str
+    text: str
+    vertical: Optional[str]
+    deadline: float  # loop.time() value
+    enqueued: float
+    future: asyncio.Future
+
+
+@dataclass
+class Lane:
+    """One priority lane of the scheduler"""
+    name: str
+    capacity: int         # Queued jobs before requests are rejected
+    max_concurrency: int  # Jobs of this lane running at once
+    aging_offset: float   # Seconds its head job must out-wait other lanes' heads
+    jobs: Deque[Job] = field(default_factory=deque)
+    running: int = 0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=2048))
+
+    def room(self) -> int:
+        return self.capacity - len(self.jobs)
+
+    def urgency(self, now: float) -> float:
+        """Head job's wait minus the lane's offset; the most urgent lane runs next"""
+        return now - self.jobs[0].enqueued - self.aging_offset
+
+    def metrics(self) -> Dict:
+        waits = list(self.waits)
+        return {
+            'queueDepth': len(self.jobs),
+            'capacity': self.capacity,
+            'inFlight': self.running,
+            'maxConcurrency': self.max_concurrency,
+            'queueWaitMs': {'p50': percentile(waits, 0.50), 'p90': percentile(waits, 0.90),
+                            'p99': percentile(waits, 0.99), 'samples': len(waits)},
+        }
+
+
+def default_lanes(workers: int, queue_size: int, aging_seconds: float = 5.0) -> List[Lane]:
+    """
+    Interactive lane for editor/CLI requests, bulk lane for batch revalidation
+
+    Bulk may use all but one worker, so an interactive request never waits for
+    a bulk file to finish. A bulk head that has waited aging_seconds longer
+    than the interactive head goes first, so bulk work is never starved.
+    """
+    return [
+        Lane('interactive', capacity=max(16, queue_size // 16), max_concurrency=workers, aging_offset=0.0),
+        Lane('bulk', capacity=queue_size, max_concurrency=max(1, workers - 1), aging_offset=aging_seconds),
+    ]
+
+
+class LaneScheduler:
+    """Picks the next job across lanes, honoring per-lane concurrency and aging"""
+
+    def __init__(self, lanes: List[Lane]):
+        self.lanes: Dict[str, Lane] = {lane.name: lane for lane in lanes}
+        self._wakeup = asyncio.Event()
+
+    def put(self, lane: str, jobs: List[Job]) -> bool:
+        """Queue all jobs in a lane, or none of them if it lacks room"""
+        target = self.lanes[lane]
+        if target.room() < len(jobs):
+            return False
+        target.jobs.extend(jobs)
+        self._wakeup.set()
+        return True
+
+    def pick(self, now: float) -> Optional[Tuple[Lane, Job]]:
+        """Most urgent runnable job, marked as running in its lane"""
+        runnable = [lane for lane in self.lanes.values() if lane.jobs and lane.running < lane.max_concurrency]
+        if not runnable:
+            return None
+        lane = max(runnable, key=lambda candidate: candidate.urgency(now))
+        job = lane.jobs.popleft()
+        lane.running += 1
+        lane.waits.append((now - job.enqueued) * 1000)
+        return lane, job
+
+    async def get(self) -> Tuple[Lane, Job]:
+        while True:
+            picked = self.pick(asyncio.get_running_loop().time())
+            if picked is not None:
+                return picked
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    def done(self, lane: Lane):
+        lane.running -= 1
+        self._wakeup.set()
+
+    @property
+    def depth(self) -> int:
+        return sum(len(lane.jobs) for lane in self.lanes.values())
+
+
+@dataclass
+class Response:
+    """HTTP response whose body may be streamed"""
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[bytes] = None
+    stream: Optional[AsyncIterator[bytes]] = None
+
+    @classmethod
+    def json(cls, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> 'Response':
+        return cls(status, {'Content-Type': 'application/json', **(headers or {})},
+                   body=json.dumps(payload).encode('utf-8'))
+
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 503: 'Service Unavailable'}
+
+
+class ValidationService:
+    """Request handling, queueing and metrics, independent of the HTTP transport"""
+
+    def __init__(self, workers: int = None, queue_size: int = 256, executor: Optional[Executor] = None,
+                 max_body_bytes: int = 64 * 1024 * 1024, latency_window: int = 2048,
+                 lanes: Optional[List[Lane]] = None, interactive_max_files: int = 1,
+                 shared_dictionaries: bool = False):
+        """
+        Args:
+            workers: Worker processes (default: CPU count)
+            queue_size: Bulk lane capacity when lanes is not given
+            executor: Executor to use instead of an owned process pool
+            lanes: Scheduler lanes (default: interactive + bulk)
+            interactive_max_files: Requests with at most this many files and
+                no explicit lane go to the interactive lane
+            shared_dictionaries: Compile dictionaries once into shared memory
+                for the owned pool instead of loading them in every worker
+        """
+        self.workers = workers or os.cpu_count() or 2
+        self.queue_size = queue_size
+        self.interactive_max_files = interactive_max_files
+        self._lanes = lanes or default_lanes(self.workers, queue_size)
+        self.shared_dictionaries = shared_dictionaries
+        self._shared = None
+        self.max_body_bytes = max_body_bytes
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.scheduler: Optional[LaneScheduler] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self.in_flight = 0
+        self.counters = {'accepted': 0, 'completed': 0, 'rejected': 0, 'deadlineExceeded': 0, 'failed': 0}
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+
+    async def start(self, dispatch: bool = True):
+        """Create the scheduler, the worker pool and one dispatcher per worker"""
+        self.scheduler = LaneScheduler(self._lanes)
+        if self._executor is None:
+            segments = None
+            if self.shared_dictionaries:
+                from shared_dictionary import SharedMemoryDictionaries
+                from vertical_engine import VerticalEngine
+                self._shared = SharedMemoryDictionaries.from_engine(VerticalEngine())
+                segments = self._shared.segments
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(segments,))
+        if dispatch:
+            self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        if self._owns_executor and self._executor is not None:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                # Each dispatcher submits one job at a time, so at most one job per worker is left
+                self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._shared is not None:
+            # Workers keep their mappings; unlinking only removes the name
+            self._shared.close()
+            self._shared = None
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lane, job = await self.scheduler.get()
+            try:
+                if job.future.done():
+                    continue
+                if loop.time() >= job.deadline:
+                    self.counters['deadlineExceeded'] += 1
+                    job.future.set_result({'name': job.name, 'error': 'Deadline exceeded while queued'})
+                    continue
+                self.in_flight += 1
+                try:
+                    result = await loop.run_in_executor(
+                        self._executor, _validate_in_worker, job.name, job.text, job.vertical)
+                    self.counters['completed'] += 1
+                except Exception as e:  # Worker crash or unpicklable result
+                    self.counters['failed'] += 1
+                    result = {'name': job.name, 'error': f"Validation failed: {e}"}
+                finally:
+                    self.in_flight -= 1
+                self._latencies.append((loop.time() - job.enqueued) * 1000)
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self.scheduler.done(lane)
+
+    def _enqueue(self, lane: str, files: List[Dict], vertical: Optional[str],
+                 deadline_ms: float) -> Optional[List[Job]]:
+        """Queue all files of a request, or none of them if the lane lacks room"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        jobs = []
+        for i, item in enumerate(files):
+            job = Job(
+                name=item.get('name') or f"file{i}",
+                text=item['text'],
+                vertical=item.get('vertical', vertical),
+                deadline=now + deadline_ms / 1000,
+                enqueued=now,
+                future=loop.create_future(),
+            )
+            jobs.append(job)
+        if not self.scheduler.put(lane, jobs):
+            self.counters['rejected'] += len(jobs)
+            return None
+        self.counters['accepted'] += len(jobs)
+        return jobs
+
+    async def _results(self, jobs: List[Job]) -> AsyncIterator[bytes]:
+        """NDJSON lines in completion order, each job bounded by its deadline"""
+        loop = asyncio.get_running_loop()
+
+        async def settle(job: Job) -> Dict:
+            try:
+                return await asyncio.wait_for(asyncio.shield(job.future), max(job.deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                if not job.future.done():
+                    # The dispatcher skips it if still queued
+                    job.future.set_result(None)
+                    self.counters['deadlineExceeded'] += 1
+                return {'name': job.name, 'error': 'Deadline exceeded'}
+
+        for next_done in asyncio.as_completed([settle(job) for job in jobs]):
+            result = await next_done
+            yield json.dumps(result).encode('utf-8') + b'\n'
+
+    async def handle(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Response:
+        """Route one request"""
+        if path == '/health':
+            return Response.json(200, {'status': 'ok'})
+        if path == '/metrics':
+            return Response.json(200, self.metrics())
+        if path != '/validate':
+            return Response.json(404, {'error': f"No route for {path}"})
+        if method != 'POST':
+            return Response.json(405, {'error': "Use POST"})
+        if len(body) > self.max_body_bytes:
+            return Response.json(413, {'error': "Request body too large"})
+
+        try:
+            payload = json.loads(body or b'{}')
+            files = payload['files'] if 'files' in payload else [payload]
+            if not files or not all(isinstance(f, dict) and isinstance(f.get('text'), str) for f in files):
+                raise ValueError("Each file needs a 'text' string")
+        except (ValueError, KeyError, TypeError) as e:
+            return Response.json(400, {'error': f"Invalid request: {e}"})
+
+        try:
+            deadline_ms = float(headers.get('x-deadline-ms', payload.get('deadlineMs', DEFAULT_DEADLINE_MS)))
+        except (TypeError, ValueError):
+            return Response.json(400, {'error': "Invalid deadline"})
+        lane = headers.get('x-lane', payload.get('lane'))
+        if lane is None:
+            lane = 'interactive' if len(files) <= self.interactive_max_files else 'bulk'
+        if lane not in self.scheduler.lanes:
+            return Response.json(400, {'error': f"Unknown lane '{lane}'", 'lanes': list(self.scheduler.lanes)})
+
+        jobs = self._enqueue(lane, files, payload.get('vertical'), deadline_ms)
+        if jobs is None:
+            return Response.json(503, {'error': f"Validation queue full ({lane} lane), retry later"},
+                                 {'Retry-After': '1'})
+        return Response(200, {'Content-Type': 'application/x-ndjson'}, stream=self._results(jobs))
+
+    def metrics(self) -> Dict:
+        latencies = list(self._latencies)
+        return {
+            'queueDepth': self.scheduler.depth if self.scheduler else 0,
+            'inFlight': self.in_flight,
+            'workers': self.workers,
+            **self.counters,
+            'latencyMs': {'p50': percentile(latencies, 0.50), 'p90': percentile(latencies, 0.90),
+                          'p99': percentile(latencies, 0.99), 'samples': len(latencies)},
+            'lanes': {name: lane.metrics() for name, lane in (self.scheduler.lanes if self.scheduler else {}).items()},
+        }
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0))
+    body = await reader.readexactly(length) if length else b''
+    return method, path.split('?', 1)[0], headers, body
+
+
+async def _write_response(writer: asyncio.StreamWriter, response: Response):
+    reason = REASONS.get(response.status, 'OK')
+    head = [f"HTTP/1.1 {response.status} {reason}", "Connection: close"]
+    head += [f"{k}: {v}" for k, v in response.headers.items()]
+    if response.stream is None:
+        head.append(f"Content-Length: {len(response.body or b'')}")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + (response.body or b''))
+    else:
+        head.append("Transfer-Encoding: chunked")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        async for chunk in response.stream:
+            writer.write(f"{len(chunk):x}\r\n".encode('ascii') + chunk + b'\r\n')
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+    await writer.drain()
+
+
+async def serve(service: ValidationService, host: str = '127.0.0.1', port: int = 8085) -> asyncio.AbstractServer:
+    """Start the HTTP server (one request per connection)"""
+
+    async def on_connection(reader, writer):
+        try:
+            request = await _read_request(reader)
+            if request is not None:
+                await _write_response(writer, await service.handle(*request))
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(on_connection, host, port)
+
+
+class InProcessClient:
+    """Calls a ValidationService directly, for tests and embedding"""
+
+    def __init__(self, service: ValidationService):
+        self.service = service
+
+    async def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, object]:
+        """(status, decoded body); streamed NDJSON bodies decode to a list"""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        response = await self.service.handle(method, path, {k.lower(): v for k, v in (headers or {}).items()}, body)
+        if response.stream is None:
+            return response.status, json.loads(response.body)
+        return response.status, [json.loads(chunk) async for chunk in response.stream]
+
+    async def validate(self, files: List[Dict], vertical: Optional[str] = None,
+                       deadline_ms: Optional[float] = None, lane: Optional[str] = None) -> Tuple[int, object]:
+        payload = {'files': files}
+        if lane:
+            payload['lane'] = lane
+        if vertical:
+            payload['vertical'] = vertical
+        if deadline_ms is not None:
+            payload['deadlineMs'] = deadline_ms
+        return await self.request('POST', '/validate', payload)
+
+    async def metrics(self) -> Dict:
+        return (await self.request('GET', '/metrics'))[1]
+
+
+async def _main(host: str, port: int, workers: Optional[int], queue_size: int, shared_dictionaries: bool):
+    service = ValidationService(workers=workers, queue_size=queue_size, shared_dictionaries=shared_dictionaries)
+    await service.start()
+    server = await serve(service, host, port)
+    print(f"🚀 EBL validation service on http://{host}:{port} ({service.workers} workers, queue {queue_size})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv: List[str]):
+    options = {'--host': '127.0.0.1', '--port': '8085', '--workers': None, '--queue-size': '256'}
+    shared_dictionaries = False
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == '--shared-dictionaries':
+            shared_dictionaries = True
+            continue
+        if arg not in options:
+            print("Usage: python validation_service.py [--host HOST] [--port PORT] [--workers N] [--queue-size N]"
+                  " [--shared-dictionaries]")
+            sys.exit(1)
+        options[arg] = next(args, None)
+
+    workers = int(options['--workers']) if options['--workers'] else None
+    try:
+        asyncio.run(_main(options['--host'], int(options['--port']), workers, int(options['--queue-size']),
+                          shared_dictionaries))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,550 @@
+"""
+EBL Engine - Vertical Engine
+One validation engine for every vertical, configured by rule packs
+
+The engine loads a vertical's generated parser and dictionary the first time
+the vertical is used and keeps them for later files. Generated parsers are
+imported from verticals/<vertical>/generated/python; run
+utilities/generate_vertical_parsers.sh to create them.
+
+Usage:
+    python vertical_engine.py <vertical|auto> <ebl_file> [dictionary_json]
+"""
+
+import gc
+import importlib.util
+import os
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Union
+
+from antlr4 import CommonTokenStream, InputStream, ParseTreeWalker
+from antlr4.error.ErrorListener import ErrorListener
+
+from canonical_hash import CanonicalHash, canonical_hash
+from dictionary_lint import lint_dictionary
+from ebl_blocks import Block, iter_blocks
+from mmap_stream import MmapInputStream, iter_mapped_blocks
+from parse_limits import (
+    BoundedErrorStrategy,
+    InputGuard,
+    InputLimitError,
+    ParseLimits,
+    check_size,
+    check_text,
+)
+
+from rule_packs import RulePack, SemanticIssue, format_semantic_report, load_rule_packs
+from vertical_validator import (
+    DATA_OBJECT_PATTERN,
+    ValidationIssue,
+    VerticalDictionary,
+    VerticalDictionaryValidator,
+    print_dictionary_report,
+)
+from vertical_sniffer import VerticalSniffer
+
+
+ENGINE_ROOT = Path(__file__).parent.parent
+VERTICALS_ROOT = ENGINE_ROOT.parent / 'verticals'
+RULE_PACK_DIR = ENGINE_ROOT / 'rule_packs'
+
+# In-memory inputs (e.g. archive members) above this size are streamed (see validate_stream)
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+
+class ParserNotGeneratedError(RuntimeError):
+    """Raised when a vertical's ANTLR parser has not been generated yet"""
+
+
+@dataclass
+class VerticalGrammar:
+    """Generated lexer and parser classes of one vertical"""
+    name: str
+    lexer_class: type
+    parser_class: type
+
+
+@dataclass
+class VerticalReport:
+    """Combined dictionary and semantic results for one file"""
+    vertical: str
+    errors: List[ValidationIssue] = field(default_factory=list)
+    warnings: List[ValidationIssue] = field(default_factory=list)
+    semantic_issues: List[SemanticIssue] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors and not any(i.severity.value == 'error' for i in self.semantic_issues)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form"""
+        return {
+            'vertical': self.vertical,
+            'valid': self.is_valid,
+            'errors': [asdict(i) for i in self.errors],
+            'warnings': [asdict(i) for i in self.warnings],
+            'semanticIssues': [{**asdict(i), 'severity': i.severity.value} for i in self.semantic_issues],
+        }
+
+
+class SyntaxErrorCollector(ErrorListener):
+    """Collects syntax errors as ValidationIssues instead of printing them"""
+
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.issues.append(ValidationIssue(
+            severity='error',
+            rule='SYNTAX',
+            message=msg,
+            line=line,
+            column=column,
+        ))
+
+
+def outside_block_issue(line: int, text: str) -> ValidationIssue:
+    """SYNTAX error for a line that belongs to no top-level block"""
+    return ValidationIssue(
+        severity='error',
+        rule='SYNTAX',
+        message=f"Text outside any top-level block: '{text.strip()}'",
+        line=line,
+        column=len(text) - len(text.lstrip()),
+    )
+
+
+@dataclass
+class ParsedBlock:
+    """Parse tree of one top-level block"""
+    block: Block
+    tree: object
+    tokens: list
+    syntax_errors: List[ValidationIssue]
+
+    def move_to(self, start_line: int):
+        """Shift token and issue lines after the block moved within its file"""
+        delta = start_line - self.block.start_line
+        if delta == 0:
+            return
+        for token in self.tokens:
+            token.line += delta
+        for issue in self.syntax_errors:
+            issue.line += delta
+        self.block = Block(self.block.kind, self.block.name, start_line, self.block.text)
+
+
+def _import_generated(module_name: str, generated_dir: Path):
+    """Import a generated module by file path, reusing it if already loaded"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    module_path = generated_dir / f"{module_name}.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    # Generated parsers import their listener/visitor by bare module name
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def load_grammar(generated_dir: Path, grammar_name: str) -> VerticalGrammar:
+    """Load <grammar_name>Lexer/<grammar_name>Parser from a generated directory"""
+    for suffix in ('Lexer', 'Parser'):
+        if not (generated_dir / f"{grammar_name}{suffix}.py").exists():
+            raise ParserNotGeneratedError(
+                f"No generated parser for {grammar_name} in {generated_dir}. "
+                f"Run utilities/generate_vertical_parsers.sh first."
+            )
+
+    if str(generated_dir) not in sys.path:
+        sys.path.insert(0, str(generated_dir))
+    lexer_module = _import_generated(f"{grammar_name}Lexer", generated_dir)
+    parser_module = _import_generated(f"{grammar_name}Parser", generated_dir)
+    return VerticalGrammar(
+        name=grammar_name,
+        lexer_class=getattr(lexer_module, f"{grammar_name}Lexer"),
+        parser_class=getattr(parser_module, f"{grammar_name}Parser"),
+    )
+
+
+class VerticalEngine:
+    """
+    Validates EBL files of any vertical
+
+    Rule packs are read eagerly (they are small); grammars and dictionaries
+    are loaded on first use and cached for the lifetime of the engine. Input
+    is checked against limits before it is lexed (see parse_limits.py).
+    """
+
+    def __init__(self, verticals_root: Optional[str] = None, rule_pack_dir: Optional[str] = None,
+                 limits: Optional[ParseLimits] = None):
+        self.verticals_root = Path(verticals_root) if verticals_root else VERTICALS_ROOT
+        self.limits = limits or ParseLimits()
+        self.rule_packs: Dict[str, RulePack] = load_rule_packs(rule_pack_dir or RULE_PACK_DIR)
+        self._grammars: Dict[str, VerticalGrammar] = {}
+        self._dictionaries: Dict[str, VerticalDictionary] = {}
+        self._lint_issues: Dict[str, List[ValidationIssue]] = {}
+        self._sniffer: Optional[VerticalSniffer] = None
+        self._lock = threading.Lock()
+
+    def verticals(self) -> List[str]:
+        """Names of all verticals with a rule pack"""
+        return sorted(self.rule_packs)
+
+    def rule_pack(self, vertical: str) -> RulePack:
+        """Rule pack of a vertical"""
+        try:
+            return self.rule_packs[vertical]
+        except KeyError:
+            raise ValueError(f"Unknown vertical '{vertical}'. Known verticals: {', '.join(self.verticals())}")
+
+    @property
+    def sniffer(self) -> VerticalSniffer:
+        """Header/keyword sniffer built from the rule packs"""
+        if self._sniffer is None:
+            self._sniffer = VerticalSniffer(self.rule_packs)
+        return self._sniffer
+
+    def detect_vertical(self, ebl_file_path: str) -> str:
+        """Sniff the vertical of a file, raising ValueError if it is unclassifiable"""
+        result = self.sniffer.sniff_file(ebl_file_path)
+        if result.vertical is None:
+            raise ValueError(f"Cannot detect the vertical of {ebl_file_path}; pass it explicitly")
+        return result.vertical
+
+    def dictionary_path(self, vertical: str) -> Path:
+        """Path of the vertical's default dictionary"""
+        return self.verticals_root / self.rule_pack(vertical).dictionary
+
+    def grammar_path(self, vertical: str) -> Path:
+        """Path of the vertical's .g4 grammar"""
+        return self.verticals_root / vertical / 'grammar' / f"{self.rule_pack(vertical).grammar}.g4"
+
+    def dictionary(self, vertical: str) -> VerticalDictionary:
+        """The vertical's default dictionary, loaded on first use"""
+        with self._lock:
+            if vertical not in self._dictionaries:
+                dictionary = VerticalDictionary(str(self.dictionary_path(vertical)))
+                # Linted once per load from disk, not per compile or per file
+                self._lint_issues[vertical] = lint_dictionary(dictionary)
+                self._dictionaries[vertical] = dictionary
+            return self._dictionaries[vertical]
+
+    def dictionary_lint(self, vertical: str) -> List[ValidationIssue]:
+        """Self-consistency issues of the vertical's dictionary file"""
+        self.dictionary(vertical)
+        with self._lock:
+            return self._lint_issues.get(vertical, [])
+
+    def install_dictionary(self, vertical: str, dictionary: VerticalDictionary):
+        """Use an already-built dictionary (e.g. a SharedDictionary) for a vertical"""
+        self.rule_pack(vertical)
+        with self._lock:
+            self._dictionaries[vertical] = dictionary
+            self._lint_issues.pop(vertical, None)
+
+    def reload_dictionary(self, vertical: str):
+        """Drop the cached dictionary so the next use reads the file again"""
+        with self._lock:
+            self._dictionaries.pop(vertical, None)
+            self._lint_issues.pop(vertical, None)
+
+    def vertical_of_dictionary(self, dictionary_path: str) -> Optional[str]:
+        """Vertical whose default dictionary is at dictionary_path, if any"""
+        resolved = Path(dictionary_path).resolve()
+        for vertical in self.rule_packs:
+            if self.dictionary_path(vertical).resolve() == resolved:
+                return vertical
+        return None
+
+    def grammar(self, vertical: str) -> VerticalGrammar:
+        """The vertical's generated lexer/parser, imported on first use"""
+        with self._lock:
+            if vertical not in self._grammars:
+                generated_dir = self.verticals_root / vertical / 'generated' / 'python'
+                self._grammars[vertical] = load_grammar(generated_dir, self.rule_pack(vertical).grammar)
+            return self._grammars[vertical]
+
+    def parse(self, vertical: str, text: Union[str, InputStream], errors: Optional[SyntaxErrorCollector] = None):
+        """
+        Parse a whole EBL file (text or an InputStream) with eblDefinition, returning the tree
+
+        Syntax errors go to errors, if given; nothing is printed.
+        """
+        grammar = self.grammar(vertical)
+        lexer = grammar.lexer_class(text if isinstance(text, InputStream) else InputStream(text))
+        parser = grammar.parser_class(CommonTokenStream(lexer))
+        for recognizer in (lexer, parser):
+            recognizer.removeErrorListeners()
+            if errors is not None:
+                recognizer.addErrorListener(errors)
+        parser._errHandler = BoundedErrorStrategy(self.limits.max_syntax_errors)
+        return parser.eblDefinition()
+
+    def parse_block(self, vertical: str, block: Block, input_stream: Optional[InputStream] = None) -> ParsedBlock:
+        """
+        Parse one top-level block with its own start rule, keeping file line numbers
+
+        The block is lexed from input_stream if given (e.g. a window of a mapped
+        file holding exactly block.text), else from block.text.
+        """
+        grammar = self.grammar(vertical)
+        errors = SyntaxErrorCollector()
+        lexer = grammar.lexer_class(input_stream or InputStream(block.text))
+        lexer.line = block.start_line
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(errors)
+        stream = CommonTokenStream(lexer)
+        parser = grammar.parser_class(stream)
+        parser.removeErrorListeners()
+        parser.addErrorListener(errors)
+        parser._errHandler = BoundedErrorStrategy(self.limits.max_syntax_errors)
+        tree = getattr(parser, block.rule)()
+        return ParsedBlock(block, tree, stream.tokens, errors.issues)
+
+    def preflight(self, text: str):
+        """Raise InputLimitError if text is over the engine's size, line-length or depth limits"""
+        check_text(text, self.limits)
+
+    def canonical_hash(self, vertical: str, text: str) -> CanonicalHash:
+        """Formatting-insensitive file and block digests (see canonical_hash.py)"""
+        try:
+            lexer_class = self.grammar(vertical).lexer_class
+        except ParserNotGeneratedError:
+            lexer_class = None
+        return canonical_hash(text, lexer_class)
+
+    def dictionary_validator(self, vertical: str, dictionary: Optional[VerticalDictionary] = None,
+                             listener_class: type = VerticalDictionaryValidator) -> VerticalDictionaryValidator:
+        """A fresh dictionary listener configured from the vertical's rule pack"""
+        pack = self.rule_pack(vertical)
+        return listener_class(
+            dictionary or self.dictionary(vertical),
+            label=pack.label,
+            verb_hint=pack.verb_hint,
+            data_object_pattern=pack.data_object_pattern or DATA_OBJECT_PATTERN,
+        )
+
+    def walk_blocks(self, vertical: str, lines: Iterable[str], listener: VerticalDictionaryValidator,
+                    after_block: Optional[Callable[[], None]] = None, stream: Optional[MmapInputStream] = None):
+        """
+        Parse lines one top-level block at a time, walking each tree with listener
+
+        Syntax errors and lines outside any block are added to listener.errors
+        in file order. Every entry point validates through here, so a file gets
+        the same issues whatever its size or source. With stream, lines are
+        stream.iter_lines() and each block is lexed from the mapping.
+        """
+        self.grammar(vertical)  # ParserNotGeneratedError even for text without blocks
+        walker = ParseTreeWalker()
+
+        def outside_block(line: int, text: str):
+            listener.errors.append(outside_block_issue(line, text))
+
+        # ANTLR trees, parsers and token streams are full of reference cycles.
+        # Automatic collection would promote a block's objects mid-parse and
+        # leave them in older generations, so collect the young generation
+        # after each block instead: it then holds exactly that block's garbage.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if stream is not None:
+                blocks = iter_mapped_blocks(stream, lines, outside_block)
+            else:
+                blocks = ((block, None) for block in iter_blocks(lines, outside_block))
+            for block, input_stream in blocks:
+                parsed = self.parse_block(vertical, block, input_stream)
+                listener.errors.extend(parsed.syntax_errors)
+                walker.walk(listener, parsed.tree)
+                if after_block:
+                    after_block()
+                del parsed
+                gc.collect(0)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def check_dictionary(self, vertical: str, text: str,
+                         dictionary: Optional[VerticalDictionary] = None) -> VerticalDictionaryValidator:
+        """Parse text block by block and walk it with the dictionary listener (syntax errors included)"""
+        self.preflight(text)
+        validator = self.dictionary_validator(vertical, dictionary)
+        self.walk_blocks(vertical, text.split('\n'), validator)
+        return validator
+
+    def check_semantics(self, vertical: str, text: str) -> List[SemanticIssue]:
+        """Run the vertical's semantic rules on text"""
+        return self.rule_pack(vertical).check_semantics(text)
+
+    def validate(self, vertical: str, text: str,
+                 dictionary: Optional[VerticalDictionary] = None) -> VerticalReport:
+        """Dictionary and semantic validation of EBL text"""
+        validator = self.check_dictionary(vertical, text, dictionary)
+        return VerticalReport(
+            vertical=vertical,
+            errors=validator.get_errors(),
+            warnings=validator.get_warnings(),
+            semantic_issues=self.check_semantics(vertical, text),
+        )
+
+    def validate_stream(self, vertical: str, source: Union[str, Path, TextIO],
+                        dictionary: Optional[VerticalDictionary] = None) -> VerticalReport:
+        """
+        Dictionary and semantic validation one top-level block at a time
+
+        Each block is lexed and parsed with its own start rule and walked by a
+        single listener, which keeps the cross-block symbol table and issues;
+        the block's text, tokens and tree are dropped before the next block is
+        read. Peak memory follows the largest block, not the file. A path is
+        memory-mapped (see mmap_stream.py) and its blocks are lexed from the
+        mapping.
+        """
+        if isinstance(source, (str, Path)):
+            check_size(os.path.getsize(source), self.limits)
+            with MmapInputStream(str(source)) as stream:
+                return self._validate_lines(vertical, stream.iter_lines(), dictionary, stream)
+        return self._validate_lines(vertical, source, dictionary)
+
+    def _validate_lines(self, vertical: str, source: Iterable[str], dictionary: Optional[VerticalDictionary],
+                        stream: Optional[MmapInputStream] = None) -> VerticalReport:
+        validator = self.dictionary_validator(vertical, dictionary)
+        scan = self.rule_pack(vertical).semantic_scan()
+        guard = InputGuard(self.limits)
+        pending: List[str] = []
+
+        def read_lines():
+            for line in source:
+                guard.feed(line)
+                pending.append(line)
+                yield line
+
+        def feed_scan():
+            scan.feed(''.join(pending).replace('\r\n', '\n'))  # Mapped lines keep their CRLFs
+            pending.clear()
+
+        self.walk_blocks(vertical, read_lines(), validator, feed_scan, stream)
+        guard.close()
+        feed_scan()
+
+        return VerticalReport(
+            vertical=vertical,
+            errors=validator.get_errors(),
+            warnings=validator.get_warnings(),
+            semantic_issues=scan.issues(),
+        )
+
+    def validate_to_dict(self, vertical: str, text: str) -> Dict:
+        """
+        JSON-ready validation result
+
+        Falls back to semantic rules alone (with a 'parserError' entry) when
+        the vertical's parser has not been generated. Input over the engine's
+        limits is reported as a single LIMIT error, without semantic results.
+        """
+        try:
+            return self.validate(vertical, text).to_dict()
+        except ParserNotGeneratedError as e:
+            report = VerticalReport(vertical, semantic_issues=self.check_semantics(vertical, text))
+            return {**report.to_dict(), 'parserError': str(e)}
+        except InputLimitError as e:
+            return VerticalReport(vertical, errors=[e.issue]).to_dict()
+
+    def validate_file_to_dict(self, vertical: str, ebl_file_path: str) -> Dict:
+        """validate_to_dict for a file, streamed from its memory map instead of read into memory"""
+        try:
+            try:
+                return self.validate_stream(vertical, ebl_file_path).to_dict()
+            except ParserNotGeneratedError as e:
+                return {**self._scan_file(vertical, ebl_file_path).to_dict(), 'parserError': str(e)}
+        except InputLimitError as e:
+            return VerticalReport(vertical, errors=[e.issue]).to_dict()
+
+    def _scan_file(self, vertical: str, ebl_file_path: str) -> VerticalReport:
+        """Semantic rules alone over a mapped file, with the input limits checked"""
+        check_size(os.path.getsize(ebl_file_path), self.limits)
+        guard = InputGuard(self.limits)
+        scan = self.rule_pack(vertical).semantic_scan()
+        with MmapInputStream(ebl_file_path) as stream:
+            for chunk in stream.iter_text():
+                guard.feed(chunk)
+                scan.feed(chunk)
+        guard.close()
+        return VerticalReport(vertical, semantic_issues=scan.issues())
+
+    def validate_file(self, vertical: Optional[str], ebl_file_path: str) -> VerticalReport:
+        """
+        Dictionary and semantic validation of an EBL file (vertical None: sniff it)
+
+        Streamed block by block whatever the file size (see validate_stream).
+        """
+        vertical = vertical or self.detect_vertical(ebl_file_path)
+        return self.validate_stream(vertical, ebl_file_path)
+
+
+def run_dictionary_cli(vertical: str, argv: List[str]) -> int:
+    """Entry point of verticals/<vertical>/validators/python/dictionary_validator.py"""
+    engine = VerticalEngine()
+    pack = engine.rule_pack(vertical)
+    if len(argv) < 2:
+        print("Usage: python dictionary_validator.py <ebl_file> [dictionary_json]")
+        print(f"Default dictionary: {engine.dictionary_path(vertical)}")
+        return 1
+
+    ebl_file = argv[1]
+    dictionary_path = argv[2] if len(argv) > 2 else str(engine.dictionary_path(vertical))
+    dictionary = VerticalDictionary(dictionary_path)
+
+    try:
+        with open(ebl_file, 'r', encoding='utf-8') as f:
+            validator = engine.check_dictionary(vertical, f.read(), dictionary)
+    except ParserNotGeneratedError as e:
+        print(f"❌ {e}")
+        return 2
+
+    is_valid = print_dictionary_report(
+        f"{pack.title.upper()} DICTIONARY VALIDATION REPORT", ebl_file, dictionary_path,
+        validator.get_errors(), validator.get_warnings()
+    )
+    return 0 if is_valid else 1
+
+
+def run_semantic_cli(vertical: str, argv: List[str]) -> int:
+    """Entry point of verticals/<vertical>/validators/python/semantic_validator.py"""
+    engine = VerticalEngine()
+    pack = engine.rule_pack(vertical)
+    if len(argv) < 2:
+        print("Usage: python semantic_validator.py <ebl_file>")
+        return 1
+
+    with open(argv[1], 'r', encoding='utf-8') as f:
+        issues = engine.check_semantics(vertical, f.read())
+
+    print(format_semantic_report(f"{pack.title.upper()} SEMANTIC VALIDATION REPORT", issues))
+    return 1 if any(i.severity.value == 'error' for i in issues) else 0
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python vertical_engine.py <vertical|auto> <ebl_file> [dictionary_json]")
+        print(f"Verticals: {', '.join(VerticalEngine().verticals())}")
+        sys.exit(1)
+
+    vertical = sys.argv[1]
+    if vertical == 'auto':
+        vertical = VerticalEngine().detect_vertical(sys.argv[2])
+        print(f"Detected vertical: {vertical}")
+    dictionary_status = run_dictionary_cli(vertical, sys.argv[1:])
+    print()
+    semantic_status = run_semantic_cli(vertical, sys.argv[1:3])
+    sys.exit(max(dictionary_status, semantic_status))
+
+
+if __name__ == '__main__':
+    main()
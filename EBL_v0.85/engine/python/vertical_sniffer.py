@@ -0,0 +1,176 @@
+"""
+EBL Engine - Vertical Sniffer
+Classifies an EBL file to a vertical from its first few KB, without parsing
+
+Signals, strongest first:
+1. RequirementID prefix in Metadata (e.g. REQ-BAIN- -> banking)
+2. `# Domain:` header comment (e.g. "# Domain: Banking (BAIN) - ...")
+3. `Domain:` entry in the Metadata block
+4. Score over ComplianceFrameworks entries and vertical keyword tokens
+   (SWIFT/IBAN, HL7, BidRequest, ...), EBLClass included
+
+Sniff patterns come from the "sniff" section of each rule pack.
+
+Usage:
+    python vertical_sniffer.py <ebl_file> [<ebl_file> ...]
+"""
+
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from rule_packs import RulePack
+
+
+# Bytes read from the start of a file; headers and Metadata fit well within it
+SNIFF_BYTES = 8192
+
+# Each keyword counts at most this many times, so one repeated word cannot win alone
+MAX_KEYWORD_HITS = 3
+
+# Weight of a ComplianceFrameworks entry, split across verticals that claim it
+FRAMEWORK_WEIGHT = 2.0
+
+# Fallback scores below this are too weak to classify
+MIN_SCORE = 2.0
+
+HEADER_DOMAIN = re.compile(r'^\s*(?:#|//)\s*Domain:\s*(.+)$', re.MULTILINE)
+METADATA_DOMAIN = re.compile(r'^\s+Domain:\s*(.+)$', re.MULTILINE)
+REQUIREMENT_ID = re.compile(r'RequirementID:\s*"?([A-Za-z0-9-]+)')
+COMPLIANCE_FRAMEWORKS = re.compile(r'ComplianceFrameworks:\s*\[([^\]]*)')
+
+
+@dataclass
+class SniffResult:
+    """Outcome of sniffing one file"""
+    vertical: Optional[str]
+    source: Optional[str] = None  # 'requirementId' | 'header' | 'metadata' | 'keywords'
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+def _alias_pattern(names: Iterable[str]) -> 're.Pattern':
+    alternation = '|'.join(re.escape(n.lower()) for n in sorted(names, key=len, reverse=True))
+    return re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])')
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> 're.Pattern':
+    # Case-sensitive; a keyword may start a CamelCase or DO_ name (DO_BidRequest)
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])')
+
+
+class VerticalSniffer:
+    """Cheap vertical classification from file headers and keywords"""
+
+    def __init__(self, rule_packs: Dict[str, RulePack]):
+        self._prefixes: List[tuple] = []
+        self._domain_names: Dict[str, 're.Pattern'] = {}
+        self._keywords: Dict[str, 're.Pattern'] = {}
+        self._frameworks: Dict[str, List[str]] = defaultdict(list)
+
+        for vertical, pack in sorted(rule_packs.items()):
+            sniff = pack.data.get('sniff', {})
+            for prefix in sniff.get('requirementPrefixes', []):
+                self._prefixes.append((prefix.upper(), vertical))
+            if sniff.get('domainNames'):
+                self._domain_names[vertical] = _alias_pattern(sniff['domainNames'])
+            if sniff.get('keywords'):
+                self._keywords[vertical] = _keyword_pattern(sniff['keywords'])
+            for framework in sniff.get('complianceFrameworks', []):
+                self._frameworks[framework.lower()].append(vertical)
+
+        # Longest prefix first so REQ-KYCB- would not be shadowed by REQ-KYC-
+        self._prefixes.sort(key=lambda p: len(p[0]), reverse=True)
+
+    def _by_requirement_id(self, head: str) -> Optional[str]:
+        for match in REQUIREMENT_ID.finditer(head):
+            requirement_id = match.group(1).upper()
+            for prefix, vertical in self._prefixes:
+                if requirement_id.startswith(prefix):
+                    return vertical
+        return None
+
+    def _by_domain(self, value: str) -> Optional[str]:
+        """Vertical whose domain name appears earliest in a Domain value"""
+        value = value.lower()
+        best, best_pos = None, len(value) + 1
+        for vertical, pattern in self._domain_names.items():
+            match = pattern.search(value)
+            if match and match.start() < best_pos:
+                best, best_pos = vertical, match.start()
+        return best
+
+    def score(self, head: str) -> Dict[str, float]:
+        """Fallback scores from ComplianceFrameworks and keyword tokens"""
+        scores: Dict[str, float] = defaultdict(float)
+
+        for match in COMPLIANCE_FRAMEWORKS.finditer(head):
+            for framework in match.group(1).split(','):
+                claimants = self._frameworks.get(framework.strip().lower(), [])
+                for vertical in claimants:
+                    scores[vertical] += FRAMEWORK_WEIGHT / len(claimants)
+
+        for vertical, pattern in self._keywords.items():
+            hits: Dict[str, int] = defaultdict(int)
+            for match in pattern.finditer(head):
+                hits[match.group(0)] += 1
+            scores[vertical] += sum(min(n, MAX_KEYWORD_HITS) for n in hits.values())
+
+        return {v: s for v, s in scores.items() if s > 0}
+
+    def sniff_text(self, text: str) -> SniffResult:
+        """Classify EBL text (only the first SNIFF_BYTES characters are used)"""
+        head = text[:SNIFF_BYTES]
+
+        vertical = self._by_requirement_id(head)
+        if vertical:
+            return SniffResult(vertical, 'requirementId')
+
+        for source, pattern in (('header', HEADER_DOMAIN), ('metadata', METADATA_DOMAIN)):
+            for match in pattern.finditer(head):
+                vertical = self._by_domain(match.group(1))
+                if vertical:
+                    return SniffResult(vertical, source)
+
+        scores = self.score(head)
+        if not scores:
+            return SniffResult(None)
+        best = max(scores, key=lambda v: (scores[v], v))
+        if scores[best] < MIN_SCORE:
+            return SniffResult(None, scores=scores)
+        return SniffResult(best, 'keywords', scores)
+
+    def sniff_file(self, path: str) -> SniffResult:
+        """Classify an EBL file, reading at most SNIFF_BYTES"""
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+        return self.sniff_text(head.decode('utf-8', errors='ignore'))
+
+    def route(self, paths: Iterable[str]) -> Dict[Optional[str], List[str]]:
+        """Group files by sniffed vertical (None for unclassified files)"""
+        groups: Dict[Optional[str], List[str]] = defaultdict(list)
+        for path in paths:
+            groups[self.sniff_file(path).vertical].append(path)
+        return dict(groups)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python vertical_sniffer.py <ebl_file> [<ebl_file> ...]")
+        sys.exit(1)
+
+    from vertical_engine import VerticalEngine
+
+    sniffer = VerticalEngine().sniffer
+    for path in sys.argv[1:]:
+        result = sniffer.sniff_file(path)
+        if result.vertical:
+            print(f"{result.vertical:<20} ({result.source})  {path}")
+        else:
+            print(f"{'?':<20} (unclassified)  {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,576 @@
+"""
+EBL Engine - Vertical Dictionary Validator
+Dictionary model and ANTLR listener shared by every vertical
+
+All vertical grammars share the same parser rule names (dataObject, entity,
+process, action, relationshipDef, ...), so one listener validates parse trees
+from any generated vertical parser. Vertical-specific wording comes from the
+vertical's rule pack.
+"""
+
+import json
+import re
+from typing import Dict, List, Set, Optional
+from dataclasses import dataclass
+
+from antlr4 import ParserRuleContext
+from antlr4.tree.Tree import ParseTree, ParseTreeListener, TerminalNode
+
+from name_index import TrigramIndex
+
+
+# DataObject references in Action text, optionally qualified with Input/Output
+DATA_OBJECT_PATTERN = r'\b(DO_[A-Za-z0-9_]+)\s*(Input|Output)?'
+
+
+def canonicalize(s: str) -> str:
+    """Canonicalize string for comparison (lowercase, alphanumeric only)"""
+    return re.sub(r'[^A-Za-z0-9_]+', '', s or '').lower()
+
+
+def did_you_mean(matches: List[str], fallback: Optional[str] = None) -> Optional[str]:
+    """Prefix a suggestion with the nearest dictionary names, if any"""
+    if not matches:
+        return fallback
+    quoted = ", ".join(f"'{m}'" for m in matches)
+    if not fallback:
+        return f"Did you mean {quoted}?"
+    return f"Did you mean {quoted}? Otherwise: {fallback[0].lower()}{fallback[1:]}"
+
+
+def _start_token(node: Optional[ParseTree]):
+    if isinstance(node, TerminalNode):
+        return node.getSymbol()
+    return getattr(node, 'start', None)
+
+
+def node_line(node: Optional[ParseTree]) -> Optional[int]:
+    """Line of the first token of a parse tree node"""
+    token = _start_token(node)
+    return token.line if token is not None else None
+
+
+def node_column(node: Optional[ParseTree]) -> Optional[int]:
+    """Column of the first token of a parse tree node"""
+    token = _start_token(node)
+    return token.column if token is not None else None
+
+
+def find_terminal(ctx: ParserRuleContext, text: str) -> ParseTree:
+    """First terminal below ctx whose text is `text`, else ctx itself"""
+    stack = [ctx]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TerminalNode):
+            if node.getText() == text:
+                return node
+        elif node.children:
+            stack.extend(reversed(node.children))
+    return ctx
+
+
+def source_text(ctx: ParserRuleContext) -> str:
+    """Input text of a parse tree node, whitespace included"""
+    if ctx.start is None or ctx.stop is None or ctx.stop.stop < ctx.start.start:
+        return ctx.getText()
+    return ctx.start.getInputStream().getText(ctx.start.start, ctx.stop.stop)
+
+
+@dataclass
+class ValidationIssue:
+    """Represents a validation issue"""
+    severity: str  # 'error' or 'warning'
+    rule: str      # Rule identifier (e.g., 'DICT-001')
+    message: str
+    suggestion: Optional[str] = None
+    line: Optional[int] = None    # 1-based, as reported by ANTLR
+    column: Optional[int] = None  # 0-based, as reported by ANTLR
+
+
+class VerticalDictionary:
+    """Loads and provides access to a vertical dictionary"""
+
+    def __init__(self, dictionary_path: str):
+        """Load vertical dictionary from JSON file"""
+        with open(dictionary_path, 'r') as f:
+            self._compile(json.load(f))
+
+    @classmethod
+    def from_data(cls, data: Dict) -> 'VerticalDictionary':
+        """Build a dictionary from already-loaded JSON data"""
+        dictionary = cls.__new__(cls)
+        dictionary._compile(data)
+        return dictionary
+
+    def _compile(self, data: Dict):
+        """Compile raw dictionary JSON into canonicalized lookup sets"""
+        self.dict = data
+
+        # Load core components
+        core = self.dict.get("core", {})
+        self.reserved_keywords = set(k.upper() for k in core.get("keywords", {}).get("reserved", []))
+        self.verb_permissions = {canonicalize(k): v.lower() for k, v in core.get("verbPermissions", {}).items()}
+        self.relationship_types = set(canonicalize(x) for x in core.get("relationshipTypes", []))
+
+        # Load domain components
+        domain = self.dict.get("domain", {})
+        self.actors = set(canonicalize(a) for a in domain.get("actors", []))
+        self.verbs = set(canonicalize(v) for v in domain.get("verbs", []))
+        self.entities = set(canonicalize(e) for e in domain.get("entities", []))
+        self.data_objects = set(canonicalize(d) for d in domain.get("dataObjects", []))
+
+        # Actor-verb mappings
+        self.actor_verbs: Dict[str, Set[str]] = {}
+        for actor, verb_list in domain.get("actorVerbs", {}).items():
+            self.actor_verbs[canonicalize(actor)] = set(canonicalize(v) for v in verb_list)
+
+        # Actor data permissions
+        self.actor_read_perms: Dict[str, Set[str]] = {}
+        self.actor_write_perms: Dict[str, Set[str]] = {}
+        for actor, perms in domain.get("actorDataPerms", {}).items():
+            actor_canon = canonicalize(actor)
+            if "read" in perms:
+                self.actor_read_perms[actor_canon] = set(canonicalize(d) for d in perms["read"])
+            if "write" in perms:
+                self.actor_write_perms[actor_canon] = set(canonicalize(d) for d in perms["write"])
+
+        # Union of all permitted verbs
+        self.all_permitted_verbs = set()
+        for verb_set in self.actor_verbs.values():
+            self.all_permitted_verbs.update(verb_set)
+
+        # Nearest-match indexes, built on first miss
+        self._name_lists = {
+            'actor': domain.get("actors", []),
+            'verb': domain.get("verbs", []),
+            'entity': domain.get("entities", []),
+            'dataObject': domain.get("dataObjects", []),
+        }
+        self._name_indexes: Dict[str, TrigramIndex] = {}
+
+    def has_actor(self, actor: str) -> bool:
+        """Check if actor exists in dictionary"""
+        return canonicalize(actor) in self.actors
+
+    def has_verb(self, verb: str) -> bool:
+        """Check if verb exists in dictionary"""
+        return canonicalize(verb) in self.verbs
+
+    def has_entity(self, entity: str) -> bool:
+        """Check if entity exists in dictionary"""
+        return canonicalize(entity) in self.entities
+
+    def has_data_object(self, data_object: str) -> bool:
+        """Check if DataObject exists in dictionary"""
+        return canonicalize(data_object) in self.data_objects
+
+    def actor_allows_verb(self, actor: str, verb: str) -> bool:
+        """Check if actor is allowed to perform verb"""
+        actor_canon = canonicalize(actor)
+        allowed_verbs = self.actor_verbs.get(actor_canon)
+        if not allowed_verbs:  # If no whitelist, allow all
+            return True
+        return canonicalize(verb) in allowed_verbs
+
+    def verb_permitted_by_any(self, verb: str) -> bool:
+        """Check if verb is permitted by at least one actor"""
+        return canonicalize(verb) in self.all_permitted_verbs if self.all_permitted_verbs else True
+
+    def actor_can_read(self, actor: str, data_object: str) -> bool:
+        """Check if actor has read permission on DataObject"""
+        actor_canon = canonicalize(actor)
+        read_perms = self.actor_read_perms.get(actor_canon)
+        if not read_perms:  # If no explicit perms, allow
+            return True
+        return canonicalize(data_object) in read_perms
+
+    def actor_can_write(self, actor: str, data_object: str) -> bool:
+        """Check if actor has write permission on DataObject"""
+        actor_canon = canonicalize(actor)
+        write_perms = self.actor_write_perms.get(actor_canon)
+        if not write_perms:  # If no explicit perms, allow
+            return True
+        return canonicalize(data_object) in write_perms
+
+    def is_relationship_type(self, rel_type: str) -> bool:
+        """Check if relationship type is valid"""
+        return canonicalize(rel_type) in self.relationship_types
+
+    def get_verb_permission(self, verb: str) -> Optional[str]:
+        """Get required permission (read/write) for verb"""
+        return self.verb_permissions.get(canonicalize(verb))
+
+    def name_index(self, kind: str) -> TrigramIndex:
+        """Trigram index over the names of one kind ('actor', 'verb', 'entity', 'dataObject')"""
+        index = self._name_indexes.get(kind)
+        if index is None:
+            index = TrigramIndex(self._name_lists[kind], normalize=canonicalize)
+            self._name_indexes[kind] = index
+        return index
+
+    def names(self, kind: str) -> List[str]:
+        """Dictionary names of one kind, spelled as in the JSON"""
+        return self._name_lists[kind]
+
+    def _suggest(self, kind: str, name: str, limit: int) -> List[str]:
+        """Nearest dictionary names of the given kind"""
+        return self.name_index(kind).suggest(name, limit)
+
+    def suggest_actor(self, actor: str, limit: int = 3) -> List[str]:
+        """Suggest dictionary actors close to an unknown actor"""
+        return self._suggest('actor', actor, limit)
+
+    def suggest_verb(self, verb: str, limit: int = 3) -> List[str]:
+        """Suggest dictionary verbs close to an unknown verb"""
+        return self._suggest('verb', verb, limit)
+
+    def suggest_entity(self, entity: str, limit: int = 3) -> List[str]:
+        """Suggest dictionary entities close to an unknown entity"""
+        return self._suggest('entity', entity, limit)
+
+    def suggest_data_object(self, data_object: str, limit: int = 3) -> List[str]:
+        """Suggest dictionary DataObjects close to an unknown DataObject"""
+        return self._suggest('dataObject', data_object, limit)
+
+
+class VerticalDictionaryValidator(ParseTreeListener):
+    """ANTLR-based dictionary validator shared by every vertical grammar"""
+
+    def __init__(self, dictionary: VerticalDictionary, label: str,
+                 verb_hint: Optional[str] = None, data_object_pattern: str = DATA_OBJECT_PATTERN):
+        """
+        Initialize validator with a vertical dictionary
+
+        Args:
+            dictionary: Dictionary to check names and permissions against
+            label: Vertical name used in messages (e.g. 'banking')
+            verb_hint: Suggestion shown for unknown verbs without a near match
+            data_object_pattern: Regex matching DataObject references in Actions
+        """
+        self.dictionary = dictionary
+        self.label = label
+        self.verb_hint = verb_hint
+        self.data_object_pattern = data_object_pattern
+        self.reset()
+
+    def reset(self):
+        """Forget the previous document's issues and definitions, keeping the dictionary"""
+        # New lists, so issues already handed out by get_errors() stay intact
+        self.errors: List[ValidationIssue] = []
+        self.warnings: List[ValidationIssue] = []
+
+        # Track defined elements for cross-reference validation
+        self.defined_data_objects = set()
+        self.defined_entities = set()
+        self.defined_it_assets = set()
+
+        # Track process scope for actor usage validation
+        self.process_stack = []  # Stack of (declared_actors, used_actors)
+
+    def enterDataObject(self, ctx: ParserRuleContext):
+        """Validate DataObject definition"""
+        if ctx.IDENTIFIER():
+            data_object_name = ctx.IDENTIFIER(0).getText()
+            self.defined_data_objects.add(data_object_name)
+
+            # Check if DataObject is in dictionary
+            if not self.dictionary.has_data_object(data_object_name):
+                self.warnings.append(ValidationIssue(
+                    severity='warning',
+                    rule='DICT-DO-001',
+                    line=node_line(ctx.IDENTIFIER(0)),
+                    column=node_column(ctx.IDENTIFIER(0)),
+                    message=f"DataObject '{data_object_name}' not found in {self.label} dictionary",
+                    suggestion=did_you_mean(
+                        self.dictionary.suggest_data_object(data_object_name),
+                        f"Consider adding to dictionary if this is a standard {self.label} DataObject"
+                    )
+                ))
+
+    def enterEntity(self, ctx: ParserRuleContext):
+        """Validate Entity definition"""
+        if ctx.IDENTIFIER():
+            entity_name = ctx.IDENTIFIER(0).getText()
+            self.defined_entities.add(entity_name)
+
+            # Check if Entity is in dictionary
+            if not self.dictionary.has_entity(entity_name):
+                self.warnings.append(ValidationIssue(
+                    severity='warning',
+                    rule='DICT-ENT-001',
+                    line=node_line(ctx.IDENTIFIER(0)),
+                    column=node_column(ctx.IDENTIFIER(0)),
+                    message=f"Entity '{entity_name}' not found in {self.label} dictionary",
+                    suggestion=did_you_mean(
+                        self.dictionary.suggest_entity(entity_name),
+                        f"Consider adding to dictionary if this is a standard {self.label} entity"
+                    )
+                ))
+
+            # Validate dataRef
+            if len(ctx.IDENTIFIER()) > 1:
+                data_ref = ctx.IDENTIFIER(1)
+                self.check_data_ref(entity_name, data_ref.getText(), node_line(data_ref), node_column(data_ref))
+
+    def check_data_ref(self, entity_name: str, data_ref: str, line: Optional[int], column: Optional[int]):
+        """Cross-reference check: an Entity's dataRef names a DataObject defined before it"""
+        if data_ref not in self.defined_data_objects:
+            self.errors.append(ValidationIssue(
+                severity='error',
+                rule='DICT-ENT-002',
+                line=line,
+                column=column,
+                message=f"Entity '{entity_name}' references undefined DataObject '{data_ref}'",
+                suggestion=f"Define DataObject '{data_ref}' before referencing it"
+            ))
+
+    def enterItAsset(self, ctx: ParserRuleContext):
+        """Validate ITAsset definition"""
+        if ctx.IDENTIFIER():
+            asset_name = ctx.IDENTIFIER(0).getText()
+            self.defined_it_assets.add(asset_name)
+
+    def enterProcess(self, ctx: ParserRuleContext):
+        """Validate Process and track declared actors"""
+        declared_actors = set()
+        used_actors = set()
+
+        # Extract declared actors from Actors: [...], which may span lines
+        text = ctx.getText()
+        actors_match = re.search(r'Actors:\[(.*?)\]', text, re.DOTALL)
+        if actors_match:
+            actors_str = actors_match.group(1)
+            for actor in actors_str.split(','):
+                actor = actor.strip()
+                if actor:
+                    declared_actors.add(actor)
+
+                    # Validate actor exists in dictionary
+                    if not self.dictionary.has_actor(actor):
+                        actor_node = find_terminal(ctx, actor)
+                        self.errors.append(ValidationIssue(
+                            severity='error',
+                            rule='DICT-ACT-001',
+                            line=node_line(actor_node),
+                            column=node_column(actor_node),
+                            message=f"Actor '{actor}' not found in {self.label} dictionary",
+                            suggestion=did_you_mean(
+                                self.dictionary.suggest_actor(actor),
+                                f"Check spelling or add actor to {self.label} dictionary"
+                            )
+                        ))
+
+        self.process_stack.append((declared_actors, used_actors))
+
+    def exitProcess(self, ctx: ParserRuleContext):
+        """Check for unused actors at end of process"""
+        if self.process_stack:
+            declared_actors, used_actors = self.process_stack.pop()
+            unused_actors = declared_actors - used_actors
+
+            for actor in unused_actors:
+                actor_node = find_terminal(ctx, actor)
+                self.warnings.append(ValidationIssue(
+                    severity='warning',
+                    rule='DICT-ACT-002',
+                    line=node_line(actor_node),
+                    column=node_column(actor_node),
+                    message=f"Actor '{actor}' declared in Process but never used in Actions",
+                    suggestion="Remove unused actor or add actions using this actor"
+                ))
+
+    def enterAction(self, ctx: ParserRuleContext):
+        """Validate Action (actor-verb-dataobject patterns)"""
+        text = source_text(ctx)
+
+        # Extract actor and verb from action pattern: "- Actor Verb ..."
+        action_match = re.match(r'^-\s*([A-Za-z_][A-Za-z0-9_]*)\s+([A-Za-z][A-Za-z0-9_]*)\b', text)
+
+        if not action_match:
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-ACT-003',
+                line=node_line(ctx),
+                column=node_column(ctx),
+                message="Action missing explicit 'Actor Verb' prefix",
+                suggestion="Use format: '- Actor Verb ...' for better clarity"
+            ))
+            return
+
+        actor, verb = action_match.groups()
+
+        # Mark actor as used
+        if self.process_stack:
+            _, used_actors = self.process_stack[-1]
+            used_actors.add(actor)
+
+        # Validate actor
+        if not self.dictionary.has_actor(actor):
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-ACT-004',
+                line=node_line(ctx),
+                column=node_column(ctx),
+                message=f"Actor '{actor}' in Action not found in {self.label} dictionary",
+                suggestion=did_you_mean(self.dictionary.suggest_actor(actor))
+            ))
+
+        # Validate verb
+        if not self.dictionary.has_verb(verb):
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-VERB-001',
+                line=node_line(ctx),
+                column=node_column(ctx),
+                message=f"Verb '{verb}' not found in {self.label} dictionary",
+                suggestion=did_you_mean(
+                    self.dictionary.suggest_verb(verb),
+                    self.verb_hint
+                )
+            ))
+
+        # Check if verb is permitted by any actor
+        if not self.dictionary.verb_permitted_by_any(verb):
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-VERB-002',
+                line=node_line(ctx),
+                column=node_column(ctx),
+                message=f"Verb '{verb}' is never permitted by any actor in {self.label} dictionary",
+                suggestion="Add verb permission to at least one actor"
+            ))
+
+        # Check if this specific actor can perform this verb
+        if not self.dictionary.actor_allows_verb(actor, verb):
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-VERB-003',
+                line=node_line(ctx),
+                column=node_column(ctx),
+                message=f"Actor '{actor}' not permitted to perform verb '{verb}' by whitelist",
+                suggestion=f"Add '{verb}' to actor '{actor}' permissions in dictionary"
+            ))
+
+        # Validate DataObject permissions
+        required_perm = self.dictionary.get_verb_permission(verb)
+        for match in re.finditer(self.data_object_pattern, text):
+            data_object = match.group(1)
+            io_qualifier = match.group(2)
+
+            # Determine if Input (write) or Output (read)
+            if io_qualifier is None and required_perm:
+                io_qualifier = "Input" if required_perm == "write" else "Output"
+
+            # Check permissions
+            if io_qualifier == "Input":
+                if not self.dictionary.actor_can_write(actor, data_object):
+                    self.warnings.append(ValidationIssue(
+                        severity='warning',
+                        rule='DICT-PERM-001',
+                        line=node_line(ctx),
+                        column=node_column(ctx),
+                        message=f"Actor '{actor}' lacks WRITE permission on '{data_object}'",
+                        suggestion=f"Add write permission for '{actor}' on '{data_object}'"
+                    ))
+            elif io_qualifier == "Output":
+                if not self.dictionary.actor_can_read(actor, data_object):
+                    self.warnings.append(ValidationIssue(
+                        severity='warning',
+                        rule='DICT-PERM-002',
+                        line=node_line(ctx),
+                        column=node_column(ctx),
+                        message=f"Actor '{actor}' lacks READ permission on '{data_object}'",
+                        suggestion=f"Add read permission for '{actor}' on '{data_object}'"
+                    ))
+
+    def enterRelationshipDef(self, ctx: ParserRuleContext):
+        """Validate Relationship definition"""
+        if ctx.IDENTIFIER() and len(ctx.IDENTIFIER()) >= 4:
+            rel_name = ctx.IDENTIFIER(0).getText()
+            from_entity = ctx.IDENTIFIER(1).getText()
+            to_entity = ctx.IDENTIFIER(2).getText()
+            rel_type = ctx.IDENTIFIER(3).getText()
+
+            # Validate relationship type
+            if not self.dictionary.is_relationship_type(rel_type):
+                self.warnings.append(ValidationIssue(
+                    severity='warning',
+                    rule='DICT-REL-001',
+                    line=node_line(ctx.IDENTIFIER(3)),
+                    column=node_column(ctx.IDENTIFIER(3)),
+                    message=f"Relationship '{rel_name}': Type '{rel_type}' not in {self.label} dictionary",
+                    suggestion=f"Valid types: {', '.join(sorted([t for t in self.dictionary.relationship_types]))}"
+                ))
+
+            # Validate from/to entities exist
+            self.check_relationship_end(rel_name, 'From', from_entity,
+                                        node_line(ctx.IDENTIFIER(1)), node_column(ctx.IDENTIFIER(1)))
+            self.check_relationship_end(rel_name, 'To', to_entity,
+                                        node_line(ctx.IDENTIFIER(2)), node_column(ctx.IDENTIFIER(2)))
+
+    def check_relationship_end(self, rel_name: str, end: str, name: str,
+                               line: Optional[int], column: Optional[int]):
+        """Cross-reference check: a Relationship From/To names a defined Entity or ITAsset"""
+        if name not in self.defined_entities and name not in self.defined_it_assets:
+            self.warnings.append(ValidationIssue(
+                severity='warning',
+                rule='DICT-REL-002' if end == 'From' else 'DICT-REL-003',
+                line=line,
+                column=column,
+                message=f"Relationship '{rel_name}': {end} '{name}' not a defined Entity/ITAsset"
+            ))
+
+    def get_errors(self) -> List[ValidationIssue]:
+        """Get all validation errors"""
+        return self.errors
+
+    def get_warnings(self) -> List[ValidationIssue]:
+        """Get all validation warnings"""
+        return self.warnings
+
+
+def format_dictionary_report(title: str, ebl_file_path: str, dictionary_path: str,
+                             errors: List[ValidationIssue], warnings: List[ValidationIssue]) -> str:
+    """Dictionary validation report as text (see print_dictionary_report)"""
+    report = ["=" * 80, title, "=" * 80, f"File: {ebl_file_path}", f"Dictionary: {dictionary_path}", "=" * 80]
+
+    if not errors and not warnings:
+        report.append("\n✅ VALIDATION PASSED - No errors or warnings\n")
+        report.append("=" * 80)
+        return "\n".join(report)
+
+    if errors:
+        report.append(f"\n❌ ERRORS ({len(errors)}):")
+        for i, error in enumerate(errors, 1):
+            report.append(f"\n  {i}. [{error.rule}] {error.message}")
+            if error.suggestion:
+                report.append(f"     💡 {error.suggestion}")
+
+    if warnings:
+        report.append(f"\n⚠️  WARNINGS ({len(warnings)}):")
+        for i, warning in enumerate(warnings, 1):
+            report.append(f"\n  {i}. [{warning.rule}] {warning.message}")
+            if warning.suggestion:
+                report.append(f"     💡 {warning.suggestion}")
+
+    report.append("\n" + "=" * 80)
+    return "\n".join(report)
+
+
+def print_dictionary_report(title: str, ebl_file_path: str, dictionary_path: str,
+                            errors: List[ValidationIssue], warnings: List[ValidationIssue]) -> bool:
+    """
+    Print a dictionary validation report
+
+    Args:
+        title: Report title (e.g. 'BANKING DICTIONARY VALIDATION REPORT')
+        ebl_file_path: Validated file
+        dictionary_path: Dictionary used
+        errors: Validation errors
+        warnings: Validation warnings
+
+    Returns:
+        True if valid (no errors), False otherwise
+    """
+    print(format_dictionary_report(title, ebl_file_path, dictionary_path, errors, warnings))
+    return len(errors) == 0
@@ -0,0 +1,176 @@
+"""
+EBL Engine - Batch Runner Tests
+Tests for cost ordering, per-file budgets, the result cache and archive/stdin sources
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import tarfile
+import time
+import unittest
+import zipfile
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from archive_sources import Archive, read_stream_members
+from batch_runner import BatchRunner, ResultCache, collect_files
+from vertical_engine import VerticalEngine
+
+
+def sleepy_task(path, vertical):
+    """Worker task that hangs on files named slow*"""
+    if os.path.basename(path).startswith('slow'):
+        time.sleep(60)
+    return {'vertical': vertical, 'valid': True, 'errors': [], 'warnings': [], 'semanticIssues': []}
+
+
+def echo_member_task(path, data, vertical):
+    """Worker task that reports the member bytes it received"""
+    return {'vertical': vertical, 'valid': True, 'text': data.decode('utf-8')}
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test scheduling without depending on real parses"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = {}
+        for name, size in (('small.ebl', 100), ('large.ebl', 5000), ('medium.ebl', 1000)):
+            path = Path(self.tmp.name) / name
+            path.write_text('# Domain: Banking\n' + 'x' * size)
+            self.paths[name] = str(path)
+
+    def test_largest_first(self):
+        """Test that files are ordered by size without history"""
+        items, known = BatchRunner(task=sleepy_task).plan(collect_files([self.tmp.name]), 'banking')
+        self.assertEqual(known, [])
+        self.assertEqual([Path(i.path).name for i in items], ['large.ebl', 'medium.ebl', 'small.ebl'])
+
+    def test_historical_timings_win(self):
+        """Test that a slow file from the last run is scheduled first"""
+        cache = ResultCache()
+        for name, seconds in (('small.ebl', 30.0), ('medium.ebl', 0.01), ('large.ebl', 0.05)):
+            size = os.path.getsize(self.paths[name])
+            cache.record(self.paths[name], (0, size), 'banking', (0, 0), seconds=seconds, result=None)
+        items, _ = BatchRunner(cache=cache, task=sleepy_task).plan(collect_files([self.tmp.name]), 'banking')
+        self.assertEqual([Path(i.path).name for i in items], ['small.ebl', 'large.ebl', 'medium.ebl'])
+
+    def test_budget_kills_pathological_file(self):
+        """Test that a hanging file is killed and reported, and the batch finishes"""
+        slow = Path(self.tmp.name) / 'slow.ebl'
+        slow.write_text('# Domain: Banking\n')
+        runner = BatchRunner(workers=2, budget=0.5, task=sleepy_task)
+        started = time.monotonic()
+        results = {Path(r.path).name: r for r in runner.run(collect_files([self.tmp.name]), 'banking')}
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(results['slow.ebl'].timed_out)
+        self.assertFalse(results['slow.ebl'].ok)
+        self.assertTrue(all(results[name].ok for name in self.paths))
+
+    def test_unchanged_files_come_from_cache(self):
+        """Test that a second run reuses results and persists timings"""
+        cache_path = Path(self.tmp.name) / 'cache.json'
+        files = collect_files([self.tmp.name])
+        cache = ResultCache(str(cache_path))
+        BatchRunner(workers=2, cache=cache, task=sleepy_task).run(files, 'banking')
+        cache.save()
+        self.assertTrue(cache_path.exists())
+
+        results = BatchRunner(workers=2, cache=ResultCache(str(cache_path)), task=sleepy_task).run(files, 'banking')
+        self.assertTrue(all(r.cached for r in results))
+
+
+class TestArchiveSources(unittest.TestCase):
+    """Test validation of archive members and stdin streams without extraction"""
+
+    MEMBERS = {
+        'bundle/Payments.ebl': '# Domain: Banking\nProcess Pay {\n  Description: "Überweisung"\n}\n',
+        'bundle/nested/Loans.ebl': '# Domain: Banking\n' + 'x' * 2000,
+        'bundle/README.txt': 'not EBL',
+    }
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.runner = BatchRunner(workers=2, task=sleepy_task, member_task=echo_member_task)
+        self.expected = {k: v for k, v in self.MEMBERS.items() if k.endswith('.ebl')}
+
+    def texts(self, results):
+        self.assertTrue(all(r.ok for r in results), [r.error for r in results])
+        return {r.path: r.result['text'] for r in results}
+
+    def test_zip_members(self):
+        """Test that zip members are validated largest first and keyed by member path"""
+        path = os.path.join(self.tmp.name, 'bundle.zip')
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, text in self.MEMBERS.items():
+                zf.writestr(name, text)
+        with Archive(path) as archive:
+            self.assertFalse(archive.sequential)
+            items, _ = self.runner.plan_members(archive.members)
+            self.assertEqual([i.path for i in items], ['bundle/nested/Loans.ebl', 'bundle/Payments.ebl'])
+            self.assertEqual(self.texts(self.runner.run_members(archive.members)), self.expected)
+        self.assertEqual(os.listdir(self.tmp.name), ['bundle.zip'])
+
+    def test_compressed_tar_members(self):
+        """Test that a .tar.gz is read in one pass, in archive order"""
+        path = os.path.join(self.tmp.name, 'bundle.tar.gz')
+        with tarfile.open(path, 'w:gz') as tf:
+            for name, text in self.MEMBERS.items():
+                data = text.encode('utf-8')
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        with Archive(path) as archive:
+            self.assertTrue(archive.sequential)
+            results = self.runner.run_members(archive.members, ordered=False)
+        self.assertEqual(self.texts(results), self.expected)
+
+    def test_ndjson_stream(self):
+        """Test NDJSON records with "path" or "name" keys"""
+        lines = [json.dumps({'path': 'a.ebl', 'text': self.MEMBERS['bundle/Payments.ebl']}),
+                 '',
+                 json.dumps({'name': 'b.ebl', 'text': '# Domain: Banking\n'})]
+        stream = io.BytesIO('\n'.join(lines).encode('utf-8'))
+        results = self.runner.run_members(read_stream_members(stream), ordered=False)
+        self.assertEqual(self.texts(results), {'a.ebl': self.MEMBERS['bundle/Payments.ebl'],
+                                               'b.ebl': '# Domain: Banking\n'})
+
+    def test_length_prefixed_stream(self):
+        """Test length-prefixed framing, including multi-byte text and newlines inside members"""
+        stream = io.BytesIO()
+        for name, text in self.expected.items():
+            data = text.encode('utf-8')
+            stream.write(f"{len(data)} {name}\n".encode('utf-8') + data)
+        stream.seek(0)
+        results = self.runner.run_members(read_stream_members(stream), 'banking', ordered=False)
+        self.assertEqual(self.texts(results), self.expected)
+
+    def test_truncated_stream(self):
+        """Test that a short length-prefixed member is an error, not a silent truncation"""
+        with self.assertRaises(ValueError):
+            list(read_stream_members(io.BytesIO(b"100 a.ebl\nshort")))
+
+    def test_default_member_task(self):
+        """Test that real validation of a member matches validating its text"""
+        example = engine_path.parent.parent / 'verticals' / 'banking' / 'examples' / 'AFC_Fraud_SAR.ebl'
+        text = example.read_text(encoding='utf-8')
+        path = os.path.join(self.tmp.name, 'release.zip')
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr('AFC_Fraud_SAR.ebl', text)
+        with Archive(path) as archive:
+            [result] = BatchRunner(workers=1).run_members(archive.members)
+        self.assertEqual(result.path, 'AFC_Fraud_SAR.ebl')
+        self.assertEqual(result.result, VerticalEngine().validate_to_dict('banking', text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+EBL Engine - Block Deduplication Tests
+Tests that reused block results match a fresh block-by-block validation
+"""
+
+import io
+import os
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from block_dedup import BlockStore, DedupValidator
+from vertical_engine import VerticalEngine
+
+EXAMPLES = sorted((engine_path.parent.parent / 'verticals' / 'banking' / 'examples').glob('*.ebl'))
+
+DATA_OBJECT = '''DataObject DO_Shared {
+  Schema:
+    Id: UUID, required
+  Policies:
+    - Retain 7 years
+  Resources:
+    Input: { Channel: API, Protocol: REST, Endpoint: "/shared", Auth: OAuth2, Format: JSON, SLA: "1s" }
+    Output: { Channel: API, Protocol: REST, Endpoint: "/shared", Auth: OAuth2, Format: JSON, SLA: "1s" }
+  erMap: Shared
+}
+'''
+
+ENTITY = '''Entity Shared {
+  dataRef: DO_Shared
+  Properties:
+    Id: { type: UUID, required: true }
+  erMap: Shared
+}
+'''
+
+
+class TestDedupValidator(unittest.TestCase):
+    """Test block reuse across files and cosmetic variants"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def setUp(self):
+        self.validator = DedupValidator(self.engine)
+
+    def reference(self, text):
+        return self.engine.validate_stream('banking', io.StringIO(text)).to_dict()
+
+    def test_matches_block_validation(self):
+        """Test that first-seen and reused blocks give the block-by-block result"""
+        for path in EXAMPLES:
+            text = path.read_text(encoding='utf-8')
+            with self.subTest(file=path.name):
+                self.assertEqual(self.validator.validate('banking', text).to_dict(), self.reference(text))
+        misses = self.validator.store.misses
+        self.assertEqual(self.validator.store.hits, 0)
+
+        for path in EXAMPLES:
+            copy = '# Copied bundle\n\n' + re.sub(r'^  ', '    ', path.read_text(encoding='utf-8'), flags=re.MULTILINE)
+            with self.subTest(copy=path.name):
+                self.assertEqual(self.validator.validate('banking', copy).to_dict(), self.reference(copy))
+        self.assertEqual(self.validator.store.misses, misses)
+        self.assertEqual(self.validator.store.hits, misses)
+
+    def test_cross_references_rerun_per_file(self):
+        """Test that a stored Entity block is checked against each file's DataObjects"""
+        with_definition = self.validator.validate('banking', DATA_OBJECT + '\n' + ENTITY)
+        misses = self.validator.store.misses
+        without_definition = self.validator.validate('banking', '\n\n' + ENTITY.replace('  ', '\t'))
+        self.assertEqual(self.validator.store.misses, misses)
+        self.assertEqual(with_definition.errors, [])
+        self.assertEqual([(e.rule, e.line, e.column) for e in without_definition.errors],
+                         [('DICT-ENT-002', 4, 10)])
+
+    def test_store_persists(self):
+        """Test that a saved store serves the next run"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'blocks.json')
+            first = DedupValidator(self.engine, BlockStore(path))
+            text = EXAMPLES[0].read_text(encoding='utf-8')
+            expected = first.validate('banking', text).to_dict()
+            first.store.save()
+
+            second = DedupValidator(self.engine, BlockStore(path))
+            self.assertEqual(second.validate('banking', text).to_dict(), expected)
+            self.assertEqual(second.store.misses, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+EBL Engine - Canonical Hash Tests
+Tests that cosmetic edits keep digests and content edits change them
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from canonical_hash import canonical_hash, normalize_token
+from vertical_engine import VerticalEngine
+
+EXAMPLES = engine_path.parent.parent / 'verticals'
+AFC = EXAMPLES / 'banking' / 'examples' / 'AFC_Fraud_SAR.ebl'
+
+
+class TestCanonicalHash(unittest.TestCase):
+    """Test file and block digests over the banking lexer"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+        cls.text = AFC.read_text(encoding='utf-8')
+        cls.base = cls.engine.canonical_hash('banking', cls.text)
+
+    def digest(self, text):
+        return self.engine.canonical_hash('banking', text)
+
+    def test_cosmetic_edits_keep_digest(self):
+        """Test re-indentation, spacing, comments, blank lines and CRLF"""
+        edits = {
+            'reindent': re.sub(r'^  ', '      ', self.text, flags=re.MULTILINE),
+            'spacing': self.text.replace(': ', ':   ').replace(', ', ' ,'),
+            'header comment': '# Domain: Banking (BAIN) - edited\n# another note\n' + self.text,
+            'trailing comment': self.text.replace('FilingDate: Date', 'FilingDate: Date   // filed at'),
+            'blank lines': self.text.replace('\n\n', '\n\n\n\n'),
+            'crlf': self.text.replace('\n', '\r\n'),
+        }
+        for name, text in edits.items():
+            with self.subTest(edit=name):
+                result = self.digest(text)
+                self.assertEqual(result.digest, self.base.digest)
+                self.assertEqual(result.block_digests(), self.base.block_digests())
+
+    def test_content_edit_changes_only_its_block(self):
+        """Test that renaming a field changes the file and that one block's digest"""
+        result = self.digest(self.text.replace('FilingDate: Date', 'FiledOn: Date'))
+        self.assertNotEqual(result.digest, self.base.digest)
+        before, after = self.base.block_digests(), result.block_digests()
+        self.assertEqual([k for k in before if before[k] != after[k]], ['DataObject:DO_SARFiling'])
+
+    def test_string_literals_are_verbatim(self):
+        """Test that spacing inside strings and // inside URLs are content"""
+        self.assertEqual(normalize_token('  Endpoint :  "https://a  b"  // note'), 'Endpoint:"https://a  b"')
+        result = self.digest(self.text.replace('"SAR filings immutable', '"SAR  filings immutable'))
+        self.assertNotEqual(result.digest, self.base.digest)
+
+    def test_lexer_and_line_fallback_agree(self):
+        """Test that verticals without a lexer hash the same as the banking lexer"""
+        lexer_class = self.engine.grammar('banking').lexer_class
+        for path in sorted(EXAMPLES.glob('*/examples/*.ebl')):
+            with self.subTest(file=path.name):
+                text = path.read_text(encoding='utf-8')
+                self.assertEqual(canonical_hash(text, lexer_class).digest, canonical_hash(text).digest)
+
+
+if __name__ == '__main__':
+    unittest.main()
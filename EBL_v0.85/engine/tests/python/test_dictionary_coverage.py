@@ -0,0 +1,183 @@
+"""
+EBL Engine - Dictionary Coverage Tests
+Tests for usage scanning, ID-keyed counters and their merge across workers
+"""
+
+import csv
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from batch_runner import BatchRunner, ResultCache, collect_files
+from dictionary_coverage import (
+    Coverage,
+    coverage_member,
+    coverage_path,
+    coverage_rows,
+    file_coverage,
+    merge_results,
+    report_coverage,
+)
+from ebl_usage import scan_usage
+from vertical_engine import VerticalEngine
+from vertical_validator import VerticalDictionary, canonicalize
+
+LOANS = '''# Domain: Banking
+Metadata:
+  Version: 0.85
+
+DataObject DO_Loan {
+  Schema:
+    Id: UUID
+}
+
+Process Lending {
+  Description: "Loans"
+  Actors: [
+    LoanOfficer,
+    Underwriter
+  ]
+
+  Step Apply {
+    Validation:
+      - Underwriter Checks DO_Loan
+    Actions:
+      - LoanOfficer Create DO_Loan Input
+      - Underwriter Approve DO_Loan
+  }
+}
+
+Relationship LoanOwner {
+  From: Loan
+  To: Borrower
+  Type: owns
+}
+'''
+
+REVIEWS = '''Process Review {
+  Actors: [Underwriter, Auditor]
+
+  Step Check {
+    Actions:
+      - underwriter approve DO_Loan
+      - Auditor Review DO_Audit
+  }
+}
+'''
+
+DICTIONARY = {
+    'core': {'verbPermissions': {'Create': 'write', 'Approve': 'write', 'Delete': 'write'},
+             'relationshipTypes': ['owns', 'secures']},
+    'domain': {
+        'actors': ['LoanOfficer', 'Underwriter', 'Teller'],
+        'verbs': ['Create', 'Approve'],
+        'dataObjects': ['DO_Loan', 'DO_Unused'],
+        'actorVerbs': {'LoanOfficer': ['Create'], 'Underwriter': ['Approve', 'Create']},
+    },
+}
+
+
+def counts(coverage: Coverage, kind: str):
+    return {coverage.name(kind, key): n for key, n in coverage.counts[kind].items()}
+
+
+def canonical_counts(coverage: Coverage, kind: str):
+    return {canonicalize(name.replace(' ', '/')): n for name, n in counts(coverage, kind).items()}
+
+
+class TestUsageScan(unittest.TestCase):
+    """Test the line scan of a file's names"""
+
+    def test_scan(self):
+        """Test multi-line Actors lists, Actions-only items, DataObjects and relationship types"""
+        usage = scan_usage(LOANS.split('\n'))
+        [process] = usage.processes
+        self.assertEqual(process.actors, ['LoanOfficer', 'Underwriter'])
+        self.assertEqual([(a.actor, a.verb, a.line, a.step) for a in process.actions],
+                         [('LoanOfficer', 'Create', 21, 'Apply'), ('Underwriter', 'Approve', 22, 'Apply')])
+        self.assertEqual([line for _, line in usage.data_objects], [5, 19, 21, 22])
+        self.assertEqual(usage.relationship_types, [('owns', 29)])
+
+
+class TestCoverage(unittest.TestCase):
+    """Test counters, merging and the ranked rows"""
+
+    def merged(self, *files):
+        coverage = Coverage()
+        for path, text in files:
+            coverage.merge_compact(file_coverage(path, scan_usage(text.split('\n'))))
+        return coverage
+
+    def test_merge_is_order_independent(self):
+        """Test that compact forms with different interned IDs merge to the same counts"""
+        forward = self.merged(('a.ebl', LOANS), ('b.ebl', REVIEWS))
+        backward = self.merged(('b.ebl', REVIEWS), ('a.ebl', LOANS))
+        for kind in forward.counts:
+            self.assertEqual(canonical_counts(forward, kind), canonical_counts(backward, kind))
+        self.assertEqual(counts(forward, 'actorVerb'), {'LoanOfficer Create': 1, 'Underwriter Approve': 2,
+                                                        'Auditor Review': 1})
+        self.assertEqual(counts(backward, 'actorVerb')['Underwriter approve'], 2)
+
+    def test_rows(self):
+        """Test ranking, dictionary spelling, unknown names and unused dictionary names"""
+        coverage = self.merged(('b.ebl', REVIEWS), ('a.ebl', LOANS))
+        rows = coverage_rows(coverage, VerticalDictionary.from_data(DICTIONARY))
+        actors = [(r.name, r.in_dictionary, r.count, r.files) for r in rows if r.kind == 'actor']
+        self.assertEqual(actors, [('Underwriter', True, 4, ['b.ebl', 'a.ebl']), ('Auditor', False, 2, ['b.ebl']),
+                                  ('LoanOfficer', True, 2, ['a.ebl']), ('Teller', True, 0, [])])
+        verbs = {r.name: r.count for r in rows if r.kind == 'verb'}
+        self.assertEqual(verbs, {'Approve': 2, 'Create': 1, 'Review': 1, 'Delete': 0})
+        pairs = {r.name: r.count for r in rows if r.kind == 'actorVerb' and r.in_dictionary}
+        self.assertEqual(pairs, {'Underwriter Approve': 2, 'LoanOfficer Create': 1, 'Underwriter Create': 0})
+        self.assertIn(('relationshipType', 'secures', 0), [(r.kind, r.name, r.count) for r in rows])
+
+
+class TestBatchCoverage(unittest.TestCase):
+    """Test coverage collected by batch workers"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, text in (('loans.ebl', LOANS), ('reviews.ebl', '# Domain: Banking\n' + REVIEWS)):
+            (Path(self.tmp.name) / name).write_text(text)
+        self.files = collect_files([self.tmp.name])
+
+    def run_batch(self, cache):
+        runner = BatchRunner(workers=2, cache=cache, task=coverage_path, member_task=coverage_member,
+                             requires=('coverage',))
+        return runner.run(self.files, 'banking')
+
+    def test_workers_merge(self):
+        """Test that per-file coverage from the workers merges into one report and CSV"""
+        results = self.run_batch(ResultCache())
+        coverage = merge_results(results)['banking']
+        self.assertEqual(counts(coverage, 'actor')['Underwriter'], 4)
+        self.assertEqual(len(coverage.files), 2)
+
+        csv_path = Path(self.tmp.name) / 'coverage.csv'
+        with redirect_stdout(io.StringIO()) as out:
+            report_coverage(VerticalEngine(), {'banking': coverage}, csv_path=str(csv_path))
+        self.assertIn('BANKING DICTIONARY COVERAGE (2 files)', out.getvalue())
+        with open(csv_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        [row] = [r for r in rows if r['kind'] == 'actor' and r['name'] == 'Underwriter']
+        self.assertEqual((row['inDictionary'], row['count'], row['files']), ('1', '4', '2'))
+
+    def test_cached_results_without_coverage_rerun(self):
+        """Test that a cached result from a plain run is not reused for a coverage run"""
+        cache = ResultCache()
+        BatchRunner(workers=1, cache=cache).run(self.files, 'banking')
+        results = self.run_batch(cache)
+        self.assertFalse(any(r.cached for r in results))
+        self.assertTrue(all(r.cached for r in self.run_batch(cache)))
+
+
+if __name__ == '__main__':
+    unittest.main()
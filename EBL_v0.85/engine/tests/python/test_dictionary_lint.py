@@ -0,0 +1,107 @@
+"""
+EBL Engine - Dictionary Lint Tests
+Tests for the dictionary self-consistency checks
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from dictionary_lint import dictionary_paths, lint_dictionary, main
+from vertical_engine import VerticalEngine
+from vertical_validator import VerticalDictionary
+
+CONSISTENT = {
+    'core': {'verbPermissions': {'Approve': 'write', 'Review': 'read'}},
+    'domain': {
+        'actors': ['LoanOfficer', 'Underwriter'],
+        'verbs': ['Approve', 'Review'],
+        'entities': ['Loan'],
+        'dataObjects': ['DO_Loan'],
+        'actorVerbs': {'LoanOfficer': ['Review'], 'Underwriter': ['Approve', 'Review']},
+        'actorDataPerms': {'Underwriter': {'read': ['DO_Loan'], 'write': ['DO_Loan']}},
+    },
+}
+
+
+class TestDictionaryLint(unittest.TestCase):
+    """Test each lint rule on small dictionaries"""
+
+    def lint(self, verb_permissions=None, **domain):
+        permissions = {**CONSISTENT['core']['verbPermissions'], **(verb_permissions or {})}
+        data = {'core': {'verbPermissions': permissions}, 'domain': {**CONSISTENT['domain'], **domain}}
+        return [(i.severity, i.rule, i.message) for i in lint_dictionary(VerticalDictionary.from_data(data))]
+
+    def test_consistent(self):
+        """Test that a consistent dictionary has no issues"""
+        self.assertEqual(self.lint(), [])
+
+    def test_unknown_references(self):
+        """Test actors, verbs and DataObjects missing from the domain lists"""
+        issues = self.lint(
+            actorVerbs={'LoanOfficer': ['Review', 'Sign'], 'Teller': ['Review'], 'Underwriter': ['Approve', 'sign']},
+            actorDataPerms={'Underwriter': {'read': ['DO_Loan', 'DO_Missing']}, 'Auditor': {'read': ['DO_Loan']}},
+        )
+        self.assertEqual([rule for _, rule, _ in issues],
+                         ['DLINT-001', 'DLINT-002', 'DLINT-003', 'DLINT-004'])
+        self.assertEqual({severity for severity, _, _ in issues}, {'error'})
+        self.assertIn("verb 'Sign' (granted to 'LoanOfficer', 'Underwriter')", issues[1][2])
+        self.assertIn("'DO_Missing' (granted to 'Underwriter')", issues[3][2])
+
+    def test_gaps(self):
+        """Test permission holes, unreachable verbs and unrestricted actors"""
+        issues = self.lint(verb_permissions={'Close': 'execute'}, actors=['LoanOfficer', 'Underwriter', 'Clerk'],
+                           verbs=['Approve', 'Review', 'Archive', 'Close'])
+        self.assertEqual([(severity, rule) for severity, rule, _ in issues],
+                         [('error', 'DLINT-005'), ('warning', 'DLINT-006'), ('warning', 'DLINT-007'),
+                          ('warning', 'DLINT-007'), ('warning', 'DLINT-008')])
+        self.assertIn("'Archive' has no verbPermissions", issues[1][2])
+        self.assertIn("'Clerk'", issues[4][2])
+
+    def test_canonical_duplicates(self):
+        """Test names and keys that differ only in case or punctuation"""
+        issues = self.lint(verb_permissions={'approve': 'write'}, actors=['LoanOfficer', 'Underwriter', 'Loan Officer'],
+                           entities=['Loan', 'loan'])
+        self.assertEqual([rule for _, rule, _ in issues], ['DLINT-009'] * 3)
+        self.assertIn("'Loan', 'loan' are the same entity", issues[1][2])
+        self.assertIn('core.verbPermissions', issues[2][2])
+
+    def test_shipped_dictionaries_lint(self):
+        """Test that every shipped dictionary is found and linted once when the engine loads it"""
+        paths = dictionary_paths([str(engine_path.parent.parent / 'verticals')])
+        self.assertGreaterEqual(len(paths), 8)
+        engine = VerticalEngine()
+        for vertical in engine.rule_packs:
+            with self.subTest(vertical=vertical):
+                self.assertIn(engine.dictionary_path(vertical).resolve(), [p.resolve() for p in paths])
+                issues = engine.dictionary_lint(vertical)
+                self.assertEqual(issues, lint_dictionary(VerticalDictionary(str(engine.dictionary_path(vertical)))))
+                self.assertIs(engine.dictionary_lint(vertical), issues)
+
+    def test_cli(self):
+        """Test the command line on one dictionary file and on the verticals directory"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'consistent.json'
+            path.write_text(json.dumps(CONSISTENT))
+            with redirect_stdout(io.StringIO()) as out, self.assertRaises(SystemExit) as exit:
+                main(['dictionary_lint.py', str(path)])
+            self.assertEqual(exit.exception.code, 0)
+            self.assertIn(f"✅ {path}: 0 errors, 0 warnings", out.getvalue())
+
+        verticals = str(engine_path.parent.parent / 'verticals')
+        with redirect_stdout(io.StringIO()) as out, self.assertRaises(SystemExit) as exit:
+            main(['dictionary_lint.py', verticals])
+        self.assertEqual(exit.exception.code, 1)
+        self.assertIn('banking_dictionary_v0.85.json', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
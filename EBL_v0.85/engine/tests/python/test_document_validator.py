@@ -0,0 +1,88 @@
+"""
+EBL Engine - Document Validator Tests
+Tests for reusable parsers and in-memory validation
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from document_validator import DocumentValidator
+from vertical_engine import VerticalEngine
+from vertical_validator import ValidationIssue
+
+EXAMPLES = sorted((engine_path.parent.parent / 'verticals' / 'banking' / 'examples').glob('*.ebl'))
+HEADER = '# Domain: Banking\nMetadata:\n  Version: 0.85\n\n'
+
+
+class TestDocumentValidator(unittest.TestCase):
+    """Test one validator across many banking documents"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def setUp(self):
+        self.validator = DocumentValidator(self.engine, 'banking')
+
+    def test_same_report_as_validate_stream(self):
+        """Test that every example gives the validate_stream report, with one parser"""
+        parser = self.validator.parser.parser
+        for path in EXAMPLES + EXAMPLES:
+            with self.subTest(file=path.name):
+                self.assertEqual(self.validator.validate_text(path.read_text(encoding='utf-8')).to_dict(),
+                                 self.engine.validate_stream('banking', path).to_dict())
+        self.assertIs(self.validator.parser.parser, parser)
+
+    def test_state_reset_between_documents(self):
+        """Test that a document sees none of the previous document's issues or definitions"""
+        listener = self.validator.listener
+        listener.defined_data_objects.add('DO_Leaked')
+        listener.process_stack.append(({'Actor'}, set()))
+        earlier = listener.get_errors()
+        earlier.append(ValidationIssue('error', 'DICT-ACT-001', 'earlier document'))
+
+        report = self.validator.validate_text(HEADER)
+        self.assertEqual(report.errors, [])
+        self.assertEqual((listener.defined_data_objects, listener.process_stack), (set(), []))
+        self.assertEqual(len(earlier), 1)
+
+    def test_syntax_errors_keep_file_lines(self):
+        """Test that syntax errors are reported and a reused lexer numbers each block from its own start line"""
+        entity = 'Entity Loan {\n  dataRef: DO_Loan\n}\n'
+        report = self.validator.validate_text(HEADER + entity)
+        first = [(i.rule, i.line) for i in self.validator.parser.errors.issues]
+        self.assertEqual(first, [('SYNTAX', 7), ('SYNTAX', 8)])
+        self.assertEqual([(i.rule, i.line) for i in report.errors], first + [('DICT-ENT-002', 6)])
+        self.validator.validate_text('\n\n' + HEADER + entity)
+        self.assertEqual([(i.rule, i.line) for i in self.validator.parser.errors.issues],
+                         [(rule, line + 2) for rule, line in first])
+
+    def test_text_outside_blocks(self):
+        """Test that text outside any block is an error and an indented document is split at its margin"""
+        report = self.validator.validate_text('garbage {{{ ;;; ')
+        self.assertFalse(report.is_valid)
+        self.assertEqual([(i.rule, i.line) for i in report.errors], [('SYNTAX', 1)])
+        self.assertIn("outside any top-level block: 'garbage {{{ ;;;'", report.errors[0].message)
+
+        indented = '\n'.join('    ' + line for line in (HEADER + 'Entity Loan {\n  dataRef: DO_Loan\n}').split('\n'))
+        self.assertEqual([(i.rule, i.line, i.column) for i in self.validator.validate_text(indented).errors],
+                         [('SYNTAX', 7, 4), ('SYNTAX', 8, 0), ('DICT-ENT-002', 6, 15)])
+
+    def test_bytes_and_many(self):
+        """Test bytes input, limit errors and ordered results of validate_many"""
+        text = EXAMPLES[0].read_text(encoding='utf-8')
+        reports = list(self.validator.validate_many([text, HEADER + '{\n' * 40, text.encode('utf-8')]))
+        self.assertEqual(len(reports), 3)
+        self.assertEqual([(e.rule, e.line) for e in reports[1].errors], [('LIMIT-003', 37)])
+        self.assertEqual(reports[1].semantic_issues, [])
+        self.assertEqual(reports[0].to_dict(), reports[2].to_dict())
+        self.assertEqual(self.validator.validate_bytes(text.encode('utf-8')).to_dict(), reports[0].to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+EBL Engine - Structural Diff Tests
+Tests element matching by key on the mortgage example
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from ebl_diff import diff_texts, parse_model
+
+MORTGAGE = engine_path.parent.parent / 'verticals' / 'banking' / 'examples' / 'MortgageLoanApplication.ebl'
+PROCESS = 'Process:MortgageLoanOriginationWorkflow'
+STEP = 'Step:InitialApplicationReview'
+
+
+class TestStructuralDiff(unittest.TestCase):
+    """Test added/removed/modified/reordered reporting"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.text = MORTGAGE.read_text(encoding='utf-8')
+
+    def changes(self, new_text):
+        return [(c.op, c.path) for c in diff_texts(self.text, new_text).changes]
+
+    def test_model_shape(self):
+        """Test that blocks, steps, sections, fields and actions are keyed"""
+        model = parse_model(self.text)
+        step = model.children[PROCESS].children[STEP]
+        self.assertEqual(step.kind, 'Step')
+        self.assertIn('MortgageLoanOfficer Create LoanApplication', step.children['Actions'].children)
+        self.assertEqual(step.children['Actions'].children['MortgageLoanOfficer Create LoanApplication'].kind,
+                         'Action')
+        fields = model.children['DataObject:DO_BorrowerData'].children['Schema'].children
+        self.assertEqual(fields['SSN'].kind, 'Field')
+        self.assertEqual(fields['SSN'].line, 59)
+
+    def test_formatting_is_not_a_change(self):
+        """Test re-indentation, spacing and comments"""
+        edited = re.sub(r'^(\s+)', r'\1\1', self.text, flags=re.MULTILINE).replace(', required', ' ,  required')
+        edited = '# Reviewed 2025-06\n' + edited.replace('  Schema:\n', '  // fields\n  Schema:\n')
+        self.assertEqual(self.changes(edited), [])
+
+    def test_field_changes(self):
+        """Test a modified, an added and a removed Schema field"""
+        edited = (self.text.replace('SSN: String, required', 'SSN: String, required, unique')
+                  .replace('    MiddleName: String\n', '')
+                  .replace('    LastName: String, required\n', '    LastName: String, required\n    Suffix: String\n'))
+        schema = ['DataObject:DO_BorrowerData', 'Schema']
+        self.assertEqual(self.changes(edited), [('modified', schema + ['SSN']),
+                                                ('added', schema + ['Suffix']),
+                                                ('removed', schema + ['MiddleName'])])
+        diff = diff_texts(self.text, edited)
+        self.assertEqual(diff.changed_blocks, {'DataObject:DO_BorrowerData'})
+        self.assertEqual(diff.changes[0].old, 'SSN:String,required')
+
+    def test_actions_and_steps(self):
+        """Test removed and reordered Actions and a removed Step"""
+        first = '      - MortgageLoanOfficer Create LoanApplication\n'
+        second = '      - MortgageLoanOfficer Review application completeness\n'
+        reordered = self.text.replace(first + second, second + first)
+        self.assertEqual(self.changes(reordered), [('reordered', [PROCESS, STEP, 'Actions'])])
+
+        removed = self.text.replace(second, '')
+        self.assertEqual(self.changes(removed),
+                         [('removed', [PROCESS, STEP, 'Actions', 'MortgageLoanOfficer Review application completeness'])])
+
+        start = self.text.index('  Step PullCreditReport {')
+        end = self.text.index('\n  }\n', start) + 5
+        self.assertEqual(self.changes(self.text[:start] + self.text[end:]),
+                         [('removed', [PROCESS, 'Step:PullCreditReport'])])
+
+    def test_multiline_attribute(self):
+        """Test that a bracket list spanning lines is one attribute"""
+        edited = self.text.replace('    CreditBureau,\n', '')
+        changes = diff_texts(self.text, edited).changes
+        self.assertEqual([(c.op, c.path) for c in changes], [('modified', [PROCESS, 'Actors'])])
+        self.assertIn('CreditBureau', changes[0].old)
+        self.assertNotIn('CreditBureau', changes[0].new)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+EBL Engine - Import Tests
+Tests for module caching, cycle detection and the import graph
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from ebl_blocks import split_blocks
+from ebl_imports import ImportResolver
+from vertical_engine import SyntaxErrorCollector, VerticalEngine
+
+HEADER = '# Domain: Banking\nMetadata:\n  Version: 0.85\n'
+
+SHARED = HEADER + '''
+DataObject DO_Shared {
+  Schema:
+    Id: UUID, required
+}
+
+Entity Shared {
+  dataRef: DO_Shared
+}
+'''
+
+IMPORTER = HEADER + '''Import: "{module}"
+
+Process Uses{name} {{
+  Actors: [Teller]
+  Actions:
+    - Teller Review DO_Shared
+}}
+'''
+
+
+class TestImportResolver(unittest.TestCase):
+    """Test resolution over temporary module trees"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(os.path.realpath(self.tmp.name))
+        (self.root / 'lib').mkdir()
+        self.write('lib/shared.ebl', SHARED)
+        self.write('a.ebl', IMPORTER.format(module='lib/shared.ebl', name='A'))
+        self.write('b.ebl', IMPORTER.format(module='lib/../lib/shared.ebl', name='B'))
+        self.resolver = ImportResolver(self.engine)
+
+    def write(self, name: str, text: str) -> str:
+        path = self.root / name
+        path.write_text(text, encoding='utf-8')
+        return str(path)
+
+    def test_shared_module_compiled_once(self):
+        """Test that two importers share one compiled module with its definitions"""
+        for name in ('a.ebl', 'b.ebl'):
+            report = self.resolver.validate('banking', str(self.root / name))
+            self.assertEqual([e.rule for e in report.errors if e.rule.startswith('IMPORT')], [])
+        self.assertEqual(self.resolver.parses, 3)
+        visible = self.resolver.visible_definitions('banking', str(self.root / 'a.ebl'))
+        self.assertEqual(visible['dataObject'], {'DO_Shared'})
+        self.assertEqual(visible['entity'], {'Shared'})
+
+        # Identical content at another path is the same compiled model
+        shutil.copy(self.root / 'lib' / 'shared.ebl', self.root / 'copy.ebl')
+        self.write('c.ebl', IMPORTER.format(module='copy.ebl', name='C'))
+        self.resolver.validate('banking', str(self.root / 'c.ebl'))
+        self.assertEqual(self.resolver.parses, 4)
+
+    def test_directive_ends_metadata(self):
+        """Test that the Import line is its own block, not part of the Metadata block"""
+        blocks = split_blocks(IMPORTER.format(module='lib/shared.ebl', name='A'))
+        self.assertEqual([b.key for b in blocks], ['Metadata', 'Import:lib/shared.ebl', 'Process:UsesA'])
+        self.assertEqual((blocks[1].rule, blocks[1].start_line), ('importDirective', 4))
+        self.assertNotIn('Import', blocks[0].text)
+
+    def test_directive_in_grammar(self):
+        """Test that a module of only imports parses, and a malformed directive is a syntax error"""
+        errors = SyntaxErrorCollector()
+        self.engine.parse('banking', HEADER + 'Import: "lib/shared.ebl"\nImport: "lib/other.ebl"\n', errors)
+        self.assertEqual(errors.issues, [])
+
+        path = self.write('g.ebl', HEADER + 'Import: lib/shared.ebl\n')
+        report = self.resolver.validate('banking', path)
+        self.assertEqual([(e.rule, e.line) for e in report.errors], [('SYNTAX', 4)])
+
+    def test_graph_and_invalidation(self):
+        """Test dependents of a module and recompilation only on content change"""
+        a, b = str(self.root / 'a.ebl'), str(self.root / 'b.ebl')
+        shared = str(self.root / 'lib' / 'shared.ebl')
+        self.resolver.validate('banking', a)
+        self.resolver.validate('banking', b)
+        self.assertEqual(self.resolver.graph.imports[a], [shared])
+        self.assertEqual(self.resolver.invalidate(shared), {a, b})
+
+        os.utime(shared)  # Touched, same content: still cached
+        self.resolver.validate('banking', a)
+        self.assertEqual(self.resolver.parses, 3)
+
+        self.write('lib/shared.ebl', SHARED.replace('DO_Shared {', 'DO_Shared  {'))
+        self.resolver.validate('banking', a)
+        self.assertEqual(self.resolver.parses, 4)
+
+    def test_cycle_detected(self):
+        """Test that a cycle is an error on the root file's directive and resolution terminates"""
+        self.write('c.ebl', IMPORTER.format(module='d.ebl', name='C'))
+        self.write('d.ebl', IMPORTER.format(module='c.ebl', name='D'))
+        report = self.resolver.validate('banking', str(self.root / 'c.ebl'))
+        cycles = [e for e in report.errors if e.rule == 'IMPORT-002']
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(cycles[0].line, 4)
+        self.assertIn('c.ebl -> d.ebl -> c.ebl', cycles[0].message)
+        self.assertFalse(report.is_valid)
+
+    def test_missing_module(self):
+        """Test that an unresolvable import is reported"""
+        self.write('e.ebl', IMPORTER.format(module='nowhere.ebl', name='E'))
+        report = self.resolver.validate('banking', str(self.root / 'e.ebl'))
+        self.assertEqual([(e.rule, e.line) for e in report.errors if e.rule.startswith('IMPORT')],
+                         [('IMPORT-001', 4)])
+
+    def test_syntax_errors_in_file_order(self):
+        """Test that syntax errors and text outside blocks are reported like validate_file does"""
+        path = self.write('f.ebl', 'stray\n' + IMPORTER.format(module='lib/shared.ebl', name='F') + 'trailing\n')
+        report = self.resolver.validate('banking', path)
+        self.assertEqual([e for e in report.errors if e.rule == 'SYNTAX'],
+                         [e for e in self.engine.validate_file('banking', path).errors if e.rule == 'SYNTAX'])
+        self.assertEqual([e.line for e in report.errors if 'outside any top-level block' in e.message], [1, 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
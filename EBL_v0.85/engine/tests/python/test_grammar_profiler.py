@@ -0,0 +1,74 @@
+"""
+EBL Engine - Grammar Profiler Tests
+Tests for decision mapping, reach counting and the profiling ATN simulator
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from antlr4 import CommonTokenStream, InputStream, ParserRuleContext
+from antlr4.dfa.DFA import DFA
+
+from grammar_profiler import GrammarProfiler, ProfilingATNSimulator, describe_decisions
+from vertical_engine import VerticalEngine
+
+
+class TestGrammarProfiler(unittest.TestCase):
+    """Test against the generated banking parser"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+        cls.grammar = cls.engine.grammar('banking')
+        cls.decisions = describe_decisions(cls.grammar.parser_class, cls.engine.grammar_path('banking'))
+
+    def decision(self, rule: str, first: str):
+        return [d for d in self.decisions if d.rule == rule and d.alternatives[0] == first]
+
+    def test_decisions_link_to_grammar_lines(self):
+        """Test that subrules map to their rule and .g4 line"""
+        lines = self.engine.grammar_path('banking').read_text(encoding='utf-8').split('\n')
+        for rule, first, text in (('stepSection', "'Description'", "'Description' ':' text NL+"),
+                                  ('stepSection', 'output', "'Output' ':' (output NL+"),
+                                  ('process', 'step', 'step*'),
+                                  ('eblDefinition', 'importDirective', '(importDirective | metadata')):
+            [decision] = self.decision(rule, first)
+            self.assertIn(text, lines[decision.line - 1])
+        [alternatives] = self.decision('stepSection', "'Description'")
+        self.assertEqual(alternatives.kind, '( | )')
+        self.assertEqual(len(self.decision('step', 'NL')), 2)
+        self.assertEqual(sorted(d.line for d in self.decision('step', 'NL')), [145, 147])
+
+    def test_reached_decisions_counted(self):
+        """Test that LA(1) decisions are counted when the parser reaches them"""
+        profiler = GrammarProfiler(self.engine, whole_files=True)
+        profiler.add_text('banking', 'Metadata:\n' + 'DataObject\n' * 50)
+        profiler.finish()
+        profile = profiler.profiles['banking']
+        top = profile.hotspots('reached', 1)[0]
+        self.assertEqual((top.rule, top.reached), ('eblDefinition', 51))  # Metadata and each DataObject
+        self.assertEqual(profile.to_dict('reached', 1)['decisionsReached'], profile.reached)
+
+    def test_profiling_simulator(self):
+        """Test invocation, lookahead and DFA statistics of adaptivePredict"""
+        parser_class = self.grammar.parser_class
+        dfas = [DFA(state, i) for i, state in enumerate(parser_class.atn.decisionToState)]
+        stream = CommonTokenStream(self.grammar.lexer_class(InputStream('\n\nInputs\n')))
+        simulator = ProfilingATNSimulator(parser_class(stream), self.decisions, dfas)
+        [decision] = [d for d in self.decisions if d.rule == 'step' and d.line == 145]
+        for _ in range(3):
+            stream.seek(0)
+            self.assertEqual(simulator.adaptivePredict(stream, decision.decision, ParserRuleContext()), 1)
+        self.assertEqual((decision.invocations, decision.sll_total_look, decision.sll_max_look), (3, 3, 1))
+        self.assertEqual(decision.ll_fallbacks, 0)
+        self.assertGreater(decision.time_ns, 0)
+        self.assertGreater(len(dfas[decision.decision].states), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""
+EBL Engine - Language Server Tests
+Tests for incremental re-parse, diagnostics, cancellation and completion
+"""
+
+import contextlib
+import io
+import queue
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from antlr4.Token import CommonToken
+from antlr4.tree.Tree import TerminalNodeImpl
+
+from ebl_blocks import split_blocks
+from lsp_server import EblLanguageServer, JsonRpcStream, position_to_offset
+from vertical_validator import find_terminal, node_column, node_line
+
+
+URI = 'file:///tmp/wire.ebl'
+DOCUMENT = """# Domain: Banking
+Metadata:
+  EBLClass: WireWorkflow
+  Version: 0.85
+
+DataObject DO_Wire {
+  Schema:
+    Amount: Currency
+  erMap: Wire
+}
+
+Process SendWire {
+  Description: "Send SWIFT MT103"
+}
+"""
+
+
+class RecordingStream(JsonRpcStream):
+    """Stream that queues outgoing messages for inspection"""
+
+    def __init__(self):
+        super().__init__(io.BytesIO(), io.BytesIO())
+        self.sent: 'queue.Queue[dict]' = queue.Queue()
+
+    def write_message(self, message):
+        self.sent.put(message)
+
+
+class TestIssuePositions(unittest.TestCase):
+    """Test line/column helpers used by ValidationIssue"""
+
+    def test_terminal_position(self):
+        """Test that terminal nodes report their token position"""
+        token = CommonToken(type=1)
+        token.line, token.column, token.text = 12, 4, 'LoanOfficer'
+        node = TerminalNodeImpl(token)
+        self.assertEqual((node_line(node), node_column(node)), (12, 4))
+        self.assertIsNone(node_line(None))
+
+    def test_find_terminal_falls_back_to_node(self):
+        """Test that a missing terminal falls back to the given node"""
+        token = CommonToken(type=1)
+        token.text = 'Underwriter'
+        node = TerminalNodeImpl(token)
+        self.assertIs(find_terminal(node, 'Underwriter'), node)
+
+
+class TestBlocks(unittest.TestCase):
+    """Test the top-level block splitter"""
+
+    def test_split(self):
+        """Test block kinds, names and line ranges"""
+        blocks = split_blocks(DOCUMENT)
+        self.assertEqual([b.key for b in blocks], ['Metadata', 'DataObject:DO_Wire', 'Process:SendWire'])
+        self.assertEqual([(b.start_line, b.end_line) for b in blocks], [(2, 4), (6, 10), (12, 14)])
+        self.assertEqual(blocks[1].rule, 'dataObject')
+
+
+class TestLanguageServer(unittest.TestCase):
+    """Test the server without a transport loop"""
+
+    def setUp(self):
+        self.stream = RecordingStream()
+        self.server = EblLanguageServer(self.stream, debounce=0)
+        self.server.handle({'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}})
+        self.assertIn('capabilities', self.stream.sent.get(timeout=5)['result'])
+
+    def tearDown(self):
+        self.server.handle({'jsonrpc': '2.0', 'method': 'exit'})
+
+    def open(self, text=DOCUMENT):
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+            'textDocument': {'uri': URI, 'languageId': 'ebl', 'version': 1, 'text': text}}})
+        return self.next_diagnostics()
+
+    def next_diagnostics(self):
+        while True:
+            message = self.stream.sent.get(timeout=10)
+            if message.get('method') == 'textDocument/publishDiagnostics':
+                return message['params']
+
+    def test_diagnostics_have_positions(self):
+        """Test that syntax errors land on the block's own lines"""
+        params = self.open()
+        self.assertEqual(params['uri'], URI)
+        lines = {d['range']['start']['line'] for d in params['diagnostics'] if d['code'] == 'SYNTAX'}
+        self.assertEqual(lines, {8, 13})
+        self.assertIn('WIRE-002', [d['code'] for d in params['diagnostics']])
+
+    def test_incremental_reparse(self):
+        """Test that an edit re-parses only the changed block"""
+        self.open()
+        document = self.server.documents[URI]
+        self.assertEqual(document.parses, 3)
+
+        # Rename the process: only the Process block changes
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': URI, 'version': 2},
+            'contentChanges': [{'range': {'start': {'line': 11, 'character': 8},
+                                          'end': {'line': 11, 'character': 16}},
+                                'text': 'WireOut'}]}})
+        params = self.next_diagnostics()
+        self.assertEqual(params['version'], 2)
+        self.assertIn('Process WireOut {', document.text)
+        self.assertEqual(document.parses, 4)
+
+        # Insert a line above everything: blocks move but are not re-parsed
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': URI, 'version': 3},
+            'contentChanges': [{'range': {'start': {'line': 0, 'character': 0},
+                                          'end': {'line': 0, 'character': 0}},
+                                'text': '// header\n'}]}})
+        params = self.next_diagnostics()
+        self.assertEqual(document.parses, 4)
+        lines = {d['range']['start']['line'] for d in params['diagnostics'] if d['code'] == 'SYNTAX'}
+        self.assertEqual(lines, {9, 14})
+
+    def test_stale_request_cancelled(self):
+        """Test $/cancelRequest for a queued request"""
+        self.server.cancel_request({'id': 7})
+        self.server.handle({'jsonrpc': '2.0', 'id': 7, 'method': 'textDocument/completion', 'params': {}})
+        self.assertEqual(self.stream.sent.get(timeout=5)['error']['code'], -32800)
+
+    def test_failures_keep_serving(self):
+        """Test that a failing request or validation is logged and the session goes on"""
+        validate_document = self.server.validate_document
+        calls = []
+
+        def fail_once(uri):
+            calls.append(uri)
+            if len(calls) == 1:
+                raise RuntimeError('bad dictionary')
+            return validate_document(uri)
+
+        self.server.validate_document = fail_once
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            self.server.handle({'jsonrpc': '2.0', 'id': 3, 'method': 'textDocument/completion', 'params': {}})
+            error = self.stream.sent.get(timeout=5)
+            self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+                'textDocument': {'uri': URI, 'languageId': 'ebl', 'version': 1, 'text': DOCUMENT}}})
+            self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+                'textDocument': {'uri': URI, 'version': 2}, 'contentChanges': [{'text': DOCUMENT}]}})
+            params = self.next_diagnostics()
+        self.assertEqual((error['id'], error['error']['code']), (3, -32603))
+        self.assertIn("Request 'textDocument/completion' failed", stderr.getvalue())
+        self.assertIn("Validation of file:///tmp/wire.ebl failed", stderr.getvalue())
+        self.assertIn('RuntimeError: bad dictionary', stderr.getvalue())
+
+        # The worker survived the first validation and published for the edit
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(params['version'], 2)
+
+    def test_completion(self):
+        """Test dictionary-backed completion by context"""
+        text = "Process P {\n  Actors: [Loan\n      - LoanOfficer \n  dataRef: DO_SAR\n"
+        self.open(text)
+
+        def complete(line, character):
+            self.server.handle({'jsonrpc': '2.0', 'id': 9, 'method': 'textDocument/completion', 'params': {
+                'textDocument': {'uri': URI}, 'position': {'line': line, 'character': character}}})
+            return self.stream.sent.get(timeout=5)['result']['items']
+
+        actors = complete(1, 15)
+        self.assertIn('LoanOfficer', [i['label'] for i in actors])
+        self.assertTrue(all(i['detail'] == 'actor' for i in actors))
+
+        verbs = complete(2, 20)
+        self.assertTrue(all(i['detail'] == 'verb' for i in verbs))
+        self.assertEqual(min(verbs, key=lambda i: i['sortText'])['sortText'][0], '0')
+
+        data_objects = complete(3, 17)
+        self.assertIn('DO_SARFiling', [i['label'] for i in data_objects])
+
+    def test_utf16_positions(self):
+        """Test LSP UTF-16 positions on non-ASCII lines"""
+        text = "a😀b\nsecond"
+        self.assertEqual(text[position_to_offset(text, 0, 3)], 'b')
+        self.assertEqual(text[position_to_offset(text, 1, 0)], 's')
+
+
+class TestTransport(unittest.TestCase):
+    """Test Content-Length framing"""
+
+    def test_round_trip(self):
+        """Test writing and reading one framed message"""
+        buffer = io.BytesIO()
+        JsonRpcStream(io.BytesIO(), buffer).write_message({'jsonrpc': '2.0', 'method': 'x'})
+        buffer.seek(0)
+        self.assertEqual(JsonRpcStream(buffer, io.BytesIO()).read_message()['method'], 'x')
+
+
+if __name__ == '__main__':
+    unittest.main()
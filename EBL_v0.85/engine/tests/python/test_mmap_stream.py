@@ -0,0 +1,120 @@
+"""
+EBL Engine - Memory-Mapped Input Stream Tests
+Tests that the lexer sees an mmapped file exactly as it sees the decoded text
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from antlr4 import InputStream
+from ebl_blocks import split_blocks
+from mmap_stream import MmapInputStream, MmapWindow, iter_mapped_blocks
+from vertical_engine import VerticalEngine
+
+EXAMPLE = engine_path.parent.parent / 'verticals' / 'banking' / 'examples' / 'MortgageLoanApplication.ebl'
+
+NON_ASCII = (
+    'Process Zahlung {\n'
+    '  Description: "Überweisung – naïve café 😀"\n'
+    '  Actors: [Kassierer]\n'
+    '}\n'
+) * 20
+
+
+class TestMmapInputStream(unittest.TestCase):
+    """Test token text and positions against antlr4's InputStream"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lexer_class = VerticalEngine().grammar('banking').lexer_class
+
+    def write(self, text: str) -> str:
+        fd, path = tempfile.mkstemp(suffix='.ebl')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(text.encode('utf-8'))
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def tokens(self, stream):
+        lexer = self.lexer_class(stream)
+        lexer.removeErrorListeners()
+        return [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in lexer.getAllTokens()]
+
+    def assert_same_as_input_stream(self, text: str, segment_bytes: int):
+        with MmapInputStream(self.write(text), segment_bytes=segment_bytes) as stream:
+            self.assertEqual(stream.size, len(text))
+            self.assertEqual(str(stream), text)
+            self.assertEqual(self.tokens(stream), self.tokens(InputStream(text)))
+
+    def test_ascii_file(self):
+        """An ASCII example lexes identically"""
+        self.assert_same_as_input_stream(EXAMPLE.read_text(encoding='utf-8'), 64 * 1024)
+
+    def test_non_ascii_segments(self):
+        """Multi-byte characters across segment boundaries keep code point positions"""
+        for segment_bytes in (5, 64, 64 * 1024):
+            with self.subTest(segment_bytes=segment_bytes):
+                self.assert_same_as_input_stream(NON_ASCII, segment_bytes)
+
+    def test_get_text_ranges(self):
+        """getText clamps and slices like InputStream"""
+        reference = InputStream(NON_ASCII)
+        with MmapInputStream(self.write(NON_ASCII), segment_bytes=16, cached_segments=2) as stream:
+            for start, stop in [(0, 10), (30, 60), (45, 45), (50, 40), (0, len(NON_ASCII) + 5),
+                                (len(NON_ASCII) - 3, len(NON_ASCII) + 2), (len(NON_ASCII), len(NON_ASCII))]:
+                self.assertEqual(stream.getText(start, stop), reference.getText(start, stop), (start, stop))
+
+    def test_iter_text(self):
+        """Chunks end at line breaks and reassemble the file"""
+        with MmapInputStream(self.write(NON_ASCII)) as stream:
+            chunks = list(stream.iter_text(chunk_bytes=100))
+        self.assertEqual(''.join(chunks), NON_ASCII)
+        self.assertTrue(all(chunk.endswith('\n') for chunk in chunks))
+
+    def test_iter_lines(self):
+        """Lines keep their breaks (CRLF included) and the last one may have none"""
+        text = NON_ASCII + 'Process Last {\r\n}'
+        with MmapInputStream(self.write(text)) as stream:
+            lines = list(stream.iter_lines())
+        self.assertEqual(lines, text.splitlines(keepends=True))
+
+    def test_window(self):
+        """A window lexes like the text it covers, indexed from 0"""
+        with MmapInputStream(self.write(NON_ASCII), segment_bytes=16) as stream:
+            for start, size in [(0, 30), (40, 70), (len(NON_ASCII) - 10, 50)]:
+                with self.subTest(start=start, size=size):
+                    window = stream.window(start, size)
+                    part = NON_ASCII[start:start + size]
+                    self.assertEqual(window.size, len(part))
+                    self.assertEqual(str(window), part)
+                    self.assertEqual(self.tokens(window), self.tokens(InputStream(part)))
+
+    def test_mapped_blocks(self):
+        """Blocks lexed from the mapping give the tokens of their text"""
+        text = NON_ASCII + '\nstray\nProcess Last {\n  Actors: [A]\n}'
+        strays = []
+        with MmapInputStream(self.write(text), segment_bytes=64) as stream:
+            mapped = list(iter_mapped_blocks(stream, stream.iter_lines(), lambda line, stray: strays.append(line)))
+            self.assertEqual([block for block, _ in mapped], split_blocks(text))
+            for block, input_stream in mapped:
+                self.assertEqual(self.tokens(input_stream), self.tokens(InputStream(block.text)))
+        self.assertEqual(strays, [82])
+        self.assertIsInstance(mapped[0][1], MmapWindow)
+        self.assertNotIsInstance(mapped[-1][1], MmapWindow)  # No final line break
+
+    def test_empty_file(self):
+        """Empty files are not mapped but still read as EOF"""
+        with MmapInputStream(self.write('')) as stream:
+            self.assertEqual(stream.size, 0)
+            self.assertEqual(self.tokens(stream), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+EBL Engine - Parse Limit Tests
+Tests for pre-flight limits and bounded syntax-error recovery
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from parse_limits import InputGuard, InputLimitError, ParseLimits, TooManySyntaxErrors, check_text
+from vertical_engine import VerticalEngine
+
+HEADER = '# Domain: Banking\nMetadata:\n  Version: 0.85\n\n'
+
+
+class TestPreflight(unittest.TestCase):
+    """Test the size, line-length and depth checks"""
+
+    def test_long_line(self):
+        """Test that an over-long line is rejected with its line number"""
+        text = HEADER + 'DataObject DO_X {\n  Note: ' + 'x' * 70000 + '\n}\n'
+        with self.assertRaises(InputLimitError) as caught:
+            check_text(text, ParseLimits())
+        self.assertEqual((caught.exception.issue.rule, caught.exception.issue.line), ('LIMIT-002', 6))
+
+    def test_brace_depth(self):
+        """Test that deep nesting is rejected where it passes the limit"""
+        text = HEADER + ''.join(f"{'  ' * i}Step S{i} {{\n" for i in range(6))
+        check_text(text, ParseLimits(max_brace_depth=6))
+        with self.assertRaises(InputLimitError) as caught:
+            check_text(text, ParseLimits(max_brace_depth=4))
+        self.assertEqual((caught.exception.issue.rule, caught.exception.issue.line), ('LIMIT-003', 9))
+
+    def test_chunking_does_not_matter(self):
+        """Test that a line split across feeds is measured whole"""
+        limits = ParseLimits(max_line_chars=10)
+        guard = InputGuard(limits)
+        for chunk in ('abc\nabcdef', 'ghi\n', '{ "}" {\n'):
+            guard.feed(chunk)
+        guard.close()
+        self.assertEqual((guard.line, guard.depth), (3, 2))
+        guard.feed('abcdef')
+        with self.assertRaises(InputLimitError):
+            guard.feed('ghijk')
+
+    def test_examples_within_defaults(self):
+        """Test that every shipped example passes the default limits"""
+        for path in (engine_path.parent.parent / 'verticals').glob('*/examples/*.ebl'):
+            check_text(path.read_text(encoding='utf-8'), ParseLimits())
+
+
+class TestEngineLimits(unittest.TestCase):
+    """Test that the engine fails fast with a LIMIT diagnostic"""
+
+    def test_file_size(self):
+        """Test that an oversized file is rejected before it is read"""
+        engine = VerticalEngine(limits=ParseLimits(max_file_bytes=64))
+        with tempfile.NamedTemporaryFile('w', suffix='.ebl', delete=False) as f:
+            f.write(HEADER + 'x' * 100)
+        self.addCleanup(os.unlink, f.name)
+        for validate in (engine.validate_file, engine.validate_stream):
+            with self.assertRaises(InputLimitError) as caught:
+                validate('banking', f.name)
+            self.assertEqual(caught.exception.issue.rule, 'LIMIT-001')
+
+    def test_syntax_error_cap(self):
+        """Test that recovery stops after max_syntax_errors"""
+        text = 'Metadata:\n' + 'DataObject\n' * 2000
+        engine = VerticalEngine(limits=ParseLimits(max_syntax_errors=20))
+        started = time.perf_counter()
+        with self.assertRaises(TooManySyntaxErrors) as caught:
+            engine.parse('banking', text)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(caught.exception.issue.rule, 'LIMIT-004')
+        self.assertLess(caught.exception.issue.line, 30)
+
+    def test_report(self):
+        """Test that validate_to_dict reports a limit as one error"""
+        result = VerticalEngine().validate_to_dict('banking', HEADER + '{\n' * 40)
+        self.assertFalse(result['valid'])
+        self.assertEqual([(e['rule'], e['line']) for e in result['errors']], [('LIMIT-003', 37)])
+        self.assertEqual(result['semanticIssues'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
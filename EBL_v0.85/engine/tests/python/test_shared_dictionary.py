@@ -0,0 +1,87 @@
+"""
+EBL Engine - Shared-Memory Dictionary Tests
+Tests that a compiled segment answers exactly like the JSON-loaded dictionary
+"""
+
+import multiprocessing
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from shared_dictionary import (
+    SharedDictionary, SharedMemoryDictionaries, attach_dictionaries, compile_dictionary,
+)
+from vertical_engine import VerticalEngine
+
+
+def _child_lookup(segment_name, actor, verb, queue):
+    dictionary = SharedDictionary.attach(segment_name)
+    queue.put((dictionary.has_actor(actor), dictionary.actor_allows_verb(actor, verb)))
+
+
+class TestSharedDictionary(unittest.TestCase):
+    """Test lookups through the flat layout"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+        cls.source = cls.engine.dictionary('banking')
+        cls.shared = SharedDictionary(compile_dictionary(cls.source))
+
+    def test_sets_match(self):
+        """Test that every name set round-trips"""
+        for attr in ('actors', 'verbs', 'entities', 'data_objects', 'relationship_types',
+                     'all_permitted_verbs', 'reserved_keywords'):
+            with self.subTest(attr=attr):
+                self.assertEqual(set(getattr(self.shared, attr)), getattr(self.source, attr))
+        self.assertEqual(dict(self.shared.verb_permissions), self.source.verb_permissions)
+
+    def test_permission_bitsets_match(self):
+        """Test that actor permission rows round-trip"""
+        for attr in ('actor_verbs', 'actor_read_perms', 'actor_write_perms'):
+            with self.subTest(attr=attr):
+                expected = {a: members for a, members in getattr(self.source, attr).items() if members}
+                self.assertEqual({a: set(row) for a, row in getattr(self.shared, attr).items()}, expected)
+
+    def test_lookups_match(self):
+        """Test the dictionary API, including misses and suggestions"""
+        actor = next(a for a, verbs in self.source.actor_verbs.items() if verbs)
+        verb = sorted(self.source.actor_verbs[actor])[0]
+        for method, args in (('has_actor', ('Loan Officer',)), ('has_actor', ('Nobody',)),
+                             ('actor_allows_verb', (actor, verb)), ('actor_allows_verb', (actor, 'teleport')),
+                             ('actor_allows_verb', ('Nobody', 'teleport')),
+                             ('verb_permitted_by_any', ('teleport',)), ('get_verb_permission', (verb,)),
+                             ('suggest_actor', ('LoanOfficr',)), ('names', ('dataObject',))):
+            with self.subTest(method=method, args=args):
+                self.assertEqual(getattr(self.shared, method)(*args), getattr(self.source, method)(*args))
+
+    def test_validation_is_identical(self):
+        """Test that an engine with attached segments reports the same issues"""
+        text = (Path(__file__).parents[3] / 'verticals/banking/examples/AFC_Fraud_SAR.ebl').read_text()
+        with SharedMemoryDictionaries.from_engine(self.engine, ['banking']) as store:
+            attached = VerticalEngine()
+            attach_dictionaries(attached, store.segments)
+            self.assertIsInstance(attached.dictionary('banking'), SharedDictionary)
+            self.assertEqual(attached.validate_to_dict('banking', text), self.engine.validate_to_dict('banking', text))
+
+    def test_worker_attaches_read_only(self):
+        """Test attaching by name from another process"""
+        actor = next(a for a, verbs in self.source.actor_verbs.items() if verbs)
+        verb = sorted(self.source.actor_verbs[actor])[0]
+        with SharedMemoryDictionaries.from_engine(self.engine, ['banking']) as store:
+            queue = multiprocessing.Queue()
+            child = multiprocessing.Process(target=_child_lookup,
+                                            args=(store.segments['banking'], actor, verb, queue))
+            child.start()
+            self.assertEqual(queue.get(timeout=10), (True, True))
+            child.join()
+            with self.assertRaises(TypeError):
+                SharedDictionary.attach(store.segments['banking'])._view[0] = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
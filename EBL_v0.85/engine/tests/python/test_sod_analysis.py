@@ -0,0 +1,161 @@
+"""
+EBL Engine - Segregation of Duties Tests
+Tests for conflicting verb pairs evaluated as bit masks per actor and Process
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from ebl_usage import scan_usage
+from rule_packs import Severity
+from sod_analysis import ConflictMatrix, SodAnalysis
+from vertical_engine import VerticalEngine
+from vertical_validator import VerticalDictionary
+
+PAIRS = [['Create', 'Approve'], ['Originate', 'Underwrite']]
+
+PAYMENTS = '''# Domain: Banking
+Metadata:
+  Version: 0.85
+
+DataObject DO_Payment {
+  Schema:
+    Id: UUID
+}
+
+Process Payments {
+  Actors: [Teller, BranchManager]
+
+  Step Enter {
+    Actions:
+      - Teller CreateTransaction DO_Payment
+      - BranchManager Review DO_Payment
+  }
+
+  Step Release {
+    Validation:
+      - Teller Approve DO_Payment
+    Actions:
+      - teller ApproveTransaction DO_Payment
+      - BranchManager Approve DO_Payment
+  }
+}
+
+Process Lending {
+  Actors: [LoanOfficer]
+  Step Book {
+    Actions:
+      - LoanOfficer Originate DO_Loan
+      - LoanOfficer Underwrite DO_Loan
+      - LoanOfficer Approve DO_Loan
+  }
+}
+'''
+
+
+class TestConflictMatrix(unittest.TestCase):
+    """Test verb masks and per-Process conflicts"""
+
+    def setUp(self):
+        self.matrix = ConflictMatrix(PAIRS)
+
+    def test_verb_masks(self):
+        """Test exact and compound verbs, and words that only share a prefix"""
+        create, approve = self.matrix.verb_mask('Create'), self.matrix.verb_mask('Approve')
+        self.assertEqual(self.matrix.verb_mask('CreateTransaction'), create)
+        self.assertEqual(self.matrix.verb_mask('approve'), approve)
+        self.assertEqual(self.matrix.verb_mask('Creator'), 0)
+        self.assertEqual(self.matrix.conflicts(create | approve), [self.matrix.pairs[0]])
+        self.assertEqual(self.matrix.conflicts(create), [])
+        with self.assertRaises(ValueError):
+            ConflictMatrix([['Approve', 'approve']])
+
+    def test_process_conflicts(self):
+        """Test that only Actions count, actors are canonicalized and lines are the first Actions"""
+        usage = scan_usage(PAYMENTS.split('\n'))
+        conflicts = [c for p in usage.processes for c in self.matrix.process_conflicts(p)]
+        self.assertEqual([(c.process, c.actor, c.pair.name, c.first.line, c.second.line) for c in conflicts],
+                         [('Payments', 'Teller', 'Create/Approve', 15, 23),
+                          ('Lending', 'LoanOfficer', 'Originate/Underwrite', 32, 33)])
+
+    def test_issues(self):
+        """Test the SOD-001 issue text, line and severity"""
+        [first, second] = ConflictMatrix(PAIRS, Severity.ERROR).check_text(PAYMENTS)
+        self.assertEqual((first.rule, first.severity, first.line), ('SOD-001', Severity.ERROR, 23))
+        self.assertIn("'Teller' performs both CreateTransaction (line 15) and ApproveTransaction (line 23) "
+                      "in Process Payments", first.message)
+        self.assertEqual(second.location, 'Process Lending')
+
+    def test_chunked_scan_matches_check_text(self):
+        """Test that a scan fed in chunks of any size reports what check_text reports"""
+        expected = self.matrix.check_text(PAYMENTS)
+        for size in (1, 7, 64, len(PAYMENTS)):
+            with self.subTest(size=size):
+                scan = self.matrix.scan()
+                for start in range(0, len(PAYMENTS), size):
+                    scan.feed(PAYMENTS[start:start + size])
+                self.assertEqual(scan.close(), expected)
+
+    def test_grant_conflicts(self):
+        """Test pairs granted to one actor by actorVerbs"""
+        dictionary = VerticalDictionary.from_data({'domain': {
+            'actors': ['Teller', 'LoanOfficer'],
+            'verbs': ['CreateTransaction', 'Approve', 'Originate'],
+            'actorVerbs': {'Teller': ['CreateTransaction', 'Approve'], 'LoanOfficer': ['Originate', 'Approve']},
+        }})
+        granted = self.matrix.grant_conflicts(dictionary)
+        self.assertEqual({actor: [p.name for p in pairs] for actor, pairs in granted.items()},
+                         {'Teller': ['Create/Approve']})
+
+
+class TestCorpusAnalysis(unittest.TestCase):
+    """Test every actor against every Process of a corpus"""
+
+    def test_actor_process_matrix(self):
+        """Test a generated corpus where actor i conflicts in Process j when (i + j) % 7 == 0"""
+        actors, processes = 40, 60
+        matrix = ConflictMatrix(PAIRS)
+        analysis = SodAnalysis(matrix)
+        for j in range(processes):
+            lines = [f"Process P{j} {{", "  Actions:"]
+            for i in range(actors):
+                lines.append(f"    - Actor{i} Create DO_X")
+                lines.append(f"    - Actor{i} {'Approve' if (i + j) % 7 == 0 else 'Review'} DO_X")
+            lines.append("}")
+            analysis.add_usage(f"p{j}.ebl", scan_usage(lines))
+
+        expected = {(i, j) for i in range(actors) for j in range(processes) if (i + j) % 7 == 0}
+        found = {(int(c.actor[5:]), int(c.process[1:])) for c in analysis.conflicts}
+        self.assertEqual(found, expected)
+        self.assertEqual((analysis.files, analysis.processes), (processes, processes))
+        by_actor = analysis.by_actor()
+        self.assertEqual(sum(map(len, by_actor.values())), len(expected))
+        self.assertEqual(len(analysis.by_process()), processes)
+
+
+class TestRulePackIntegration(unittest.TestCase):
+    """Test segregation of duties among the vertical's semantic rules"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def test_semantic_rules_and_scan_agree(self):
+        """Test that check_semantics and the chunked semantic scan both report the pack's SOX-001"""
+        issues = self.engine.check_semantics('banking', PAYMENTS)
+        sod = [(i.line, i.message.split(': ')[1]) for i in issues if i.rule == 'SOX-001']
+        self.assertEqual([line for line, _ in sod], [23, 33, 34])
+        self.assertIn('Originate (line 32) and Approve (line 34)', sod[2][1])
+        scan = self.engine.rule_pack('banking').semantic_scan()
+        for line in PAYMENTS.splitlines(keepends=True):
+            scan.feed(line)
+        self.assertEqual(scan.issues(), issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
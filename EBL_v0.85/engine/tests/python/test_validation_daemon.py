@@ -0,0 +1,120 @@
+"""
+EBL Engine - Validation Daemon Tests
+Tests for file watching, the result cache and the Unix socket protocol
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from daemon_client import DaemonClient
+from file_watcher import InotifyWatcher, PollingWatcher
+from validation_daemon import ValidationDaemon, serve
+
+
+SWIFT_EBL = "# Domain: Banking\nProcess: Send SWIFT MT103\n"
+CLEAN_EBL = "# Domain: Banking\nProcess: Noop\n"
+
+
+def write(path: Path, text: str):
+    path.write_text(text)
+    # Make sure (mtime_ns, size) changes even on coarse timestamp filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestWatchers(unittest.TestCase):
+    """Test change detection"""
+
+    def check_watcher(self, make):
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher = make(tmp)
+            try:
+                target = Path(tmp) / 'a.ebl'
+                write(target, CLEAN_EBL)
+                (Path(tmp) / 'notes.txt').write_text('ignored')
+                self.assertEqual(watcher.changes(timeout=2.0), {str(target)})
+            finally:
+                watcher.close()
+
+    def test_polling_watcher(self):
+        """Test the portable fallback"""
+        self.check_watcher(lambda d: PollingWatcher([d], interval=0.05))
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "inotify is Linux-only")
+    def test_inotify_watcher(self):
+        """Test the inotify watcher"""
+        self.check_watcher(lambda d: InotifyWatcher([d]))
+
+
+class TestValidationDaemon(unittest.TestCase):
+    """Test caching and revalidation without a socket"""
+
+    def test_cache_and_change(self):
+        """Test that unchanged files are served from cache"""
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / 'wire.ebl'
+            write(target, SWIFT_EBL)
+            daemon = ValidationDaemon()
+
+            first = daemon.validate(str(target))
+            self.assertFalse(first['cached'])
+            self.assertEqual(first['vertical'], 'banking')
+            self.assertIn('WIRE-002', [i['rule'] for i in first['semanticIssues']])
+            self.assertTrue(daemon.validate(str(target))['cached'])
+
+            write(target, CLEAN_EBL)
+            daemon.on_changes([str(target)])
+            result = daemon.validate(str(target))
+            self.assertTrue(result['cached'])
+            self.assertNotIn('WIRE-002', [i['rule'] for i in result['semanticIssues']])
+
+
+class TestDaemonSocket(unittest.TestCase):
+    """Test the client/daemon round trip"""
+
+    def test_round_trip(self):
+        """Test validate, status and shutdown over the Unix socket"""
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / 'wire.ebl'
+            write(target, SWIFT_EBL)
+            socket_path = os.path.join(tmp, 'ebl.sock')
+
+            daemon = ValidationDaemon([tmp], polling=True)
+            ready = threading.Event()
+            thread = threading.Thread(target=serve, args=(daemon, socket_path, ready), daemon=True)
+            thread.start()
+            self.assertTrue(ready.wait(5))
+
+            with DaemonClient(socket_path) as client:
+                result = client.validate(str(target))
+                self.assertIn('WIRE-002', [i['rule'] for i in result['semanticIssues']])
+
+                start = time.perf_counter()
+                self.assertTrue(client.validate(str(target))['cached'])
+                self.assertLess(time.perf_counter() - start, 0.5)
+
+                self.assertEqual(client.status()['cachedFiles'], 1)
+                self.assertEqual(stat.S_IMODE(os.stat(socket_path).st_mode), 0o600)
+                with self.assertRaises(OSError):
+                    serve(ValidationDaemon([tmp], polling=True), socket_path)
+                self.assertTrue(client.validate(str(target))['cached'])
+                self.assertIn('error', client.request({'cmd': 'bogus'}))
+                client.shutdown()
+
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+            self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
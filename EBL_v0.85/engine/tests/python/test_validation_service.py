@@ -0,0 +1,157 @@
+"""
+EBL Engine - Validation Service Tests
+Tests for streaming results, deadlines, backpressure and metrics
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from validation_service import (
+    InProcessClient, Job, Lane, LaneScheduler, ValidationService, _init_worker, percentile,
+)
+
+
+SWIFT_EBL = "# Domain: Banking\nProcess: Send SWIFT MT103\n"
+CLEAN_EBL = "# Domain: Banking\nProcess: Noop\n"
+
+
+class TestValidationService(unittest.IsolatedAsyncioTestCase):
+    """Test the service through the in-process client"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2, initializer=_init_worker)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    async def asyncSetUp(self):
+        self.service = ValidationService(workers=2, queue_size=4, executor=self.executor)
+        self.client = InProcessClient(self.service)
+
+    async def asyncTearDown(self):
+        await self.service.stop()
+
+    async def test_streams_one_line_per_file(self):
+        """Test that every file gets a result, sniffing the vertical"""
+        await self.service.start()
+        status, results = await self.client.validate(
+            [{'name': 'swift.ebl', 'text': SWIFT_EBL}, {'name': 'clean.ebl', 'text': CLEAN_EBL}])
+        self.assertEqual(status, 200)
+        by_name = {r['name']: r for r in results}
+        self.assertEqual(set(by_name), {'swift.ebl', 'clean.ebl'})
+        self.assertEqual(by_name['swift.ebl']['vertical'], 'banking')
+        self.assertIn('WIRE-002', [i['rule'] for i in by_name['swift.ebl']['semanticIssues']])
+
+        metrics = await self.client.metrics()
+        self.assertEqual(metrics['completed'], 2)
+        self.assertEqual(metrics['queueDepth'], 0)
+        self.assertEqual(metrics['latencyMs']['samples'], 2)
+        self.assertIsNotNone(metrics['latencyMs']['p99'])
+        self.assertEqual(metrics['lanes']['bulk']['queueWaitMs']['samples'], 2)
+
+    async def test_lane_routing(self):
+        """Test default lane choice and explicit lanes"""
+        await self.service.start(dispatch=False)
+        await self.service.handle('POST', '/validate', {}, json.dumps({'text': CLEAN_EBL}).encode())
+        await self.service.handle('POST', '/validate', {'x-lane': 'bulk'}, json.dumps({'text': CLEAN_EBL}).encode())
+        lanes = (await self.client.metrics())['lanes']
+        self.assertEqual((lanes['interactive']['queueDepth'], lanes['bulk']['queueDepth']), (1, 1))
+        status, body = await self.client.validate([{'text': CLEAN_EBL}], lane='express')
+        self.assertEqual(status, 400)
+
+    async def test_deadline(self):
+        """Test that queued work past its deadline is answered, not run"""
+        await self.service.start(dispatch=False)
+        status, results = await self.client.validate([{'name': 'late.ebl', 'text': CLEAN_EBL}], deadline_ms=0)
+        self.assertEqual(status, 200)
+        self.assertEqual(results[0]['error'], 'Deadline exceeded')
+        self.assertEqual((await self.client.metrics())['deadlineExceeded'], 1)
+
+    async def test_backpressure(self):
+        """Test that a full queue is rejected with 503"""
+        await self.service.start(dispatch=False)
+        files = [{'text': CLEAN_EBL}] * 3
+        # Start a 3-file request without consuming its stream: 1 slot left
+        response = await self.service.handle('POST', '/validate', {}, json.dumps({'files': files}).encode())
+        self.assertEqual(response.status, 200)
+        status, body = await self.client.validate(files[:2])
+        self.assertEqual(status, 503)
+        self.assertIn('queue full', body['error'])
+        self.assertEqual((await self.client.metrics())['rejected'], 2)
+
+    async def test_bad_requests(self):
+        """Test routing and request validation"""
+        await self.service.start(dispatch=False)
+        self.assertEqual((await self.client.request('POST', '/validate', {'files': [{}]}))[0], 400)
+        self.assertEqual((await self.client.request('GET', '/validate'))[0], 405)
+        self.assertEqual((await self.client.request('GET', '/nope'))[0], 404)
+
+
+class TestLaneScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test lane selection, concurrency limits and aging"""
+
+    def make_scheduler(self):
+        return LaneScheduler([
+            Lane('interactive', capacity=4, max_concurrency=2, aging_offset=0.0),
+            Lane('bulk', capacity=8, max_concurrency=1, aging_offset=5.0),
+        ])
+
+    def job(self, name, enqueued):
+        return Job(name, '', None, deadline=1e9, enqueued=enqueued,
+                   future=asyncio.get_running_loop().create_future())
+
+    async def test_interactive_preempts_bulk(self):
+        """Test that a fresh interactive job runs before older bulk jobs"""
+        scheduler = self.make_scheduler()
+        self.assertTrue(scheduler.put('bulk', [self.job(f"b{i}", 100.0) for i in range(3)]))
+        self.assertTrue(scheduler.put('interactive', [self.job('edit', 102.0)]))
+        lane, job = scheduler.pick(now=103.0)
+        self.assertEqual((lane.name, job.name), ('interactive', 'edit'))
+
+    async def test_concurrency_limit(self):
+        """Test that bulk never takes more than its share of workers"""
+        scheduler = self.make_scheduler()
+        scheduler.put('bulk', [self.job(f"b{i}", 100.0) for i in range(3)])
+        lane, _ = scheduler.pick(now=100.0)
+        self.assertIsNone(scheduler.pick(now=100.0))
+        scheduler.done(lane)
+        self.assertEqual(scheduler.pick(now=100.0)[1].name, 'b1')
+
+    async def test_aging(self):
+        """Test that a long-waiting bulk job eventually beats interactive work"""
+        scheduler = self.make_scheduler()
+        scheduler.put('bulk', [self.job('old', 100.0)])
+        scheduler.put('interactive', [self.job('edit', 106.0)])
+        lane, job = scheduler.pick(now=106.5)
+        self.assertEqual((lane.name, job.name), ('bulk', 'old'))
+        self.assertEqual(lane.metrics()['queueWaitMs']['p50'], 6500.0)
+
+    async def test_capacity(self):
+        """Test all-or-nothing admission per lane"""
+        scheduler = self.make_scheduler()
+        self.assertFalse(scheduler.put('interactive', [self.job(str(i), 0.0) for i in range(5)]))
+        self.assertEqual(scheduler.depth, 0)
+
+
+class TestPercentile(unittest.TestCase):
+    """Test latency percentiles"""
+
+    def test_percentile(self):
+        samples = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(samples, 0.5), 51.0)
+        self.assertEqual(percentile(samples, 0.99), 100.0)
+        self.assertIsNone(percentile([], 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+"""
+EBL Engine - Vertical Engine Tests
+Tests for rule packs and the shared vertical engine
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from batch_runner import validate_path
+from rule_packs import SemanticRule, Severity
+from vertical_engine import ParserNotGeneratedError, VerticalEngine
+from vertical_validator import VerticalDictionary
+
+
+VERTICALS = [
+    'adtech', 'banking', 'healthcare', 'insurance',
+    'it_infrastructure', 'kyc_compliance', 'logistics', 'retail',
+]
+
+
+class TestRulePacks(unittest.TestCase):
+    """Test rule pack loading and rule evaluation"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def test_every_vertical_has_a_pack(self):
+        """Test that all eight verticals are configured"""
+        self.assertEqual(self.engine.verticals(), VERTICALS)
+
+    def test_pack_dictionaries_load(self):
+        """Test that every pack points at a loadable dictionary"""
+        for vertical in VERTICALS:
+            with self.subTest(vertical=vertical):
+                dictionary = self.engine.dictionary(vertical)
+                self.assertIsInstance(dictionary, VerticalDictionary)
+                self.assertTrue(dictionary.actors)
+                self.assertIs(self.engine.dictionary(vertical), dictionary)
+
+    def test_requires_and_unless(self):
+        """Test rule conditions"""
+        rule = SemanticRule.from_data({
+            "rule": "PCI-DSS-002", "severity": "error", "message": "No CVV storage",
+            "when": "CVV", "requires": "(?i:store)", "unless": "Tokenize"
+        })
+        self.assertEqual(len(rule.evaluate("Capture CVV and Store it")), 1)
+        self.assertEqual(rule.evaluate("Capture CVV"), [])
+        self.assertEqual(rule.evaluate("Capture CVV, Store it, Tokenize"), [])
+
+    def test_requires_list(self):
+        """Test that every pattern of a requires list must match"""
+        rule = SemanticRule.from_data({
+            "rule": "WIRE-001", "severity": "warning", "message": "Dual authorization",
+            "when": "SWIFT", "requires": ["Approve", "Actors\\s*:\\s*\\[[^,\\]\\n]*\\]"]
+        })
+        self.assertEqual(len(rule.evaluate("SWIFT\nActors: [Teller]\n- Approve")), 1)
+        self.assertEqual(rule.evaluate("SWIFT\nActors: [Teller]"), [])
+        self.assertEqual(rule.evaluate("SWIFT\nActors: [Teller, Manager]\n- Approve"), [])
+
+    def test_for_each(self):
+        """Test one issue per distinct match, in the order of the `when` alternatives"""
+        rule = SemanticRule.from_data({
+            "rule": "DATA-001", "severity": "warning", "message": "Field '{match}'",
+            "when": "SSN|IBAN|(?i:card_number)", "forEach": True
+        })
+        issues = rule.evaluate("Card_Number IBAN SSN IBAN")
+        self.assertEqual([i.message for i in issues], ["Field 'SSN'", "Field 'IBAN'", "Field 'Card_Number'"])
+        self.assertEqual([i.line for i in rule.evaluate("IBAN\nSSN")], [2, 1])
+        self.assertEqual(issues[0].severity, Severity.WARNING)
+
+    def test_vertical_rules_fire(self):
+        """Test a domain rule from a non-banking pack"""
+        issues = self.engine.check_semantics('kyc_compliance', "Process: Onboard customer with OpenAccount")
+        self.assertIn('KYC-001', [i.rule for i in issues])
+        self.assertIn('AML-001', [i.rule for i in issues])
+
+
+class TestStreamingValidation(unittest.TestCase):
+    """Test block-at-a-time validation"""
+
+    BLOCK = ('DataObject DO_CreditReport {{\n  Schema:\n    Score: Integer\n  Policies:\n    - Retain 7 years\n'
+             '  Resources:\n'
+             '    Input: {{ Channel: API, Protocol: REST, Endpoint: "/reports", Auth: OAuth2, Format: ISO, SLA: "1s" }}\n'
+             '    Output: {{ Channel: API, Protocol: REST, Endpoint: "/reports/{n}", Auth: OAuth2, Format: ISO, SLA: "1s" }}\n'
+             '  erMap: CreditReport{n}\n}}\n\n')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = VerticalEngine()
+
+    def test_matches_whole_file_semantics(self):
+        """Test that chunked semantic rules match check_semantics, lines included"""
+        examples = Path(__file__).parents[3] / 'verticals' / 'banking' / 'examples'
+        for path in sorted(examples.glob('*.ebl')):
+            with self.subTest(file=path.name):
+                streamed = self.engine.validate_stream('banking', path)
+                expected = self.engine.check_semantics('banking', path.read_text())
+                self.assertEqual(streamed.semantic_issues, expected)
+
+    def test_syntax_errors_reported(self):
+        """Test that validate_file reports syntax errors as errors, without console output"""
+        with tempfile.NamedTemporaryFile('w', suffix='.ebl', delete=False) as f:
+            f.write('# Domain: Banking\nMetadata:\n  Version: 0.85\n\nEntity Loan {\n  dataRef: DO_Loan\n}\n')
+        stderr = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(stderr):
+                report = self.engine.validate_file(None, f.name)
+        finally:
+            Path(f.name).unlink()
+        self.assertEqual(stderr.getvalue(), '')
+        self.assertFalse(report.is_valid)
+        self.assertIn(('SYNTAX', 7), [(e.rule, e.line) for e in report.errors])
+
+    def test_file_and_text_reports_match(self):
+        """Test that validate_file, validate and the batch runner give equal reports on the examples"""
+        examples = Path(__file__).parents[3] / 'verticals' / 'banking' / 'examples'
+        for path in sorted(examples.glob('*.ebl')):
+            with self.subTest(file=path.name):
+                from_file = self.engine.validate_file('banking', str(path)).to_dict()
+                self.assertTrue(from_file['valid'])
+                self.assertEqual(self.engine.validate('banking', path.read_text()).to_dict(), from_file)
+                self.assertEqual(validate_path(str(path), 'banking'), from_file)
+
+    def test_mapped_file_matches_text(self):
+        """Test that a CRLF, non-ASCII file without a final line break validates like its text"""
+        example = Path(__file__).parents[3] / 'verticals' / 'banking' / 'examples' / 'MortgageLoanApplication.ebl'
+        text = example.read_text().replace('Mortgage', 'Hypothèk').rstrip('\n')
+        with tempfile.NamedTemporaryFile('wb', suffix='.ebl', delete=False) as f:
+            f.write(text.replace('\n', '\r\n').encode('utf-8'))
+        try:
+            from_file = self.engine.validate_file('banking', f.name).to_dict()
+            self.assertEqual(validate_path(f.name, 'banking'), from_file)
+        finally:
+            Path(f.name).unlink()
+        self.assertEqual(self.engine.validate('banking', text).to_dict(), from_file)
+
+    def test_requires_across_blocks(self):
+        """Test that requires/unless see the whole file, not one block"""
+        text = ("Process A {\n  Description: \"Cross-Border\"\n}\n"
+                "Process B {\n  Description: \"Transfer funds\"\n}\n")
+        streamed = self.engine.validate_stream('banking', io.StringIO(text)).semantic_issues
+        self.assertEqual(streamed, self.engine.check_semantics('banking', text))
+        self.assertTrue(streamed)
+
+        text = "Process A {\n  Actors: [Teller]\n}\nProcess B {\n  Description: \"Approve a SWIFT payment\"\n}\n"
+        streamed = self.engine.validate_stream('banking', io.StringIO(text)).semantic_issues
+        self.assertEqual(streamed, self.engine.check_semantics('banking', text))
+        self.assertIn('WIRE-001', [i.rule for i in streamed])
+
+    def test_peak_memory_is_flat(self):
+        """Test that peak memory does not grow with the number of blocks"""
+        def peak(blocks: int) -> int:
+            with tempfile.NamedTemporaryFile('w', suffix='.ebl', delete=False) as f:
+                f.write('# Domain: Banking\n' + ''.join(self.BLOCK.format(n=i) for i in range(blocks)))
+            try:
+                tracemalloc.start()
+                self.engine.validate_stream('banking', f.name)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+                Path(f.name).unlink()
+
+        report = self.engine.validate_stream('banking', io.StringIO(self.BLOCK.format(n=0)))
+        self.assertEqual((report.errors, report.warnings, report.semantic_issues), ([], [], []))
+        peak(1)  # Warm the grammar and dictionary
+        self.assertLess(peak(400), peak(50) * 1.5)
+
+
+class TestVerticalEngine(unittest.TestCase):
+    """Test grammar loading and dictionary validation through the engine"""
+
+    def test_banking_grammar_loads(self):
+        """Test that the generated banking parser is found and cached"""
+        engine = VerticalEngine()
+        grammar = engine.grammar('banking')
+        self.assertEqual(grammar.parser_class.__name__, 'Banking_v0_85Parser')
+        self.assertIs(engine.grammar('banking'), grammar)
+
+    def test_banking_validation(self):
+        """Test a full validation run through the engine"""
+        engine = VerticalEngine()
+        text = ('Process WireTransfer {\n'
+                '  Description: "Approve and send a wire"\n'
+                '  ObjectiveID: OBJ_Wires\n'
+                '  BusinessGoalID: BG_Wires\n'
+                '  Actors: [Teller]\n'
+                '  erMap: WireTransfer\n'
+                '  Starts With: Event WireRequested(DO_TransactionData)\n'
+                '  Step Send {\n'
+                '    Actions:\n'
+                '      - Teller PostTransaction DO_TransactionData\n'
+                '      - Teller Reconcile DO_TransactionData\n'
+                '  }\n'
+                '  Ends With: Event WireSent(DO_TransactionData)\n'
+                '}\n')
+        report = engine.validate('banking', text)
+        self.assertEqual(report.vertical, 'banking')
+        self.assertEqual(report.errors, [])
+        self.assertIn(('DICT-VERB-003', 11), [(w.rule, w.line) for w in report.warnings])
+        rules = {i.rule: i.line for i in report.semantic_issues}
+        self.assertEqual((rules['WIRE-001'], rules['SOX-001']), (1, 11))
+
+    def test_missing_parser(self):
+        """Test the error raised for verticals without generated parsers"""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = VerticalEngine(verticals_root=tmp)
+            with self.assertRaises(ParserNotGeneratedError):
+                engine.grammar('healthcare')
+
+    def test_unknown_vertical(self):
+        """Test that unknown verticals are rejected"""
+        with self.assertRaises(ValueError):
+            VerticalEngine().rule_pack('astrology')
+
+
+if __name__ == '__main__':
+    unittest.main()
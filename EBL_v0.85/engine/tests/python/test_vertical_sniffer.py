@@ -0,0 +1,85 @@
+"""
+EBL Engine - Vertical Sniffer Tests
+Tests for header and keyword based vertical detection
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parent.parent.parent / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import VerticalEngine
+from vertical_sniffer import SNIFF_BYTES
+
+
+VERTICALS_ROOT = Path(__file__).parents[3] / 'verticals'
+
+
+class TestVerticalSniffer(unittest.TestCase):
+    """Test each sniffing signal"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sniffer = VerticalEngine().sniffer
+
+    def test_requirement_id_prefix(self):
+        """Test that RequirementID prefixes win over everything else"""
+        text = "# Domain: Retail\nMetadata:\n  RequirementID: REQ-BAIN-MLO-001\n"
+        result = self.sniffer.sniff_text(text)
+        self.assertEqual((result.vertical, result.source), ('banking', 'requirementId'))
+
+    def test_domain_header(self):
+        """Test the '# Domain:' header, earliest domain name first"""
+        result = self.sniffer.sniff_text("# Domain: Banking (BAIN) - Payments & Compliance\n")
+        self.assertEqual((result.vertical, result.source), ('banking', 'header'))
+        self.assertEqual(self.sniffer.sniff_text("# Domain: Pharmaceutical\n").vertical, 'healthcare')
+
+    def test_metadata_domain(self):
+        """Test a Domain entry inside Metadata"""
+        result = self.sniffer.sniff_text("Metadata:\n  Domain: kyc\n  Owner: Compliance\n")
+        self.assertEqual((result.vertical, result.source), ('kyc_compliance', 'metadata'))
+
+    def test_keyword_fallback(self):
+        """Test keyword and framework scoring without any header"""
+        text = (
+            "Metadata:\n  EBLClass: Exchange\n  ComplianceFrameworks: [GDPR, IAB_TCF]\n"
+            "DataObject DO_BidRequest {\n}\nDataObject DO_Impression {\n}\n"
+        )
+        result = self.sniffer.sniff_text(text)
+        self.assertEqual((result.vertical, result.source), ('adtech', 'keywords'))
+        self.assertEqual(self.sniffer.sniff_text("Process: Send SWIFT MT103 with IBAN\n").vertical, 'banking')
+
+    def test_unclassified(self):
+        """Test that text without signals is not guessed"""
+        self.assertIsNone(self.sniffer.sniff_text("Process: Something\n").vertical)
+
+    def test_only_head_is_read(self):
+        """Test that signals past SNIFF_BYTES are ignored"""
+        text = " " * SNIFF_BYTES + "# Domain: Banking\n"
+        self.assertIsNone(self.sniffer.sniff_text(text).vertical)
+
+    def test_examples(self):
+        """Test that examples with a RequirementID are routed to their own vertical"""
+        for path in sorted(VERTICALS_ROOT.glob('*/examples/*.ebl')):
+            result = self.sniffer.sniff_file(str(path))
+            if result.source == 'requirementId':
+                with self.subTest(file=path.name):
+                    self.assertEqual(result.vertical, path.parent.parent.name)
+
+    def test_route(self):
+        """Test grouping a mixed batch by vertical"""
+        paths = [
+            str(VERTICALS_ROOT / 'banking' / 'examples' / 'AFC_Fraud_SAR.ebl'),
+            str(VERTICALS_ROOT / 'healthcare' / 'examples' / 'Healthcare_PatientIntake.ebl'),
+            str(VERTICALS_ROOT / 'banking' / 'examples' / 'Payments_Screening.ebl'),
+        ]
+        groups = self.sniffer.route(paths)
+        self.assertEqual(groups['banking'], [paths[0], paths[2]])
+        self.assertEqual(groups['healthcare'], [paths[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,23 @@
 """
 AdTech Vertical - Semantic Validator
 Validates AdTech business logic and compliance
+
+Domain-specific rules: GDPR Consent, Privacy Compliance, Viewability Standards, Fraud Detection
+Rules are data-driven: see engine/rule_packs/adtech.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for adtech domain
-# Domain-specific rules: GDPR Consent, Privacy Compliance, Viewability Standards, Fraud Detection
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("AdTech Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('adtech', sys.argv))
@@ -1,4 +1,4 @@
-# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.1
+# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.2
 from antlr4 import *
 from io import StringIO
 import sys
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,142,1834,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,
+        4,0,147,1889,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,
         5,2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,
         2,13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,
         7,19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,
@@ -33,167 +33,173 @@ def serializedATN():
         7,125,2,126,7,126,2,127,7,127,2,128,7,128,2,129,7,129,2,130,7,130,
         2,131,7,131,2,132,7,132,2,133,7,133,2,134,7,134,2,135,7,135,2,136,
         7,136,2,137,7,137,2,138,7,138,2,139,7,139,2,140,7,140,2,141,7,141,
-        1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,2,1,2,1,2,1,2,1,2,
-        1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,
-        1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
-        1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,
-        11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,
-        13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,
-        14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,
-        16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,
-        18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,
-        20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,
-        21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,
-        24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,
-        25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,
-        27,1,27,1,27,1,27,1,27,1,28,1,28,1,29,1,29,1,30,1,30,1,30,1,30,1,
-        30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,
-        32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,
-        33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,
-        35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,
-        36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,38,1,
-        38,1,39,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,
-        40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,
-        42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,
-        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,
-        45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,1,46,1,46,1,
-        46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,
-        47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,
-        48,1,48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,1,
-        50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,
-        52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,1,53,1,
-        53,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,
-        54,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,
-        55,1,55,1,56,1,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,58,1,
-        58,1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,61,1,61,1,61,1,61,1,
-        61,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,63,1,63,1,63,1,63,1,
-        63,1,63,1,63,1,63,1,63,1,63,1,63,1,64,1,64,1,64,1,64,1,64,1,64,1,
-        64,1,65,1,65,1,65,1,65,1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,
-        66,1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,
-        67,1,67,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,
-        69,1,69,1,69,1,69,1,69,1,69,1,69,1,69,1,69,1,69,1,70,1,70,1,70,1,
-        70,1,70,1,70,1,70,1,70,1,70,1,70,1,70,1,71,1,71,1,71,1,71,1,71,1,
-        72,1,72,1,72,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,
-        73,1,73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,
-        75,1,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,77,1,77,1,77,1,77,1,
-        77,1,78,1,78,1,78,1,78,1,78,1,79,1,79,1,79,1,79,1,79,1,79,1,79,1,
-        79,1,80,1,80,1,80,1,80,1,80,1,80,1,81,1,81,1,81,1,81,1,82,1,82,1,
-        82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,83,1,83,1,83,1,83,1,
-        84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,
-        84,1,85,1,85,1,85,1,85,1,86,1,86,1,87,1,87,1,87,1,87,1,88,1,88,1,
-        88,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,
-        89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,
-        90,1,90,1,90,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,
-        91,1,91,1,91,1,91,3,91,964,8,91,1,92,1,92,1,92,1,92,1,92,1,93,1,
-        93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,
-        93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,
-        93,1,93,1,93,3,93,1001,8,93,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,
-        94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,
-        94,1,94,1,94,1,94,1,94,1,94,1,94,3,94,1030,8,94,1,95,1,95,1,95,1,
-        95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,
-        95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,
-        95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,3,95,1073,
-        8,95,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,97,1,97,1,97,1,97,
-        1,97,1,97,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,99,1,99,1,99,
-        1,99,1,99,1,99,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,
+        2,142,7,142,2,143,7,143,2,144,7,144,2,145,7,145,2,146,7,146,2,147,
+        7,147,2,148,7,148,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,2,1,2,1,
+        2,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,
+        6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,
+        8,1,8,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,12,1,12,1,
+        12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,
+        14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,
+        16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,
+        17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,20,1,20,1,20,1,
+        20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,
+        22,1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,
+        23,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,26,1,
+        26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,
+        27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,
+        29,1,29,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,
+        32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,
+        34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,
+        35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,37,1,
+        37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,
+        39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,
+        42,1,42,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,
+        45,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,
+        48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,49,1,49,1,
+        49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,1,50,1,50,1,50,1,50,1,
+        50,1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,
+        51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,
+        52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,1,53,1,53,1,
+        53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,
+        54,1,54,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,1,
+        56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,58,1,
+        58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,59,1,59,1,59,1,59,1,
+        59,1,59,1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,
+        60,1,60,1,60,1,60,1,60,1,61,1,61,1,62,1,62,1,62,1,62,1,62,1,62,1,
+        62,1,62,1,63,1,63,1,64,1,64,1,65,1,65,1,65,1,65,1,65,1,65,1,66,1,
+        66,1,66,1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,68,1,
+        68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,69,1,
+        69,1,69,1,69,1,69,1,70,1,70,1,70,1,70,1,70,1,70,1,71,1,71,1,71,1,
+        71,1,71,1,71,1,71,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,
+        72,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,
+        73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,
+        75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,76,1,76,1,
+        76,1,76,1,77,1,77,1,77,1,77,1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,
+        79,1,79,1,79,1,79,1,79,1,79,1,79,1,79,1,79,1,79,1,80,1,80,1,80,1,
+        80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,81,1,81,1,
+        81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,83,1,83,1,83,1,
+        83,1,83,1,83,1,83,1,83,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,
+        84,1,85,1,85,1,85,1,85,1,85,1,85,1,86,1,86,1,86,1,86,1,86,1,87,1,
+        87,1,87,1,87,1,87,1,88,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,
+        89,1,89,1,89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,1,91,1,91,1,91,1,
+        91,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,93,1,
+        93,1,93,1,93,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,
+        94,1,94,1,94,1,94,1,95,1,95,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,
+        96,1,96,1,96,1,96,1,96,1,96,1,96,3,96,1017,8,96,1,97,1,97,1,97,1,
+        97,1,97,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,
+        98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,
+        98,1,98,1,98,1,98,1,98,1,98,3,98,1054,8,98,1,99,1,99,1,99,1,99,1,
+        99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,
+        99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,3,99,1083,8,99,1,
         100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,
-        1,100,3,100,1123,8,100,1,101,1,101,1,101,1,101,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,3,101,1163,
-        8,101,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,
-        1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,
-        3,102,1186,8,102,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,
-        1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,
-        1,103,1,103,1,103,1,103,1,103,3,103,1212,8,103,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,3,104,1244,8,104,1,105,1,105,1,105,
+        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,
+        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,
+        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,3,100,1126,8,100,
+        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,102,1,102,1,102,
+        1,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,
+        1,104,1,104,1,104,1,104,1,104,1,104,1,105,1,105,1,105,1,105,1,105,
         1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,
-        1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,
-        1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,
-        1,105,3,105,1283,8,105,1,106,1,106,1,106,1,106,1,106,1,106,1,106,
-        1,106,1,106,1,106,1,106,3,106,1296,8,106,1,107,1,107,1,107,1,107,
-        1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,3,107,
-        1312,8,107,1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,
-        1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,3,108,1331,8,108,
+        1,105,1,105,1,105,1,105,3,105,1176,8,105,1,106,1,106,1,106,1,106,
+        1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,
+        1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,
+        1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,
+        1,106,3,106,1216,8,106,1,107,1,107,1,107,1,107,1,107,1,107,1,107,
+        1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,
+        1,107,1,107,1,107,3,107,1239,8,107,1,108,1,108,1,108,1,108,1,108,
+        1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,
+        1,108,1,108,1,108,1,108,1,108,1,108,1,108,1,108,3,108,1265,8,108,
         1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,
         1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,
-        1,109,1,109,1,109,3,109,1358,8,109,1,110,1,110,1,110,1,110,1,110,
-        1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,3,110,1374,
-        8,110,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,111,1,111,3,111,1426,8,111,1,112,
-        1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
+        1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,3,109,1297,8,109,
+        1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,
+        1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,
+        1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,
+        1,110,1,110,1,110,1,110,3,110,1336,8,110,1,111,1,111,1,111,1,111,
+        1,111,1,111,1,111,1,111,1,111,1,111,1,111,3,111,1349,8,111,1,112,
         1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
-        1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
-        3,112,1462,8,112,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,112,1,112,3,112,1365,8,112,1,113,1,113,1,113,1,113,1,113,1,113,
         1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
-        1,113,1,113,1,113,1,113,1,113,1,113,3,113,1489,8,113,1,114,1,114,
-        1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
+        3,113,1384,8,113,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
         1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
-        1,114,1,114,3,114,1517,8,114,1,115,1,115,1,115,1,115,1,115,1,115,
+        1,114,1,114,1,114,1,114,1,114,1,114,3,114,1411,8,114,1,115,1,115,
         1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,
-        3,115,1536,8,115,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
-        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,3,116,1554,8,116,
+        1,115,3,115,1427,8,115,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,3,116,
+        1479,8,116,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,
         1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,
-        1,117,1,117,1,117,1,117,1,117,3,117,1572,8,117,1,118,1,118,1,118,
+        1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,
+        1,117,1,117,1,117,3,117,1515,8,117,1,118,1,118,1,118,1,118,1,118,
         1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,
-        1,118,3,118,1589,8,118,1,119,1,119,1,119,1,119,1,119,1,119,1,119,
-        1,119,1,119,1,119,1,119,1,120,1,120,1,120,1,120,1,120,1,120,1,120,
-        1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,3,120,
-        1619,8,120,1,121,1,121,1,121,1,121,1,121,1,121,1,122,1,122,1,122,
-        1,122,1,122,1,123,1,123,1,123,1,123,1,124,1,124,1,124,1,124,1,125,
-        1,125,1,125,1,125,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,
-        1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,3,126,1661,
-        8,126,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,
-        1,127,1,127,1,127,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,
-        1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,
-        4,128,1695,8,128,11,128,12,128,1696,3,128,1699,8,128,1,129,1,129,
-        1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,3,129,
-        1713,8,129,1,130,1,130,5,130,1717,8,130,10,130,12,130,1720,9,130,
-        1,130,1,130,1,131,4,131,1725,8,131,11,131,12,131,1726,1,132,1,132,
-        1,132,1,132,5,132,1733,8,132,10,132,12,132,1736,9,132,1,132,1,132,
+        1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,3,118,1542,
+        8,118,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,
+        1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,
+        1,119,1,119,1,119,1,119,1,119,3,119,1570,8,119,1,120,1,120,1,120,
+        1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,
+        1,120,1,120,1,120,3,120,1589,8,120,1,121,1,121,1,121,1,121,1,121,
+        1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,121,
+        3,121,1607,8,121,1,122,1,122,1,122,1,122,1,122,1,122,1,122,1,122,
+        1,122,1,122,1,122,1,122,1,122,1,122,1,122,1,122,3,122,1625,8,122,
+        1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,
+        1,123,1,123,1,123,1,123,3,123,1642,8,123,1,124,1,124,1,124,1,124,
+        1,124,1,124,1,124,1,124,1,124,1,124,1,124,1,125,1,125,1,125,1,125,
+        1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,
+        1,125,1,125,3,125,1672,8,125,1,126,1,126,1,126,1,126,1,126,1,126,
+        1,127,1,127,1,127,1,127,1,127,1,128,1,128,1,128,1,128,1,129,1,129,
+        1,129,1,129,1,130,1,130,1,130,1,130,1,131,1,131,1,131,1,131,1,131,
+        1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,
+        1,131,3,131,1714,8,131,1,132,1,132,1,132,1,132,1,132,1,132,1,132,
+        1,132,1,132,1,132,1,132,1,132,1,132,1,133,1,133,1,133,1,133,1,133,
         1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,
-        1,133,1,133,1,133,1,133,1,134,1,134,1,134,1,134,1,134,1,134,1,134,
-        1,134,1,134,1,135,4,135,1765,8,135,11,135,12,135,1766,1,135,1,135,
-        4,135,1771,8,135,11,135,12,135,1772,3,135,1775,8,135,1,136,1,136,
-        1,136,1,136,1,136,1,136,1,136,1,136,1,136,3,136,1786,8,136,1,137,
-        1,137,5,137,1790,8,137,10,137,12,137,1793,9,137,1,138,3,138,1796,
-        8,138,1,138,4,138,1799,8,138,11,138,12,138,1800,1,139,4,139,1804,
-        8,139,11,139,12,139,1805,1,139,1,139,1,140,1,140,1,140,1,140,5,140,
-        1814,8,140,10,140,12,140,1817,9,140,1,140,1,140,1,141,1,141,1,141,
-        1,141,5,141,1825,8,141,10,141,12,141,1828,9,141,1,141,1,141,1,141,
-        1,141,1,141,1,1826,0,142,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,
-        19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,
-        41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,
-        63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,42,
-        85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,51,103,52,105,
-        53,107,54,109,55,111,56,113,57,115,58,117,59,119,60,121,61,123,62,
-        125,63,127,64,129,65,131,66,133,67,135,68,137,69,139,70,141,71,143,
-        72,145,73,147,74,149,75,151,76,153,77,155,78,157,79,159,80,161,81,
-        163,82,165,83,167,84,169,85,171,86,173,87,175,88,177,89,179,90,181,
-        91,183,92,185,93,187,94,189,95,191,96,193,97,195,98,197,99,199,100,
-        201,101,203,102,205,103,207,104,209,105,211,106,213,107,215,108,
-        217,109,219,110,221,111,223,112,225,113,227,114,229,115,231,116,
-        233,117,235,118,237,119,239,120,241,121,243,122,245,123,247,124,
-        249,125,251,126,253,127,255,128,257,129,259,130,261,131,263,132,
-        265,133,267,134,269,135,271,136,273,137,275,138,277,139,279,140,
-        281,141,283,142,1,0,7,1,0,48,57,3,0,10,10,13,13,34,34,2,0,10,10,
-        13,13,3,0,48,57,65,70,97,102,3,0,65,90,95,95,97,122,4,0,48,57,65,
-        90,95,95,97,122,2,0,9,9,32,32,1891,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,
-        0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,
-        0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,
-        0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,
-        0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,
-        0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,
-        0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,
-        0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,
-        0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,
-        0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,
-        0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,
+        1,133,1,133,1,133,4,133,1748,8,133,11,133,12,133,1749,3,133,1752,
+        8,133,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,
+        1,134,1,134,3,134,1766,8,134,1,135,1,135,5,135,1770,8,135,10,135,
+        12,135,1773,9,135,1,135,1,135,1,136,1,136,1,136,1,136,1,136,1,136,
+        1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,137,1,137,1,137,1,137,
+        1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,138,4,138,1802,8,138,
+        11,138,12,138,1803,1,138,1,138,4,138,1808,8,138,11,138,12,138,1809,
+        3,138,1812,8,138,1,139,1,139,1,139,1,139,1,139,1,139,1,139,1,139,
+        1,139,3,139,1823,8,139,1,140,1,140,5,140,1827,8,140,10,140,12,140,
+        1830,9,140,1,141,3,141,1833,8,141,1,141,4,141,1836,8,141,11,141,
+        12,141,1837,1,142,4,142,1841,8,142,11,142,12,142,1842,1,142,1,142,
+        1,143,1,143,1,143,1,143,5,143,1851,8,143,10,143,12,143,1854,9,143,
+        1,143,1,143,1,144,1,144,1,144,1,144,5,144,1862,8,144,10,144,12,144,
+        1865,9,144,1,144,1,144,1,144,1,144,1,144,1,145,1,145,5,145,1874,
+        8,145,10,145,12,145,1877,9,145,1,145,1,145,1,146,1,146,1,147,1,147,
+        1,147,1,147,1,147,1,148,1,148,1,1863,0,149,1,1,3,2,5,3,7,4,9,5,11,
+        6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,
+        35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,
+        57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,
+        79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,
+        101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,58,117,59,119,
+        60,121,61,123,62,125,63,127,64,129,65,131,66,133,67,135,68,137,69,
+        139,70,141,71,143,72,145,73,147,74,149,75,151,76,153,77,155,78,157,
+        79,159,80,161,81,163,82,165,83,167,84,169,85,171,86,173,87,175,88,
+        177,89,179,90,181,91,183,92,185,93,187,94,189,95,191,96,193,97,195,
+        98,197,99,199,100,201,101,203,102,205,103,207,104,209,105,211,106,
+        213,107,215,108,217,109,219,110,221,111,223,112,225,113,227,114,
+        229,115,231,116,233,117,235,118,237,119,239,120,241,121,243,122,
+        245,123,247,124,249,125,251,126,253,127,255,128,257,129,259,130,
+        261,131,263,132,265,133,267,134,269,135,271,136,273,137,275,138,
+        277,139,279,140,281,141,283,142,285,143,287,144,289,145,291,146,
+        293,147,295,0,297,0,1,0,7,1,0,48,57,3,0,10,10,13,13,34,34,3,0,65,
+        90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,2,0,9,9,32,32,2,0,10,
+        10,13,13,3,0,48,57,65,70,97,102,1943,0,1,1,0,0,0,0,3,1,0,0,0,0,5,
+        1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,
+        0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,
+        0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,
+        0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,
+        0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,
+        0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,
+        0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,
+        0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,
+        0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,
+        0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,
         1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,
         0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,0,123,1,
         0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,0,
@@ -213,494 +219,509 @@ def serializedATN():
         0,253,1,0,0,0,0,255,1,0,0,0,0,257,1,0,0,0,0,259,1,0,0,0,0,261,1,
         0,0,0,0,263,1,0,0,0,0,265,1,0,0,0,0,267,1,0,0,0,0,269,1,0,0,0,0,
         271,1,0,0,0,0,273,1,0,0,0,0,275,1,0,0,0,0,277,1,0,0,0,0,279,1,0,
-        0,0,0,281,1,0,0,0,0,283,1,0,0,0,1,285,1,0,0,0,3,294,1,0,0,0,5,296,
-        1,0,0,0,7,307,1,0,0,0,9,309,1,0,0,0,11,316,1,0,0,0,13,325,1,0,0,
-        0,15,335,1,0,0,0,17,341,1,0,0,0,19,343,1,0,0,0,21,345,1,0,0,0,23,
-        347,1,0,0,0,25,353,1,0,0,0,27,360,1,0,0,0,29,368,1,0,0,0,31,377,
-        1,0,0,0,33,386,1,0,0,0,35,391,1,0,0,0,37,398,1,0,0,0,39,402,1,0,
-        0,0,41,409,1,0,0,0,43,417,1,0,0,0,45,428,1,0,0,0,47,434,1,0,0,0,
-        49,439,1,0,0,0,51,448,1,0,0,0,53,455,1,0,0,0,55,463,1,0,0,0,57,470,
-        1,0,0,0,59,472,1,0,0,0,61,474,1,0,0,0,63,482,1,0,0,0,65,487,1,0,
-        0,0,67,499,1,0,0,0,69,506,1,0,0,0,71,515,1,0,0,0,73,526,1,0,0,0,
-        75,540,1,0,0,0,77,542,1,0,0,0,79,544,1,0,0,0,81,549,1,0,0,0,83,562,
-        1,0,0,0,85,567,1,0,0,0,87,570,1,0,0,0,89,578,1,0,0,0,91,590,1,0,
-        0,0,93,602,1,0,0,0,95,617,1,0,0,0,97,624,1,0,0,0,99,636,1,0,0,0,
-        101,646,1,0,0,0,103,651,1,0,0,0,105,658,1,0,0,0,107,669,1,0,0,0,
-        109,679,1,0,0,0,111,687,1,0,0,0,113,701,1,0,0,0,115,703,1,0,0,0,
-        117,711,1,0,0,0,119,713,1,0,0,0,121,715,1,0,0,0,123,721,1,0,0,0,
-        125,726,1,0,0,0,127,734,1,0,0,0,129,745,1,0,0,0,131,752,1,0,0,0,
-        133,758,1,0,0,0,135,767,1,0,0,0,137,779,1,0,0,0,139,788,1,0,0,0,
-        141,800,1,0,0,0,143,811,1,0,0,0,145,816,1,0,0,0,147,823,1,0,0,0,
-        149,831,1,0,0,0,151,840,1,0,0,0,153,846,1,0,0,0,155,851,1,0,0,0,
-        157,856,1,0,0,0,159,861,1,0,0,0,161,869,1,0,0,0,163,875,1,0,0,0,
-        165,879,1,0,0,0,167,890,1,0,0,0,169,894,1,0,0,0,171,908,1,0,0,0,
-        173,912,1,0,0,0,175,914,1,0,0,0,177,918,1,0,0,0,179,925,1,0,0,0,
-        181,935,1,0,0,0,183,963,1,0,0,0,185,965,1,0,0,0,187,1000,1,0,0,0,
-        189,1029,1,0,0,0,191,1072,1,0,0,0,193,1074,1,0,0,0,195,1082,1,0,
-        0,0,197,1088,1,0,0,0,199,1096,1,0,0,0,201,1122,1,0,0,0,203,1162,
-        1,0,0,0,205,1185,1,0,0,0,207,1211,1,0,0,0,209,1243,1,0,0,0,211,1282,
-        1,0,0,0,213,1295,1,0,0,0,215,1311,1,0,0,0,217,1330,1,0,0,0,219,1357,
-        1,0,0,0,221,1373,1,0,0,0,223,1425,1,0,0,0,225,1461,1,0,0,0,227,1488,
-        1,0,0,0,229,1516,1,0,0,0,231,1535,1,0,0,0,233,1553,1,0,0,0,235,1571,
-        1,0,0,0,237,1588,1,0,0,0,239,1590,1,0,0,0,241,1618,1,0,0,0,243,1620,
-        1,0,0,0,245,1626,1,0,0,0,247,1631,1,0,0,0,249,1635,1,0,0,0,251,1639,
-        1,0,0,0,253,1660,1,0,0,0,255,1662,1,0,0,0,257,1698,1,0,0,0,259,1712,
-        1,0,0,0,261,1714,1,0,0,0,263,1724,1,0,0,0,265,1728,1,0,0,0,267,1739,
-        1,0,0,0,269,1754,1,0,0,0,271,1764,1,0,0,0,273,1785,1,0,0,0,275,1787,
-        1,0,0,0,277,1798,1,0,0,0,279,1803,1,0,0,0,281,1809,1,0,0,0,283,1820,
-        1,0,0,0,285,286,5,77,0,0,286,287,5,101,0,0,287,288,5,116,0,0,288,
-        289,5,97,0,0,289,290,5,100,0,0,290,291,5,97,0,0,291,292,5,116,0,
-        0,292,293,5,97,0,0,293,2,1,0,0,0,294,295,5,58,0,0,295,4,1,0,0,0,
-        296,297,5,68,0,0,297,298,5,97,0,0,298,299,5,116,0,0,299,300,5,97,
-        0,0,300,301,5,79,0,0,301,302,5,98,0,0,302,303,5,106,0,0,303,304,
-        5,101,0,0,304,305,5,99,0,0,305,306,5,116,0,0,306,6,1,0,0,0,307,308,
-        5,123,0,0,308,8,1,0,0,0,309,310,5,83,0,0,310,311,5,99,0,0,311,312,
-        5,104,0,0,312,313,5,101,0,0,313,314,5,109,0,0,314,315,5,97,0,0,315,
-        10,1,0,0,0,316,317,5,80,0,0,317,318,5,111,0,0,318,319,5,108,0,0,
-        319,320,5,105,0,0,320,321,5,99,0,0,321,322,5,105,0,0,322,323,5,101,
-        0,0,323,324,5,115,0,0,324,12,1,0,0,0,325,326,5,82,0,0,326,327,5,
-        101,0,0,327,328,5,115,0,0,328,329,5,111,0,0,329,330,5,117,0,0,330,
-        331,5,114,0,0,331,332,5,99,0,0,332,333,5,101,0,0,333,334,5,115,0,
-        0,334,14,1,0,0,0,335,336,5,101,0,0,336,337,5,114,0,0,337,338,5,77,
-        0,0,338,339,5,97,0,0,339,340,5,112,0,0,340,16,1,0,0,0,341,342,5,
-        125,0,0,342,18,1,0,0,0,343,344,5,44,0,0,344,20,1,0,0,0,345,346,5,
-        45,0,0,346,22,1,0,0,0,347,348,5,73,0,0,348,349,5,110,0,0,349,350,
-        5,112,0,0,350,351,5,117,0,0,351,352,5,116,0,0,352,24,1,0,0,0,353,
-        354,5,79,0,0,354,355,5,117,0,0,355,356,5,116,0,0,356,357,5,112,0,
-        0,357,358,5,117,0,0,358,359,5,116,0,0,359,26,1,0,0,0,360,361,5,67,
-        0,0,361,362,5,104,0,0,362,363,5,97,0,0,363,364,5,110,0,0,364,365,
-        5,110,0,0,365,366,5,101,0,0,366,367,5,108,0,0,367,28,1,0,0,0,368,
-        369,5,80,0,0,369,370,5,114,0,0,370,371,5,111,0,0,371,372,5,116,0,
-        0,372,373,5,111,0,0,373,374,5,99,0,0,374,375,5,111,0,0,375,376,5,
-        108,0,0,376,30,1,0,0,0,377,378,5,69,0,0,378,379,5,110,0,0,379,380,
-        5,100,0,0,380,381,5,112,0,0,381,382,5,111,0,0,382,383,5,105,0,0,
-        383,384,5,110,0,0,384,385,5,116,0,0,385,32,1,0,0,0,386,387,5,65,
-        0,0,387,388,5,117,0,0,388,389,5,116,0,0,389,390,5,104,0,0,390,34,
-        1,0,0,0,391,392,5,70,0,0,392,393,5,111,0,0,393,394,5,114,0,0,394,
-        395,5,109,0,0,395,396,5,97,0,0,396,397,5,116,0,0,397,36,1,0,0,0,
-        398,399,5,83,0,0,399,400,5,76,0,0,400,401,5,65,0,0,401,38,1,0,0,
-        0,402,403,5,69,0,0,403,404,5,110,0,0,404,405,5,116,0,0,405,406,5,
-        105,0,0,406,407,5,116,0,0,407,408,5,121,0,0,408,40,1,0,0,0,409,410,
-        5,100,0,0,410,411,5,97,0,0,411,412,5,116,0,0,412,413,5,97,0,0,413,
-        414,5,82,0,0,414,415,5,101,0,0,415,416,5,102,0,0,416,42,1,0,0,0,
-        417,418,5,80,0,0,418,419,5,114,0,0,419,420,5,111,0,0,420,421,5,112,
-        0,0,421,422,5,101,0,0,422,423,5,114,0,0,423,424,5,116,0,0,424,425,
-        5,105,0,0,425,426,5,101,0,0,426,427,5,115,0,0,427,44,1,0,0,0,428,
-        429,5,82,0,0,429,430,5,117,0,0,430,431,5,108,0,0,431,432,5,101,0,
-        0,432,433,5,115,0,0,433,46,1,0,0,0,434,435,5,116,0,0,435,436,5,121,
-        0,0,436,437,5,112,0,0,437,438,5,101,0,0,438,48,1,0,0,0,439,440,5,
-        114,0,0,440,441,5,101,0,0,441,442,5,113,0,0,442,443,5,117,0,0,443,
-        444,5,105,0,0,444,445,5,114,0,0,445,446,5,101,0,0,446,447,5,100,
-        0,0,447,50,1,0,0,0,448,449,5,117,0,0,449,450,5,110,0,0,450,451,5,
-        105,0,0,451,452,5,113,0,0,452,453,5,117,0,0,453,454,5,101,0,0,454,
-        52,1,0,0,0,455,456,5,100,0,0,456,457,5,101,0,0,457,458,5,102,0,0,
-        458,459,5,97,0,0,459,460,5,117,0,0,460,461,5,108,0,0,461,462,5,116,
-        0,0,462,54,1,0,0,0,463,464,5,118,0,0,464,465,5,97,0,0,465,466,5,
-        108,0,0,466,467,5,117,0,0,467,468,5,101,0,0,468,469,5,115,0,0,469,
-        56,1,0,0,0,470,471,5,91,0,0,471,58,1,0,0,0,472,473,5,93,0,0,473,
-        60,1,0,0,0,474,475,5,73,0,0,475,476,5,84,0,0,476,477,5,65,0,0,477,
-        478,5,115,0,0,478,479,5,115,0,0,479,480,5,101,0,0,480,481,5,116,
-        0,0,481,62,1,0,0,0,482,483,5,75,0,0,483,484,5,105,0,0,484,485,5,
-        110,0,0,485,486,5,100,0,0,486,64,1,0,0,0,487,488,5,65,0,0,488,489,
-        5,112,0,0,489,490,5,112,0,0,490,491,5,108,0,0,491,492,5,105,0,0,
-        492,493,5,99,0,0,493,494,5,97,0,0,494,495,5,116,0,0,495,496,5,105,
-        0,0,496,497,5,111,0,0,497,498,5,110,0,0,498,66,1,0,0,0,499,500,5,
-        83,0,0,500,501,5,121,0,0,501,502,5,115,0,0,502,503,5,116,0,0,503,
-        504,5,101,0,0,504,505,5,109,0,0,505,68,1,0,0,0,506,507,5,80,0,0,
-        507,508,5,108,0,0,508,509,5,97,0,0,509,510,5,116,0,0,510,511,5,102,
-        0,0,511,512,5,111,0,0,512,513,5,114,0,0,513,514,5,109,0,0,514,70,
-        1,0,0,0,515,516,5,65,0,0,516,517,5,116,0,0,517,518,5,116,0,0,518,
-        519,5,114,0,0,519,520,5,105,0,0,520,521,5,98,0,0,521,522,5,117,0,
-        0,522,523,5,116,0,0,523,524,5,101,0,0,524,525,5,115,0,0,525,72,1,
-        0,0,0,526,527,5,82,0,0,527,528,5,101,0,0,528,529,5,108,0,0,529,530,
-        5,97,0,0,530,531,5,116,0,0,531,532,5,105,0,0,532,533,5,111,0,0,533,
-        534,5,110,0,0,534,535,5,115,0,0,535,536,5,104,0,0,536,537,5,105,
-        0,0,537,538,5,112,0,0,538,539,5,115,0,0,539,74,1,0,0,0,540,541,5,
-        40,0,0,541,76,1,0,0,0,542,543,5,41,0,0,543,78,1,0,0,0,544,545,5,
-        84,0,0,545,546,5,121,0,0,546,547,5,112,0,0,547,548,5,101,0,0,548,
-        80,1,0,0,0,549,550,5,82,0,0,550,551,5,101,0,0,551,552,5,108,0,0,
-        552,553,5,97,0,0,553,554,5,116,0,0,554,555,5,105,0,0,555,556,5,111,
-        0,0,556,557,5,110,0,0,557,558,5,115,0,0,558,559,5,104,0,0,559,560,
-        5,105,0,0,560,561,5,112,0,0,561,82,1,0,0,0,562,563,5,70,0,0,563,
-        564,5,114,0,0,564,565,5,111,0,0,565,566,5,109,0,0,566,84,1,0,0,0,
-        567,568,5,84,0,0,568,569,5,111,0,0,569,86,1,0,0,0,570,571,5,80,0,
-        0,571,572,5,114,0,0,572,573,5,111,0,0,573,574,5,99,0,0,574,575,5,
-        101,0,0,575,576,5,115,0,0,576,577,5,115,0,0,577,88,1,0,0,0,578,579,
-        5,68,0,0,579,580,5,101,0,0,580,581,5,115,0,0,581,582,5,99,0,0,582,
-        583,5,114,0,0,583,584,5,105,0,0,584,585,5,112,0,0,585,586,5,116,
-        0,0,586,587,5,105,0,0,587,588,5,111,0,0,588,589,5,110,0,0,589,90,
-        1,0,0,0,590,591,5,79,0,0,591,592,5,98,0,0,592,593,5,106,0,0,593,
-        594,5,101,0,0,594,595,5,99,0,0,595,596,5,116,0,0,596,597,5,105,0,
-        0,597,598,5,118,0,0,598,599,5,101,0,0,599,600,5,73,0,0,600,601,5,
-        68,0,0,601,92,1,0,0,0,602,603,5,66,0,0,603,604,5,117,0,0,604,605,
-        5,115,0,0,605,606,5,105,0,0,606,607,5,110,0,0,607,608,5,101,0,0,
-        608,609,5,115,0,0,609,610,5,115,0,0,610,611,5,71,0,0,611,612,5,111,
-        0,0,612,613,5,97,0,0,613,614,5,108,0,0,614,615,5,73,0,0,615,616,
-        5,68,0,0,616,94,1,0,0,0,617,618,5,65,0,0,618,619,5,99,0,0,619,620,
-        5,116,0,0,620,621,5,111,0,0,621,622,5,114,0,0,622,623,5,115,0,0,
-        623,96,1,0,0,0,624,625,5,83,0,0,625,626,5,116,0,0,626,627,5,97,0,
-        0,627,628,5,114,0,0,628,629,5,116,0,0,629,630,5,115,0,0,630,631,
-        5,32,0,0,631,632,5,87,0,0,632,633,5,105,0,0,633,634,5,116,0,0,634,
-        635,5,104,0,0,635,98,1,0,0,0,636,637,5,69,0,0,637,638,5,110,0,0,
-        638,639,5,100,0,0,639,640,5,115,0,0,640,641,5,32,0,0,641,642,5,87,
-        0,0,642,643,5,105,0,0,643,644,5,116,0,0,644,645,5,104,0,0,645,100,
-        1,0,0,0,646,647,5,83,0,0,647,648,5,116,0,0,648,649,5,101,0,0,649,
-        650,5,112,0,0,650,102,1,0,0,0,651,652,5,73,0,0,652,653,5,110,0,0,
-        653,654,5,112,0,0,654,655,5,117,0,0,655,656,5,116,0,0,656,657,5,
-        115,0,0,657,104,1,0,0,0,658,659,5,86,0,0,659,660,5,97,0,0,660,661,
-        5,108,0,0,661,662,5,105,0,0,662,663,5,100,0,0,663,664,5,97,0,0,664,
-        665,5,116,0,0,665,666,5,105,0,0,666,667,5,111,0,0,667,668,5,110,
-        0,0,668,106,1,0,0,0,669,670,5,67,0,0,670,671,5,111,0,0,671,672,5,
-        110,0,0,672,673,5,100,0,0,673,674,5,105,0,0,674,675,5,116,0,0,675,
-        676,5,105,0,0,676,677,5,111,0,0,677,678,5,110,0,0,678,108,1,0,0,
-        0,679,680,5,65,0,0,680,681,5,99,0,0,681,682,5,116,0,0,682,683,5,
-        105,0,0,683,684,5,111,0,0,684,685,5,110,0,0,685,686,5,115,0,0,686,
-        110,1,0,0,0,687,688,5,69,0,0,688,689,5,114,0,0,689,690,5,114,0,0,
-        690,691,5,111,0,0,691,692,5,114,0,0,692,693,5,72,0,0,693,694,5,97,
-        0,0,694,695,5,110,0,0,695,696,5,100,0,0,696,697,5,108,0,0,697,698,
-        5,105,0,0,698,699,5,110,0,0,699,700,5,103,0,0,700,112,1,0,0,0,701,
-        702,5,46,0,0,702,114,1,0,0,0,703,704,5,80,0,0,704,705,5,97,0,0,705,
-        706,5,114,0,0,706,707,5,116,0,0,707,708,5,105,0,0,708,709,5,97,0,
-        0,709,710,5,108,0,0,710,116,1,0,0,0,711,712,5,60,0,0,712,118,1,0,
-        0,0,713,714,5,62,0,0,714,120,1,0,0,0,715,716,5,69,0,0,716,717,5,
-        118,0,0,717,718,5,101,0,0,718,719,5,110,0,0,719,720,5,116,0,0,720,
-        122,1,0,0,0,721,722,5,82,0,0,722,723,5,117,0,0,723,724,5,108,0,0,
-        724,725,5,101,0,0,725,124,1,0,0,0,726,727,5,84,0,0,727,728,5,114,
-        0,0,728,729,5,105,0,0,729,730,5,103,0,0,730,731,5,103,0,0,731,732,
-        5,101,0,0,732,733,5,114,0,0,733,126,1,0,0,0,734,735,5,67,0,0,735,
-        736,5,111,0,0,736,737,5,110,0,0,737,738,5,100,0,0,738,739,5,105,
-        0,0,739,740,5,116,0,0,740,741,5,105,0,0,741,742,5,111,0,0,742,743,
-        5,110,0,0,743,744,5,115,0,0,744,128,1,0,0,0,745,746,5,82,0,0,746,
-        747,5,101,0,0,747,748,5,112,0,0,748,749,5,111,0,0,749,750,5,114,
-        0,0,750,751,5,116,0,0,751,130,1,0,0,0,752,753,5,81,0,0,753,754,5,
-        117,0,0,754,755,5,101,0,0,755,756,5,114,0,0,756,757,5,121,0,0,757,
-        132,1,0,0,0,758,759,5,83,0,0,759,760,5,99,0,0,760,761,5,104,0,0,
-        761,762,5,101,0,0,762,763,5,100,0,0,763,764,5,117,0,0,764,765,5,
-        108,0,0,765,766,5,101,0,0,766,134,1,0,0,0,767,768,5,73,0,0,768,769,
-        5,110,0,0,769,770,5,116,0,0,770,771,5,101,0,0,771,772,5,103,0,0,
-        772,773,5,114,0,0,773,774,5,97,0,0,774,775,5,116,0,0,775,776,5,105,
-        0,0,776,777,5,111,0,0,777,778,5,110,0,0,778,136,1,0,0,0,779,780,
-        5,80,0,0,780,781,5,114,0,0,781,782,5,111,0,0,782,783,5,118,0,0,783,
-        784,5,105,0,0,784,785,5,100,0,0,785,786,5,101,0,0,786,787,5,114,
-        0,0,787,138,1,0,0,0,788,789,5,67,0,0,789,790,5,114,0,0,790,791,5,
-        101,0,0,791,792,5,100,0,0,792,793,5,101,0,0,793,794,5,110,0,0,794,
-        795,5,116,0,0,795,796,5,105,0,0,796,797,5,97,0,0,797,798,5,108,0,
-        0,798,799,5,115,0,0,799,140,1,0,0,0,800,801,5,79,0,0,801,802,5,112,
-        0,0,802,803,5,101,0,0,803,804,5,114,0,0,804,805,5,97,0,0,805,806,
-        5,116,0,0,806,807,5,105,0,0,807,808,5,111,0,0,808,809,5,110,0,0,
-        809,810,5,115,0,0,810,142,1,0,0,0,811,812,5,85,0,0,812,813,5,85,
-        0,0,813,814,5,73,0,0,814,815,5,68,0,0,815,144,1,0,0,0,816,817,5,
-        83,0,0,817,818,5,116,0,0,818,819,5,114,0,0,819,820,5,105,0,0,820,
-        821,5,110,0,0,821,822,5,103,0,0,822,146,1,0,0,0,823,824,5,73,0,0,
-        824,825,5,110,0,0,825,826,5,116,0,0,826,827,5,101,0,0,827,828,5,
-        103,0,0,828,829,5,101,0,0,829,830,5,114,0,0,830,148,1,0,0,0,831,
-        832,5,67,0,0,832,833,5,117,0,0,833,834,5,114,0,0,834,835,5,114,0,
-        0,835,836,5,101,0,0,836,837,5,110,0,0,837,838,5,99,0,0,838,839,5,
-        121,0,0,839,150,1,0,0,0,840,841,5,82,0,0,841,842,5,97,0,0,842,843,
-        5,116,0,0,843,844,5,105,0,0,844,845,5,111,0,0,845,152,1,0,0,0,846,
-        847,5,68,0,0,847,848,5,97,0,0,848,849,5,116,0,0,849,850,5,101,0,
-        0,850,154,1,0,0,0,851,852,5,69,0,0,852,853,5,110,0,0,853,854,5,117,
-        0,0,854,855,5,109,0,0,855,156,1,0,0,0,856,857,5,74,0,0,857,858,5,
-        83,0,0,858,859,5,79,0,0,859,860,5,78,0,0,860,158,1,0,0,0,861,862,
-        5,66,0,0,862,863,5,111,0,0,863,864,5,111,0,0,864,865,5,108,0,0,865,
-        866,5,101,0,0,866,867,5,97,0,0,867,868,5,110,0,0,868,160,1,0,0,0,
-        869,870,5,83,0,0,870,871,5,87,0,0,871,872,5,73,0,0,872,873,5,70,
-        0,0,873,874,5,84,0,0,874,162,1,0,0,0,875,876,5,66,0,0,876,877,5,
-        73,0,0,877,878,5,67,0,0,878,164,1,0,0,0,879,880,5,67,0,0,880,881,
-        5,97,0,0,881,882,5,114,0,0,882,883,5,100,0,0,883,884,5,78,0,0,884,
-        885,5,117,0,0,885,886,5,109,0,0,886,887,5,98,0,0,887,888,5,101,0,
-        0,888,889,5,114,0,0,889,166,1,0,0,0,890,891,5,67,0,0,891,892,5,86,
-        0,0,892,893,5,86,0,0,893,168,1,0,0,0,894,895,5,65,0,0,895,896,5,
-        99,0,0,896,897,5,99,0,0,897,898,5,111,0,0,898,899,5,117,0,0,899,
-        900,5,110,0,0,900,901,5,116,0,0,901,902,5,78,0,0,902,903,5,117,0,
-        0,903,904,5,109,0,0,904,905,5,98,0,0,905,906,5,101,0,0,906,907,5,
-        114,0,0,907,170,1,0,0,0,908,909,5,109,0,0,909,910,5,105,0,0,910,
-        911,5,110,0,0,911,172,1,0,0,0,912,913,5,61,0,0,913,174,1,0,0,0,914,
-        915,5,109,0,0,915,916,5,97,0,0,916,917,5,120,0,0,917,176,1,0,0,0,
-        918,919,5,109,0,0,919,920,5,97,0,0,920,921,5,115,0,0,921,922,5,107,
-        0,0,922,923,5,101,0,0,923,924,5,100,0,0,924,178,1,0,0,0,925,926,
-        5,101,0,0,926,927,5,110,0,0,927,928,5,99,0,0,928,929,5,114,0,0,929,
-        930,5,121,0,0,930,931,5,112,0,0,931,932,5,116,0,0,932,933,5,101,
-        0,0,933,934,5,100,0,0,934,180,1,0,0,0,935,936,5,112,0,0,936,937,
-        5,99,0,0,937,938,5,105,0,0,938,939,5,95,0,0,939,940,5,99,0,0,940,
-        941,5,111,0,0,941,942,5,109,0,0,942,943,5,112,0,0,943,944,5,108,
-        0,0,944,945,5,105,0,0,945,946,5,97,0,0,946,947,5,110,0,0,947,948,
-        5,116,0,0,948,182,1,0,0,0,949,950,5,83,0,0,950,951,5,87,0,0,951,
-        952,5,73,0,0,952,953,5,70,0,0,953,964,5,84,0,0,954,955,5,83,0,0,
-        955,956,5,87,0,0,956,957,5,73,0,0,957,958,5,70,0,0,958,959,5,84,
-        0,0,959,960,5,95,0,0,960,961,5,66,0,0,961,962,5,73,0,0,962,964,5,
-        67,0,0,963,949,1,0,0,0,963,954,1,0,0,0,964,184,1,0,0,0,965,966,5,
-        73,0,0,966,967,5,66,0,0,967,968,5,65,0,0,968,969,5,78,0,0,969,186,
-        1,0,0,0,970,971,5,82,0,0,971,972,5,84,0,0,972,973,5,71,0,0,973,1001,
-        5,83,0,0,974,975,5,82,0,0,975,976,5,69,0,0,976,977,5,65,0,0,977,
-        978,5,76,0,0,978,979,5,95,0,0,979,980,5,84,0,0,980,981,5,73,0,0,
-        981,982,5,77,0,0,982,983,5,69,0,0,983,984,5,95,0,0,984,985,5,71,
-        0,0,985,986,5,82,0,0,986,987,5,79,0,0,987,988,5,83,0,0,988,989,5,
-        83,0,0,989,990,5,95,0,0,990,991,5,83,0,0,991,992,5,69,0,0,992,993,
-        5,84,0,0,993,994,5,84,0,0,994,995,5,76,0,0,995,996,5,69,0,0,996,
-        997,5,77,0,0,997,998,5,69,0,0,998,999,5,78,0,0,999,1001,5,84,0,0,
-        1000,970,1,0,0,0,1000,974,1,0,0,0,1001,188,1,0,0,0,1002,1003,5,65,
-        0,0,1003,1004,5,67,0,0,1004,1030,5,72,0,0,1005,1006,5,65,0,0,1006,
-        1007,5,85,0,0,1007,1008,5,84,0,0,1008,1009,5,79,0,0,1009,1010,5,
-        77,0,0,1010,1011,5,65,0,0,1011,1012,5,84,0,0,1012,1013,5,69,0,0,
-        1013,1014,5,68,0,0,1014,1015,5,95,0,0,1015,1016,5,67,0,0,1016,1017,
-        5,76,0,0,1017,1018,5,69,0,0,1018,1019,5,65,0,0,1019,1020,5,82,0,
-        0,1020,1021,5,73,0,0,1021,1022,5,78,0,0,1022,1023,5,71,0,0,1023,
-        1024,5,95,0,0,1024,1025,5,72,0,0,1025,1026,5,79,0,0,1026,1027,5,
-        85,0,0,1027,1028,5,83,0,0,1028,1030,5,69,0,0,1029,1002,1,0,0,0,1029,
-        1005,1,0,0,0,1030,190,1,0,0,0,1031,1032,5,83,0,0,1032,1033,5,69,
-        0,0,1033,1034,5,80,0,0,1034,1073,5,65,0,0,1035,1036,5,83,0,0,1036,
-        1037,5,69,0,0,1037,1038,5,80,0,0,1038,1039,5,65,0,0,1039,1040,5,
-        95,0,0,1040,1041,5,67,0,0,1041,1042,5,82,0,0,1042,1043,5,69,0,0,
-        1043,1044,5,68,0,0,1044,1045,5,73,0,0,1045,1046,5,84,0,0,1046,1047,
-        5,95,0,0,1047,1048,5,84,0,0,1048,1049,5,82,0,0,1049,1050,5,65,0,
-        0,1050,1051,5,78,0,0,1051,1052,5,83,0,0,1052,1053,5,70,0,0,1053,
-        1054,5,69,0,0,1054,1073,5,82,0,0,1055,1056,5,83,0,0,1056,1057,5,
-        69,0,0,1057,1058,5,80,0,0,1058,1059,5,65,0,0,1059,1060,5,95,0,0,
-        1060,1061,5,68,0,0,1061,1062,5,73,0,0,1062,1063,5,82,0,0,1063,1064,
-        5,69,0,0,1064,1065,5,67,0,0,1065,1066,5,84,0,0,1066,1067,5,95,0,
-        0,1067,1068,5,68,0,0,1068,1069,5,69,0,0,1069,1070,5,66,0,0,1070,
-        1071,5,73,0,0,1071,1073,5,84,0,0,1072,1031,1,0,0,0,1072,1035,1,0,
-        0,0,1072,1055,1,0,0,0,1073,192,1,0,0,0,1074,1075,5,70,0,0,1075,1076,
-        5,69,0,0,1076,1077,5,68,0,0,1077,1078,5,87,0,0,1078,1079,5,73,0,
-        0,1079,1080,5,82,0,0,1080,1081,5,69,0,0,1081,194,1,0,0,0,1082,1083,
-        5,67,0,0,1083,1084,5,72,0,0,1084,1085,5,65,0,0,1085,1086,5,80,0,
-        0,1086,1087,5,83,0,0,1087,196,1,0,0,0,1088,1089,5,84,0,0,1089,1090,
-        5,65,0,0,1090,1091,5,82,0,0,1091,1092,5,71,0,0,1092,1093,5,69,0,
-        0,1093,1094,5,84,0,0,1094,1095,5,50,0,0,1095,198,1,0,0,0,1096,1097,
-        5,67,0,0,1097,1098,5,72,0,0,1098,1099,5,73,0,0,1099,1100,5,80,0,
-        0,1100,1101,5,83,0,0,1101,200,1,0,0,0,1102,1103,5,80,0,0,1103,1104,
-        5,67,0,0,1104,1105,5,73,0,0,1105,1106,5,95,0,0,1106,1107,5,68,0,
-        0,1107,1108,5,83,0,0,1108,1123,5,83,0,0,1109,1110,5,80,0,0,1110,
-        1111,5,67,0,0,1111,1112,5,73,0,0,1112,1113,5,95,0,0,1113,1114,5,
-        67,0,0,1114,1115,5,79,0,0,1115,1116,5,77,0,0,1116,1117,5,80,0,0,
-        1117,1118,5,76,0,0,1118,1119,5,73,0,0,1119,1120,5,65,0,0,1120,1121,
-        5,78,0,0,1121,1123,5,84,0,0,1122,1102,1,0,0,0,1122,1109,1,0,0,0,
-        1123,202,1,0,0,0,1124,1125,5,80,0,0,1125,1126,5,73,0,0,1126,1163,
-        5,73,0,0,1127,1128,5,80,0,0,1128,1129,5,69,0,0,1129,1130,5,82,0,
-        0,1130,1131,5,83,0,0,1131,1132,5,79,0,0,1132,1133,5,78,0,0,1133,
-        1134,5,65,0,0,1134,1135,5,76,0,0,1135,1136,5,76,0,0,1136,1137,5,
-        89,0,0,1137,1138,5,95,0,0,1138,1139,5,73,0,0,1139,1140,5,68,0,0,
-        1140,1141,5,69,0,0,1141,1142,5,78,0,0,1142,1143,5,84,0,0,1143,1144,
-        5,73,0,0,1144,1145,5,70,0,0,1145,1146,5,73,0,0,1146,1147,5,65,0,
-        0,1147,1148,5,66,0,0,1148,1149,5,76,0,0,1149,1150,5,69,0,0,1150,
-        1151,5,95,0,0,1151,1152,5,73,0,0,1152,1153,5,78,0,0,1153,1154,5,
-        70,0,0,1154,1155,5,79,0,0,1155,1156,5,82,0,0,1156,1157,5,77,0,0,
-        1157,1158,5,65,0,0,1158,1159,5,84,0,0,1159,1160,5,73,0,0,1160,1161,
-        5,79,0,0,1161,1163,5,78,0,0,1162,1124,1,0,0,0,1162,1127,1,0,0,0,
-        1163,204,1,0,0,0,1164,1165,5,75,0,0,1165,1166,5,89,0,0,1166,1186,
-        5,67,0,0,1167,1168,5,75,0,0,1168,1169,5,78,0,0,1169,1170,5,79,0,
-        0,1170,1171,5,87,0,0,1171,1172,5,95,0,0,1172,1173,5,89,0,0,1173,
-        1174,5,79,0,0,1174,1175,5,85,0,0,1175,1176,5,82,0,0,1176,1177,5,
-        95,0,0,1177,1178,5,67,0,0,1178,1179,5,85,0,0,1179,1180,5,83,0,0,
-        1180,1181,5,84,0,0,1181,1182,5,79,0,0,1182,1183,5,77,0,0,1183,1184,
-        5,69,0,0,1184,1186,5,82,0,0,1185,1164,1,0,0,0,1185,1167,1,0,0,0,
-        1186,206,1,0,0,0,1187,1188,5,65,0,0,1188,1189,5,77,0,0,1189,1212,
-        5,76,0,0,1190,1191,5,65,0,0,1191,1192,5,78,0,0,1192,1193,5,84,0,
-        0,1193,1194,5,73,0,0,1194,1195,5,95,0,0,1195,1196,5,77,0,0,1196,
-        1197,5,79,0,0,1197,1198,5,78,0,0,1198,1199,5,69,0,0,1199,1200,5,
-        89,0,0,1200,1201,5,95,0,0,1201,1202,5,76,0,0,1202,1203,5,65,0,0,
-        1203,1204,5,85,0,0,1204,1205,5,78,0,0,1205,1206,5,68,0,0,1206,1207,
-        5,69,0,0,1207,1208,5,82,0,0,1208,1209,5,73,0,0,1209,1210,5,78,0,
-        0,1210,1212,5,71,0,0,1211,1187,1,0,0,0,1211,1190,1,0,0,0,1212,208,
-        1,0,0,0,1213,1214,5,67,0,0,1214,1215,5,70,0,0,1215,1244,5,84,0,0,
-        1216,1217,5,67,0,0,1217,1218,5,79,0,0,1218,1219,5,85,0,0,1219,1220,
-        5,78,0,0,1220,1221,5,84,0,0,1221,1222,5,69,0,0,1222,1223,5,82,0,
-        0,1223,1224,5,95,0,0,1224,1225,5,84,0,0,1225,1226,5,69,0,0,1226,
-        1227,5,82,0,0,1227,1228,5,82,0,0,1228,1229,5,79,0,0,1229,1230,5,
-        82,0,0,1230,1231,5,73,0,0,1231,1232,5,83,0,0,1232,1233,5,84,0,0,
-        1233,1234,5,95,0,0,1234,1235,5,70,0,0,1235,1236,5,73,0,0,1236,1237,
-        5,78,0,0,1237,1238,5,65,0,0,1238,1239,5,78,0,0,1239,1240,5,67,0,
-        0,1240,1241,5,73,0,0,1241,1242,5,78,0,0,1242,1244,5,71,0,0,1243,
-        1213,1,0,0,0,1243,1216,1,0,0,0,1244,210,1,0,0,0,1245,1246,5,86,0,
-        0,1246,1247,5,73,0,0,1247,1248,5,83,0,0,1248,1283,5,65,0,0,1249,
-        1250,5,77,0,0,1250,1251,5,65,0,0,1251,1252,5,83,0,0,1252,1253,5,
-        84,0,0,1253,1254,5,69,0,0,1254,1255,5,82,0,0,1255,1256,5,67,0,0,
-        1256,1257,5,65,0,0,1257,1258,5,82,0,0,1258,1283,5,68,0,0,1259,1260,
-        5,65,0,0,1260,1261,5,77,0,0,1261,1262,5,69,0,0,1262,1283,5,88,0,
-        0,1263,1264,5,68,0,0,1264,1265,5,73,0,0,1265,1266,5,83,0,0,1266,
-        1267,5,67,0,0,1267,1268,5,79,0,0,1268,1269,5,86,0,0,1269,1270,5,
-        69,0,0,1270,1283,5,82,0,0,1271,1272,5,74,0,0,1272,1273,5,67,0,0,
-        1273,1283,5,66,0,0,1274,1275,5,85,0,0,1275,1276,5,78,0,0,1276,1277,
-        5,73,0,0,1277,1278,5,79,0,0,1278,1279,5,78,0,0,1279,1280,5,80,0,
-        0,1280,1281,5,65,0,0,1281,1283,5,89,0,0,1282,1245,1,0,0,0,1282,1249,
-        1,0,0,0,1282,1259,1,0,0,0,1282,1263,1,0,0,0,1282,1271,1,0,0,0,1282,
-        1274,1,0,0,0,1283,212,1,0,0,0,1284,1285,5,69,0,0,1285,1286,5,77,
-        0,0,1286,1296,5,86,0,0,1287,1288,5,69,0,0,1288,1289,5,77,0,0,1289,
-        1290,5,86,0,0,1290,1291,5,95,0,0,1291,1292,5,67,0,0,1292,1293,5,
-        72,0,0,1293,1294,5,73,0,0,1294,1296,5,80,0,0,1295,1284,1,0,0,0,1295,
-        1287,1,0,0,0,1296,214,1,0,0,0,1297,1298,5,78,0,0,1298,1299,5,70,
-        0,0,1299,1312,5,67,0,0,1300,1301,5,67,0,0,1301,1302,5,79,0,0,1302,
-        1303,5,78,0,0,1303,1304,5,84,0,0,1304,1305,5,65,0,0,1305,1306,5,
-        67,0,0,1306,1307,5,84,0,0,1307,1308,5,76,0,0,1308,1309,5,69,0,0,
-        1309,1310,5,83,0,0,1310,1312,5,83,0,0,1311,1297,1,0,0,0,1311,1300,
-        1,0,0,0,1312,216,1,0,0,0,1313,1314,5,84,0,0,1314,1315,5,79,0,0,1315,
-        1316,5,75,0,0,1316,1317,5,69,0,0,1317,1318,5,78,0,0,1318,1319,5,
-        73,0,0,1319,1320,5,90,0,0,1320,1321,5,65,0,0,1321,1322,5,84,0,0,
-        1322,1323,5,73,0,0,1323,1324,5,79,0,0,1324,1331,5,78,0,0,1325,1326,
-        5,84,0,0,1326,1327,5,79,0,0,1327,1328,5,75,0,0,1328,1329,5,69,0,
-        0,1329,1331,5,78,0,0,1330,1313,1,0,0,0,1330,1325,1,0,0,0,1331,218,
-        1,0,0,0,1332,1333,5,80,0,0,1333,1334,5,65,0,0,1334,1358,5,78,0,0,
-        1335,1336,5,80,0,0,1336,1337,5,82,0,0,1337,1338,5,73,0,0,1338,1339,
-        5,77,0,0,1339,1340,5,65,0,0,1340,1341,5,82,0,0,1341,1342,5,89,0,
-        0,1342,1343,5,95,0,0,1343,1344,5,65,0,0,1344,1345,5,67,0,0,1345,
-        1346,5,67,0,0,1346,1347,5,79,0,0,1347,1348,5,85,0,0,1348,1349,5,
-        78,0,0,1349,1350,5,84,0,0,1350,1351,5,95,0,0,1351,1352,5,78,0,0,
-        1352,1353,5,85,0,0,1353,1354,5,77,0,0,1354,1355,5,66,0,0,1355,1356,
-        5,69,0,0,1356,1358,5,82,0,0,1357,1332,1,0,0,0,1357,1335,1,0,0,0,
-        1358,220,1,0,0,0,1359,1360,5,67,0,0,1360,1361,5,86,0,0,1361,1374,
-        5,86,0,0,1362,1363,5,67,0,0,1363,1364,5,86,0,0,1364,1365,5,86,0,
-        0,1365,1374,5,50,0,0,1366,1367,5,67,0,0,1367,1368,5,86,0,0,1368,
-        1374,5,67,0,0,1369,1370,5,67,0,0,1370,1371,5,86,0,0,1371,1372,5,
-        67,0,0,1372,1374,5,50,0,0,1373,1359,1,0,0,0,1373,1362,1,0,0,0,1373,
-        1366,1,0,0,0,1373,1369,1,0,0,0,1374,222,1,0,0,0,1375,1376,5,80,0,
-        0,1376,1377,5,69,0,0,1377,1378,5,78,0,0,1378,1379,5,68,0,0,1379,
-        1380,5,73,0,0,1380,1381,5,78,0,0,1381,1426,5,71,0,0,1382,1383,5,
-        65,0,0,1383,1384,5,85,0,0,1384,1385,5,84,0,0,1385,1386,5,72,0,0,
-        1386,1387,5,79,0,0,1387,1388,5,82,0,0,1388,1389,5,73,0,0,1389,1390,
-        5,90,0,0,1390,1391,5,69,0,0,1391,1426,5,68,0,0,1392,1393,5,83,0,
-        0,1393,1394,5,69,0,0,1394,1395,5,84,0,0,1395,1396,5,84,0,0,1396,
-        1397,5,76,0,0,1397,1398,5,69,0,0,1398,1426,5,68,0,0,1399,1400,5,
-        68,0,0,1400,1401,5,69,0,0,1401,1402,5,67,0,0,1402,1403,5,76,0,0,
-        1403,1404,5,73,0,0,1404,1405,5,78,0,0,1405,1406,5,69,0,0,1406,1426,
-        5,68,0,0,1407,1408,5,82,0,0,1408,1409,5,69,0,0,1409,1410,5,86,0,
-        0,1410,1411,5,69,0,0,1411,1412,5,82,0,0,1412,1413,5,83,0,0,1413,
-        1414,5,69,0,0,1414,1426,5,68,0,0,1415,1416,5,67,0,0,1416,1417,5,
-        72,0,0,1417,1418,5,65,0,0,1418,1419,5,82,0,0,1419,1420,5,71,0,0,
-        1420,1421,5,69,0,0,1421,1422,5,66,0,0,1422,1423,5,65,0,0,1423,1424,
-        5,67,0,0,1424,1426,5,75,0,0,1425,1375,1,0,0,0,1425,1382,1,0,0,0,
-        1425,1392,1,0,0,0,1425,1399,1,0,0,0,1425,1407,1,0,0,0,1425,1415,
-        1,0,0,0,1426,224,1,0,0,0,1427,1428,5,67,0,0,1428,1429,5,65,0,0,1429,
-        1430,5,82,0,0,1430,1462,5,68,0,0,1431,1432,5,65,0,0,1432,1433,5,
-        67,0,0,1433,1462,5,72,0,0,1434,1435,5,87,0,0,1435,1436,5,73,0,0,
-        1436,1437,5,82,0,0,1437,1462,5,69,0,0,1438,1439,5,67,0,0,1439,1440,
-        5,72,0,0,1440,1441,5,69,0,0,1441,1442,5,67,0,0,1442,1462,5,75,0,
-        0,1443,1444,5,67,0,0,1444,1445,5,65,0,0,1445,1446,5,83,0,0,1446,
-        1462,5,72,0,0,1447,1448,5,68,0,0,1448,1449,5,73,0,0,1449,1450,5,
-        71,0,0,1450,1451,5,73,0,0,1451,1452,5,84,0,0,1452,1453,5,65,0,0,
-        1453,1454,5,76,0,0,1454,1455,5,95,0,0,1455,1456,5,87,0,0,1456,1457,
-        5,65,0,0,1457,1458,5,76,0,0,1458,1459,5,76,0,0,1459,1460,5,69,0,
-        0,1460,1462,5,84,0,0,1461,1427,1,0,0,0,1461,1431,1,0,0,0,1461,1434,
-        1,0,0,0,1461,1438,1,0,0,0,1461,1443,1,0,0,0,1461,1447,1,0,0,0,1462,
-        226,1,0,0,0,1463,1464,5,65,0,0,1464,1465,5,80,0,0,1465,1489,5,82,
-        0,0,1466,1467,5,65,0,0,1467,1468,5,78,0,0,1468,1469,5,78,0,0,1469,
-        1470,5,85,0,0,1470,1471,5,65,0,0,1471,1472,5,76,0,0,1472,1473,5,
-        95,0,0,1473,1474,5,80,0,0,1474,1475,5,69,0,0,1475,1476,5,82,0,0,
-        1476,1477,5,67,0,0,1477,1478,5,69,0,0,1478,1479,5,78,0,0,1479,1480,
-        5,84,0,0,1480,1481,5,65,0,0,1481,1482,5,71,0,0,1482,1483,5,69,0,
-        0,1483,1484,5,95,0,0,1484,1485,5,82,0,0,1485,1486,5,65,0,0,1486,
-        1487,5,84,0,0,1487,1489,5,69,0,0,1488,1463,1,0,0,0,1488,1466,1,0,
-        0,0,1489,228,1,0,0,0,1490,1491,5,65,0,0,1491,1492,5,80,0,0,1492,
-        1517,5,89,0,0,1493,1494,5,65,0,0,1494,1495,5,78,0,0,1495,1496,5,
-        78,0,0,1496,1497,5,85,0,0,1497,1498,5,65,0,0,1498,1499,5,76,0,0,
-        1499,1500,5,95,0,0,1500,1501,5,80,0,0,1501,1502,5,69,0,0,1502,1503,
-        5,82,0,0,1503,1504,5,67,0,0,1504,1505,5,69,0,0,1505,1506,5,78,0,
-        0,1506,1507,5,84,0,0,1507,1508,5,65,0,0,1508,1509,5,71,0,0,1509,
-        1510,5,69,0,0,1510,1511,5,95,0,0,1511,1512,5,89,0,0,1512,1513,5,
-        73,0,0,1513,1514,5,69,0,0,1514,1515,5,76,0,0,1515,1517,5,68,0,0,
-        1516,1490,1,0,0,0,1516,1493,1,0,0,0,1517,230,1,0,0,0,1518,1519,5,
-        68,0,0,1519,1520,5,84,0,0,1520,1536,5,73,0,0,1521,1522,5,68,0,0,
-        1522,1523,5,69,0,0,1523,1524,5,66,0,0,1524,1525,5,84,0,0,1525,1526,
-        5,95,0,0,1526,1527,5,84,0,0,1527,1528,5,79,0,0,1528,1529,5,95,0,
-        0,1529,1530,5,73,0,0,1530,1531,5,78,0,0,1531,1532,5,67,0,0,1532,
-        1533,5,79,0,0,1533,1534,5,77,0,0,1534,1536,5,69,0,0,1535,1518,1,
-        0,0,0,1535,1521,1,0,0,0,1536,232,1,0,0,0,1537,1538,5,76,0,0,1538,
-        1539,5,84,0,0,1539,1554,5,86,0,0,1540,1541,5,76,0,0,1541,1542,5,
-        79,0,0,1542,1543,5,65,0,0,1543,1544,5,78,0,0,1544,1545,5,95,0,0,
-        1545,1546,5,84,0,0,1546,1547,5,79,0,0,1547,1548,5,95,0,0,1548,1549,
-        5,86,0,0,1549,1550,5,65,0,0,1550,1551,5,76,0,0,1551,1552,5,85,0,
-        0,1552,1554,5,69,0,0,1553,1537,1,0,0,0,1553,1540,1,0,0,0,1554,234,
-        1,0,0,0,1555,1556,5,70,0,0,1556,1557,5,73,0,0,1557,1558,5,67,0,0,
-        1558,1572,5,79,0,0,1559,1560,5,67,0,0,1560,1561,5,82,0,0,1561,1562,
-        5,69,0,0,1562,1563,5,68,0,0,1563,1564,5,73,0,0,1564,1565,5,84,0,
-        0,1565,1566,5,95,0,0,1566,1567,5,83,0,0,1567,1568,5,67,0,0,1568,
-        1569,5,79,0,0,1569,1570,5,82,0,0,1570,1572,5,69,0,0,1571,1555,1,
-        0,0,0,1571,1559,1,0,0,0,1572,236,1,0,0,0,1573,1574,5,66,0,0,1574,
-        1575,5,65,0,0,1575,1576,5,83,0,0,1576,1577,5,69,0,0,1577,1578,5,
-        76,0,0,1578,1579,5,95,0,0,1579,1580,5,73,0,0,1580,1581,5,73,0,0,
-        1581,1589,5,73,0,0,1582,1583,5,66,0,0,1583,1584,5,65,0,0,1584,1585,
-        5,83,0,0,1585,1586,5,69,0,0,1586,1587,5,76,0,0,1587,1589,5,51,0,
-        0,1588,1573,1,0,0,0,1588,1582,1,0,0,0,1589,238,1,0,0,0,1590,1591,
-        5,68,0,0,1591,1592,5,79,0,0,1592,1593,5,68,0,0,1593,1594,5,68,0,
-        0,1594,1595,5,95,0,0,1595,1596,5,70,0,0,1596,1597,5,82,0,0,1597,
-        1598,5,65,0,0,1598,1599,5,78,0,0,1599,1600,5,75,0,0,1600,240,1,0,
-        0,0,1601,1602,5,83,0,0,1602,1603,5,79,0,0,1603,1619,5,88,0,0,1604,
-        1605,5,83,0,0,1605,1606,5,65,0,0,1606,1607,5,82,0,0,1607,1608,5,
-        66,0,0,1608,1609,5,65,0,0,1609,1610,5,78,0,0,1610,1611,5,69,0,0,
-        1611,1612,5,83,0,0,1612,1613,5,95,0,0,1613,1614,5,79,0,0,1614,1615,
-        5,88,0,0,1615,1616,5,76,0,0,1616,1617,5,69,0,0,1617,1619,5,89,0,
-        0,1618,1601,1,0,0,0,1618,1604,1,0,0,0,1619,242,1,0,0,0,1620,1621,
-        5,70,0,0,1621,1622,5,65,0,0,1622,1623,5,84,0,0,1623,1624,5,67,0,
-        0,1624,1625,5,65,0,0,1625,244,1,0,0,0,1626,1627,5,70,0,0,1627,1628,
-        5,66,0,0,1628,1629,5,65,0,0,1629,1630,5,82,0,0,1630,246,1,0,0,0,
-        1631,1632,5,84,0,0,1632,1633,5,43,0,0,1633,1634,5,48,0,0,1634,248,
-        1,0,0,0,1635,1636,5,84,0,0,1636,1637,5,43,0,0,1637,1638,5,49,0,0,
-        1638,250,1,0,0,0,1639,1640,5,84,0,0,1640,1641,5,43,0,0,1641,1642,
-        5,50,0,0,1642,252,1,0,0,0,1643,1644,5,73,0,0,1644,1645,5,83,0,0,
-        1645,1646,5,79,0,0,1646,1647,5,50,0,0,1647,1648,5,48,0,0,1648,1649,
-        5,48,0,0,1649,1650,5,50,0,0,1650,1661,5,50,0,0,1651,1652,5,73,0,
-        0,1652,1653,5,83,0,0,1653,1654,5,79,0,0,1654,1655,5,95,0,0,1655,
-        1656,5,50,0,0,1656,1657,5,48,0,0,1657,1658,5,48,0,0,1658,1659,5,
-        50,0,0,1659,1661,5,50,0,0,1660,1643,1,0,0,0,1660,1651,1,0,0,0,1661,
-        254,1,0,0,0,1662,1663,5,70,0,0,1663,1664,5,73,0,0,1664,1665,5,88,
-        0,0,1665,1666,5,95,0,0,1666,1667,5,80,0,0,1667,1668,5,82,0,0,1668,
-        1669,5,79,0,0,1669,1670,5,84,0,0,1670,1671,5,79,0,0,1671,1672,5,
-        67,0,0,1672,1673,5,79,0,0,1673,1674,5,76,0,0,1674,256,1,0,0,0,1675,
-        1676,5,77,0,0,1676,1677,5,84,0,0,1677,1678,5,49,0,0,1678,1679,5,
-        48,0,0,1679,1699,5,51,0,0,1680,1681,5,77,0,0,1681,1682,5,84,0,0,
-        1682,1683,5,50,0,0,1683,1684,5,48,0,0,1684,1699,5,50,0,0,1685,1686,
-        5,77,0,0,1686,1687,5,84,0,0,1687,1688,5,55,0,0,1688,1689,5,48,0,
-        0,1689,1699,5,48,0,0,1690,1691,5,77,0,0,1691,1692,5,84,0,0,1692,
-        1694,1,0,0,0,1693,1695,7,0,0,0,1694,1693,1,0,0,0,1695,1696,1,0,0,
-        0,1696,1694,1,0,0,0,1696,1697,1,0,0,0,1697,1699,1,0,0,0,1698,1675,
-        1,0,0,0,1698,1680,1,0,0,0,1698,1685,1,0,0,0,1698,1690,1,0,0,0,1699,
-        258,1,0,0,0,1700,1701,5,77,0,0,1701,1713,5,88,0,0,1702,1703,5,77,
-        0,0,1703,1704,5,88,0,0,1704,1705,5,95,0,0,1705,1706,5,77,0,0,1706,
-        1707,5,69,0,0,1707,1708,5,83,0,0,1708,1709,5,83,0,0,1709,1710,5,
-        65,0,0,1710,1711,5,71,0,0,1711,1713,5,69,0,0,1712,1700,1,0,0,0,1712,
-        1702,1,0,0,0,1713,260,1,0,0,0,1714,1718,5,34,0,0,1715,1717,8,1,0,
-        0,1716,1715,1,0,0,0,1717,1720,1,0,0,0,1718,1716,1,0,0,0,1718,1719,
-        1,0,0,0,1719,1721,1,0,0,0,1720,1718,1,0,0,0,1721,1722,5,34,0,0,1722,
-        262,1,0,0,0,1723,1725,8,2,0,0,1724,1723,1,0,0,0,1725,1726,1,0,0,
-        0,1726,1724,1,0,0,0,1726,1727,1,0,0,0,1727,264,1,0,0,0,1728,1729,
-        5,91,0,0,1729,1734,3,275,137,0,1730,1731,5,44,0,0,1731,1733,3,275,
-        137,0,1732,1730,1,0,0,0,1733,1736,1,0,0,0,1734,1732,1,0,0,0,1734,
-        1735,1,0,0,0,1735,1737,1,0,0,0,1736,1734,1,0,0,0,1737,1738,5,93,
-        0,0,1738,266,1,0,0,0,1739,1740,7,3,0,0,1740,1741,6,133,0,0,1741,
-        1742,5,45,0,0,1742,1743,7,3,0,0,1743,1744,6,133,1,0,1744,1745,5,
-        45,0,0,1745,1746,7,3,0,0,1746,1747,6,133,2,0,1747,1748,5,45,0,0,
-        1748,1749,7,3,0,0,1749,1750,6,133,3,0,1750,1751,5,45,0,0,1751,1752,
-        7,3,0,0,1752,1753,6,133,4,0,1753,268,1,0,0,0,1754,1755,7,0,0,0,1755,
-        1756,6,134,5,0,1756,1757,5,45,0,0,1757,1758,7,0,0,0,1758,1759,6,
-        134,6,0,1759,1760,5,45,0,0,1760,1761,7,0,0,0,1761,1762,6,134,7,0,
-        1762,270,1,0,0,0,1763,1765,7,0,0,0,1764,1763,1,0,0,0,1765,1766,1,
-        0,0,0,1766,1764,1,0,0,0,1766,1767,1,0,0,0,1767,1774,1,0,0,0,1768,
-        1770,5,46,0,0,1769,1771,7,0,0,0,1770,1769,1,0,0,0,1771,1772,1,0,
-        0,0,1772,1770,1,0,0,0,1772,1773,1,0,0,0,1773,1775,1,0,0,0,1774,1768,
-        1,0,0,0,1774,1775,1,0,0,0,1775,272,1,0,0,0,1776,1777,5,116,0,0,1777,
-        1778,5,114,0,0,1778,1779,5,117,0,0,1779,1786,5,101,0,0,1780,1781,
-        5,102,0,0,1781,1782,5,97,0,0,1782,1783,5,108,0,0,1783,1784,5,115,
-        0,0,1784,1786,5,101,0,0,1785,1776,1,0,0,0,1785,1780,1,0,0,0,1786,
-        274,1,0,0,0,1787,1791,7,4,0,0,1788,1790,7,5,0,0,1789,1788,1,0,0,
-        0,1790,1793,1,0,0,0,1791,1789,1,0,0,0,1791,1792,1,0,0,0,1792,276,
-        1,0,0,0,1793,1791,1,0,0,0,1794,1796,5,13,0,0,1795,1794,1,0,0,0,1795,
-        1796,1,0,0,0,1796,1797,1,0,0,0,1797,1799,5,10,0,0,1798,1795,1,0,
-        0,0,1799,1800,1,0,0,0,1800,1798,1,0,0,0,1800,1801,1,0,0,0,1801,278,
-        1,0,0,0,1802,1804,7,6,0,0,1803,1802,1,0,0,0,1804,1805,1,0,0,0,1805,
-        1803,1,0,0,0,1805,1806,1,0,0,0,1806,1807,1,0,0,0,1807,1808,6,139,
-        8,0,1808,280,1,0,0,0,1809,1810,5,47,0,0,1810,1811,5,47,0,0,1811,
-        1815,1,0,0,0,1812,1814,8,2,0,0,1813,1812,1,0,0,0,1814,1817,1,0,0,
-        0,1815,1813,1,0,0,0,1815,1816,1,0,0,0,1816,1818,1,0,0,0,1817,1815,
-        1,0,0,0,1818,1819,6,140,8,0,1819,282,1,0,0,0,1820,1821,5,47,0,0,
-        1821,1822,5,42,0,0,1822,1826,1,0,0,0,1823,1825,9,0,0,0,1824,1823,
-        1,0,0,0,1825,1828,1,0,0,0,1826,1827,1,0,0,0,1826,1824,1,0,0,0,1827,
-        1829,1,0,0,0,1828,1826,1,0,0,0,1829,1830,5,42,0,0,1830,1831,5,47,
-        0,0,1831,1832,1,0,0,0,1832,1833,6,141,8,0,1833,284,1,0,0,0,42,0,
-        963,1000,1029,1072,1122,1162,1185,1211,1243,1282,1295,1311,1330,
-        1357,1373,1425,1461,1488,1516,1535,1553,1571,1588,1618,1660,1696,
-        1698,1712,1718,1726,1734,1766,1772,1774,1785,1791,1795,1800,1805,
-        1815,1826,9,1,133,0,1,133,1,1,133,2,1,133,3,1,133,4,1,134,5,1,134,
-        6,1,134,7,6,0,0
+        0,0,0,281,1,0,0,0,0,283,1,0,0,0,0,285,1,0,0,0,0,287,1,0,0,0,0,289,
+        1,0,0,0,0,291,1,0,0,0,0,293,1,0,0,0,1,299,1,0,0,0,3,306,1,0,0,0,
+        5,308,1,0,0,0,7,317,1,0,0,0,9,328,1,0,0,0,11,330,1,0,0,0,13,337,
+        1,0,0,0,15,346,1,0,0,0,17,356,1,0,0,0,19,362,1,0,0,0,21,364,1,0,
+        0,0,23,366,1,0,0,0,25,368,1,0,0,0,27,374,1,0,0,0,29,381,1,0,0,0,
+        31,389,1,0,0,0,33,398,1,0,0,0,35,407,1,0,0,0,37,412,1,0,0,0,39,419,
+        1,0,0,0,41,421,1,0,0,0,43,425,1,0,0,0,45,432,1,0,0,0,47,440,1,0,
+        0,0,49,451,1,0,0,0,51,457,1,0,0,0,53,462,1,0,0,0,55,471,1,0,0,0,
+        57,478,1,0,0,0,59,486,1,0,0,0,61,493,1,0,0,0,63,495,1,0,0,0,65,497,
+        1,0,0,0,67,503,1,0,0,0,69,514,1,0,0,0,71,527,1,0,0,0,73,535,1,0,
+        0,0,75,540,1,0,0,0,77,552,1,0,0,0,79,559,1,0,0,0,81,568,1,0,0,0,
+        83,579,1,0,0,0,85,593,1,0,0,0,87,595,1,0,0,0,89,597,1,0,0,0,91,602,
+        1,0,0,0,93,607,1,0,0,0,95,610,1,0,0,0,97,618,1,0,0,0,99,630,1,0,
+        0,0,101,640,1,0,0,0,103,652,1,0,0,0,105,664,1,0,0,0,107,679,1,0,
+        0,0,109,686,1,0,0,0,111,699,1,0,0,0,113,704,1,0,0,0,115,711,1,0,
+        0,0,117,722,1,0,0,0,119,732,1,0,0,0,121,740,1,0,0,0,123,754,1,0,
+        0,0,125,756,1,0,0,0,127,764,1,0,0,0,129,766,1,0,0,0,131,768,1,0,
+        0,0,133,774,1,0,0,0,135,779,1,0,0,0,137,787,1,0,0,0,139,798,1,0,
+        0,0,141,805,1,0,0,0,143,811,1,0,0,0,145,820,1,0,0,0,147,832,1,0,
+        0,0,149,841,1,0,0,0,151,853,1,0,0,0,153,864,1,0,0,0,155,868,1,0,
+        0,0,157,872,1,0,0,0,159,879,1,0,0,0,161,889,1,0,0,0,163,903,1,0,
+        0,0,165,908,1,0,0,0,167,915,1,0,0,0,169,923,1,0,0,0,171,932,1,0,
+        0,0,173,938,1,0,0,0,175,943,1,0,0,0,177,948,1,0,0,0,179,953,1,0,
+        0,0,181,961,1,0,0,0,183,967,1,0,0,0,185,971,1,0,0,0,187,982,1,0,
+        0,0,189,986,1,0,0,0,191,1000,1,0,0,0,193,1016,1,0,0,0,195,1018,1,
+        0,0,0,197,1053,1,0,0,0,199,1082,1,0,0,0,201,1125,1,0,0,0,203,1127,
+        1,0,0,0,205,1135,1,0,0,0,207,1141,1,0,0,0,209,1149,1,0,0,0,211,1175,
+        1,0,0,0,213,1215,1,0,0,0,215,1238,1,0,0,0,217,1264,1,0,0,0,219,1296,
+        1,0,0,0,221,1335,1,0,0,0,223,1348,1,0,0,0,225,1364,1,0,0,0,227,1383,
+        1,0,0,0,229,1410,1,0,0,0,231,1426,1,0,0,0,233,1478,1,0,0,0,235,1514,
+        1,0,0,0,237,1541,1,0,0,0,239,1569,1,0,0,0,241,1588,1,0,0,0,243,1606,
+        1,0,0,0,245,1624,1,0,0,0,247,1641,1,0,0,0,249,1643,1,0,0,0,251,1671,
+        1,0,0,0,253,1673,1,0,0,0,255,1679,1,0,0,0,257,1684,1,0,0,0,259,1688,
+        1,0,0,0,261,1692,1,0,0,0,263,1713,1,0,0,0,265,1715,1,0,0,0,267,1751,
+        1,0,0,0,269,1765,1,0,0,0,271,1767,1,0,0,0,273,1776,1,0,0,0,275,1789,
+        1,0,0,0,277,1801,1,0,0,0,279,1822,1,0,0,0,281,1824,1,0,0,0,283,1835,
+        1,0,0,0,285,1840,1,0,0,0,287,1846,1,0,0,0,289,1857,1,0,0,0,291,1871,
+        1,0,0,0,293,1880,1,0,0,0,295,1882,1,0,0,0,297,1887,1,0,0,0,299,300,
+        5,73,0,0,300,301,5,109,0,0,301,302,5,112,0,0,302,303,5,111,0,0,303,
+        304,5,114,0,0,304,305,5,116,0,0,305,2,1,0,0,0,306,307,5,58,0,0,307,
+        4,1,0,0,0,308,309,5,77,0,0,309,310,5,101,0,0,310,311,5,116,0,0,311,
+        312,5,97,0,0,312,313,5,100,0,0,313,314,5,97,0,0,314,315,5,116,0,
+        0,315,316,5,97,0,0,316,6,1,0,0,0,317,318,5,68,0,0,318,319,5,97,0,
+        0,319,320,5,116,0,0,320,321,5,97,0,0,321,322,5,79,0,0,322,323,5,
+        98,0,0,323,324,5,106,0,0,324,325,5,101,0,0,325,326,5,99,0,0,326,
+        327,5,116,0,0,327,8,1,0,0,0,328,329,5,123,0,0,329,10,1,0,0,0,330,
+        331,5,83,0,0,331,332,5,99,0,0,332,333,5,104,0,0,333,334,5,101,0,
+        0,334,335,5,109,0,0,335,336,5,97,0,0,336,12,1,0,0,0,337,338,5,80,
+        0,0,338,339,5,111,0,0,339,340,5,108,0,0,340,341,5,105,0,0,341,342,
+        5,99,0,0,342,343,5,105,0,0,343,344,5,101,0,0,344,345,5,115,0,0,345,
+        14,1,0,0,0,346,347,5,82,0,0,347,348,5,101,0,0,348,349,5,115,0,0,
+        349,350,5,111,0,0,350,351,5,117,0,0,351,352,5,114,0,0,352,353,5,
+        99,0,0,353,354,5,101,0,0,354,355,5,115,0,0,355,16,1,0,0,0,356,357,
+        5,101,0,0,357,358,5,114,0,0,358,359,5,77,0,0,359,360,5,97,0,0,360,
+        361,5,112,0,0,361,18,1,0,0,0,362,363,5,125,0,0,363,20,1,0,0,0,364,
+        365,5,44,0,0,365,22,1,0,0,0,366,367,5,45,0,0,367,24,1,0,0,0,368,
+        369,5,73,0,0,369,370,5,110,0,0,370,371,5,112,0,0,371,372,5,117,0,
+        0,372,373,5,116,0,0,373,26,1,0,0,0,374,375,5,79,0,0,375,376,5,117,
+        0,0,376,377,5,116,0,0,377,378,5,112,0,0,378,379,5,117,0,0,379,380,
+        5,116,0,0,380,28,1,0,0,0,381,382,5,67,0,0,382,383,5,104,0,0,383,
+        384,5,97,0,0,384,385,5,110,0,0,385,386,5,110,0,0,386,387,5,101,0,
+        0,387,388,5,108,0,0,388,30,1,0,0,0,389,390,5,80,0,0,390,391,5,114,
+        0,0,391,392,5,111,0,0,392,393,5,116,0,0,393,394,5,111,0,0,394,395,
+        5,99,0,0,395,396,5,111,0,0,396,397,5,108,0,0,397,32,1,0,0,0,398,
+        399,5,69,0,0,399,400,5,110,0,0,400,401,5,100,0,0,401,402,5,112,0,
+        0,402,403,5,111,0,0,403,404,5,105,0,0,404,405,5,110,0,0,405,406,
+        5,116,0,0,406,34,1,0,0,0,407,408,5,65,0,0,408,409,5,117,0,0,409,
+        410,5,116,0,0,410,411,5,104,0,0,411,36,1,0,0,0,412,413,5,70,0,0,
+        413,414,5,111,0,0,414,415,5,114,0,0,415,416,5,109,0,0,416,417,5,
+        97,0,0,417,418,5,116,0,0,418,38,1,0,0,0,419,420,5,124,0,0,420,40,
+        1,0,0,0,421,422,5,83,0,0,422,423,5,76,0,0,423,424,5,65,0,0,424,42,
+        1,0,0,0,425,426,5,69,0,0,426,427,5,110,0,0,427,428,5,116,0,0,428,
+        429,5,105,0,0,429,430,5,116,0,0,430,431,5,121,0,0,431,44,1,0,0,0,
+        432,433,5,100,0,0,433,434,5,97,0,0,434,435,5,116,0,0,435,436,5,97,
+        0,0,436,437,5,82,0,0,437,438,5,101,0,0,438,439,5,102,0,0,439,46,
+        1,0,0,0,440,441,5,80,0,0,441,442,5,114,0,0,442,443,5,111,0,0,443,
+        444,5,112,0,0,444,445,5,101,0,0,445,446,5,114,0,0,446,447,5,116,
+        0,0,447,448,5,105,0,0,448,449,5,101,0,0,449,450,5,115,0,0,450,48,
+        1,0,0,0,451,452,5,82,0,0,452,453,5,117,0,0,453,454,5,108,0,0,454,
+        455,5,101,0,0,455,456,5,115,0,0,456,50,1,0,0,0,457,458,5,116,0,0,
+        458,459,5,121,0,0,459,460,5,112,0,0,460,461,5,101,0,0,461,52,1,0,
+        0,0,462,463,5,114,0,0,463,464,5,101,0,0,464,465,5,113,0,0,465,466,
+        5,117,0,0,466,467,5,105,0,0,467,468,5,114,0,0,468,469,5,101,0,0,
+        469,470,5,100,0,0,470,54,1,0,0,0,471,472,5,117,0,0,472,473,5,110,
+        0,0,473,474,5,105,0,0,474,475,5,113,0,0,475,476,5,117,0,0,476,477,
+        5,101,0,0,477,56,1,0,0,0,478,479,5,100,0,0,479,480,5,101,0,0,480,
+        481,5,102,0,0,481,482,5,97,0,0,482,483,5,117,0,0,483,484,5,108,0,
+        0,484,485,5,116,0,0,485,58,1,0,0,0,486,487,5,118,0,0,487,488,5,97,
+        0,0,488,489,5,108,0,0,489,490,5,117,0,0,490,491,5,101,0,0,491,492,
+        5,115,0,0,492,60,1,0,0,0,493,494,5,91,0,0,494,62,1,0,0,0,495,496,
+        5,93,0,0,496,64,1,0,0,0,497,498,5,114,0,0,498,499,5,97,0,0,499,500,
+        5,110,0,0,500,501,5,103,0,0,501,502,5,101,0,0,502,66,1,0,0,0,503,
+        504,5,99,0,0,504,505,5,97,0,0,505,506,5,108,0,0,506,507,5,99,0,0,
+        507,508,5,117,0,0,508,509,5,108,0,0,509,510,5,97,0,0,510,511,5,116,
+        0,0,511,512,5,101,0,0,512,513,5,100,0,0,513,68,1,0,0,0,514,515,5,
+        82,0,0,515,516,5,101,0,0,516,517,5,108,0,0,517,518,5,97,0,0,518,
+        519,5,116,0,0,519,520,5,105,0,0,520,521,5,111,0,0,521,522,5,110,
+        0,0,522,523,5,115,0,0,523,524,5,104,0,0,524,525,5,105,0,0,525,526,
+        5,112,0,0,526,70,1,0,0,0,527,528,5,73,0,0,528,529,5,84,0,0,529,530,
+        5,65,0,0,530,531,5,115,0,0,531,532,5,115,0,0,532,533,5,101,0,0,533,
+        534,5,116,0,0,534,72,1,0,0,0,535,536,5,75,0,0,536,537,5,105,0,0,
+        537,538,5,110,0,0,538,539,5,100,0,0,539,74,1,0,0,0,540,541,5,65,
+        0,0,541,542,5,112,0,0,542,543,5,112,0,0,543,544,5,108,0,0,544,545,
+        5,105,0,0,545,546,5,99,0,0,546,547,5,97,0,0,547,548,5,116,0,0,548,
+        549,5,105,0,0,549,550,5,111,0,0,550,551,5,110,0,0,551,76,1,0,0,0,
+        552,553,5,83,0,0,553,554,5,121,0,0,554,555,5,115,0,0,555,556,5,116,
+        0,0,556,557,5,101,0,0,557,558,5,109,0,0,558,78,1,0,0,0,559,560,5,
+        80,0,0,560,561,5,108,0,0,561,562,5,97,0,0,562,563,5,116,0,0,563,
+        564,5,102,0,0,564,565,5,111,0,0,565,566,5,114,0,0,566,567,5,109,
+        0,0,567,80,1,0,0,0,568,569,5,65,0,0,569,570,5,116,0,0,570,571,5,
+        116,0,0,571,572,5,114,0,0,572,573,5,105,0,0,573,574,5,98,0,0,574,
+        575,5,117,0,0,575,576,5,116,0,0,576,577,5,101,0,0,577,578,5,115,
+        0,0,578,82,1,0,0,0,579,580,5,82,0,0,580,581,5,101,0,0,581,582,5,
+        108,0,0,582,583,5,97,0,0,583,584,5,116,0,0,584,585,5,105,0,0,585,
+        586,5,111,0,0,586,587,5,110,0,0,587,588,5,115,0,0,588,589,5,104,
+        0,0,589,590,5,105,0,0,590,591,5,112,0,0,591,592,5,115,0,0,592,84,
+        1,0,0,0,593,594,5,40,0,0,594,86,1,0,0,0,595,596,5,41,0,0,596,88,
+        1,0,0,0,597,598,5,84,0,0,598,599,5,121,0,0,599,600,5,112,0,0,600,
+        601,5,101,0,0,601,90,1,0,0,0,602,603,5,70,0,0,603,604,5,114,0,0,
+        604,605,5,111,0,0,605,606,5,109,0,0,606,92,1,0,0,0,607,608,5,84,
+        0,0,608,609,5,111,0,0,609,94,1,0,0,0,610,611,5,80,0,0,611,612,5,
+        114,0,0,612,613,5,111,0,0,613,614,5,99,0,0,614,615,5,101,0,0,615,
+        616,5,115,0,0,616,617,5,115,0,0,617,96,1,0,0,0,618,619,5,83,0,0,
+        619,620,5,116,0,0,620,621,5,97,0,0,621,622,5,114,0,0,622,623,5,116,
+        0,0,623,624,5,115,0,0,624,625,5,32,0,0,625,626,5,87,0,0,626,627,
+        5,105,0,0,627,628,5,116,0,0,628,629,5,104,0,0,629,98,1,0,0,0,630,
+        631,5,69,0,0,631,632,5,110,0,0,632,633,5,100,0,0,633,634,5,115,0,
+        0,634,635,5,32,0,0,635,636,5,87,0,0,636,637,5,105,0,0,637,638,5,
+        116,0,0,638,639,5,104,0,0,639,100,1,0,0,0,640,641,5,68,0,0,641,642,
+        5,101,0,0,642,643,5,115,0,0,643,644,5,99,0,0,644,645,5,114,0,0,645,
+        646,5,105,0,0,646,647,5,112,0,0,647,648,5,116,0,0,648,649,5,105,
+        0,0,649,650,5,111,0,0,650,651,5,110,0,0,651,102,1,0,0,0,652,653,
+        5,79,0,0,653,654,5,98,0,0,654,655,5,106,0,0,655,656,5,101,0,0,656,
+        657,5,99,0,0,657,658,5,116,0,0,658,659,5,105,0,0,659,660,5,118,0,
+        0,660,661,5,101,0,0,661,662,5,73,0,0,662,663,5,68,0,0,663,104,1,
+        0,0,0,664,665,5,66,0,0,665,666,5,117,0,0,666,667,5,115,0,0,667,668,
+        5,105,0,0,668,669,5,110,0,0,669,670,5,101,0,0,670,671,5,115,0,0,
+        671,672,5,115,0,0,672,673,5,71,0,0,673,674,5,111,0,0,674,675,5,97,
+        0,0,675,676,5,108,0,0,676,677,5,73,0,0,677,678,5,68,0,0,678,106,
+        1,0,0,0,679,680,5,65,0,0,680,681,5,99,0,0,681,682,5,116,0,0,682,
+        683,5,111,0,0,683,684,5,114,0,0,684,685,5,115,0,0,685,108,1,0,0,
+        0,686,687,5,67,0,0,687,688,5,97,0,0,688,689,5,112,0,0,689,690,5,
+        97,0,0,690,691,5,98,0,0,691,692,5,105,0,0,692,693,5,108,0,0,693,
+        694,5,105,0,0,694,695,5,116,0,0,695,696,5,105,0,0,696,697,5,101,
+        0,0,697,698,5,115,0,0,698,110,1,0,0,0,699,700,5,83,0,0,700,701,5,
+        116,0,0,701,702,5,101,0,0,702,703,5,112,0,0,703,112,1,0,0,0,704,
+        705,5,73,0,0,705,706,5,110,0,0,706,707,5,112,0,0,707,708,5,117,0,
+        0,708,709,5,116,0,0,709,710,5,115,0,0,710,114,1,0,0,0,711,712,5,
+        86,0,0,712,713,5,97,0,0,713,714,5,108,0,0,714,715,5,105,0,0,715,
+        716,5,100,0,0,716,717,5,97,0,0,717,718,5,116,0,0,718,719,5,105,0,
+        0,719,720,5,111,0,0,720,721,5,110,0,0,721,116,1,0,0,0,722,723,5,
+        67,0,0,723,724,5,111,0,0,724,725,5,110,0,0,725,726,5,100,0,0,726,
+        727,5,105,0,0,727,728,5,116,0,0,728,729,5,105,0,0,729,730,5,111,
+        0,0,730,731,5,110,0,0,731,118,1,0,0,0,732,733,5,65,0,0,733,734,5,
+        99,0,0,734,735,5,116,0,0,735,736,5,105,0,0,736,737,5,111,0,0,737,
+        738,5,110,0,0,738,739,5,115,0,0,739,120,1,0,0,0,740,741,5,69,0,0,
+        741,742,5,114,0,0,742,743,5,114,0,0,743,744,5,111,0,0,744,745,5,
+        114,0,0,745,746,5,72,0,0,746,747,5,97,0,0,747,748,5,110,0,0,748,
+        749,5,100,0,0,749,750,5,108,0,0,750,751,5,105,0,0,751,752,5,110,
+        0,0,752,753,5,103,0,0,753,122,1,0,0,0,754,755,5,46,0,0,755,124,1,
+        0,0,0,756,757,5,80,0,0,757,758,5,97,0,0,758,759,5,114,0,0,759,760,
+        5,116,0,0,760,761,5,105,0,0,761,762,5,97,0,0,762,763,5,108,0,0,763,
+        126,1,0,0,0,764,765,5,60,0,0,765,128,1,0,0,0,766,767,5,62,0,0,767,
+        130,1,0,0,0,768,769,5,69,0,0,769,770,5,118,0,0,770,771,5,101,0,0,
+        771,772,5,110,0,0,772,773,5,116,0,0,773,132,1,0,0,0,774,775,5,82,
+        0,0,775,776,5,117,0,0,776,777,5,108,0,0,777,778,5,101,0,0,778,134,
+        1,0,0,0,779,780,5,84,0,0,780,781,5,114,0,0,781,782,5,105,0,0,782,
+        783,5,103,0,0,783,784,5,103,0,0,784,785,5,101,0,0,785,786,5,114,
+        0,0,786,136,1,0,0,0,787,788,5,67,0,0,788,789,5,111,0,0,789,790,5,
+        110,0,0,790,791,5,100,0,0,791,792,5,105,0,0,792,793,5,116,0,0,793,
+        794,5,105,0,0,794,795,5,111,0,0,795,796,5,110,0,0,796,797,5,115,
+        0,0,797,138,1,0,0,0,798,799,5,82,0,0,799,800,5,101,0,0,800,801,5,
+        112,0,0,801,802,5,111,0,0,802,803,5,114,0,0,803,804,5,116,0,0,804,
+        140,1,0,0,0,805,806,5,81,0,0,806,807,5,117,0,0,807,808,5,101,0,0,
+        808,809,5,114,0,0,809,810,5,121,0,0,810,142,1,0,0,0,811,812,5,83,
+        0,0,812,813,5,99,0,0,813,814,5,104,0,0,814,815,5,101,0,0,815,816,
+        5,100,0,0,816,817,5,117,0,0,817,818,5,108,0,0,818,819,5,101,0,0,
+        819,144,1,0,0,0,820,821,5,73,0,0,821,822,5,110,0,0,822,823,5,116,
+        0,0,823,824,5,101,0,0,824,825,5,103,0,0,825,826,5,114,0,0,826,827,
+        5,97,0,0,827,828,5,116,0,0,828,829,5,105,0,0,829,830,5,111,0,0,830,
+        831,5,110,0,0,831,146,1,0,0,0,832,833,5,80,0,0,833,834,5,114,0,0,
+        834,835,5,111,0,0,835,836,5,118,0,0,836,837,5,105,0,0,837,838,5,
+        100,0,0,838,839,5,101,0,0,839,840,5,114,0,0,840,148,1,0,0,0,841,
+        842,5,67,0,0,842,843,5,114,0,0,843,844,5,101,0,0,844,845,5,100,0,
+        0,845,846,5,101,0,0,846,847,5,110,0,0,847,848,5,116,0,0,848,849,
+        5,105,0,0,849,850,5,97,0,0,850,851,5,108,0,0,851,852,5,115,0,0,852,
+        150,1,0,0,0,853,854,5,79,0,0,854,855,5,112,0,0,855,856,5,101,0,0,
+        856,857,5,114,0,0,857,858,5,97,0,0,858,859,5,116,0,0,859,860,5,105,
+        0,0,860,861,5,111,0,0,861,862,5,110,0,0,862,863,5,115,0,0,863,152,
+        1,0,0,0,864,865,5,109,0,0,865,866,5,105,0,0,866,867,5,110,0,0,867,
+        154,1,0,0,0,868,869,5,109,0,0,869,870,5,97,0,0,870,871,5,120,0,0,
+        871,156,1,0,0,0,872,873,5,109,0,0,873,874,5,97,0,0,874,875,5,115,
+        0,0,875,876,5,107,0,0,876,877,5,101,0,0,877,878,5,100,0,0,878,158,
+        1,0,0,0,879,880,5,101,0,0,880,881,5,110,0,0,881,882,5,99,0,0,882,
+        883,5,114,0,0,883,884,5,121,0,0,884,885,5,112,0,0,885,886,5,116,
+        0,0,886,887,5,101,0,0,887,888,5,100,0,0,888,160,1,0,0,0,889,890,
+        5,112,0,0,890,891,5,99,0,0,891,892,5,105,0,0,892,893,5,95,0,0,893,
+        894,5,99,0,0,894,895,5,111,0,0,895,896,5,109,0,0,896,897,5,112,0,
+        0,897,898,5,108,0,0,898,899,5,105,0,0,899,900,5,97,0,0,900,901,5,
+        110,0,0,901,902,5,116,0,0,902,162,1,0,0,0,903,904,5,85,0,0,904,905,
+        5,85,0,0,905,906,5,73,0,0,906,907,5,68,0,0,907,164,1,0,0,0,908,909,
+        5,83,0,0,909,910,5,116,0,0,910,911,5,114,0,0,911,912,5,105,0,0,912,
+        913,5,110,0,0,913,914,5,103,0,0,914,166,1,0,0,0,915,916,5,73,0,0,
+        916,917,5,110,0,0,917,918,5,116,0,0,918,919,5,101,0,0,919,920,5,
+        103,0,0,920,921,5,101,0,0,921,922,5,114,0,0,922,168,1,0,0,0,923,
+        924,5,67,0,0,924,925,5,117,0,0,925,926,5,114,0,0,926,927,5,114,0,
+        0,927,928,5,101,0,0,928,929,5,110,0,0,929,930,5,99,0,0,930,931,5,
+        121,0,0,931,170,1,0,0,0,932,933,5,82,0,0,933,934,5,97,0,0,934,935,
+        5,116,0,0,935,936,5,105,0,0,936,937,5,111,0,0,937,172,1,0,0,0,938,
+        939,5,68,0,0,939,940,5,97,0,0,940,941,5,116,0,0,941,942,5,101,0,
+        0,942,174,1,0,0,0,943,944,5,69,0,0,944,945,5,110,0,0,945,946,5,117,
+        0,0,946,947,5,109,0,0,947,176,1,0,0,0,948,949,5,74,0,0,949,950,5,
+        83,0,0,950,951,5,79,0,0,951,952,5,78,0,0,952,178,1,0,0,0,953,954,
+        5,66,0,0,954,955,5,111,0,0,955,956,5,111,0,0,956,957,5,108,0,0,957,
+        958,5,101,0,0,958,959,5,97,0,0,959,960,5,110,0,0,960,180,1,0,0,0,
+        961,962,5,83,0,0,962,963,5,87,0,0,963,964,5,73,0,0,964,965,5,70,
+        0,0,965,966,5,84,0,0,966,182,1,0,0,0,967,968,5,66,0,0,968,969,5,
+        73,0,0,969,970,5,67,0,0,970,184,1,0,0,0,971,972,5,67,0,0,972,973,
+        5,97,0,0,973,974,5,114,0,0,974,975,5,100,0,0,975,976,5,78,0,0,976,
+        977,5,117,0,0,977,978,5,109,0,0,978,979,5,98,0,0,979,980,5,101,0,
+        0,980,981,5,114,0,0,981,186,1,0,0,0,982,983,5,67,0,0,983,984,5,86,
+        0,0,984,985,5,86,0,0,985,188,1,0,0,0,986,987,5,65,0,0,987,988,5,
+        99,0,0,988,989,5,99,0,0,989,990,5,111,0,0,990,991,5,117,0,0,991,
+        992,5,110,0,0,992,993,5,116,0,0,993,994,5,78,0,0,994,995,5,117,0,
+        0,995,996,5,109,0,0,996,997,5,98,0,0,997,998,5,101,0,0,998,999,5,
+        114,0,0,999,190,1,0,0,0,1000,1001,5,61,0,0,1001,192,1,0,0,0,1002,
+        1003,5,83,0,0,1003,1004,5,87,0,0,1004,1005,5,73,0,0,1005,1006,5,
+        70,0,0,1006,1017,5,84,0,0,1007,1008,5,83,0,0,1008,1009,5,87,0,0,
+        1009,1010,5,73,0,0,1010,1011,5,70,0,0,1011,1012,5,84,0,0,1012,1013,
+        5,95,0,0,1013,1014,5,66,0,0,1014,1015,5,73,0,0,1015,1017,5,67,0,
+        0,1016,1002,1,0,0,0,1016,1007,1,0,0,0,1017,194,1,0,0,0,1018,1019,
+        5,73,0,0,1019,1020,5,66,0,0,1020,1021,5,65,0,0,1021,1022,5,78,0,
+        0,1022,196,1,0,0,0,1023,1024,5,82,0,0,1024,1025,5,84,0,0,1025,1026,
+        5,71,0,0,1026,1054,5,83,0,0,1027,1028,5,82,0,0,1028,1029,5,69,0,
+        0,1029,1030,5,65,0,0,1030,1031,5,76,0,0,1031,1032,5,95,0,0,1032,
+        1033,5,84,0,0,1033,1034,5,73,0,0,1034,1035,5,77,0,0,1035,1036,5,
+        69,0,0,1036,1037,5,95,0,0,1037,1038,5,71,0,0,1038,1039,5,82,0,0,
+        1039,1040,5,79,0,0,1040,1041,5,83,0,0,1041,1042,5,83,0,0,1042,1043,
+        5,95,0,0,1043,1044,5,83,0,0,1044,1045,5,69,0,0,1045,1046,5,84,0,
+        0,1046,1047,5,84,0,0,1047,1048,5,76,0,0,1048,1049,5,69,0,0,1049,
+        1050,5,77,0,0,1050,1051,5,69,0,0,1051,1052,5,78,0,0,1052,1054,5,
+        84,0,0,1053,1023,1,0,0,0,1053,1027,1,0,0,0,1054,198,1,0,0,0,1055,
+        1056,5,65,0,0,1056,1057,5,67,0,0,1057,1083,5,72,0,0,1058,1059,5,
+        65,0,0,1059,1060,5,85,0,0,1060,1061,5,84,0,0,1061,1062,5,79,0,0,
+        1062,1063,5,77,0,0,1063,1064,5,65,0,0,1064,1065,5,84,0,0,1065,1066,
+        5,69,0,0,1066,1067,5,68,0,0,1067,1068,5,95,0,0,1068,1069,5,67,0,
+        0,1069,1070,5,76,0,0,1070,1071,5,69,0,0,1071,1072,5,65,0,0,1072,
+        1073,5,82,0,0,1073,1074,5,73,0,0,1074,1075,5,78,0,0,1075,1076,5,
+        71,0,0,1076,1077,5,95,0,0,1077,1078,5,72,0,0,1078,1079,5,79,0,0,
+        1079,1080,5,85,0,0,1080,1081,5,83,0,0,1081,1083,5,69,0,0,1082,1055,
+        1,0,0,0,1082,1058,1,0,0,0,1083,200,1,0,0,0,1084,1085,5,83,0,0,1085,
+        1086,5,69,0,0,1086,1087,5,80,0,0,1087,1126,5,65,0,0,1088,1089,5,
+        83,0,0,1089,1090,5,69,0,0,1090,1091,5,80,0,0,1091,1092,5,65,0,0,
+        1092,1093,5,95,0,0,1093,1094,5,67,0,0,1094,1095,5,82,0,0,1095,1096,
+        5,69,0,0,1096,1097,5,68,0,0,1097,1098,5,73,0,0,1098,1099,5,84,0,
+        0,1099,1100,5,95,0,0,1100,1101,5,84,0,0,1101,1102,5,82,0,0,1102,
+        1103,5,65,0,0,1103,1104,5,78,0,0,1104,1105,5,83,0,0,1105,1106,5,
+        70,0,0,1106,1107,5,69,0,0,1107,1126,5,82,0,0,1108,1109,5,83,0,0,
+        1109,1110,5,69,0,0,1110,1111,5,80,0,0,1111,1112,5,65,0,0,1112,1113,
+        5,95,0,0,1113,1114,5,68,0,0,1114,1115,5,73,0,0,1115,1116,5,82,0,
+        0,1116,1117,5,69,0,0,1117,1118,5,67,0,0,1118,1119,5,84,0,0,1119,
+        1120,5,95,0,0,1120,1121,5,68,0,0,1121,1122,5,69,0,0,1122,1123,5,
+        66,0,0,1123,1124,5,73,0,0,1124,1126,5,84,0,0,1125,1084,1,0,0,0,1125,
+        1088,1,0,0,0,1125,1108,1,0,0,0,1126,202,1,0,0,0,1127,1128,5,70,0,
+        0,1128,1129,5,69,0,0,1129,1130,5,68,0,0,1130,1131,5,87,0,0,1131,
+        1132,5,73,0,0,1132,1133,5,82,0,0,1133,1134,5,69,0,0,1134,204,1,0,
+        0,0,1135,1136,5,67,0,0,1136,1137,5,72,0,0,1137,1138,5,65,0,0,1138,
+        1139,5,80,0,0,1139,1140,5,83,0,0,1140,206,1,0,0,0,1141,1142,5,84,
+        0,0,1142,1143,5,65,0,0,1143,1144,5,82,0,0,1144,1145,5,71,0,0,1145,
+        1146,5,69,0,0,1146,1147,5,84,0,0,1147,1148,5,50,0,0,1148,208,1,0,
+        0,0,1149,1150,5,67,0,0,1150,1151,5,72,0,0,1151,1152,5,73,0,0,1152,
+        1153,5,80,0,0,1153,1154,5,83,0,0,1154,210,1,0,0,0,1155,1156,5,80,
+        0,0,1156,1157,5,67,0,0,1157,1158,5,73,0,0,1158,1159,5,95,0,0,1159,
+        1160,5,68,0,0,1160,1161,5,83,0,0,1161,1176,5,83,0,0,1162,1163,5,
+        80,0,0,1163,1164,5,67,0,0,1164,1165,5,73,0,0,1165,1166,5,95,0,0,
+        1166,1167,5,67,0,0,1167,1168,5,79,0,0,1168,1169,5,77,0,0,1169,1170,
+        5,80,0,0,1170,1171,5,76,0,0,1171,1172,5,73,0,0,1172,1173,5,65,0,
+        0,1173,1174,5,78,0,0,1174,1176,5,84,0,0,1175,1155,1,0,0,0,1175,1162,
+        1,0,0,0,1176,212,1,0,0,0,1177,1178,5,80,0,0,1178,1179,5,73,0,0,1179,
+        1216,5,73,0,0,1180,1181,5,80,0,0,1181,1182,5,69,0,0,1182,1183,5,
+        82,0,0,1183,1184,5,83,0,0,1184,1185,5,79,0,0,1185,1186,5,78,0,0,
+        1186,1187,5,65,0,0,1187,1188,5,76,0,0,1188,1189,5,76,0,0,1189,1190,
+        5,89,0,0,1190,1191,5,95,0,0,1191,1192,5,73,0,0,1192,1193,5,68,0,
+        0,1193,1194,5,69,0,0,1194,1195,5,78,0,0,1195,1196,5,84,0,0,1196,
+        1197,5,73,0,0,1197,1198,5,70,0,0,1198,1199,5,73,0,0,1199,1200,5,
+        65,0,0,1200,1201,5,66,0,0,1201,1202,5,76,0,0,1202,1203,5,69,0,0,
+        1203,1204,5,95,0,0,1204,1205,5,73,0,0,1205,1206,5,78,0,0,1206,1207,
+        5,70,0,0,1207,1208,5,79,0,0,1208,1209,5,82,0,0,1209,1210,5,77,0,
+        0,1210,1211,5,65,0,0,1211,1212,5,84,0,0,1212,1213,5,73,0,0,1213,
+        1214,5,79,0,0,1214,1216,5,78,0,0,1215,1177,1,0,0,0,1215,1180,1,0,
+        0,0,1216,214,1,0,0,0,1217,1218,5,75,0,0,1218,1219,5,89,0,0,1219,
+        1239,5,67,0,0,1220,1221,5,75,0,0,1221,1222,5,78,0,0,1222,1223,5,
+        79,0,0,1223,1224,5,87,0,0,1224,1225,5,95,0,0,1225,1226,5,89,0,0,
+        1226,1227,5,79,0,0,1227,1228,5,85,0,0,1228,1229,5,82,0,0,1229,1230,
+        5,95,0,0,1230,1231,5,67,0,0,1231,1232,5,85,0,0,1232,1233,5,83,0,
+        0,1233,1234,5,84,0,0,1234,1235,5,79,0,0,1235,1236,5,77,0,0,1236,
+        1237,5,69,0,0,1237,1239,5,82,0,0,1238,1217,1,0,0,0,1238,1220,1,0,
+        0,0,1239,216,1,0,0,0,1240,1241,5,65,0,0,1241,1242,5,77,0,0,1242,
+        1265,5,76,0,0,1243,1244,5,65,0,0,1244,1245,5,78,0,0,1245,1246,5,
+        84,0,0,1246,1247,5,73,0,0,1247,1248,5,95,0,0,1248,1249,5,77,0,0,
+        1249,1250,5,79,0,0,1250,1251,5,78,0,0,1251,1252,5,69,0,0,1252,1253,
+        5,89,0,0,1253,1254,5,95,0,0,1254,1255,5,76,0,0,1255,1256,5,65,0,
+        0,1256,1257,5,85,0,0,1257,1258,5,78,0,0,1258,1259,5,68,0,0,1259,
+        1260,5,69,0,0,1260,1261,5,82,0,0,1261,1262,5,73,0,0,1262,1263,5,
+        78,0,0,1263,1265,5,71,0,0,1264,1240,1,0,0,0,1264,1243,1,0,0,0,1265,
+        218,1,0,0,0,1266,1267,5,67,0,0,1267,1268,5,70,0,0,1268,1297,5,84,
+        0,0,1269,1270,5,67,0,0,1270,1271,5,79,0,0,1271,1272,5,85,0,0,1272,
+        1273,5,78,0,0,1273,1274,5,84,0,0,1274,1275,5,69,0,0,1275,1276,5,
+        82,0,0,1276,1277,5,95,0,0,1277,1278,5,84,0,0,1278,1279,5,69,0,0,
+        1279,1280,5,82,0,0,1280,1281,5,82,0,0,1281,1282,5,79,0,0,1282,1283,
+        5,82,0,0,1283,1284,5,73,0,0,1284,1285,5,83,0,0,1285,1286,5,84,0,
+        0,1286,1287,5,95,0,0,1287,1288,5,70,0,0,1288,1289,5,73,0,0,1289,
+        1290,5,78,0,0,1290,1291,5,65,0,0,1291,1292,5,78,0,0,1292,1293,5,
+        67,0,0,1293,1294,5,73,0,0,1294,1295,5,78,0,0,1295,1297,5,71,0,0,
+        1296,1266,1,0,0,0,1296,1269,1,0,0,0,1297,220,1,0,0,0,1298,1299,5,
+        86,0,0,1299,1300,5,73,0,0,1300,1301,5,83,0,0,1301,1336,5,65,0,0,
+        1302,1303,5,77,0,0,1303,1304,5,65,0,0,1304,1305,5,83,0,0,1305,1306,
+        5,84,0,0,1306,1307,5,69,0,0,1307,1308,5,82,0,0,1308,1309,5,67,0,
+        0,1309,1310,5,65,0,0,1310,1311,5,82,0,0,1311,1336,5,68,0,0,1312,
+        1313,5,65,0,0,1313,1314,5,77,0,0,1314,1315,5,69,0,0,1315,1336,5,
+        88,0,0,1316,1317,5,68,0,0,1317,1318,5,73,0,0,1318,1319,5,83,0,0,
+        1319,1320,5,67,0,0,1320,1321,5,79,0,0,1321,1322,5,86,0,0,1322,1323,
+        5,69,0,0,1323,1336,5,82,0,0,1324,1325,5,74,0,0,1325,1326,5,67,0,
+        0,1326,1336,5,66,0,0,1327,1328,5,85,0,0,1328,1329,5,78,0,0,1329,
+        1330,5,73,0,0,1330,1331,5,79,0,0,1331,1332,5,78,0,0,1332,1333,5,
+        80,0,0,1333,1334,5,65,0,0,1334,1336,5,89,0,0,1335,1298,1,0,0,0,1335,
+        1302,1,0,0,0,1335,1312,1,0,0,0,1335,1316,1,0,0,0,1335,1324,1,0,0,
+        0,1335,1327,1,0,0,0,1336,222,1,0,0,0,1337,1338,5,69,0,0,1338,1339,
+        5,77,0,0,1339,1349,5,86,0,0,1340,1341,5,69,0,0,1341,1342,5,77,0,
+        0,1342,1343,5,86,0,0,1343,1344,5,95,0,0,1344,1345,5,67,0,0,1345,
+        1346,5,72,0,0,1346,1347,5,73,0,0,1347,1349,5,80,0,0,1348,1337,1,
+        0,0,0,1348,1340,1,0,0,0,1349,224,1,0,0,0,1350,1351,5,78,0,0,1351,
+        1352,5,70,0,0,1352,1365,5,67,0,0,1353,1354,5,67,0,0,1354,1355,5,
+        79,0,0,1355,1356,5,78,0,0,1356,1357,5,84,0,0,1357,1358,5,65,0,0,
+        1358,1359,5,67,0,0,1359,1360,5,84,0,0,1360,1361,5,76,0,0,1361,1362,
+        5,69,0,0,1362,1363,5,83,0,0,1363,1365,5,83,0,0,1364,1350,1,0,0,0,
+        1364,1353,1,0,0,0,1365,226,1,0,0,0,1366,1367,5,84,0,0,1367,1368,
+        5,79,0,0,1368,1369,5,75,0,0,1369,1370,5,69,0,0,1370,1371,5,78,0,
+        0,1371,1372,5,73,0,0,1372,1373,5,90,0,0,1373,1374,5,65,0,0,1374,
+        1375,5,84,0,0,1375,1376,5,73,0,0,1376,1377,5,79,0,0,1377,1384,5,
+        78,0,0,1378,1379,5,84,0,0,1379,1380,5,79,0,0,1380,1381,5,75,0,0,
+        1381,1382,5,69,0,0,1382,1384,5,78,0,0,1383,1366,1,0,0,0,1383,1378,
+        1,0,0,0,1384,228,1,0,0,0,1385,1386,5,80,0,0,1386,1387,5,65,0,0,1387,
+        1411,5,78,0,0,1388,1389,5,80,0,0,1389,1390,5,82,0,0,1390,1391,5,
+        73,0,0,1391,1392,5,77,0,0,1392,1393,5,65,0,0,1393,1394,5,82,0,0,
+        1394,1395,5,89,0,0,1395,1396,5,95,0,0,1396,1397,5,65,0,0,1397,1398,
+        5,67,0,0,1398,1399,5,67,0,0,1399,1400,5,79,0,0,1400,1401,5,85,0,
+        0,1401,1402,5,78,0,0,1402,1403,5,84,0,0,1403,1404,5,95,0,0,1404,
+        1405,5,78,0,0,1405,1406,5,85,0,0,1406,1407,5,77,0,0,1407,1408,5,
+        66,0,0,1408,1409,5,69,0,0,1409,1411,5,82,0,0,1410,1385,1,0,0,0,1410,
+        1388,1,0,0,0,1411,230,1,0,0,0,1412,1413,5,67,0,0,1413,1414,5,86,
+        0,0,1414,1427,5,86,0,0,1415,1416,5,67,0,0,1416,1417,5,86,0,0,1417,
+        1418,5,86,0,0,1418,1427,5,50,0,0,1419,1420,5,67,0,0,1420,1421,5,
+        86,0,0,1421,1427,5,67,0,0,1422,1423,5,67,0,0,1423,1424,5,86,0,0,
+        1424,1425,5,67,0,0,1425,1427,5,50,0,0,1426,1412,1,0,0,0,1426,1415,
+        1,0,0,0,1426,1419,1,0,0,0,1426,1422,1,0,0,0,1427,232,1,0,0,0,1428,
+        1429,5,80,0,0,1429,1430,5,69,0,0,1430,1431,5,78,0,0,1431,1432,5,
+        68,0,0,1432,1433,5,73,0,0,1433,1434,5,78,0,0,1434,1479,5,71,0,0,
+        1435,1436,5,65,0,0,1436,1437,5,85,0,0,1437,1438,5,84,0,0,1438,1439,
+        5,72,0,0,1439,1440,5,79,0,0,1440,1441,5,82,0,0,1441,1442,5,73,0,
+        0,1442,1443,5,90,0,0,1443,1444,5,69,0,0,1444,1479,5,68,0,0,1445,
+        1446,5,83,0,0,1446,1447,5,69,0,0,1447,1448,5,84,0,0,1448,1449,5,
+        84,0,0,1449,1450,5,76,0,0,1450,1451,5,69,0,0,1451,1479,5,68,0,0,
+        1452,1453,5,68,0,0,1453,1454,5,69,0,0,1454,1455,5,67,0,0,1455,1456,
+        5,76,0,0,1456,1457,5,73,0,0,1457,1458,5,78,0,0,1458,1459,5,69,0,
+        0,1459,1479,5,68,0,0,1460,1461,5,82,0,0,1461,1462,5,69,0,0,1462,
+        1463,5,86,0,0,1463,1464,5,69,0,0,1464,1465,5,82,0,0,1465,1466,5,
+        83,0,0,1466,1467,5,69,0,0,1467,1479,5,68,0,0,1468,1469,5,67,0,0,
+        1469,1470,5,72,0,0,1470,1471,5,65,0,0,1471,1472,5,82,0,0,1472,1473,
+        5,71,0,0,1473,1474,5,69,0,0,1474,1475,5,66,0,0,1475,1476,5,65,0,
+        0,1476,1477,5,67,0,0,1477,1479,5,75,0,0,1478,1428,1,0,0,0,1478,1435,
+        1,0,0,0,1478,1445,1,0,0,0,1478,1452,1,0,0,0,1478,1460,1,0,0,0,1478,
+        1468,1,0,0,0,1479,234,1,0,0,0,1480,1481,5,67,0,0,1481,1482,5,65,
+        0,0,1482,1483,5,82,0,0,1483,1515,5,68,0,0,1484,1485,5,65,0,0,1485,
+        1486,5,67,0,0,1486,1515,5,72,0,0,1487,1488,5,87,0,0,1488,1489,5,
+        73,0,0,1489,1490,5,82,0,0,1490,1515,5,69,0,0,1491,1492,5,67,0,0,
+        1492,1493,5,72,0,0,1493,1494,5,69,0,0,1494,1495,5,67,0,0,1495,1515,
+        5,75,0,0,1496,1497,5,67,0,0,1497,1498,5,65,0,0,1498,1499,5,83,0,
+        0,1499,1515,5,72,0,0,1500,1501,5,68,0,0,1501,1502,5,73,0,0,1502,
+        1503,5,71,0,0,1503,1504,5,73,0,0,1504,1505,5,84,0,0,1505,1506,5,
+        65,0,0,1506,1507,5,76,0,0,1507,1508,5,95,0,0,1508,1509,5,87,0,0,
+        1509,1510,5,65,0,0,1510,1511,5,76,0,0,1511,1512,5,76,0,0,1512,1513,
+        5,69,0,0,1513,1515,5,84,0,0,1514,1480,1,0,0,0,1514,1484,1,0,0,0,
+        1514,1487,1,0,0,0,1514,1491,1,0,0,0,1514,1496,1,0,0,0,1514,1500,
+        1,0,0,0,1515,236,1,0,0,0,1516,1517,5,65,0,0,1517,1518,5,80,0,0,1518,
+        1542,5,82,0,0,1519,1520,5,65,0,0,1520,1521,5,78,0,0,1521,1522,5,
+        78,0,0,1522,1523,5,85,0,0,1523,1524,5,65,0,0,1524,1525,5,76,0,0,
+        1525,1526,5,95,0,0,1526,1527,5,80,0,0,1527,1528,5,69,0,0,1528,1529,
+        5,82,0,0,1529,1530,5,67,0,0,1530,1531,5,69,0,0,1531,1532,5,78,0,
+        0,1532,1533,5,84,0,0,1533,1534,5,65,0,0,1534,1535,5,71,0,0,1535,
+        1536,5,69,0,0,1536,1537,5,95,0,0,1537,1538,5,82,0,0,1538,1539,5,
+        65,0,0,1539,1540,5,84,0,0,1540,1542,5,69,0,0,1541,1516,1,0,0,0,1541,
+        1519,1,0,0,0,1542,238,1,0,0,0,1543,1544,5,65,0,0,1544,1545,5,80,
+        0,0,1545,1570,5,89,0,0,1546,1547,5,65,0,0,1547,1548,5,78,0,0,1548,
+        1549,5,78,0,0,1549,1550,5,85,0,0,1550,1551,5,65,0,0,1551,1552,5,
+        76,0,0,1552,1553,5,95,0,0,1553,1554,5,80,0,0,1554,1555,5,69,0,0,
+        1555,1556,5,82,0,0,1556,1557,5,67,0,0,1557,1558,5,69,0,0,1558,1559,
+        5,78,0,0,1559,1560,5,84,0,0,1560,1561,5,65,0,0,1561,1562,5,71,0,
+        0,1562,1563,5,69,0,0,1563,1564,5,95,0,0,1564,1565,5,89,0,0,1565,
+        1566,5,73,0,0,1566,1567,5,69,0,0,1567,1568,5,76,0,0,1568,1570,5,
+        68,0,0,1569,1543,1,0,0,0,1569,1546,1,0,0,0,1570,240,1,0,0,0,1571,
+        1572,5,68,0,0,1572,1573,5,84,0,0,1573,1589,5,73,0,0,1574,1575,5,
+        68,0,0,1575,1576,5,69,0,0,1576,1577,5,66,0,0,1577,1578,5,84,0,0,
+        1578,1579,5,95,0,0,1579,1580,5,84,0,0,1580,1581,5,79,0,0,1581,1582,
+        5,95,0,0,1582,1583,5,73,0,0,1583,1584,5,78,0,0,1584,1585,5,67,0,
+        0,1585,1586,5,79,0,0,1586,1587,5,77,0,0,1587,1589,5,69,0,0,1588,
+        1571,1,0,0,0,1588,1574,1,0,0,0,1589,242,1,0,0,0,1590,1591,5,76,0,
+        0,1591,1592,5,84,0,0,1592,1607,5,86,0,0,1593,1594,5,76,0,0,1594,
+        1595,5,79,0,0,1595,1596,5,65,0,0,1596,1597,5,78,0,0,1597,1598,5,
+        95,0,0,1598,1599,5,84,0,0,1599,1600,5,79,0,0,1600,1601,5,95,0,0,
+        1601,1602,5,86,0,0,1602,1603,5,65,0,0,1603,1604,5,76,0,0,1604,1605,
+        5,85,0,0,1605,1607,5,69,0,0,1606,1590,1,0,0,0,1606,1593,1,0,0,0,
+        1607,244,1,0,0,0,1608,1609,5,70,0,0,1609,1610,5,73,0,0,1610,1611,
+        5,67,0,0,1611,1625,5,79,0,0,1612,1613,5,67,0,0,1613,1614,5,82,0,
+        0,1614,1615,5,69,0,0,1615,1616,5,68,0,0,1616,1617,5,73,0,0,1617,
+        1618,5,84,0,0,1618,1619,5,95,0,0,1619,1620,5,83,0,0,1620,1621,5,
+        67,0,0,1621,1622,5,79,0,0,1622,1623,5,82,0,0,1623,1625,5,69,0,0,
+        1624,1608,1,0,0,0,1624,1612,1,0,0,0,1625,246,1,0,0,0,1626,1627,5,
+        66,0,0,1627,1628,5,65,0,0,1628,1629,5,83,0,0,1629,1630,5,69,0,0,
+        1630,1631,5,76,0,0,1631,1632,5,95,0,0,1632,1633,5,73,0,0,1633,1634,
+        5,73,0,0,1634,1642,5,73,0,0,1635,1636,5,66,0,0,1636,1637,5,65,0,
+        0,1637,1638,5,83,0,0,1638,1639,5,69,0,0,1639,1640,5,76,0,0,1640,
+        1642,5,51,0,0,1641,1626,1,0,0,0,1641,1635,1,0,0,0,1642,248,1,0,0,
+        0,1643,1644,5,68,0,0,1644,1645,5,79,0,0,1645,1646,5,68,0,0,1646,
+        1647,5,68,0,0,1647,1648,5,95,0,0,1648,1649,5,70,0,0,1649,1650,5,
+        82,0,0,1650,1651,5,65,0,0,1651,1652,5,78,0,0,1652,1653,5,75,0,0,
+        1653,250,1,0,0,0,1654,1655,5,83,0,0,1655,1656,5,79,0,0,1656,1672,
+        5,88,0,0,1657,1658,5,83,0,0,1658,1659,5,65,0,0,1659,1660,5,82,0,
+        0,1660,1661,5,66,0,0,1661,1662,5,65,0,0,1662,1663,5,78,0,0,1663,
+        1664,5,69,0,0,1664,1665,5,83,0,0,1665,1666,5,95,0,0,1666,1667,5,
+        79,0,0,1667,1668,5,88,0,0,1668,1669,5,76,0,0,1669,1670,5,69,0,0,
+        1670,1672,5,89,0,0,1671,1654,1,0,0,0,1671,1657,1,0,0,0,1672,252,
+        1,0,0,0,1673,1674,5,70,0,0,1674,1675,5,65,0,0,1675,1676,5,84,0,0,
+        1676,1677,5,67,0,0,1677,1678,5,65,0,0,1678,254,1,0,0,0,1679,1680,
+        5,70,0,0,1680,1681,5,66,0,0,1681,1682,5,65,0,0,1682,1683,5,82,0,
+        0,1683,256,1,0,0,0,1684,1685,5,84,0,0,1685,1686,5,43,0,0,1686,1687,
+        5,48,0,0,1687,258,1,0,0,0,1688,1689,5,84,0,0,1689,1690,5,43,0,0,
+        1690,1691,5,49,0,0,1691,260,1,0,0,0,1692,1693,5,84,0,0,1693,1694,
+        5,43,0,0,1694,1695,5,50,0,0,1695,262,1,0,0,0,1696,1697,5,73,0,0,
+        1697,1698,5,83,0,0,1698,1699,5,79,0,0,1699,1700,5,50,0,0,1700,1701,
+        5,48,0,0,1701,1702,5,48,0,0,1702,1703,5,50,0,0,1703,1714,5,50,0,
+        0,1704,1705,5,73,0,0,1705,1706,5,83,0,0,1706,1707,5,79,0,0,1707,
+        1708,5,95,0,0,1708,1709,5,50,0,0,1709,1710,5,48,0,0,1710,1711,5,
+        48,0,0,1711,1712,5,50,0,0,1712,1714,5,50,0,0,1713,1696,1,0,0,0,1713,
+        1704,1,0,0,0,1714,264,1,0,0,0,1715,1716,5,70,0,0,1716,1717,5,73,
+        0,0,1717,1718,5,88,0,0,1718,1719,5,95,0,0,1719,1720,5,80,0,0,1720,
+        1721,5,82,0,0,1721,1722,5,79,0,0,1722,1723,5,84,0,0,1723,1724,5,
+        79,0,0,1724,1725,5,67,0,0,1725,1726,5,79,0,0,1726,1727,5,76,0,0,
+        1727,266,1,0,0,0,1728,1729,5,77,0,0,1729,1730,5,84,0,0,1730,1731,
+        5,49,0,0,1731,1732,5,48,0,0,1732,1752,5,51,0,0,1733,1734,5,77,0,
+        0,1734,1735,5,84,0,0,1735,1736,5,50,0,0,1736,1737,5,48,0,0,1737,
+        1752,5,50,0,0,1738,1739,5,77,0,0,1739,1740,5,84,0,0,1740,1741,5,
+        55,0,0,1741,1742,5,48,0,0,1742,1752,5,48,0,0,1743,1744,5,77,0,0,
+        1744,1745,5,84,0,0,1745,1747,1,0,0,0,1746,1748,7,0,0,0,1747,1746,
+        1,0,0,0,1748,1749,1,0,0,0,1749,1747,1,0,0,0,1749,1750,1,0,0,0,1750,
+        1752,1,0,0,0,1751,1728,1,0,0,0,1751,1733,1,0,0,0,1751,1738,1,0,0,
+        0,1751,1743,1,0,0,0,1752,268,1,0,0,0,1753,1754,5,77,0,0,1754,1766,
+        5,88,0,0,1755,1756,5,77,0,0,1756,1757,5,88,0,0,1757,1758,5,95,0,
+        0,1758,1759,5,77,0,0,1759,1760,5,69,0,0,1760,1761,5,83,0,0,1761,
+        1762,5,83,0,0,1762,1763,5,65,0,0,1763,1764,5,71,0,0,1764,1766,5,
+        69,0,0,1765,1753,1,0,0,0,1765,1755,1,0,0,0,1766,270,1,0,0,0,1767,
+        1771,5,34,0,0,1768,1770,8,1,0,0,1769,1768,1,0,0,0,1770,1773,1,0,
+        0,0,1771,1769,1,0,0,0,1771,1772,1,0,0,0,1772,1774,1,0,0,0,1773,1771,
+        1,0,0,0,1774,1775,5,34,0,0,1775,272,1,0,0,0,1776,1777,3,295,147,
+        0,1777,1778,3,295,147,0,1778,1779,5,45,0,0,1779,1780,3,295,147,0,
+        1780,1781,5,45,0,0,1781,1782,3,295,147,0,1782,1783,5,45,0,0,1783,
+        1784,3,295,147,0,1784,1785,5,45,0,0,1785,1786,3,295,147,0,1786,1787,
+        3,295,147,0,1787,1788,3,295,147,0,1788,274,1,0,0,0,1789,1790,3,297,
+        148,0,1790,1791,3,297,148,0,1791,1792,3,297,148,0,1792,1793,3,297,
+        148,0,1793,1794,5,45,0,0,1794,1795,3,297,148,0,1795,1796,3,297,148,
+        0,1796,1797,5,45,0,0,1797,1798,3,297,148,0,1798,1799,3,297,148,0,
+        1799,276,1,0,0,0,1800,1802,7,0,0,0,1801,1800,1,0,0,0,1802,1803,1,
+        0,0,0,1803,1801,1,0,0,0,1803,1804,1,0,0,0,1804,1811,1,0,0,0,1805,
+        1807,5,46,0,0,1806,1808,7,0,0,0,1807,1806,1,0,0,0,1808,1809,1,0,
+        0,0,1809,1807,1,0,0,0,1809,1810,1,0,0,0,1810,1812,1,0,0,0,1811,1805,
+        1,0,0,0,1811,1812,1,0,0,0,1812,278,1,0,0,0,1813,1814,5,116,0,0,1814,
+        1815,5,114,0,0,1815,1816,5,117,0,0,1816,1823,5,101,0,0,1817,1818,
+        5,102,0,0,1818,1819,5,97,0,0,1819,1820,5,108,0,0,1820,1821,5,115,
+        0,0,1821,1823,5,101,0,0,1822,1813,1,0,0,0,1822,1817,1,0,0,0,1823,
+        280,1,0,0,0,1824,1828,7,2,0,0,1825,1827,7,3,0,0,1826,1825,1,0,0,
+        0,1827,1830,1,0,0,0,1828,1826,1,0,0,0,1828,1829,1,0,0,0,1829,282,
+        1,0,0,0,1830,1828,1,0,0,0,1831,1833,5,13,0,0,1832,1831,1,0,0,0,1832,
+        1833,1,0,0,0,1833,1834,1,0,0,0,1834,1836,5,10,0,0,1835,1832,1,0,
+        0,0,1836,1837,1,0,0,0,1837,1835,1,0,0,0,1837,1838,1,0,0,0,1838,284,
+        1,0,0,0,1839,1841,7,4,0,0,1840,1839,1,0,0,0,1841,1842,1,0,0,0,1842,
+        1840,1,0,0,0,1842,1843,1,0,0,0,1843,1844,1,0,0,0,1844,1845,6,142,
+        0,0,1845,286,1,0,0,0,1846,1847,5,47,0,0,1847,1848,5,47,0,0,1848,
+        1852,1,0,0,0,1849,1851,8,5,0,0,1850,1849,1,0,0,0,1851,1854,1,0,0,
+        0,1852,1850,1,0,0,0,1852,1853,1,0,0,0,1853,1855,1,0,0,0,1854,1852,
+        1,0,0,0,1855,1856,6,143,0,0,1856,288,1,0,0,0,1857,1858,5,47,0,0,
+        1858,1859,5,42,0,0,1859,1863,1,0,0,0,1860,1862,9,0,0,0,1861,1860,
+        1,0,0,0,1862,1865,1,0,0,0,1863,1864,1,0,0,0,1863,1861,1,0,0,0,1864,
+        1866,1,0,0,0,1865,1863,1,0,0,0,1866,1867,5,42,0,0,1867,1868,5,47,
+        0,0,1868,1869,1,0,0,0,1869,1870,6,144,0,0,1870,290,1,0,0,0,1871,
+        1875,5,35,0,0,1872,1874,8,5,0,0,1873,1872,1,0,0,0,1874,1877,1,0,
+        0,0,1875,1873,1,0,0,0,1875,1876,1,0,0,0,1876,1878,1,0,0,0,1877,1875,
+        1,0,0,0,1878,1879,6,145,0,0,1879,292,1,0,0,0,1880,1881,9,0,0,0,1881,
+        294,1,0,0,0,1882,1883,7,6,0,0,1883,1884,7,6,0,0,1884,1885,7,6,0,
+        0,1885,1886,7,6,0,0,1886,296,1,0,0,0,1887,1888,7,0,0,0,1888,298,
+        1,0,0,0,41,0,1016,1053,1082,1125,1175,1215,1238,1264,1296,1335,1348,
+        1364,1383,1410,1426,1478,1514,1541,1569,1588,1606,1624,1641,1671,
+        1713,1749,1751,1765,1771,1803,1809,1811,1822,1828,1832,1837,1842,
+        1852,1863,1875,1,6,0,0
     ]
 
 class Banking_v0_85Lexer(Lexer):
@@ -800,80 +821,86 @@ class Banking_v0_85Lexer(Lexer):
     T__88 = 89
     T__89 = 90
     T__90 = 91
-    SWIFT_CODE = 92
-    IBAN_CODE = 93
-    RTGS = 94
-    ACH = 95
-    SEPA = 96
-    FEDWIRE = 97
-    CHAPS = 98
-    TARGET2 = 99
-    CHIPS = 100
-    PCI_DSS = 101
-    PII = 102
-    KYC = 103
-    AML = 104
-    CFT = 105
-    CARD_NETWORK = 106
-    EMV = 107
-    NFC = 108
-    TOKENIZATION = 109
-    PAN = 110
-    CVV_KEYWORD = 111
-    TRANSACTION_STATUS = 112
-    PAYMENT_METHOD = 113
-    APR = 114
-    APY = 115
-    DTI = 116
-    LTV = 117
-    FICO = 118
-    BASEL_III = 119
-    DODD_FRANK = 120
-    SOX = 121
-    FATCA = 122
-    FBAR = 123
-    T_PLUS_ZERO = 124
-    T_PLUS_ONE = 125
-    T_PLUS_TWO = 126
-    ISO20022 = 127
-    FIX = 128
-    MT = 129
-    MX = 130
-    STRING = 131
-    TEXT = 132
-    ENUM = 133
-    UUID = 134
-    DATE = 135
-    NUMBER = 136
-    BOOLEAN = 137
-    IDENTIFIER = 138
-    NL = 139
-    WS = 140
-    LINE_COMMENT = 141
-    BLOCK_COMMENT = 142
+    T__91 = 92
+    T__92 = 93
+    T__93 = 94
+    T__94 = 95
+    T__95 = 96
+    SWIFT_CODE = 97
+    IBAN_CODE = 98
+    RTGS = 99
+    ACH = 100
+    SEPA = 101
+    FEDWIRE = 102
+    CHAPS = 103
+    TARGET2 = 104
+    CHIPS = 105
+    PCI_DSS = 106
+    PII = 107
+    KYC = 108
+    AML = 109
+    CFT = 110
+    CARD_NETWORK = 111
+    EMV = 112
+    NFC = 113
+    TOKENIZATION = 114
+    PAN = 115
+    CVV_KEYWORD = 116
+    TRANSACTION_STATUS = 117
+    PAYMENT_METHOD = 118
+    APR = 119
+    APY = 120
+    DTI = 121
+    LTV = 122
+    FICO = 123
+    BASEL_III = 124
+    DODD_FRANK = 125
+    SOX = 126
+    FATCA = 127
+    FBAR = 128
+    T_PLUS_ZERO = 129
+    T_PLUS_ONE = 130
+    T_PLUS_TWO = 131
+    ISO20022 = 132
+    FIX = 133
+    MT = 134
+    MX = 135
+    STRING = 136
+    UUID = 137
+    DATE = 138
+    NUMBER = 139
+    BOOLEAN = 140
+    IDENTIFIER = 141
+    NL = 142
+    WS = 143
+    LINE_COMMENT = 144
+    BLOCK_COMMENT = 145
+    HASH_COMMENT = 146
+    ANY = 147
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'Metadata'", "':'", "'DataObject'", "'{'", "'Schema'", "'Policies'", 
-            "'Resources'", "'erMap'", "'}'", "','", "'-'", "'Input'", "'Output'", 
-            "'Channel'", "'Protocol'", "'Endpoint'", "'Auth'", "'Format'", 
-            "'SLA'", "'Entity'", "'dataRef'", "'Properties'", "'Rules'", 
-            "'type'", "'required'", "'unique'", "'default'", "'values'", 
-            "'['", "']'", "'ITAsset'", "'Kind'", "'Application'", "'System'", 
+            "'Import'", "':'", "'Metadata'", "'DataObject'", "'{'", "'Schema'", 
+            "'Policies'", "'Resources'", "'erMap'", "'}'", "','", "'-'", 
+            "'Input'", "'Output'", "'Channel'", "'Protocol'", "'Endpoint'", 
+            "'Auth'", "'Format'", "'|'", "'SLA'", "'Entity'", "'dataRef'", 
+            "'Properties'", "'Rules'", "'type'", "'required'", "'unique'", 
+            "'default'", "'values'", "'['", "']'", "'range'", "'calculated'", 
+            "'Relationship'", "'ITAsset'", "'Kind'", "'Application'", "'System'", 
             "'Platform'", "'Attributes'", "'Relationships'", "'('", "')'", 
-            "'Type'", "'Relationship'", "'From'", "'To'", "'Process'", "'Description'", 
-            "'ObjectiveID'", "'BusinessGoalID'", "'Actors'", "'Starts With'", 
-            "'Ends With'", "'Step'", "'Inputs'", "'Validation'", "'Condition'", 
+            "'Type'", "'From'", "'To'", "'Process'", "'Starts With'", "'Ends With'", 
+            "'Description'", "'ObjectiveID'", "'BusinessGoalID'", "'Actors'", 
+            "'Capabilities'", "'Step'", "'Inputs'", "'Validation'", "'Condition'", 
             "'Actions'", "'ErrorHandling'", "'.'", "'Partial'", "'<'", "'>'", 
             "'Event'", "'Rule'", "'Trigger'", "'Conditions'", "'Report'", 
             "'Query'", "'Schedule'", "'Integration'", "'Provider'", "'Credentials'", 
-            "'Operations'", "'UUID'", "'String'", "'Integer'", "'Currency'", 
+            "'Operations'", "'min'", "'max'", "'masked'", "'encrypted'", 
+            "'pci_compliant'", "'UUID'", "'String'", "'Integer'", "'Currency'", 
             "'Ratio'", "'Date'", "'Enum'", "'JSON'", "'Boolean'", "'SWIFT'", 
-            "'BIC'", "'CardNumber'", "'CVV'", "'AccountNumber'", "'min'", 
-            "'='", "'max'", "'masked'", "'encrypted'", "'pci_compliant'", 
+            "'BIC'", "'CardNumber'", "'CVV'", "'AccountNumber'", "'='", 
             "'IBAN'", "'FEDWIRE'", "'CHAPS'", "'TARGET2'", "'CHIPS'", "'DODD_FRANK'", 
             "'FATCA'", "'FBAR'", "'T+0'", "'T+1'", "'T+2'", "'FIX_PROTOCOL'" ]
 
@@ -884,9 +911,9 @@ class Banking_v0_85Lexer(Lexer):
             "CVV_KEYWORD", "TRANSACTION_STATUS", "PAYMENT_METHOD", "APR", 
             "APY", "DTI", "LTV", "FICO", "BASEL_III", "DODD_FRANK", "SOX", 
             "FATCA", "FBAR", "T_PLUS_ZERO", "T_PLUS_ONE", "T_PLUS_TWO", 
-            "ISO20022", "FIX", "MT", "MX", "STRING", "TEXT", "ENUM", "UUID", 
-            "DATE", "NUMBER", "BOOLEAN", "IDENTIFIER", "NL", "WS", "LINE_COMMENT", 
-            "BLOCK_COMMENT" ]
+            "ISO20022", "FIX", "MT", "MX", "STRING", "UUID", "DATE", "NUMBER", 
+            "BOOLEAN", "IDENTIFIER", "NL", "WS", "LINE_COMMENT", "BLOCK_COMMENT", 
+            "HASH_COMMENT", "ANY" ]
 
     ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
                   "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
@@ -902,72 +929,25 @@ class Banking_v0_85Lexer(Lexer):
                   "T__68", "T__69", "T__70", "T__71", "T__72", "T__73", 
                   "T__74", "T__75", "T__76", "T__77", "T__78", "T__79", 
                   "T__80", "T__81", "T__82", "T__83", "T__84", "T__85", 
-                  "T__86", "T__87", "T__88", "T__89", "T__90", "SWIFT_CODE", 
-                  "IBAN_CODE", "RTGS", "ACH", "SEPA", "FEDWIRE", "CHAPS", 
-                  "TARGET2", "CHIPS", "PCI_DSS", "PII", "KYC", "AML", "CFT", 
-                  "CARD_NETWORK", "EMV", "NFC", "TOKENIZATION", "PAN", "CVV_KEYWORD", 
-                  "TRANSACTION_STATUS", "PAYMENT_METHOD", "APR", "APY", 
-                  "DTI", "LTV", "FICO", "BASEL_III", "DODD_FRANK", "SOX", 
-                  "FATCA", "FBAR", "T_PLUS_ZERO", "T_PLUS_ONE", "T_PLUS_TWO", 
-                  "ISO20022", "FIX", "MT", "MX", "STRING", "TEXT", "ENUM", 
-                  "UUID", "DATE", "NUMBER", "BOOLEAN", "IDENTIFIER", "NL", 
-                  "WS", "LINE_COMMENT", "BLOCK_COMMENT" ]
+                  "T__86", "T__87", "T__88", "T__89", "T__90", "T__91", 
+                  "T__92", "T__93", "T__94", "T__95", "SWIFT_CODE", "IBAN_CODE", 
+                  "RTGS", "ACH", "SEPA", "FEDWIRE", "CHAPS", "TARGET2", 
+                  "CHIPS", "PCI_DSS", "PII", "KYC", "AML", "CFT", "CARD_NETWORK", 
+                  "EMV", "NFC", "TOKENIZATION", "PAN", "CVV_KEYWORD", "TRANSACTION_STATUS", 
+                  "PAYMENT_METHOD", "APR", "APY", "DTI", "LTV", "FICO", 
+                  "BASEL_III", "DODD_FRANK", "SOX", "FATCA", "FBAR", "T_PLUS_ZERO", 
+                  "T_PLUS_ONE", "T_PLUS_TWO", "ISO20022", "FIX", "MT", "MX", 
+                  "STRING", "UUID", "DATE", "NUMBER", "BOOLEAN", "IDENTIFIER", 
+                  "NL", "WS", "LINE_COMMENT", "BLOCK_COMMENT", "HASH_COMMENT", 
+                  "ANY", "HEX4", "DIGIT" ]
 
     grammarFileName = "Banking_v0_85.g4"
 
     def __init__(self, input=None, output:TextIO = sys.stdout):
         super().__init__(input, output)
-        self.checkVersion("4.13.1")
+        self.checkVersion("4.13.2")
         self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
         self._actions = None
         self._predicates = None
 
 
-    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
-        if self._actions is None:
-            actions = dict()
-            actions[133] = self.UUID_action 
-            actions[134] = self.DATE_action 
-            self._actions = actions
-        action = self._actions.get(ruleIndex, None)
-        if action is not None:
-            action(localctx, actionIndex)
-        else:
-            raise Exception("No registered action for:" + str(ruleIndex))
-
-
-    def UUID_action(self, localctx:RuleContext , actionIndex:int):
-        if actionIndex == 0:
-            8
-     
-
-        if actionIndex == 1:
-            4
-     
-
-        if actionIndex == 2:
-            4
-     
-
-        if actionIndex == 3:
-            4
-     
-
-        if actionIndex == 4:
-            12
-     
-
-    def DATE_action(self, localctx:RuleContext , actionIndex:int):
-        if actionIndex == 5:
-            4
-     
-
-        if actionIndex == 6:
-            2
-     
-
-        if actionIndex == 7:
-            2
-     
-
-
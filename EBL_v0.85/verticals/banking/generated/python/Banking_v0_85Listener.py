@@ -1,4 +1,4 @@
-# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.1
+# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.2
 from antlr4 import *
 if "." in __name__:
     from .Banking_v0_85Parser import Banking_v0_85Parser
@@ -17,6 +17,15 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#importDirective.
+    def enterImportDirective(self, ctx:Banking_v0_85Parser.ImportDirectiveContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#importDirective.
+    def exitImportDirective(self, ctx:Banking_v0_85Parser.ImportDirectiveContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#metadata.
     def enterMetadata(self, ctx:Banking_v0_85Parser.MetadataContext):
         pass
@@ -116,6 +125,15 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#expression.
+    def enterExpression(self, ctx:Banking_v0_85Parser.ExpressionContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#expression.
+    def exitExpression(self, ctx:Banking_v0_85Parser.ExpressionContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#ruleStatement.
     def enterRuleStatement(self, ctx:Banking_v0_85Parser.RuleStatementContext):
         pass
@@ -170,6 +188,15 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#processField.
+    def enterProcessField(self, ctx:Banking_v0_85Parser.ProcessFieldContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#processField.
+    def exitProcessField(self, ctx:Banking_v0_85Parser.ProcessFieldContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#step.
     def enterStep(self, ctx:Banking_v0_85Parser.StepContext):
         pass
@@ -179,6 +206,15 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#stepSection.
+    def enterStepSection(self, ctx:Banking_v0_85Parser.StepSectionContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#stepSection.
+    def exitStepSection(self, ctx:Banking_v0_85Parser.StepSectionContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#inputItem.
     def enterInputItem(self, ctx:Banking_v0_85Parser.InputItemContext):
         pass
@@ -260,6 +296,15 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#queryLine.
+    def enterQueryLine(self, ctx:Banking_v0_85Parser.QueryLineContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#queryLine.
+    def exitQueryLine(self, ctx:Banking_v0_85Parser.QueryLineContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#integration.
     def enterIntegration(self, ctx:Banking_v0_85Parser.IntegrationContext):
         pass
@@ -278,6 +323,42 @@ class Banking_v0_85Listener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by Banking_v0_85Parser#text.
+    def enterText(self, ctx:Banking_v0_85Parser.TextContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#text.
+    def exitText(self, ctx:Banking_v0_85Parser.TextContext):
+        pass
+
+
+    # Enter a parse tree produced by Banking_v0_85Parser#braced.
+    def enterBraced(self, ctx:Banking_v0_85Parser.BracedContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#braced.
+    def exitBraced(self, ctx:Banking_v0_85Parser.BracedContext):
+        pass
+
+
+    # Enter a parse tree produced by Banking_v0_85Parser#code.
+    def enterCode(self, ctx:Banking_v0_85Parser.CodeContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#code.
+    def exitCode(self, ctx:Banking_v0_85Parser.CodeContext):
+        pass
+
+
+    # Enter a parse tree produced by Banking_v0_85Parser#identifier.
+    def enterIdentifier(self, ctx:Banking_v0_85Parser.IdentifierContext):
+        pass
+
+    # Exit a parse tree produced by Banking_v0_85Parser#identifier.
+    def exitIdentifier(self, ctx:Banking_v0_85Parser.IdentifierContext):
+        pass
+
+
     # Enter a parse tree produced by Banking_v0_85Parser#type.
     def enterType(self, ctx:Banking_v0_85Parser.TypeContext):
         pass
@@ -1,4 +1,4 @@
-# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.1
+# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.2
 # encoding: utf-8
 from antlr4 import *
 from io import StringIO
@@ -10,353 +10,517 @@ else:
 
 def serializedATN():
     return [
-        4,1,142,914,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,147,1251,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
-        26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,1,
-        0,1,0,4,0,69,8,0,11,0,12,0,70,1,0,4,0,74,8,0,11,0,12,0,75,1,0,1,
-        0,1,0,1,0,1,0,1,0,5,0,84,8,0,10,0,12,0,87,9,0,1,0,1,0,1,1,1,1,1,
-        1,4,1,94,8,1,11,1,12,1,95,1,1,1,1,4,1,100,8,1,11,1,12,1,101,5,1,
-        104,8,1,10,1,12,1,107,9,1,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,4,3,117,
-        8,3,11,3,12,3,118,1,3,1,3,1,3,4,3,124,8,3,11,3,12,3,125,1,3,4,3,
-        129,8,3,11,3,12,3,130,1,3,1,3,1,3,4,3,136,8,3,11,3,12,3,137,1,3,
-        4,3,141,8,3,11,3,12,3,142,1,3,1,3,1,3,4,3,148,8,3,11,3,12,3,149,
-        1,3,1,3,1,3,1,3,1,3,4,3,157,8,3,11,3,12,3,158,1,3,1,3,1,4,1,4,1,
-        4,1,4,1,4,5,4,168,8,4,10,4,12,4,171,9,4,1,4,4,4,174,8,4,11,4,12,
-        4,175,1,5,1,5,1,5,4,5,181,8,5,11,5,12,5,182,1,6,1,6,1,6,1,6,4,6,
-        189,8,6,11,6,12,6,190,1,6,1,6,1,6,1,6,4,6,197,8,6,11,6,12,6,198,
-        1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,
-        1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,4,8,231,
-        8,8,11,8,12,8,232,1,8,1,8,1,8,1,8,4,8,239,8,8,11,8,12,8,240,1,8,
-        1,8,1,8,4,8,246,8,8,11,8,12,8,247,1,8,4,8,251,8,8,11,8,12,8,252,
-        1,8,1,8,1,8,4,8,258,8,8,11,8,12,8,259,1,8,4,8,263,8,8,11,8,12,8,
-        264,3,8,267,8,8,1,8,1,8,1,8,1,8,4,8,273,8,8,11,8,12,8,274,1,8,1,
-        8,1,9,1,9,1,9,1,9,4,9,283,8,9,11,9,12,9,284,1,10,1,10,1,10,1,10,
-        1,10,1,10,5,10,293,8,10,10,10,12,10,296,9,10,1,10,1,10,1,11,1,11,
-        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,
-        5,11,315,8,11,10,11,12,11,318,9,11,1,11,1,11,3,11,322,8,11,1,12,
-        1,12,1,12,4,12,327,8,12,11,12,12,12,328,1,13,1,13,1,13,1,13,4,13,
-        335,8,13,11,13,12,13,336,1,13,1,13,1,13,1,13,4,13,343,8,13,11,13,
-        12,13,344,1,13,1,13,1,13,4,13,350,8,13,11,13,12,13,351,1,13,4,13,
-        355,8,13,11,13,12,13,356,1,13,1,13,1,13,4,13,362,8,13,11,13,12,13,
-        363,1,13,4,13,367,8,13,11,13,12,13,368,3,13,371,8,13,1,13,1,13,1,
-        13,1,13,4,13,377,8,13,11,13,12,13,378,3,13,381,8,13,1,13,1,13,1,
-        14,1,14,1,14,1,14,4,14,389,8,14,11,14,12,14,390,1,15,1,15,1,15,1,
-        15,1,15,1,15,3,15,399,8,15,1,15,1,15,1,15,1,15,1,15,4,15,406,8,15,
-        11,15,12,15,407,1,16,1,16,1,16,1,16,4,16,414,8,16,11,16,12,16,415,
-        1,16,1,16,1,16,1,16,4,16,422,8,16,11,16,12,16,423,1,16,1,16,1,16,
-        1,16,4,16,430,8,16,11,16,12,16,431,1,16,1,16,1,16,1,16,4,16,438,
-        8,16,11,16,12,16,439,1,16,1,16,1,16,4,16,445,8,16,11,16,12,16,446,
-        1,16,4,16,450,8,16,11,16,12,16,451,3,16,454,8,16,1,16,1,16,1,16,
-        1,16,4,16,460,8,16,11,16,12,16,461,3,16,464,8,16,1,16,1,16,1,17,
-        1,17,1,17,1,17,4,17,472,8,17,11,17,12,17,473,1,17,1,17,1,17,1,17,
-        4,17,480,8,17,11,17,12,17,481,1,17,1,17,1,17,1,17,4,17,488,8,17,
-        11,17,12,17,489,1,17,1,17,1,17,1,17,4,17,496,8,17,11,17,12,17,497,
-        1,17,1,17,1,17,1,17,1,17,1,17,5,17,506,8,17,10,17,12,17,509,9,17,
-        1,17,1,17,4,17,513,8,17,11,17,12,17,514,1,17,1,17,1,17,1,17,4,17,
-        521,8,17,11,17,12,17,522,1,17,1,17,1,17,1,17,4,17,529,8,17,11,17,
-        12,17,530,1,17,4,17,534,8,17,11,17,12,17,535,1,17,1,17,1,17,1,17,
-        4,17,542,8,17,11,17,12,17,543,1,17,1,17,1,18,1,18,1,18,1,18,4,18,
-        552,8,18,11,18,12,18,553,1,18,1,18,1,18,4,18,559,8,18,11,18,12,18,
-        560,1,18,4,18,564,8,18,11,18,12,18,565,3,18,568,8,18,1,18,1,18,1,
-        18,4,18,573,8,18,11,18,12,18,574,1,18,4,18,578,8,18,11,18,12,18,
-        579,3,18,582,8,18,1,18,1,18,1,18,1,18,4,18,588,8,18,11,18,12,18,
-        589,3,18,592,8,18,1,18,1,18,1,18,4,18,597,8,18,11,18,12,18,598,1,
-        18,4,18,602,8,18,11,18,12,18,603,3,18,606,8,18,1,18,1,18,1,18,4,
-        18,611,8,18,11,18,12,18,612,1,18,4,18,616,8,18,11,18,12,18,617,3,
-        18,620,8,18,1,18,1,18,1,18,1,18,4,18,626,8,18,11,18,12,18,627,3,
-        18,630,8,18,1,18,1,18,1,19,1,19,1,19,1,19,5,19,638,8,19,10,19,12,
-        19,641,9,19,1,19,4,19,644,8,19,11,19,12,19,645,1,20,1,20,1,20,4,
-        20,651,8,20,11,20,12,20,652,1,21,1,21,1,21,4,21,658,8,21,11,21,12,
-        21,659,1,22,1,22,1,22,4,22,665,8,22,11,22,12,22,666,1,23,1,23,1,
-        23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,3,
-        24,684,8,24,1,25,1,25,1,25,1,25,1,25,1,25,5,25,692,8,25,10,25,12,
-        25,695,9,25,3,25,697,8,25,1,25,1,25,1,26,1,26,1,26,1,26,4,26,705,
-        8,26,11,26,12,26,706,1,26,1,26,1,26,1,26,4,26,713,8,26,11,26,12,
-        26,714,1,26,1,26,1,26,1,26,4,26,721,8,26,11,26,12,26,722,1,26,1,
-        26,1,26,4,26,728,8,26,11,26,12,26,729,1,26,1,26,4,26,734,8,26,11,
-        26,12,26,735,5,26,738,8,26,10,26,12,26,741,9,26,1,26,1,26,1,26,4,
-        26,746,8,26,11,26,12,26,747,1,26,4,26,751,8,26,11,26,12,26,752,1,
-        26,1,26,1,26,1,26,4,26,759,8,26,11,26,12,26,760,1,26,1,26,1,27,1,
-        27,1,27,1,27,4,27,769,8,27,11,27,12,27,770,1,27,1,27,1,27,1,27,4,
-        27,777,8,27,11,27,12,27,778,1,27,1,27,1,27,1,27,4,27,785,8,27,11,
-        27,12,27,786,1,27,1,27,1,27,1,27,4,27,793,8,27,11,27,12,27,794,1,
-        27,1,27,1,27,1,27,4,27,801,8,27,11,27,12,27,802,1,27,1,27,1,28,1,
-        28,1,28,1,28,4,28,811,8,28,11,28,12,28,812,1,28,1,28,1,28,1,28,4,
-        28,819,8,28,11,28,12,28,820,1,28,1,28,1,28,1,28,4,28,827,8,28,11,
-        28,12,28,828,1,28,1,28,1,28,4,28,834,8,28,11,28,12,28,835,1,28,4,
-        28,839,8,28,11,28,12,28,840,1,28,1,28,1,28,4,28,846,8,28,11,28,12,
-        28,847,1,28,4,28,851,8,28,11,28,12,28,852,1,28,1,28,1,28,1,28,4,
-        28,859,8,28,11,28,12,28,860,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,
-        29,5,29,871,8,29,10,29,12,29,874,9,29,3,29,876,8,29,1,29,1,29,4,
-        29,880,8,29,11,29,12,29,881,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,
-        31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,5,31,900,8,31,10,31,12,
-        31,903,9,31,1,31,1,31,1,31,1,31,1,31,3,31,910,8,31,1,32,1,32,1,32,
-        0,0,33,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
-        42,44,46,48,50,52,54,56,58,60,62,64,0,3,1,0,33,35,2,0,72,85,93,93,
-        2,0,131,131,133,137,1008,0,66,1,0,0,0,2,90,1,0,0,0,4,108,1,0,0,0,
-        6,112,1,0,0,0,8,162,1,0,0,0,10,177,1,0,0,0,12,184,1,0,0,0,14,200,
-        1,0,0,0,16,226,1,0,0,0,18,278,1,0,0,0,20,286,1,0,0,0,22,321,1,0,
-        0,0,24,323,1,0,0,0,26,330,1,0,0,0,28,384,1,0,0,0,30,392,1,0,0,0,
-        32,409,1,0,0,0,34,467,1,0,0,0,36,547,1,0,0,0,38,633,1,0,0,0,40,647,
-        1,0,0,0,42,654,1,0,0,0,44,661,1,0,0,0,46,668,1,0,0,0,48,683,1,0,
-        0,0,50,685,1,0,0,0,52,700,1,0,0,0,54,764,1,0,0,0,56,806,1,0,0,0,
-        58,864,1,0,0,0,60,883,1,0,0,0,62,909,1,0,0,0,64,911,1,0,0,0,66,68,
-        3,2,1,0,67,69,3,6,3,0,68,67,1,0,0,0,69,70,1,0,0,0,70,68,1,0,0,0,
-        70,71,1,0,0,0,71,73,1,0,0,0,72,74,3,16,8,0,73,72,1,0,0,0,74,75,1,
-        0,0,0,75,73,1,0,0,0,75,76,1,0,0,0,76,85,1,0,0,0,77,84,3,26,13,0,
-        78,84,3,34,17,0,79,84,3,52,26,0,80,84,3,32,16,0,81,84,3,54,27,0,
-        82,84,3,56,28,0,83,77,1,0,0,0,83,78,1,0,0,0,83,79,1,0,0,0,83,80,
-        1,0,0,0,83,81,1,0,0,0,83,82,1,0,0,0,84,87,1,0,0,0,85,83,1,0,0,0,
-        85,86,1,0,0,0,86,88,1,0,0,0,87,85,1,0,0,0,88,89,5,0,0,1,89,1,1,0,
-        0,0,90,91,5,1,0,0,91,93,5,2,0,0,92,94,5,139,0,0,93,92,1,0,0,0,94,
-        95,1,0,0,0,95,93,1,0,0,0,95,96,1,0,0,0,96,105,1,0,0,0,97,99,3,4,
-        2,0,98,100,5,139,0,0,99,98,1,0,0,0,100,101,1,0,0,0,101,99,1,0,0,
-        0,101,102,1,0,0,0,102,104,1,0,0,0,103,97,1,0,0,0,104,107,1,0,0,0,
-        105,103,1,0,0,0,105,106,1,0,0,0,106,3,1,0,0,0,107,105,1,0,0,0,108,
-        109,5,138,0,0,109,110,5,2,0,0,110,111,3,64,32,0,111,5,1,0,0,0,112,
-        113,5,3,0,0,113,114,5,138,0,0,114,116,5,4,0,0,115,117,5,139,0,0,
-        116,115,1,0,0,0,117,118,1,0,0,0,118,116,1,0,0,0,118,119,1,0,0,0,
-        119,120,1,0,0,0,120,121,5,5,0,0,121,123,5,2,0,0,122,124,5,139,0,
-        0,123,122,1,0,0,0,124,125,1,0,0,0,125,123,1,0,0,0,125,126,1,0,0,
-        0,126,128,1,0,0,0,127,129,3,8,4,0,128,127,1,0,0,0,129,130,1,0,0,
-        0,130,128,1,0,0,0,130,131,1,0,0,0,131,132,1,0,0,0,132,133,5,6,0,
-        0,133,135,5,2,0,0,134,136,5,139,0,0,135,134,1,0,0,0,136,137,1,0,
-        0,0,137,135,1,0,0,0,137,138,1,0,0,0,138,140,1,0,0,0,139,141,3,10,
-        5,0,140,139,1,0,0,0,141,142,1,0,0,0,142,140,1,0,0,0,142,143,1,0,
-        0,0,143,144,1,0,0,0,144,145,5,7,0,0,145,147,5,2,0,0,146,148,5,139,
-        0,0,147,146,1,0,0,0,148,149,1,0,0,0,149,147,1,0,0,0,149,150,1,0,
-        0,0,150,151,1,0,0,0,151,152,3,12,6,0,152,153,5,8,0,0,153,154,5,2,
-        0,0,154,156,5,138,0,0,155,157,5,139,0,0,156,155,1,0,0,0,157,158,
-        1,0,0,0,158,156,1,0,0,0,158,159,1,0,0,0,159,160,1,0,0,0,160,161,
-        5,9,0,0,161,7,1,0,0,0,162,163,5,138,0,0,163,164,5,2,0,0,164,169,
-        3,60,30,0,165,166,5,10,0,0,166,168,3,62,31,0,167,165,1,0,0,0,168,
-        171,1,0,0,0,169,167,1,0,0,0,169,170,1,0,0,0,170,173,1,0,0,0,171,
-        169,1,0,0,0,172,174,5,139,0,0,173,172,1,0,0,0,174,175,1,0,0,0,175,
-        173,1,0,0,0,175,176,1,0,0,0,176,9,1,0,0,0,177,178,5,11,0,0,178,180,
-        5,132,0,0,179,181,5,139,0,0,180,179,1,0,0,0,181,182,1,0,0,0,182,
-        180,1,0,0,0,182,183,1,0,0,0,183,11,1,0,0,0,184,185,5,12,0,0,185,
-        186,5,2,0,0,186,188,3,14,7,0,187,189,5,139,0,0,188,187,1,0,0,0,189,
-        190,1,0,0,0,190,188,1,0,0,0,190,191,1,0,0,0,191,192,1,0,0,0,192,
-        193,5,13,0,0,193,194,5,2,0,0,194,196,3,14,7,0,195,197,5,139,0,0,
-        196,195,1,0,0,0,197,198,1,0,0,0,198,196,1,0,0,0,198,199,1,0,0,0,
-        199,13,1,0,0,0,200,201,5,4,0,0,201,202,5,14,0,0,202,203,5,2,0,0,
-        203,204,5,138,0,0,204,205,5,10,0,0,205,206,5,15,0,0,206,207,5,2,
-        0,0,207,208,5,138,0,0,208,209,5,10,0,0,209,210,5,16,0,0,210,211,
-        5,2,0,0,211,212,5,131,0,0,212,213,5,10,0,0,213,214,5,17,0,0,214,
-        215,5,2,0,0,215,216,5,138,0,0,216,217,5,10,0,0,217,218,5,18,0,0,
-        218,219,5,2,0,0,219,220,5,138,0,0,220,221,5,10,0,0,221,222,5,19,
-        0,0,222,223,5,2,0,0,223,224,5,131,0,0,224,225,5,9,0,0,225,15,1,0,
-        0,0,226,227,5,20,0,0,227,228,5,138,0,0,228,230,5,4,0,0,229,231,5,
-        139,0,0,230,229,1,0,0,0,231,232,1,0,0,0,232,230,1,0,0,0,232,233,
-        1,0,0,0,233,234,1,0,0,0,234,235,5,21,0,0,235,236,5,2,0,0,236,238,
-        5,138,0,0,237,239,5,139,0,0,238,237,1,0,0,0,239,240,1,0,0,0,240,
-        238,1,0,0,0,240,241,1,0,0,0,241,242,1,0,0,0,242,243,5,22,0,0,243,
-        245,5,2,0,0,244,246,5,139,0,0,245,244,1,0,0,0,246,247,1,0,0,0,247,
-        245,1,0,0,0,247,248,1,0,0,0,248,250,1,0,0,0,249,251,3,18,9,0,250,
-        249,1,0,0,0,251,252,1,0,0,0,252,250,1,0,0,0,252,253,1,0,0,0,253,
-        266,1,0,0,0,254,255,5,23,0,0,255,257,5,2,0,0,256,258,5,139,0,0,257,
-        256,1,0,0,0,258,259,1,0,0,0,259,257,1,0,0,0,259,260,1,0,0,0,260,
-        262,1,0,0,0,261,263,3,24,12,0,262,261,1,0,0,0,263,264,1,0,0,0,264,
-        262,1,0,0,0,264,265,1,0,0,0,265,267,1,0,0,0,266,254,1,0,0,0,266,
-        267,1,0,0,0,267,268,1,0,0,0,268,269,5,8,0,0,269,270,5,2,0,0,270,
-        272,5,138,0,0,271,273,5,139,0,0,272,271,1,0,0,0,273,274,1,0,0,0,
-        274,272,1,0,0,0,274,275,1,0,0,0,275,276,1,0,0,0,276,277,5,9,0,0,
-        277,17,1,0,0,0,278,279,5,138,0,0,279,280,5,2,0,0,280,282,3,20,10,
-        0,281,283,5,139,0,0,282,281,1,0,0,0,283,284,1,0,0,0,284,282,1,0,
-        0,0,284,285,1,0,0,0,285,19,1,0,0,0,286,287,5,4,0,0,287,288,5,24,
-        0,0,288,289,5,2,0,0,289,294,3,60,30,0,290,291,5,10,0,0,291,293,3,
-        22,11,0,292,290,1,0,0,0,293,296,1,0,0,0,294,292,1,0,0,0,294,295,
-        1,0,0,0,295,297,1,0,0,0,296,294,1,0,0,0,297,298,5,9,0,0,298,21,1,
-        0,0,0,299,300,5,25,0,0,300,301,5,2,0,0,301,322,5,137,0,0,302,303,
-        5,26,0,0,303,304,5,2,0,0,304,322,5,137,0,0,305,306,5,27,0,0,306,
-        307,5,2,0,0,307,322,3,64,32,0,308,309,5,28,0,0,309,310,5,2,0,0,310,
-        311,5,29,0,0,311,316,3,64,32,0,312,313,5,10,0,0,313,315,3,64,32,
-        0,314,312,1,0,0,0,315,318,1,0,0,0,316,314,1,0,0,0,316,317,1,0,0,
-        0,317,319,1,0,0,0,318,316,1,0,0,0,319,320,5,30,0,0,320,322,1,0,0,
-        0,321,299,1,0,0,0,321,302,1,0,0,0,321,305,1,0,0,0,321,308,1,0,0,
-        0,322,23,1,0,0,0,323,324,5,11,0,0,324,326,5,131,0,0,325,327,5,139,
-        0,0,326,325,1,0,0,0,327,328,1,0,0,0,328,326,1,0,0,0,328,329,1,0,
-        0,0,329,25,1,0,0,0,330,331,5,31,0,0,331,332,5,138,0,0,332,334,5,
-        4,0,0,333,335,5,139,0,0,334,333,1,0,0,0,335,336,1,0,0,0,336,334,
-        1,0,0,0,336,337,1,0,0,0,337,338,1,0,0,0,338,339,5,32,0,0,339,340,
-        5,2,0,0,340,342,7,0,0,0,341,343,5,139,0,0,342,341,1,0,0,0,343,344,
-        1,0,0,0,344,342,1,0,0,0,344,345,1,0,0,0,345,346,1,0,0,0,346,347,
-        5,36,0,0,347,349,5,2,0,0,348,350,5,139,0,0,349,348,1,0,0,0,350,351,
-        1,0,0,0,351,349,1,0,0,0,351,352,1,0,0,0,352,354,1,0,0,0,353,355,
-        3,28,14,0,354,353,1,0,0,0,355,356,1,0,0,0,356,354,1,0,0,0,356,357,
-        1,0,0,0,357,370,1,0,0,0,358,359,5,37,0,0,359,361,5,2,0,0,360,362,
-        5,139,0,0,361,360,1,0,0,0,362,363,1,0,0,0,363,361,1,0,0,0,363,364,
-        1,0,0,0,364,366,1,0,0,0,365,367,3,30,15,0,366,365,1,0,0,0,367,368,
-        1,0,0,0,368,366,1,0,0,0,368,369,1,0,0,0,369,371,1,0,0,0,370,358,
-        1,0,0,0,370,371,1,0,0,0,371,380,1,0,0,0,372,373,5,8,0,0,373,374,
-        5,2,0,0,374,376,5,138,0,0,375,377,5,139,0,0,376,375,1,0,0,0,377,
-        378,1,0,0,0,378,376,1,0,0,0,378,379,1,0,0,0,379,381,1,0,0,0,380,
-        372,1,0,0,0,380,381,1,0,0,0,381,382,1,0,0,0,382,383,5,9,0,0,383,
-        27,1,0,0,0,384,385,5,138,0,0,385,386,5,2,0,0,386,388,5,132,0,0,387,
-        389,5,139,0,0,388,387,1,0,0,0,389,390,1,0,0,0,390,388,1,0,0,0,390,
-        391,1,0,0,0,391,29,1,0,0,0,392,393,5,11,0,0,393,394,5,138,0,0,394,
-        395,5,38,0,0,395,398,5,138,0,0,396,397,5,10,0,0,397,399,5,138,0,
-        0,398,396,1,0,0,0,398,399,1,0,0,0,399,400,1,0,0,0,400,401,5,39,0,
-        0,401,402,5,40,0,0,402,403,5,2,0,0,403,405,5,138,0,0,404,406,5,139,
-        0,0,405,404,1,0,0,0,406,407,1,0,0,0,407,405,1,0,0,0,407,408,1,0,
-        0,0,408,31,1,0,0,0,409,410,5,41,0,0,410,411,5,138,0,0,411,413,5,
-        4,0,0,412,414,5,139,0,0,413,412,1,0,0,0,414,415,1,0,0,0,415,413,
-        1,0,0,0,415,416,1,0,0,0,416,417,1,0,0,0,417,418,5,42,0,0,418,419,
-        5,2,0,0,419,421,5,138,0,0,420,422,5,139,0,0,421,420,1,0,0,0,422,
-        423,1,0,0,0,423,421,1,0,0,0,423,424,1,0,0,0,424,425,1,0,0,0,425,
-        426,5,43,0,0,426,427,5,2,0,0,427,429,5,138,0,0,428,430,5,139,0,0,
-        429,428,1,0,0,0,430,431,1,0,0,0,431,429,1,0,0,0,431,432,1,0,0,0,
-        432,433,1,0,0,0,433,434,5,40,0,0,434,435,5,2,0,0,435,437,5,138,0,
-        0,436,438,5,139,0,0,437,436,1,0,0,0,438,439,1,0,0,0,439,437,1,0,
-        0,0,439,440,1,0,0,0,440,453,1,0,0,0,441,442,5,36,0,0,442,444,5,2,
-        0,0,443,445,5,139,0,0,444,443,1,0,0,0,445,446,1,0,0,0,446,444,1,
-        0,0,0,446,447,1,0,0,0,447,449,1,0,0,0,448,450,3,28,14,0,449,448,
-        1,0,0,0,450,451,1,0,0,0,451,449,1,0,0,0,451,452,1,0,0,0,452,454,
-        1,0,0,0,453,441,1,0,0,0,453,454,1,0,0,0,454,463,1,0,0,0,455,456,
-        5,8,0,0,456,457,5,2,0,0,457,459,5,138,0,0,458,460,5,139,0,0,459,
-        458,1,0,0,0,460,461,1,0,0,0,461,459,1,0,0,0,461,462,1,0,0,0,462,
-        464,1,0,0,0,463,455,1,0,0,0,463,464,1,0,0,0,464,465,1,0,0,0,465,
-        466,5,9,0,0,466,33,1,0,0,0,467,468,5,44,0,0,468,469,5,138,0,0,469,
-        471,5,4,0,0,470,472,5,139,0,0,471,470,1,0,0,0,472,473,1,0,0,0,473,
-        471,1,0,0,0,473,474,1,0,0,0,474,475,1,0,0,0,475,476,5,45,0,0,476,
-        477,5,2,0,0,477,479,5,131,0,0,478,480,5,139,0,0,479,478,1,0,0,0,
-        480,481,1,0,0,0,481,479,1,0,0,0,481,482,1,0,0,0,482,483,1,0,0,0,
-        483,484,5,46,0,0,484,485,5,2,0,0,485,487,5,138,0,0,486,488,5,139,
-        0,0,487,486,1,0,0,0,488,489,1,0,0,0,489,487,1,0,0,0,489,490,1,0,
-        0,0,490,491,1,0,0,0,491,492,5,47,0,0,492,493,5,2,0,0,493,495,5,138,
-        0,0,494,496,5,139,0,0,495,494,1,0,0,0,496,497,1,0,0,0,497,495,1,
-        0,0,0,497,498,1,0,0,0,498,499,1,0,0,0,499,500,5,48,0,0,500,501,5,
-        2,0,0,501,502,5,29,0,0,502,507,5,138,0,0,503,504,5,10,0,0,504,506,
-        5,138,0,0,505,503,1,0,0,0,506,509,1,0,0,0,507,505,1,0,0,0,507,508,
-        1,0,0,0,508,510,1,0,0,0,509,507,1,0,0,0,510,512,5,30,0,0,511,513,
-        5,139,0,0,512,511,1,0,0,0,513,514,1,0,0,0,514,512,1,0,0,0,514,515,
-        1,0,0,0,515,516,1,0,0,0,516,517,5,8,0,0,517,518,5,2,0,0,518,520,
-        5,138,0,0,519,521,5,139,0,0,520,519,1,0,0,0,521,522,1,0,0,0,522,
-        520,1,0,0,0,522,523,1,0,0,0,523,524,1,0,0,0,524,525,5,49,0,0,525,
-        526,5,2,0,0,526,528,3,50,25,0,527,529,5,139,0,0,528,527,1,0,0,0,
-        529,530,1,0,0,0,530,528,1,0,0,0,530,531,1,0,0,0,531,533,1,0,0,0,
-        532,534,3,36,18,0,533,532,1,0,0,0,534,535,1,0,0,0,535,533,1,0,0,
-        0,535,536,1,0,0,0,536,537,1,0,0,0,537,538,5,50,0,0,538,539,5,2,0,
-        0,539,541,3,50,25,0,540,542,5,139,0,0,541,540,1,0,0,0,542,543,1,
-        0,0,0,543,541,1,0,0,0,543,544,1,0,0,0,544,545,1,0,0,0,545,546,5,
-        9,0,0,546,35,1,0,0,0,547,548,5,51,0,0,548,549,5,138,0,0,549,551,
-        5,4,0,0,550,552,5,139,0,0,551,550,1,0,0,0,552,553,1,0,0,0,553,551,
-        1,0,0,0,553,554,1,0,0,0,554,567,1,0,0,0,555,556,5,52,0,0,556,558,
-        5,2,0,0,557,559,5,139,0,0,558,557,1,0,0,0,559,560,1,0,0,0,560,558,
-        1,0,0,0,560,561,1,0,0,0,561,563,1,0,0,0,562,564,3,38,19,0,563,562,
-        1,0,0,0,564,565,1,0,0,0,565,563,1,0,0,0,565,566,1,0,0,0,566,568,
-        1,0,0,0,567,555,1,0,0,0,567,568,1,0,0,0,568,581,1,0,0,0,569,570,
-        5,53,0,0,570,572,5,2,0,0,571,573,5,139,0,0,572,571,1,0,0,0,573,574,
-        1,0,0,0,574,572,1,0,0,0,574,575,1,0,0,0,575,577,1,0,0,0,576,578,
-        3,40,20,0,577,576,1,0,0,0,578,579,1,0,0,0,579,577,1,0,0,0,579,580,
-        1,0,0,0,580,582,1,0,0,0,581,569,1,0,0,0,581,582,1,0,0,0,582,591,
-        1,0,0,0,583,584,5,54,0,0,584,585,5,2,0,0,585,587,5,132,0,0,586,588,
-        5,139,0,0,587,586,1,0,0,0,588,589,1,0,0,0,589,587,1,0,0,0,589,590,
-        1,0,0,0,590,592,1,0,0,0,591,583,1,0,0,0,591,592,1,0,0,0,592,605,
-        1,0,0,0,593,594,5,55,0,0,594,596,5,2,0,0,595,597,5,139,0,0,596,595,
-        1,0,0,0,597,598,1,0,0,0,598,596,1,0,0,0,598,599,1,0,0,0,599,601,
-        1,0,0,0,600,602,3,42,21,0,601,600,1,0,0,0,602,603,1,0,0,0,603,601,
-        1,0,0,0,603,604,1,0,0,0,604,606,1,0,0,0,605,593,1,0,0,0,605,606,
-        1,0,0,0,606,619,1,0,0,0,607,608,5,56,0,0,608,610,5,2,0,0,609,611,
-        5,139,0,0,610,609,1,0,0,0,611,612,1,0,0,0,612,610,1,0,0,0,612,613,
-        1,0,0,0,613,615,1,0,0,0,614,616,3,44,22,0,615,614,1,0,0,0,616,617,
-        1,0,0,0,617,615,1,0,0,0,617,618,1,0,0,0,618,620,1,0,0,0,619,607,
-        1,0,0,0,619,620,1,0,0,0,620,629,1,0,0,0,621,622,5,13,0,0,622,623,
-        5,2,0,0,623,625,3,46,23,0,624,626,5,139,0,0,625,624,1,0,0,0,626,
-        627,1,0,0,0,627,625,1,0,0,0,627,628,1,0,0,0,628,630,1,0,0,0,629,
-        621,1,0,0,0,629,630,1,0,0,0,630,631,1,0,0,0,631,632,5,9,0,0,632,
-        37,1,0,0,0,633,634,5,11,0,0,634,639,5,138,0,0,635,636,5,57,0,0,636,
-        638,5,138,0,0,637,635,1,0,0,0,638,641,1,0,0,0,639,637,1,0,0,0,639,
-        640,1,0,0,0,640,643,1,0,0,0,641,639,1,0,0,0,642,644,5,139,0,0,643,
-        642,1,0,0,0,644,645,1,0,0,0,645,643,1,0,0,0,645,646,1,0,0,0,646,
-        39,1,0,0,0,647,648,5,11,0,0,648,650,5,132,0,0,649,651,5,139,0,0,
-        650,649,1,0,0,0,651,652,1,0,0,0,652,650,1,0,0,0,652,653,1,0,0,0,
-        653,41,1,0,0,0,654,655,5,11,0,0,655,657,5,132,0,0,656,658,5,139,
-        0,0,657,656,1,0,0,0,658,659,1,0,0,0,659,657,1,0,0,0,659,660,1,0,
-        0,0,660,43,1,0,0,0,661,662,5,11,0,0,662,664,5,132,0,0,663,665,5,
-        139,0,0,664,663,1,0,0,0,665,666,1,0,0,0,666,664,1,0,0,0,666,667,
-        1,0,0,0,667,45,1,0,0,0,668,669,5,138,0,0,669,670,5,2,0,0,670,671,
-        3,48,24,0,671,47,1,0,0,0,672,684,3,60,30,0,673,674,5,58,0,0,674,
-        675,5,59,0,0,675,676,5,138,0,0,676,684,5,60,0,0,677,678,5,4,0,0,
-        678,679,5,138,0,0,679,680,5,2,0,0,680,681,3,60,30,0,681,682,5,9,
-        0,0,682,684,1,0,0,0,683,672,1,0,0,0,683,673,1,0,0,0,683,677,1,0,
-        0,0,684,49,1,0,0,0,685,686,5,61,0,0,686,687,5,138,0,0,687,696,5,
-        38,0,0,688,693,5,138,0,0,689,690,5,10,0,0,690,692,5,138,0,0,691,
-        689,1,0,0,0,692,695,1,0,0,0,693,691,1,0,0,0,693,694,1,0,0,0,694,
-        697,1,0,0,0,695,693,1,0,0,0,696,688,1,0,0,0,696,697,1,0,0,0,697,
-        698,1,0,0,0,698,699,5,39,0,0,699,51,1,0,0,0,700,701,5,62,0,0,701,
-        702,5,138,0,0,702,704,5,4,0,0,703,705,5,139,0,0,704,703,1,0,0,0,
-        705,706,1,0,0,0,706,704,1,0,0,0,706,707,1,0,0,0,707,708,1,0,0,0,
-        708,709,5,45,0,0,709,710,5,2,0,0,710,712,5,131,0,0,711,713,5,139,
-        0,0,712,711,1,0,0,0,713,714,1,0,0,0,714,712,1,0,0,0,714,715,1,0,
-        0,0,715,716,1,0,0,0,716,717,5,63,0,0,717,718,5,2,0,0,718,720,5,132,
-        0,0,719,721,5,139,0,0,720,719,1,0,0,0,721,722,1,0,0,0,722,720,1,
-        0,0,0,722,723,1,0,0,0,723,739,1,0,0,0,724,725,5,64,0,0,725,727,5,
-        2,0,0,726,728,5,139,0,0,727,726,1,0,0,0,728,729,1,0,0,0,729,727,
-        1,0,0,0,729,730,1,0,0,0,730,731,1,0,0,0,731,733,5,132,0,0,732,734,
-        5,139,0,0,733,732,1,0,0,0,734,735,1,0,0,0,735,733,1,0,0,0,735,736,
-        1,0,0,0,736,738,1,0,0,0,737,724,1,0,0,0,738,741,1,0,0,0,739,737,
-        1,0,0,0,739,740,1,0,0,0,740,742,1,0,0,0,741,739,1,0,0,0,742,743,
-        5,55,0,0,743,745,5,2,0,0,744,746,5,139,0,0,745,744,1,0,0,0,746,747,
-        1,0,0,0,747,745,1,0,0,0,747,748,1,0,0,0,748,750,1,0,0,0,749,751,
-        3,42,21,0,750,749,1,0,0,0,751,752,1,0,0,0,752,750,1,0,0,0,752,753,
-        1,0,0,0,753,754,1,0,0,0,754,755,5,8,0,0,755,756,5,2,0,0,756,758,
-        5,138,0,0,757,759,5,139,0,0,758,757,1,0,0,0,759,760,1,0,0,0,760,
-        758,1,0,0,0,760,761,1,0,0,0,761,762,1,0,0,0,762,763,5,9,0,0,763,
-        53,1,0,0,0,764,765,5,65,0,0,765,766,5,138,0,0,766,768,5,4,0,0,767,
-        769,5,139,0,0,768,767,1,0,0,0,769,770,1,0,0,0,770,768,1,0,0,0,770,
-        771,1,0,0,0,771,772,1,0,0,0,772,773,5,45,0,0,773,774,5,2,0,0,774,
-        776,5,131,0,0,775,777,5,139,0,0,776,775,1,0,0,0,777,778,1,0,0,0,
-        778,776,1,0,0,0,778,779,1,0,0,0,779,780,1,0,0,0,780,781,5,66,0,0,
-        781,782,5,2,0,0,782,784,5,132,0,0,783,785,5,139,0,0,784,783,1,0,
-        0,0,785,786,1,0,0,0,786,784,1,0,0,0,786,787,1,0,0,0,787,788,1,0,
-        0,0,788,789,5,67,0,0,789,790,5,2,0,0,790,792,5,131,0,0,791,793,5,
-        139,0,0,792,791,1,0,0,0,793,794,1,0,0,0,794,792,1,0,0,0,794,795,
-        1,0,0,0,795,796,1,0,0,0,796,797,5,8,0,0,797,798,5,2,0,0,798,800,
-        5,138,0,0,799,801,5,139,0,0,800,799,1,0,0,0,801,802,1,0,0,0,802,
-        800,1,0,0,0,802,803,1,0,0,0,803,804,1,0,0,0,804,805,5,9,0,0,805,
-        55,1,0,0,0,806,807,5,68,0,0,807,808,5,138,0,0,808,810,5,4,0,0,809,
-        811,5,139,0,0,810,809,1,0,0,0,811,812,1,0,0,0,812,810,1,0,0,0,812,
-        813,1,0,0,0,813,814,1,0,0,0,814,815,5,69,0,0,815,816,5,2,0,0,816,
-        818,5,138,0,0,817,819,5,139,0,0,818,817,1,0,0,0,819,820,1,0,0,0,
-        820,818,1,0,0,0,820,821,1,0,0,0,821,822,1,0,0,0,822,823,5,70,0,0,
-        823,824,5,2,0,0,824,826,5,138,0,0,825,827,5,139,0,0,826,825,1,0,
-        0,0,827,828,1,0,0,0,828,826,1,0,0,0,828,829,1,0,0,0,829,830,1,0,
-        0,0,830,831,5,71,0,0,831,833,5,2,0,0,832,834,5,139,0,0,833,832,1,
-        0,0,0,834,835,1,0,0,0,835,833,1,0,0,0,835,836,1,0,0,0,836,838,1,
-        0,0,0,837,839,3,58,29,0,838,837,1,0,0,0,839,840,1,0,0,0,840,838,
-        1,0,0,0,840,841,1,0,0,0,841,842,1,0,0,0,842,843,5,56,0,0,843,845,
-        5,2,0,0,844,846,5,139,0,0,845,844,1,0,0,0,846,847,1,0,0,0,847,845,
-        1,0,0,0,847,848,1,0,0,0,848,850,1,0,0,0,849,851,3,44,22,0,850,849,
-        1,0,0,0,851,852,1,0,0,0,852,850,1,0,0,0,852,853,1,0,0,0,853,854,
-        1,0,0,0,854,855,5,8,0,0,855,856,5,2,0,0,856,858,5,138,0,0,857,859,
-        5,139,0,0,858,857,1,0,0,0,859,860,1,0,0,0,860,858,1,0,0,0,860,861,
-        1,0,0,0,861,862,1,0,0,0,862,863,5,9,0,0,863,57,1,0,0,0,864,865,5,
-        11,0,0,865,866,5,138,0,0,866,875,5,38,0,0,867,872,5,138,0,0,868,
-        869,5,10,0,0,869,871,5,138,0,0,870,868,1,0,0,0,871,874,1,0,0,0,872,
-        870,1,0,0,0,872,873,1,0,0,0,873,876,1,0,0,0,874,872,1,0,0,0,875,
-        867,1,0,0,0,875,876,1,0,0,0,876,877,1,0,0,0,877,879,5,39,0,0,878,
-        880,5,139,0,0,879,878,1,0,0,0,880,881,1,0,0,0,881,879,1,0,0,0,881,
-        882,1,0,0,0,882,59,1,0,0,0,883,884,7,1,0,0,884,61,1,0,0,0,885,910,
-        5,25,0,0,886,910,5,26,0,0,887,888,5,86,0,0,888,889,5,87,0,0,889,
-        910,5,136,0,0,890,891,5,88,0,0,891,892,5,87,0,0,892,910,5,136,0,
-        0,893,894,5,28,0,0,894,895,5,87,0,0,895,896,5,29,0,0,896,901,3,64,
-        32,0,897,898,5,10,0,0,898,900,3,64,32,0,899,897,1,0,0,0,900,903,
-        1,0,0,0,901,899,1,0,0,0,901,902,1,0,0,0,902,904,1,0,0,0,903,901,
-        1,0,0,0,904,905,5,30,0,0,905,910,1,0,0,0,906,910,5,89,0,0,907,910,
-        5,90,0,0,908,910,5,91,0,0,909,885,1,0,0,0,909,886,1,0,0,0,909,887,
-        1,0,0,0,909,890,1,0,0,0,909,893,1,0,0,0,909,906,1,0,0,0,909,907,
-        1,0,0,0,909,908,1,0,0,0,910,63,1,0,0,0,911,912,7,2,0,0,912,65,1,
-        0,0,0,115,70,75,83,85,95,101,105,118,125,130,137,142,149,158,169,
-        175,182,190,198,232,240,247,252,259,264,266,274,284,294,316,321,
-        328,336,344,351,356,363,368,370,378,380,390,398,407,415,423,431,
-        439,446,451,453,461,463,473,481,489,497,507,514,522,530,535,543,
-        553,560,565,567,574,579,581,589,591,598,603,605,612,617,619,627,
-        629,639,645,652,659,666,683,693,696,706,714,722,729,735,739,747,
-        752,760,770,778,786,794,802,812,820,828,835,840,847,852,860,872,
-        875,881,901,909
+        26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,
+        33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,
+        39,2,40,7,40,2,41,7,41,1,0,5,0,86,8,0,10,0,12,0,89,9,0,1,0,1,0,1,
+        0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,3,0,101,8,0,1,0,5,0,104,8,0,10,0,12,
+        0,107,9,0,5,0,109,8,0,10,0,12,0,112,9,0,1,0,1,0,1,1,1,1,1,1,1,1,
+        1,2,1,2,1,2,4,2,123,8,2,11,2,12,2,124,1,2,1,2,4,2,129,8,2,11,2,12,
+        2,130,5,2,133,8,2,10,2,12,2,136,9,2,1,3,1,3,1,3,1,3,1,4,1,4,1,4,
+        1,4,4,4,146,8,4,11,4,12,4,147,1,4,1,4,1,4,4,4,153,8,4,11,4,12,4,
+        154,1,4,4,4,158,8,4,11,4,12,4,159,1,4,1,4,1,4,4,4,165,8,4,11,4,12,
+        4,166,1,4,4,4,170,8,4,11,4,12,4,171,1,4,1,4,1,4,4,4,177,8,4,11,4,
+        12,4,178,1,4,1,4,1,4,1,4,1,4,4,4,186,8,4,11,4,12,4,187,1,4,1,4,1,
+        5,1,5,1,5,1,5,1,5,5,5,197,8,5,10,5,12,5,200,9,5,1,5,4,5,203,8,5,
+        11,5,12,5,204,1,6,1,6,1,6,4,6,210,8,6,11,6,12,6,211,1,7,1,7,1,7,
+        1,7,4,7,218,8,7,11,7,12,7,219,1,7,1,7,1,7,1,7,4,7,226,8,7,11,7,12,
+        7,227,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,
+        8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,5,8,252,8,8,10,8,12,8,255,9,8,1,8,
+        1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,4,9,267,8,9,11,9,12,9,268,1,
+        9,1,9,1,9,1,9,4,9,275,8,9,11,9,12,9,276,1,9,1,9,1,9,4,9,282,8,9,
+        11,9,12,9,283,1,9,4,9,287,8,9,11,9,12,9,288,1,9,1,9,1,9,4,9,294,
+        8,9,11,9,12,9,295,1,9,4,9,299,8,9,11,9,12,9,300,3,9,303,8,9,1,9,
+        1,9,1,9,1,9,4,9,309,8,9,11,9,12,9,310,1,9,1,9,1,10,4,10,316,8,10,
+        11,10,12,10,317,1,10,1,10,1,10,4,10,323,8,10,11,10,12,10,324,1,11,
+        1,11,1,11,1,11,1,11,1,11,5,11,333,8,11,10,11,12,11,336,9,11,1,11,
+        1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,
+        1,12,1,12,1,12,5,12,355,8,12,10,12,12,12,358,9,12,1,12,1,12,1,12,
+        1,12,1,12,1,12,1,12,1,12,5,12,368,8,12,10,12,12,12,371,9,12,1,12,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,384,8,12,
+        3,12,386,8,12,1,13,4,13,389,8,13,11,13,12,13,390,1,14,1,14,1,14,
+        4,14,396,8,14,11,14,12,14,397,1,15,1,15,1,15,1,15,4,15,404,8,15,
+        11,15,12,15,405,1,15,1,15,1,15,1,15,4,15,412,8,15,11,15,12,15,413,
+        1,15,1,15,1,15,4,15,419,8,15,11,15,12,15,420,1,15,4,15,424,8,15,
+        11,15,12,15,425,1,15,1,15,1,15,4,15,431,8,15,11,15,12,15,432,1,15,
+        4,15,436,8,15,11,15,12,15,437,3,15,440,8,15,1,15,1,15,1,15,1,15,
+        4,15,446,8,15,11,15,12,15,447,3,15,450,8,15,1,15,1,15,1,16,1,16,
+        1,16,1,16,4,16,458,8,16,11,16,12,16,459,1,17,1,17,1,17,1,17,1,17,
+        1,17,3,17,468,8,17,1,17,1,17,1,17,1,17,1,17,4,17,475,8,17,11,17,
+        12,17,476,1,18,1,18,1,18,1,18,4,18,483,8,18,11,18,12,18,484,1,18,
+        1,18,1,18,1,18,4,18,491,8,18,11,18,12,18,492,1,18,1,18,1,18,1,18,
+        4,18,499,8,18,11,18,12,18,500,1,18,1,18,1,18,1,18,4,18,507,8,18,
+        11,18,12,18,508,1,18,1,18,1,18,4,18,514,8,18,11,18,12,18,515,1,18,
+        4,18,519,8,18,11,18,12,18,520,3,18,523,8,18,1,18,1,18,1,18,1,18,
+        4,18,529,8,18,11,18,12,18,530,3,18,533,8,18,1,18,1,18,1,19,1,19,
+        1,19,1,19,4,19,541,8,19,11,19,12,19,542,1,19,5,19,546,8,19,10,19,
+        12,19,549,9,19,1,19,1,19,1,19,1,19,4,19,555,8,19,11,19,12,19,556,
+        1,19,5,19,560,8,19,10,19,12,19,563,9,19,1,19,1,19,1,19,1,19,4,19,
+        569,8,19,11,19,12,19,570,1,19,1,19,1,20,1,20,1,20,1,20,4,20,579,
+        8,20,11,20,12,20,580,1,20,1,20,1,20,1,20,4,20,587,8,20,11,20,12,
+        20,588,1,20,1,20,1,20,1,20,4,20,595,8,20,11,20,12,20,596,1,20,1,
+        20,1,20,1,20,5,20,603,8,20,10,20,12,20,606,9,20,1,20,1,20,1,20,5,
+        20,611,8,20,10,20,12,20,614,9,20,1,20,5,20,617,8,20,10,20,12,20,
+        620,9,20,1,20,5,20,623,8,20,10,20,12,20,626,9,20,1,20,1,20,4,20,
+        630,8,20,11,20,12,20,631,1,20,1,20,1,20,4,20,637,8,20,11,20,12,20,
+        638,1,20,1,20,1,20,4,20,644,8,20,11,20,12,20,645,4,20,648,8,20,11,
+        20,12,20,649,1,20,1,20,1,20,1,20,4,20,656,8,20,11,20,12,20,657,1,
+        20,1,20,1,20,1,20,4,20,664,8,20,11,20,12,20,665,3,20,668,8,20,1,
+        21,1,21,1,21,1,21,4,21,674,8,21,11,21,12,21,675,1,21,5,21,679,8,
+        21,10,21,12,21,682,9,21,1,21,1,21,4,21,686,8,21,11,21,12,21,687,
+        1,22,1,22,1,22,1,22,4,22,694,8,22,11,22,12,22,695,1,22,1,22,1,22,
+        4,22,701,8,22,11,22,12,22,702,1,22,4,22,706,8,22,11,22,12,22,707,
+        1,22,1,22,1,22,4,22,713,8,22,11,22,12,22,714,1,22,4,22,718,8,22,
+        11,22,12,22,719,1,22,1,22,1,22,1,22,4,22,726,8,22,11,22,12,22,727,
+        1,22,1,22,1,22,4,22,733,8,22,11,22,12,22,734,1,22,1,22,4,22,739,
+        8,22,11,22,12,22,740,4,22,743,8,22,11,22,12,22,744,1,22,1,22,1,22,
+        4,22,750,8,22,11,22,12,22,751,1,22,4,22,755,8,22,11,22,12,22,756,
+        1,22,1,22,1,22,1,22,4,22,763,8,22,11,22,12,22,764,1,22,4,22,768,
+        8,22,11,22,12,22,769,1,22,1,22,1,22,4,22,775,8,22,11,22,12,22,776,
+        4,22,779,8,22,11,22,12,22,780,3,22,783,8,22,1,22,1,22,1,22,1,22,
+        4,22,789,8,22,11,22,12,22,790,3,22,793,8,22,1,23,1,23,1,23,1,23,
+        5,23,799,8,23,10,23,12,23,802,9,23,1,23,4,23,805,8,23,11,23,12,23,
+        806,1,24,1,24,1,24,4,24,812,8,24,11,24,12,24,813,1,25,1,25,1,25,
+        1,26,1,26,1,26,4,26,822,8,26,11,26,12,26,823,1,27,1,27,1,27,1,27,
+        1,28,1,28,1,28,1,28,1,28,5,28,835,8,28,10,28,12,28,838,9,28,1,28,
+        1,28,3,28,842,8,28,1,28,1,28,1,28,1,28,1,28,1,28,5,28,850,8,28,10,
+        28,12,28,853,9,28,1,28,1,28,1,28,5,28,858,8,28,10,28,12,28,861,9,
+        28,1,28,5,28,864,8,28,10,28,12,28,867,9,28,1,28,5,28,870,8,28,10,
+        28,12,28,873,9,28,1,28,1,28,3,28,877,8,28,1,29,1,29,1,29,1,29,1,
+        29,1,29,5,29,885,8,29,10,29,12,29,888,9,29,3,29,890,8,29,1,29,1,
+        29,1,30,1,30,1,30,1,30,5,30,898,8,30,10,30,12,30,901,9,30,1,30,1,
+        30,4,30,905,8,30,11,30,12,30,906,1,30,1,30,1,30,1,30,4,30,913,8,
+        30,11,30,12,30,914,1,30,1,30,1,30,1,30,4,30,921,8,30,11,30,12,30,
+        922,1,30,1,30,1,30,4,30,928,8,30,11,30,12,30,929,1,30,1,30,1,30,
+        4,30,935,8,30,11,30,12,30,936,4,30,939,8,30,11,30,12,30,940,3,30,
+        943,8,30,1,30,1,30,1,30,4,30,948,8,30,11,30,12,30,949,1,30,1,30,
+        4,30,954,8,30,11,30,12,30,955,4,30,958,8,30,11,30,12,30,959,1,30,
+        1,30,1,30,1,30,4,30,966,8,30,11,30,12,30,967,1,30,1,30,1,31,1,31,
+        1,31,1,31,4,31,976,8,31,11,31,12,31,977,1,31,1,31,1,31,1,31,4,31,
+        984,8,31,11,31,12,31,985,1,31,1,31,1,31,1,31,4,31,992,8,31,11,31,
+        12,31,993,1,31,4,31,997,8,31,11,31,12,31,998,1,31,4,31,1002,8,31,
+        11,31,12,31,1003,3,31,1006,8,31,1,31,1,31,1,31,1,31,4,31,1012,8,
+        31,11,31,12,31,1013,1,31,1,31,1,31,1,31,4,31,1020,8,31,11,31,12,
+        31,1021,1,31,1,31,1,32,1,32,3,32,1028,8,32,1,32,4,32,1031,8,32,11,
+        32,12,32,1032,1,33,1,33,1,33,1,33,4,33,1039,8,33,11,33,12,33,1040,
+        1,33,1,33,1,33,1,33,4,33,1047,8,33,11,33,12,33,1048,1,33,1,33,1,
+        33,1,33,4,33,1055,8,33,11,33,12,33,1056,1,33,1,33,1,33,4,33,1062,
+        8,33,11,33,12,33,1063,1,33,4,33,1067,8,33,11,33,12,33,1068,1,33,
+        1,33,1,33,4,33,1074,8,33,11,33,12,33,1075,1,33,4,33,1079,8,33,11,
+        33,12,33,1080,1,33,1,33,1,33,1,33,4,33,1087,8,33,11,33,12,33,1088,
+        1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,5,34,1099,8,34,10,34,12,
+        34,1102,9,34,3,34,1104,8,34,1,34,1,34,4,34,1108,8,34,11,34,12,34,
+        1109,1,35,1,35,4,35,1114,8,35,11,35,12,35,1115,1,36,1,36,1,36,5,
+        36,1121,8,36,10,36,12,36,1124,9,36,1,36,1,36,1,37,1,37,1,37,1,37,
+        3,37,1132,8,37,5,37,1134,8,37,10,37,12,37,1137,9,37,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,3,38,1213,8,38,1,39,1,39,1,40,1,
+        40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,5,
+        40,1231,8,40,10,40,12,40,1234,9,40,1,40,1,40,1,40,1,40,1,40,3,40,
+        1241,8,40,1,41,1,41,1,41,1,41,1,41,1,41,3,41,1249,8,41,1,41,0,0,
+        42,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,
+        44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,0,6,
+        3,0,5,5,10,11,142,142,1,0,38,40,4,0,5,5,9,10,72,72,142,142,3,0,5,
+        5,10,10,142,142,2,0,5,5,10,10,2,0,82,95,98,98,1471,0,87,1,0,0,0,
+        2,115,1,0,0,0,4,119,1,0,0,0,6,137,1,0,0,0,8,141,1,0,0,0,10,191,1,
+        0,0,0,12,206,1,0,0,0,14,213,1,0,0,0,16,229,1,0,0,0,18,262,1,0,0,
+        0,20,315,1,0,0,0,22,326,1,0,0,0,24,385,1,0,0,0,26,388,1,0,0,0,28,
+        392,1,0,0,0,30,399,1,0,0,0,32,453,1,0,0,0,34,461,1,0,0,0,36,478,
+        1,0,0,0,38,536,1,0,0,0,40,667,1,0,0,0,42,669,1,0,0,0,44,792,1,0,
+        0,0,46,794,1,0,0,0,48,808,1,0,0,0,50,815,1,0,0,0,52,818,1,0,0,0,
+        54,825,1,0,0,0,56,876,1,0,0,0,58,878,1,0,0,0,60,893,1,0,0,0,62,971,
+        1,0,0,0,64,1025,1,0,0,0,66,1034,1,0,0,0,68,1092,1,0,0,0,70,1113,
+        1,0,0,0,72,1117,1,0,0,0,74,1127,1,0,0,0,76,1212,1,0,0,0,78,1214,
+        1,0,0,0,80,1240,1,0,0,0,82,1248,1,0,0,0,84,86,5,142,0,0,85,84,1,
+        0,0,0,86,89,1,0,0,0,87,85,1,0,0,0,87,88,1,0,0,0,88,110,1,0,0,0,89,
+        87,1,0,0,0,90,101,3,2,1,0,91,101,3,4,2,0,92,101,3,8,4,0,93,101,3,
+        18,9,0,94,101,3,30,15,0,95,101,3,38,19,0,96,101,3,60,30,0,97,101,
+        3,36,18,0,98,101,3,62,31,0,99,101,3,66,33,0,100,90,1,0,0,0,100,91,
+        1,0,0,0,100,92,1,0,0,0,100,93,1,0,0,0,100,94,1,0,0,0,100,95,1,0,
+        0,0,100,96,1,0,0,0,100,97,1,0,0,0,100,98,1,0,0,0,100,99,1,0,0,0,
+        101,105,1,0,0,0,102,104,5,142,0,0,103,102,1,0,0,0,104,107,1,0,0,
+        0,105,103,1,0,0,0,105,106,1,0,0,0,106,109,1,0,0,0,107,105,1,0,0,
+        0,108,100,1,0,0,0,109,112,1,0,0,0,110,108,1,0,0,0,110,111,1,0,0,
+        0,111,113,1,0,0,0,112,110,1,0,0,0,113,114,5,0,0,1,114,1,1,0,0,0,
+        115,116,5,1,0,0,116,117,5,2,0,0,117,118,5,136,0,0,118,3,1,0,0,0,
+        119,120,5,3,0,0,120,122,5,2,0,0,121,123,5,142,0,0,122,121,1,0,0,
+        0,123,124,1,0,0,0,124,122,1,0,0,0,124,125,1,0,0,0,125,134,1,0,0,
+        0,126,128,3,6,3,0,127,129,5,142,0,0,128,127,1,0,0,0,129,130,1,0,
+        0,0,130,128,1,0,0,0,130,131,1,0,0,0,131,133,1,0,0,0,132,126,1,0,
+        0,0,133,136,1,0,0,0,134,132,1,0,0,0,134,135,1,0,0,0,135,5,1,0,0,
+        0,136,134,1,0,0,0,137,138,3,76,38,0,138,139,5,2,0,0,139,140,3,70,
+        35,0,140,7,1,0,0,0,141,142,5,4,0,0,142,143,5,141,0,0,143,145,5,5,
+        0,0,144,146,5,142,0,0,145,144,1,0,0,0,146,147,1,0,0,0,147,145,1,
+        0,0,0,147,148,1,0,0,0,148,149,1,0,0,0,149,150,5,6,0,0,150,152,5,
+        2,0,0,151,153,5,142,0,0,152,151,1,0,0,0,153,154,1,0,0,0,154,152,
+        1,0,0,0,154,155,1,0,0,0,155,157,1,0,0,0,156,158,3,10,5,0,157,156,
+        1,0,0,0,158,159,1,0,0,0,159,157,1,0,0,0,159,160,1,0,0,0,160,161,
+        1,0,0,0,161,162,5,7,0,0,162,164,5,2,0,0,163,165,5,142,0,0,164,163,
+        1,0,0,0,165,166,1,0,0,0,166,164,1,0,0,0,166,167,1,0,0,0,167,169,
+        1,0,0,0,168,170,3,12,6,0,169,168,1,0,0,0,170,171,1,0,0,0,171,169,
+        1,0,0,0,171,172,1,0,0,0,172,173,1,0,0,0,173,174,5,8,0,0,174,176,
+        5,2,0,0,175,177,5,142,0,0,176,175,1,0,0,0,177,178,1,0,0,0,178,176,
+        1,0,0,0,178,179,1,0,0,0,179,180,1,0,0,0,180,181,3,14,7,0,181,182,
+        5,9,0,0,182,183,5,2,0,0,183,185,5,141,0,0,184,186,5,142,0,0,185,
+        184,1,0,0,0,186,187,1,0,0,0,187,185,1,0,0,0,187,188,1,0,0,0,188,
+        189,1,0,0,0,189,190,5,10,0,0,190,9,1,0,0,0,191,192,3,76,38,0,192,
+        193,5,2,0,0,193,198,3,78,39,0,194,195,5,11,0,0,195,197,3,80,40,0,
+        196,194,1,0,0,0,197,200,1,0,0,0,198,196,1,0,0,0,198,199,1,0,0,0,
+        199,202,1,0,0,0,200,198,1,0,0,0,201,203,5,142,0,0,202,201,1,0,0,
+        0,203,204,1,0,0,0,204,202,1,0,0,0,204,205,1,0,0,0,205,11,1,0,0,0,
+        206,207,5,12,0,0,207,209,3,70,35,0,208,210,5,142,0,0,209,208,1,0,
+        0,0,210,211,1,0,0,0,211,209,1,0,0,0,211,212,1,0,0,0,212,13,1,0,0,
+        0,213,214,5,13,0,0,214,215,5,2,0,0,215,217,3,16,8,0,216,218,5,142,
+        0,0,217,216,1,0,0,0,218,219,1,0,0,0,219,217,1,0,0,0,219,220,1,0,
+        0,0,220,221,1,0,0,0,221,222,5,14,0,0,222,223,5,2,0,0,223,225,3,16,
+        8,0,224,226,5,142,0,0,225,224,1,0,0,0,226,227,1,0,0,0,227,225,1,
+        0,0,0,227,228,1,0,0,0,228,15,1,0,0,0,229,230,5,5,0,0,230,231,5,15,
+        0,0,231,232,5,2,0,0,232,233,3,76,38,0,233,234,5,11,0,0,234,235,5,
+        16,0,0,235,236,5,2,0,0,236,237,3,76,38,0,237,238,5,11,0,0,238,239,
+        5,17,0,0,239,240,5,2,0,0,240,241,5,136,0,0,241,242,5,11,0,0,242,
+        243,5,18,0,0,243,244,5,2,0,0,244,245,3,76,38,0,245,246,5,11,0,0,
+        246,247,5,19,0,0,247,248,5,2,0,0,248,253,3,76,38,0,249,250,5,20,
+        0,0,250,252,3,76,38,0,251,249,1,0,0,0,252,255,1,0,0,0,253,251,1,
+        0,0,0,253,254,1,0,0,0,254,256,1,0,0,0,255,253,1,0,0,0,256,257,5,
+        11,0,0,257,258,5,21,0,0,258,259,5,2,0,0,259,260,5,136,0,0,260,261,
+        5,10,0,0,261,17,1,0,0,0,262,263,5,22,0,0,263,264,5,141,0,0,264,266,
+        5,5,0,0,265,267,5,142,0,0,266,265,1,0,0,0,267,268,1,0,0,0,268,266,
+        1,0,0,0,268,269,1,0,0,0,269,270,1,0,0,0,270,271,5,23,0,0,271,272,
+        5,2,0,0,272,274,5,141,0,0,273,275,5,142,0,0,274,273,1,0,0,0,275,
+        276,1,0,0,0,276,274,1,0,0,0,276,277,1,0,0,0,277,278,1,0,0,0,278,
+        279,5,24,0,0,279,281,5,2,0,0,280,282,5,142,0,0,281,280,1,0,0,0,282,
+        283,1,0,0,0,283,281,1,0,0,0,283,284,1,0,0,0,284,286,1,0,0,0,285,
+        287,3,20,10,0,286,285,1,0,0,0,287,288,1,0,0,0,288,286,1,0,0,0,288,
+        289,1,0,0,0,289,302,1,0,0,0,290,291,5,25,0,0,291,293,5,2,0,0,292,
+        294,5,142,0,0,293,292,1,0,0,0,294,295,1,0,0,0,295,293,1,0,0,0,295,
+        296,1,0,0,0,296,298,1,0,0,0,297,299,3,28,14,0,298,297,1,0,0,0,299,
+        300,1,0,0,0,300,298,1,0,0,0,300,301,1,0,0,0,301,303,1,0,0,0,302,
+        290,1,0,0,0,302,303,1,0,0,0,303,304,1,0,0,0,304,305,5,9,0,0,305,
+        306,5,2,0,0,306,308,5,141,0,0,307,309,5,142,0,0,308,307,1,0,0,0,
+        309,310,1,0,0,0,310,308,1,0,0,0,310,311,1,0,0,0,311,312,1,0,0,0,
+        312,313,5,10,0,0,313,19,1,0,0,0,314,316,3,76,38,0,315,314,1,0,0,
+        0,316,317,1,0,0,0,317,315,1,0,0,0,317,318,1,0,0,0,318,319,1,0,0,
+        0,319,320,5,2,0,0,320,322,3,22,11,0,321,323,5,142,0,0,322,321,1,
+        0,0,0,323,324,1,0,0,0,324,322,1,0,0,0,324,325,1,0,0,0,325,21,1,0,
+        0,0,326,327,5,5,0,0,327,328,5,26,0,0,328,329,5,2,0,0,329,334,3,78,
+        39,0,330,331,5,11,0,0,331,333,3,24,12,0,332,330,1,0,0,0,333,336,
+        1,0,0,0,334,332,1,0,0,0,334,335,1,0,0,0,335,337,1,0,0,0,336,334,
+        1,0,0,0,337,338,5,10,0,0,338,23,1,0,0,0,339,340,5,27,0,0,340,341,
+        5,2,0,0,341,386,5,140,0,0,342,343,5,28,0,0,343,344,5,2,0,0,344,386,
+        5,140,0,0,345,346,5,29,0,0,346,347,5,2,0,0,347,386,3,82,41,0,348,
+        349,5,30,0,0,349,350,5,2,0,0,350,351,5,31,0,0,351,356,3,82,41,0,
+        352,353,5,11,0,0,353,355,3,82,41,0,354,352,1,0,0,0,355,358,1,0,0,
+        0,356,354,1,0,0,0,356,357,1,0,0,0,357,359,1,0,0,0,358,356,1,0,0,
+        0,359,360,5,32,0,0,360,386,1,0,0,0,361,362,5,33,0,0,362,363,5,2,
+        0,0,363,364,5,31,0,0,364,369,3,82,41,0,365,366,5,11,0,0,366,368,
+        3,82,41,0,367,365,1,0,0,0,368,371,1,0,0,0,369,367,1,0,0,0,369,370,
+        1,0,0,0,370,372,1,0,0,0,371,369,1,0,0,0,372,373,5,32,0,0,373,386,
+        1,0,0,0,374,375,5,34,0,0,375,376,5,2,0,0,376,386,3,26,13,0,377,378,
+        5,9,0,0,378,383,5,2,0,0,379,384,3,76,38,0,380,384,5,4,0,0,381,384,
+        5,22,0,0,382,384,5,35,0,0,383,379,1,0,0,0,383,380,1,0,0,0,383,381,
+        1,0,0,0,383,382,1,0,0,0,384,386,1,0,0,0,385,339,1,0,0,0,385,342,
+        1,0,0,0,385,345,1,0,0,0,385,348,1,0,0,0,385,361,1,0,0,0,385,374,
+        1,0,0,0,385,377,1,0,0,0,386,25,1,0,0,0,387,389,8,0,0,0,388,387,1,
+        0,0,0,389,390,1,0,0,0,390,388,1,0,0,0,390,391,1,0,0,0,391,27,1,0,
+        0,0,392,393,5,12,0,0,393,395,3,70,35,0,394,396,5,142,0,0,395,394,
+        1,0,0,0,396,397,1,0,0,0,397,395,1,0,0,0,397,398,1,0,0,0,398,29,1,
+        0,0,0,399,400,5,36,0,0,400,401,5,141,0,0,401,403,5,5,0,0,402,404,
+        5,142,0,0,403,402,1,0,0,0,404,405,1,0,0,0,405,403,1,0,0,0,405,406,
+        1,0,0,0,406,407,1,0,0,0,407,408,5,37,0,0,408,409,5,2,0,0,409,411,
+        7,1,0,0,410,412,5,142,0,0,411,410,1,0,0,0,412,413,1,0,0,0,413,411,
+        1,0,0,0,413,414,1,0,0,0,414,415,1,0,0,0,415,416,5,41,0,0,416,418,
+        5,2,0,0,417,419,5,142,0,0,418,417,1,0,0,0,419,420,1,0,0,0,420,418,
+        1,0,0,0,420,421,1,0,0,0,421,423,1,0,0,0,422,424,3,32,16,0,423,422,
+        1,0,0,0,424,425,1,0,0,0,425,423,1,0,0,0,425,426,1,0,0,0,426,439,
+        1,0,0,0,427,428,5,42,0,0,428,430,5,2,0,0,429,431,5,142,0,0,430,429,
+        1,0,0,0,431,432,1,0,0,0,432,430,1,0,0,0,432,433,1,0,0,0,433,435,
+        1,0,0,0,434,436,3,34,17,0,435,434,1,0,0,0,436,437,1,0,0,0,437,435,
+        1,0,0,0,437,438,1,0,0,0,438,440,1,0,0,0,439,427,1,0,0,0,439,440,
+        1,0,0,0,440,449,1,0,0,0,441,442,5,9,0,0,442,443,5,2,0,0,443,445,
+        5,141,0,0,444,446,5,142,0,0,445,444,1,0,0,0,446,447,1,0,0,0,447,
+        445,1,0,0,0,447,448,1,0,0,0,448,450,1,0,0,0,449,441,1,0,0,0,449,
+        450,1,0,0,0,450,451,1,0,0,0,451,452,5,10,0,0,452,31,1,0,0,0,453,
+        454,3,76,38,0,454,455,5,2,0,0,455,457,3,70,35,0,456,458,5,142,0,
+        0,457,456,1,0,0,0,458,459,1,0,0,0,459,457,1,0,0,0,459,460,1,0,0,
+        0,460,33,1,0,0,0,461,462,5,12,0,0,462,463,5,141,0,0,463,464,5,43,
+        0,0,464,467,5,141,0,0,465,466,5,11,0,0,466,468,5,141,0,0,467,465,
+        1,0,0,0,467,468,1,0,0,0,468,469,1,0,0,0,469,470,5,44,0,0,470,471,
+        5,45,0,0,471,472,5,2,0,0,472,474,5,141,0,0,473,475,5,142,0,0,474,
+        473,1,0,0,0,475,476,1,0,0,0,476,474,1,0,0,0,476,477,1,0,0,0,477,
+        35,1,0,0,0,478,479,5,35,0,0,479,480,5,141,0,0,480,482,5,5,0,0,481,
+        483,5,142,0,0,482,481,1,0,0,0,483,484,1,0,0,0,484,482,1,0,0,0,484,
+        485,1,0,0,0,485,486,1,0,0,0,486,487,5,46,0,0,487,488,5,2,0,0,488,
+        490,5,141,0,0,489,491,5,142,0,0,490,489,1,0,0,0,491,492,1,0,0,0,
+        492,490,1,0,0,0,492,493,1,0,0,0,493,494,1,0,0,0,494,495,5,47,0,0,
+        495,496,5,2,0,0,496,498,5,141,0,0,497,499,5,142,0,0,498,497,1,0,
+        0,0,499,500,1,0,0,0,500,498,1,0,0,0,500,501,1,0,0,0,501,502,1,0,
+        0,0,502,503,5,45,0,0,503,504,5,2,0,0,504,506,5,141,0,0,505,507,5,
+        142,0,0,506,505,1,0,0,0,507,508,1,0,0,0,508,506,1,0,0,0,508,509,
+        1,0,0,0,509,522,1,0,0,0,510,511,5,41,0,0,511,513,5,2,0,0,512,514,
+        5,142,0,0,513,512,1,0,0,0,514,515,1,0,0,0,515,513,1,0,0,0,515,516,
+        1,0,0,0,516,518,1,0,0,0,517,519,3,32,16,0,518,517,1,0,0,0,519,520,
+        1,0,0,0,520,518,1,0,0,0,520,521,1,0,0,0,521,523,1,0,0,0,522,510,
+        1,0,0,0,522,523,1,0,0,0,523,532,1,0,0,0,524,525,5,9,0,0,525,526,
+        5,2,0,0,526,528,5,141,0,0,527,529,5,142,0,0,528,527,1,0,0,0,529,
+        530,1,0,0,0,530,528,1,0,0,0,530,531,1,0,0,0,531,533,1,0,0,0,532,
+        524,1,0,0,0,532,533,1,0,0,0,533,534,1,0,0,0,534,535,5,10,0,0,535,
+        37,1,0,0,0,536,537,5,48,0,0,537,538,5,141,0,0,538,540,5,5,0,0,539,
+        541,5,142,0,0,540,539,1,0,0,0,541,542,1,0,0,0,542,540,1,0,0,0,542,
+        543,1,0,0,0,543,547,1,0,0,0,544,546,3,40,20,0,545,544,1,0,0,0,546,
+        549,1,0,0,0,547,545,1,0,0,0,547,548,1,0,0,0,548,550,1,0,0,0,549,
+        547,1,0,0,0,550,551,5,49,0,0,551,552,5,2,0,0,552,554,3,58,29,0,553,
+        555,5,142,0,0,554,553,1,0,0,0,555,556,1,0,0,0,556,554,1,0,0,0,556,
+        557,1,0,0,0,557,561,1,0,0,0,558,560,3,42,21,0,559,558,1,0,0,0,560,
+        563,1,0,0,0,561,559,1,0,0,0,561,562,1,0,0,0,562,564,1,0,0,0,563,
+        561,1,0,0,0,564,565,5,50,0,0,565,566,5,2,0,0,566,568,3,58,29,0,567,
+        569,5,142,0,0,568,567,1,0,0,0,569,570,1,0,0,0,570,568,1,0,0,0,570,
+        571,1,0,0,0,571,572,1,0,0,0,572,573,5,10,0,0,573,39,1,0,0,0,574,
+        575,5,51,0,0,575,576,5,2,0,0,576,578,3,70,35,0,577,579,5,142,0,0,
+        578,577,1,0,0,0,579,580,1,0,0,0,580,578,1,0,0,0,580,581,1,0,0,0,
+        581,668,1,0,0,0,582,583,5,52,0,0,583,584,5,2,0,0,584,586,3,74,37,
+        0,585,587,5,142,0,0,586,585,1,0,0,0,587,588,1,0,0,0,588,586,1,0,
+        0,0,588,589,1,0,0,0,589,668,1,0,0,0,590,591,5,53,0,0,591,592,5,2,
+        0,0,592,594,3,74,37,0,593,595,5,142,0,0,594,593,1,0,0,0,595,596,
+        1,0,0,0,596,594,1,0,0,0,596,597,1,0,0,0,597,668,1,0,0,0,598,599,
+        5,54,0,0,599,600,5,2,0,0,600,604,5,31,0,0,601,603,5,142,0,0,602,
+        601,1,0,0,0,603,606,1,0,0,0,604,602,1,0,0,0,604,605,1,0,0,0,605,
+        607,1,0,0,0,606,604,1,0,0,0,607,618,5,141,0,0,608,612,5,11,0,0,609,
+        611,5,142,0,0,610,609,1,0,0,0,611,614,1,0,0,0,612,610,1,0,0,0,612,
+        613,1,0,0,0,613,615,1,0,0,0,614,612,1,0,0,0,615,617,5,141,0,0,616,
+        608,1,0,0,0,617,620,1,0,0,0,618,616,1,0,0,0,618,619,1,0,0,0,619,
+        624,1,0,0,0,620,618,1,0,0,0,621,623,5,142,0,0,622,621,1,0,0,0,623,
+        626,1,0,0,0,624,622,1,0,0,0,624,625,1,0,0,0,625,627,1,0,0,0,626,
+        624,1,0,0,0,627,629,5,32,0,0,628,630,5,142,0,0,629,628,1,0,0,0,630,
+        631,1,0,0,0,631,629,1,0,0,0,631,632,1,0,0,0,632,668,1,0,0,0,633,
+        634,5,55,0,0,634,636,5,2,0,0,635,637,5,142,0,0,636,635,1,0,0,0,637,
+        638,1,0,0,0,638,636,1,0,0,0,638,639,1,0,0,0,639,647,1,0,0,0,640,
+        641,5,12,0,0,641,643,3,70,35,0,642,644,5,142,0,0,643,642,1,0,0,0,
+        644,645,1,0,0,0,645,643,1,0,0,0,645,646,1,0,0,0,646,648,1,0,0,0,
+        647,640,1,0,0,0,648,649,1,0,0,0,649,647,1,0,0,0,649,650,1,0,0,0,
+        650,668,1,0,0,0,651,652,5,9,0,0,652,653,5,2,0,0,653,655,5,141,0,
+        0,654,656,5,142,0,0,655,654,1,0,0,0,656,657,1,0,0,0,657,655,1,0,
+        0,0,657,658,1,0,0,0,658,668,1,0,0,0,659,660,5,141,0,0,660,661,5,
+        2,0,0,661,663,3,70,35,0,662,664,5,142,0,0,663,662,1,0,0,0,664,665,
+        1,0,0,0,665,663,1,0,0,0,665,666,1,0,0,0,666,668,1,0,0,0,667,574,
+        1,0,0,0,667,582,1,0,0,0,667,590,1,0,0,0,667,598,1,0,0,0,667,633,
+        1,0,0,0,667,651,1,0,0,0,667,659,1,0,0,0,668,41,1,0,0,0,669,670,5,
+        56,0,0,670,671,5,141,0,0,671,673,5,5,0,0,672,674,5,142,0,0,673,672,
+        1,0,0,0,674,675,1,0,0,0,675,673,1,0,0,0,675,676,1,0,0,0,676,680,
+        1,0,0,0,677,679,3,44,22,0,678,677,1,0,0,0,679,682,1,0,0,0,680,678,
+        1,0,0,0,680,681,1,0,0,0,681,683,1,0,0,0,682,680,1,0,0,0,683,685,
+        5,10,0,0,684,686,5,142,0,0,685,684,1,0,0,0,686,687,1,0,0,0,687,685,
+        1,0,0,0,687,688,1,0,0,0,688,43,1,0,0,0,689,690,5,51,0,0,690,691,
+        5,2,0,0,691,693,3,70,35,0,692,694,5,142,0,0,693,692,1,0,0,0,694,
+        695,1,0,0,0,695,693,1,0,0,0,695,696,1,0,0,0,696,793,1,0,0,0,697,
+        698,5,57,0,0,698,700,5,2,0,0,699,701,5,142,0,0,700,699,1,0,0,0,701,
+        702,1,0,0,0,702,700,1,0,0,0,702,703,1,0,0,0,703,705,1,0,0,0,704,
+        706,3,46,23,0,705,704,1,0,0,0,706,707,1,0,0,0,707,705,1,0,0,0,707,
+        708,1,0,0,0,708,793,1,0,0,0,709,710,5,58,0,0,710,712,5,2,0,0,711,
+        713,5,142,0,0,712,711,1,0,0,0,713,714,1,0,0,0,714,712,1,0,0,0,714,
+        715,1,0,0,0,715,717,1,0,0,0,716,718,3,48,24,0,717,716,1,0,0,0,718,
+        719,1,0,0,0,719,717,1,0,0,0,719,720,1,0,0,0,720,793,1,0,0,0,721,
+        722,5,59,0,0,722,723,5,2,0,0,723,725,3,70,35,0,724,726,5,142,0,0,
+        725,724,1,0,0,0,726,727,1,0,0,0,727,725,1,0,0,0,727,728,1,0,0,0,
+        728,793,1,0,0,0,729,730,5,60,0,0,730,732,5,2,0,0,731,733,5,142,0,
+        0,732,731,1,0,0,0,733,734,1,0,0,0,734,732,1,0,0,0,734,735,1,0,0,
+        0,735,742,1,0,0,0,736,738,3,50,25,0,737,739,5,142,0,0,738,737,1,
+        0,0,0,739,740,1,0,0,0,740,738,1,0,0,0,740,741,1,0,0,0,741,743,1,
+        0,0,0,742,736,1,0,0,0,743,744,1,0,0,0,744,742,1,0,0,0,744,745,1,
+        0,0,0,745,793,1,0,0,0,746,747,5,61,0,0,747,749,5,2,0,0,748,750,5,
+        142,0,0,749,748,1,0,0,0,750,751,1,0,0,0,751,749,1,0,0,0,751,752,
+        1,0,0,0,752,754,1,0,0,0,753,755,3,52,26,0,754,753,1,0,0,0,755,756,
+        1,0,0,0,756,754,1,0,0,0,756,757,1,0,0,0,757,793,1,0,0,0,758,759,
+        5,14,0,0,759,782,5,2,0,0,760,762,3,54,27,0,761,763,5,142,0,0,762,
+        761,1,0,0,0,763,764,1,0,0,0,764,762,1,0,0,0,764,765,1,0,0,0,765,
+        783,1,0,0,0,766,768,5,142,0,0,767,766,1,0,0,0,768,769,1,0,0,0,769,
+        767,1,0,0,0,769,770,1,0,0,0,770,778,1,0,0,0,771,772,5,12,0,0,772,
+        774,3,54,27,0,773,775,5,142,0,0,774,773,1,0,0,0,775,776,1,0,0,0,
+        776,774,1,0,0,0,776,777,1,0,0,0,777,779,1,0,0,0,778,771,1,0,0,0,
+        779,780,1,0,0,0,780,778,1,0,0,0,780,781,1,0,0,0,781,783,1,0,0,0,
+        782,760,1,0,0,0,782,767,1,0,0,0,783,793,1,0,0,0,784,785,5,141,0,
+        0,785,786,5,2,0,0,786,788,3,70,35,0,787,789,5,142,0,0,788,787,1,
+        0,0,0,789,790,1,0,0,0,790,788,1,0,0,0,790,791,1,0,0,0,791,793,1,
+        0,0,0,792,689,1,0,0,0,792,697,1,0,0,0,792,709,1,0,0,0,792,721,1,
+        0,0,0,792,729,1,0,0,0,792,746,1,0,0,0,792,758,1,0,0,0,792,784,1,
+        0,0,0,793,45,1,0,0,0,794,795,5,12,0,0,795,800,3,76,38,0,796,797,
+        5,62,0,0,797,799,3,76,38,0,798,796,1,0,0,0,799,802,1,0,0,0,800,798,
+        1,0,0,0,800,801,1,0,0,0,801,804,1,0,0,0,802,800,1,0,0,0,803,805,
+        5,142,0,0,804,803,1,0,0,0,805,806,1,0,0,0,806,804,1,0,0,0,806,807,
+        1,0,0,0,807,47,1,0,0,0,808,809,5,12,0,0,809,811,3,70,35,0,810,812,
+        5,142,0,0,811,810,1,0,0,0,812,813,1,0,0,0,813,811,1,0,0,0,813,814,
+        1,0,0,0,814,49,1,0,0,0,815,816,5,12,0,0,816,817,3,70,35,0,817,51,
+        1,0,0,0,818,819,5,12,0,0,819,821,3,70,35,0,820,822,5,142,0,0,821,
+        820,1,0,0,0,822,823,1,0,0,0,823,821,1,0,0,0,823,824,1,0,0,0,824,
+        53,1,0,0,0,825,826,3,76,38,0,826,827,5,2,0,0,827,828,3,56,28,0,828,
+        55,1,0,0,0,829,841,3,78,39,0,830,831,5,31,0,0,831,836,3,76,38,0,
+        832,833,5,11,0,0,833,835,3,76,38,0,834,832,1,0,0,0,835,838,1,0,0,
+        0,836,834,1,0,0,0,836,837,1,0,0,0,837,839,1,0,0,0,838,836,1,0,0,
+        0,839,840,5,32,0,0,840,842,1,0,0,0,841,830,1,0,0,0,841,842,1,0,0,
+        0,842,877,1,0,0,0,843,844,5,63,0,0,844,845,5,64,0,0,845,846,5,141,
+        0,0,846,877,5,65,0,0,847,851,5,5,0,0,848,850,5,142,0,0,849,848,1,
+        0,0,0,850,853,1,0,0,0,851,849,1,0,0,0,851,852,1,0,0,0,852,854,1,
+        0,0,0,853,851,1,0,0,0,854,865,3,54,27,0,855,859,5,11,0,0,856,858,
+        5,142,0,0,857,856,1,0,0,0,858,861,1,0,0,0,859,857,1,0,0,0,859,860,
+        1,0,0,0,860,862,1,0,0,0,861,859,1,0,0,0,862,864,3,54,27,0,863,855,
+        1,0,0,0,864,867,1,0,0,0,865,863,1,0,0,0,865,866,1,0,0,0,866,871,
+        1,0,0,0,867,865,1,0,0,0,868,870,5,142,0,0,869,868,1,0,0,0,870,873,
+        1,0,0,0,871,869,1,0,0,0,871,872,1,0,0,0,872,874,1,0,0,0,873,871,
+        1,0,0,0,874,875,5,10,0,0,875,877,1,0,0,0,876,829,1,0,0,0,876,843,
+        1,0,0,0,876,847,1,0,0,0,877,57,1,0,0,0,878,879,5,66,0,0,879,880,
+        5,141,0,0,880,889,5,43,0,0,881,886,3,76,38,0,882,883,5,11,0,0,883,
+        885,3,76,38,0,884,882,1,0,0,0,885,888,1,0,0,0,886,884,1,0,0,0,886,
+        887,1,0,0,0,887,890,1,0,0,0,888,886,1,0,0,0,889,881,1,0,0,0,889,
+        890,1,0,0,0,890,891,1,0,0,0,891,892,5,44,0,0,892,59,1,0,0,0,893,
+        894,5,67,0,0,894,899,5,141,0,0,895,896,5,12,0,0,896,898,5,141,0,
+        0,897,895,1,0,0,0,898,901,1,0,0,0,899,897,1,0,0,0,899,900,1,0,0,
+        0,900,902,1,0,0,0,901,899,1,0,0,0,902,904,5,5,0,0,903,905,5,142,
+        0,0,904,903,1,0,0,0,905,906,1,0,0,0,906,904,1,0,0,0,906,907,1,0,
+        0,0,907,908,1,0,0,0,908,909,5,51,0,0,909,910,5,2,0,0,910,912,3,70,
+        35,0,911,913,5,142,0,0,912,911,1,0,0,0,913,914,1,0,0,0,914,912,1,
+        0,0,0,914,915,1,0,0,0,915,916,1,0,0,0,916,917,5,68,0,0,917,918,5,
+        2,0,0,918,920,3,70,35,0,919,921,5,142,0,0,920,919,1,0,0,0,921,922,
+        1,0,0,0,922,920,1,0,0,0,922,923,1,0,0,0,923,942,1,0,0,0,924,925,
+        5,69,0,0,925,927,5,2,0,0,926,928,5,142,0,0,927,926,1,0,0,0,928,929,
+        1,0,0,0,929,927,1,0,0,0,929,930,1,0,0,0,930,938,1,0,0,0,931,932,
+        5,12,0,0,932,934,3,70,35,0,933,935,5,142,0,0,934,933,1,0,0,0,935,
+        936,1,0,0,0,936,934,1,0,0,0,936,937,1,0,0,0,937,939,1,0,0,0,938,
+        931,1,0,0,0,939,940,1,0,0,0,940,938,1,0,0,0,940,941,1,0,0,0,941,
+        943,1,0,0,0,942,924,1,0,0,0,942,943,1,0,0,0,943,944,1,0,0,0,944,
+        945,5,60,0,0,945,947,5,2,0,0,946,948,5,142,0,0,947,946,1,0,0,0,948,
+        949,1,0,0,0,949,947,1,0,0,0,949,950,1,0,0,0,950,957,1,0,0,0,951,
+        953,3,50,25,0,952,954,5,142,0,0,953,952,1,0,0,0,954,955,1,0,0,0,
+        955,953,1,0,0,0,955,956,1,0,0,0,956,958,1,0,0,0,957,951,1,0,0,0,
+        958,959,1,0,0,0,959,957,1,0,0,0,959,960,1,0,0,0,960,961,1,0,0,0,
+        961,962,5,9,0,0,962,963,5,2,0,0,963,965,5,141,0,0,964,966,5,142,
+        0,0,965,964,1,0,0,0,966,967,1,0,0,0,967,965,1,0,0,0,967,968,1,0,
+        0,0,968,969,1,0,0,0,969,970,5,10,0,0,970,61,1,0,0,0,971,972,5,70,
+        0,0,972,973,5,141,0,0,973,975,5,5,0,0,974,976,5,142,0,0,975,974,
+        1,0,0,0,976,977,1,0,0,0,977,975,1,0,0,0,977,978,1,0,0,0,978,979,
+        1,0,0,0,979,980,5,51,0,0,980,981,5,2,0,0,981,983,3,70,35,0,982,984,
+        5,142,0,0,983,982,1,0,0,0,984,985,1,0,0,0,985,983,1,0,0,0,985,986,
+        1,0,0,0,986,987,1,0,0,0,987,988,5,71,0,0,988,1005,5,2,0,0,989,991,
+        3,70,35,0,990,992,5,142,0,0,991,990,1,0,0,0,992,993,1,0,0,0,993,
+        991,1,0,0,0,993,994,1,0,0,0,994,1006,1,0,0,0,995,997,5,142,0,0,996,
+        995,1,0,0,0,997,998,1,0,0,0,998,996,1,0,0,0,998,999,1,0,0,0,999,
+        1001,1,0,0,0,1000,1002,3,64,32,0,1001,1000,1,0,0,0,1002,1003,1,0,
+        0,0,1003,1001,1,0,0,0,1003,1004,1,0,0,0,1004,1006,1,0,0,0,1005,989,
+        1,0,0,0,1005,996,1,0,0,0,1006,1007,1,0,0,0,1007,1008,5,72,0,0,1008,
+        1009,5,2,0,0,1009,1011,3,70,35,0,1010,1012,5,142,0,0,1011,1010,1,
+        0,0,0,1012,1013,1,0,0,0,1013,1011,1,0,0,0,1013,1014,1,0,0,0,1014,
+        1015,1,0,0,0,1015,1016,5,9,0,0,1016,1017,5,2,0,0,1017,1019,5,141,
+        0,0,1018,1020,5,142,0,0,1019,1018,1,0,0,0,1020,1021,1,0,0,0,1021,
+        1019,1,0,0,0,1021,1022,1,0,0,0,1022,1023,1,0,0,0,1023,1024,5,10,
+        0,0,1024,63,1,0,0,0,1025,1027,8,2,0,0,1026,1028,3,70,35,0,1027,1026,
+        1,0,0,0,1027,1028,1,0,0,0,1028,1030,1,0,0,0,1029,1031,5,142,0,0,
+        1030,1029,1,0,0,0,1031,1032,1,0,0,0,1032,1030,1,0,0,0,1032,1033,
+        1,0,0,0,1033,65,1,0,0,0,1034,1035,5,73,0,0,1035,1036,5,141,0,0,1036,
+        1038,5,5,0,0,1037,1039,5,142,0,0,1038,1037,1,0,0,0,1039,1040,1,0,
+        0,0,1040,1038,1,0,0,0,1040,1041,1,0,0,0,1041,1042,1,0,0,0,1042,1043,
+        5,74,0,0,1043,1044,5,2,0,0,1044,1046,3,70,35,0,1045,1047,5,142,0,
+        0,1046,1045,1,0,0,0,1047,1048,1,0,0,0,1048,1046,1,0,0,0,1048,1049,
+        1,0,0,0,1049,1050,1,0,0,0,1050,1051,5,75,0,0,1051,1052,5,2,0,0,1052,
+        1054,3,70,35,0,1053,1055,5,142,0,0,1054,1053,1,0,0,0,1055,1056,1,
+        0,0,0,1056,1054,1,0,0,0,1056,1057,1,0,0,0,1057,1058,1,0,0,0,1058,
+        1059,5,76,0,0,1059,1061,5,2,0,0,1060,1062,5,142,0,0,1061,1060,1,
+        0,0,0,1062,1063,1,0,0,0,1063,1061,1,0,0,0,1063,1064,1,0,0,0,1064,
+        1066,1,0,0,0,1065,1067,3,68,34,0,1066,1065,1,0,0,0,1067,1068,1,0,
+        0,0,1068,1066,1,0,0,0,1068,1069,1,0,0,0,1069,1070,1,0,0,0,1070,1071,
+        5,61,0,0,1071,1073,5,2,0,0,1072,1074,5,142,0,0,1073,1072,1,0,0,0,
+        1074,1075,1,0,0,0,1075,1073,1,0,0,0,1075,1076,1,0,0,0,1076,1078,
+        1,0,0,0,1077,1079,3,52,26,0,1078,1077,1,0,0,0,1079,1080,1,0,0,0,
+        1080,1078,1,0,0,0,1080,1081,1,0,0,0,1081,1082,1,0,0,0,1082,1083,
+        5,9,0,0,1083,1084,5,2,0,0,1084,1086,5,141,0,0,1085,1087,5,142,0,
+        0,1086,1085,1,0,0,0,1087,1088,1,0,0,0,1088,1086,1,0,0,0,1088,1089,
+        1,0,0,0,1089,1090,1,0,0,0,1090,1091,5,10,0,0,1091,67,1,0,0,0,1092,
+        1093,5,12,0,0,1093,1094,5,141,0,0,1094,1103,5,43,0,0,1095,1100,3,
+        76,38,0,1096,1097,5,11,0,0,1097,1099,3,76,38,0,1098,1096,1,0,0,0,
+        1099,1102,1,0,0,0,1100,1098,1,0,0,0,1100,1101,1,0,0,0,1101,1104,
+        1,0,0,0,1102,1100,1,0,0,0,1103,1095,1,0,0,0,1103,1104,1,0,0,0,1104,
+        1105,1,0,0,0,1105,1107,5,44,0,0,1106,1108,5,142,0,0,1107,1106,1,
+        0,0,0,1108,1109,1,0,0,0,1109,1107,1,0,0,0,1109,1110,1,0,0,0,1110,
+        69,1,0,0,0,1111,1114,8,3,0,0,1112,1114,3,72,36,0,1113,1111,1,0,0,
+        0,1113,1112,1,0,0,0,1114,1115,1,0,0,0,1115,1113,1,0,0,0,1115,1116,
+        1,0,0,0,1116,71,1,0,0,0,1117,1122,5,5,0,0,1118,1121,8,4,0,0,1119,
+        1121,3,72,36,0,1120,1118,1,0,0,0,1120,1119,1,0,0,0,1121,1124,1,0,
+        0,0,1122,1120,1,0,0,0,1122,1123,1,0,0,0,1123,1125,1,0,0,0,1124,1122,
+        1,0,0,0,1125,1126,5,10,0,0,1126,73,1,0,0,0,1127,1135,3,76,38,0,1128,
+        1131,5,12,0,0,1129,1132,3,76,38,0,1130,1132,5,139,0,0,1131,1129,
+        1,0,0,0,1131,1130,1,0,0,0,1132,1134,1,0,0,0,1133,1128,1,0,0,0,1134,
+        1137,1,0,0,0,1135,1133,1,0,0,0,1135,1136,1,0,0,0,1136,75,1,0,0,0,
+        1137,1135,1,0,0,0,1138,1213,5,141,0,0,1139,1213,3,78,39,0,1140,1213,
+        5,51,0,0,1141,1213,5,59,0,0,1142,1213,5,69,0,0,1143,1213,5,68,0,
+        0,1144,1213,5,13,0,0,1145,1213,5,14,0,0,1146,1213,5,15,0,0,1147,
+        1213,5,16,0,0,1148,1213,5,17,0,0,1149,1213,5,18,0,0,1150,1213,5,
+        19,0,0,1151,1213,5,21,0,0,1152,1213,5,26,0,0,1153,1213,5,27,0,0,
+        1154,1213,5,28,0,0,1155,1213,5,29,0,0,1156,1213,5,30,0,0,1157,1213,
+        5,33,0,0,1158,1213,5,34,0,0,1159,1213,5,77,0,0,1160,1213,5,78,0,
+        0,1161,1213,5,79,0,0,1162,1213,5,80,0,0,1163,1213,5,81,0,0,1164,
+        1213,5,37,0,0,1165,1213,5,46,0,0,1166,1213,5,47,0,0,1167,1213,5,
+        45,0,0,1168,1213,5,38,0,0,1169,1213,5,39,0,0,1170,1213,5,40,0,0,
+        1171,1213,5,63,0,0,1172,1213,5,66,0,0,1173,1213,5,71,0,0,1174,1213,
+        5,72,0,0,1175,1213,5,74,0,0,1176,1213,5,97,0,0,1177,1213,5,98,0,
+        0,1178,1213,5,99,0,0,1179,1213,5,100,0,0,1180,1213,5,101,0,0,1181,
+        1213,5,102,0,0,1182,1213,5,103,0,0,1183,1213,5,104,0,0,1184,1213,
+        5,105,0,0,1185,1213,5,106,0,0,1186,1213,5,107,0,0,1187,1213,5,108,
+        0,0,1188,1213,5,109,0,0,1189,1213,5,110,0,0,1190,1213,5,111,0,0,
+        1191,1213,5,112,0,0,1192,1213,5,113,0,0,1193,1213,5,114,0,0,1194,
+        1213,5,115,0,0,1195,1213,5,116,0,0,1196,1213,5,117,0,0,1197,1213,
+        5,118,0,0,1198,1213,5,119,0,0,1199,1213,5,120,0,0,1200,1213,5,121,
+        0,0,1201,1213,5,122,0,0,1202,1213,5,123,0,0,1203,1213,5,124,0,0,
+        1204,1213,5,125,0,0,1205,1213,5,126,0,0,1206,1213,5,127,0,0,1207,
+        1213,5,128,0,0,1208,1213,5,132,0,0,1209,1213,5,133,0,0,1210,1213,
+        5,134,0,0,1211,1213,5,135,0,0,1212,1138,1,0,0,0,1212,1139,1,0,0,
+        0,1212,1140,1,0,0,0,1212,1141,1,0,0,0,1212,1142,1,0,0,0,1212,1143,
+        1,0,0,0,1212,1144,1,0,0,0,1212,1145,1,0,0,0,1212,1146,1,0,0,0,1212,
+        1147,1,0,0,0,1212,1148,1,0,0,0,1212,1149,1,0,0,0,1212,1150,1,0,0,
+        0,1212,1151,1,0,0,0,1212,1152,1,0,0,0,1212,1153,1,0,0,0,1212,1154,
+        1,0,0,0,1212,1155,1,0,0,0,1212,1156,1,0,0,0,1212,1157,1,0,0,0,1212,
+        1158,1,0,0,0,1212,1159,1,0,0,0,1212,1160,1,0,0,0,1212,1161,1,0,0,
+        0,1212,1162,1,0,0,0,1212,1163,1,0,0,0,1212,1164,1,0,0,0,1212,1165,
+        1,0,0,0,1212,1166,1,0,0,0,1212,1167,1,0,0,0,1212,1168,1,0,0,0,1212,
+        1169,1,0,0,0,1212,1170,1,0,0,0,1212,1171,1,0,0,0,1212,1172,1,0,0,
+        0,1212,1173,1,0,0,0,1212,1174,1,0,0,0,1212,1175,1,0,0,0,1212,1176,
+        1,0,0,0,1212,1177,1,0,0,0,1212,1178,1,0,0,0,1212,1179,1,0,0,0,1212,
+        1180,1,0,0,0,1212,1181,1,0,0,0,1212,1182,1,0,0,0,1212,1183,1,0,0,
+        0,1212,1184,1,0,0,0,1212,1185,1,0,0,0,1212,1186,1,0,0,0,1212,1187,
+        1,0,0,0,1212,1188,1,0,0,0,1212,1189,1,0,0,0,1212,1190,1,0,0,0,1212,
+        1191,1,0,0,0,1212,1192,1,0,0,0,1212,1193,1,0,0,0,1212,1194,1,0,0,
+        0,1212,1195,1,0,0,0,1212,1196,1,0,0,0,1212,1197,1,0,0,0,1212,1198,
+        1,0,0,0,1212,1199,1,0,0,0,1212,1200,1,0,0,0,1212,1201,1,0,0,0,1212,
+        1202,1,0,0,0,1212,1203,1,0,0,0,1212,1204,1,0,0,0,1212,1205,1,0,0,
+        0,1212,1206,1,0,0,0,1212,1207,1,0,0,0,1212,1208,1,0,0,0,1212,1209,
+        1,0,0,0,1212,1210,1,0,0,0,1212,1211,1,0,0,0,1213,77,1,0,0,0,1214,
+        1215,7,5,0,0,1215,79,1,0,0,0,1216,1241,5,27,0,0,1217,1241,5,28,0,
+        0,1218,1219,5,77,0,0,1219,1220,5,96,0,0,1220,1241,5,139,0,0,1221,
+        1222,5,78,0,0,1222,1223,5,96,0,0,1223,1241,5,139,0,0,1224,1225,5,
+        30,0,0,1225,1226,5,96,0,0,1226,1227,5,31,0,0,1227,1232,3,82,41,0,
+        1228,1229,5,11,0,0,1229,1231,3,82,41,0,1230,1228,1,0,0,0,1231,1234,
+        1,0,0,0,1232,1230,1,0,0,0,1232,1233,1,0,0,0,1233,1235,1,0,0,0,1234,
+        1232,1,0,0,0,1235,1236,5,32,0,0,1236,1241,1,0,0,0,1237,1241,5,79,
+        0,0,1238,1241,5,80,0,0,1239,1241,5,81,0,0,1240,1216,1,0,0,0,1240,
+        1217,1,0,0,0,1240,1218,1,0,0,0,1240,1221,1,0,0,0,1240,1224,1,0,0,
+        0,1240,1237,1,0,0,0,1240,1238,1,0,0,0,1240,1239,1,0,0,0,1241,81,
+        1,0,0,0,1242,1249,5,136,0,0,1243,1249,5,139,0,0,1244,1249,5,137,
+        0,0,1245,1249,5,138,0,0,1246,1249,5,140,0,0,1247,1249,3,76,38,0,
+        1248,1242,1,0,0,0,1248,1243,1,0,0,0,1248,1244,1,0,0,0,1248,1245,
+        1,0,0,0,1248,1246,1,0,0,0,1248,1247,1,0,0,0,1249,83,1,0,0,0,154,
+        87,100,105,110,124,130,134,147,154,159,166,171,178,187,198,204,211,
+        219,227,253,268,276,283,288,295,300,302,310,317,324,334,356,369,
+        383,385,390,397,405,413,420,425,432,437,439,447,449,459,467,476,
+        484,492,500,508,515,520,522,530,532,542,547,556,561,570,580,588,
+        596,604,612,618,624,631,638,645,649,657,665,667,675,680,687,695,
+        702,707,714,719,727,734,740,744,751,756,764,769,776,780,782,790,
+        792,800,806,813,823,836,841,851,859,865,871,876,886,889,899,906,
+        914,922,929,936,940,942,949,955,959,967,977,985,993,998,1003,1005,
+        1013,1021,1027,1032,1040,1048,1056,1063,1068,1075,1080,1088,1100,
+        1103,1109,1113,1115,1120,1122,1131,1135,1212,1232,1240,1248
     ]
 
 class Banking_v0_85Parser ( Parser ):
@@ -369,35 +533,35 @@ class Banking_v0_85Parser ( Parser ):
 
     sharedContextCache = PredictionContextCache()
 
-    literalNames = [ "<INVALID>", "'Metadata'", "':'", "'DataObject'", "'{'", 
-                     "'Schema'", "'Policies'", "'Resources'", "'erMap'", 
+    literalNames = [ "<INVALID>", "'Import'", "':'", "'Metadata'", "'DataObject'", 
+                     "'{'", "'Schema'", "'Policies'", "'Resources'", "'erMap'", 
                      "'}'", "','", "'-'", "'Input'", "'Output'", "'Channel'", 
-                     "'Protocol'", "'Endpoint'", "'Auth'", "'Format'", "'SLA'", 
-                     "'Entity'", "'dataRef'", "'Properties'", "'Rules'", 
+                     "'Protocol'", "'Endpoint'", "'Auth'", "'Format'", "'|'", 
+                     "'SLA'", "'Entity'", "'dataRef'", "'Properties'", "'Rules'", 
                      "'type'", "'required'", "'unique'", "'default'", "'values'", 
-                     "'['", "']'", "'ITAsset'", "'Kind'", "'Application'", 
-                     "'System'", "'Platform'", "'Attributes'", "'Relationships'", 
-                     "'('", "')'", "'Type'", "'Relationship'", "'From'", 
-                     "'To'", "'Process'", "'Description'", "'ObjectiveID'", 
-                     "'BusinessGoalID'", "'Actors'", "'Starts With'", "'Ends With'", 
-                     "'Step'", "'Inputs'", "'Validation'", "'Condition'", 
-                     "'Actions'", "'ErrorHandling'", "'.'", "'Partial'", 
-                     "'<'", "'>'", "'Event'", "'Rule'", "'Trigger'", "'Conditions'", 
-                     "'Report'", "'Query'", "'Schedule'", "'Integration'", 
-                     "'Provider'", "'Credentials'", "'Operations'", "'UUID'", 
-                     "'String'", "'Integer'", "'Currency'", "'Ratio'", "'Date'", 
-                     "'Enum'", "'JSON'", "'Boolean'", "'SWIFT'", "'BIC'", 
-                     "'CardNumber'", "'CVV'", "'AccountNumber'", "'min'", 
-                     "'='", "'max'", "'masked'", "'encrypted'", "'pci_compliant'", 
-                     "<INVALID>", "'IBAN'", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "'FEDWIRE'", "'CHAPS'", "'TARGET2'", "'CHIPS'", "<INVALID>", 
+                     "'['", "']'", "'range'", "'calculated'", "'Relationship'", 
+                     "'ITAsset'", "'Kind'", "'Application'", "'System'", 
+                     "'Platform'", "'Attributes'", "'Relationships'", "'('", 
+                     "')'", "'Type'", "'From'", "'To'", "'Process'", "'Starts With'", 
+                     "'Ends With'", "'Description'", "'ObjectiveID'", "'BusinessGoalID'", 
+                     "'Actors'", "'Capabilities'", "'Step'", "'Inputs'", 
+                     "'Validation'", "'Condition'", "'Actions'", "'ErrorHandling'", 
+                     "'.'", "'Partial'", "'<'", "'>'", "'Event'", "'Rule'", 
+                     "'Trigger'", "'Conditions'", "'Report'", "'Query'", 
+                     "'Schedule'", "'Integration'", "'Provider'", "'Credentials'", 
+                     "'Operations'", "'min'", "'max'", "'masked'", "'encrypted'", 
+                     "'pci_compliant'", "'UUID'", "'String'", "'Integer'", 
+                     "'Currency'", "'Ratio'", "'Date'", "'Enum'", "'JSON'", 
+                     "'Boolean'", "'SWIFT'", "'BIC'", "'CardNumber'", "'CVV'", 
+                     "'AccountNumber'", "'='", "<INVALID>", "'IBAN'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "'FEDWIRE'", "'CHAPS'", "'TARGET2'", 
+                     "'CHIPS'", "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "<INVALID>", "'DODD_FRANK'", "<INVALID>", 
-                     "'FATCA'", "'FBAR'", "'T+0'", "'T+1'", "'T+2'", "<INVALID>", 
-                     "'FIX_PROTOCOL'" ]
+                     "<INVALID>", "<INVALID>", "<INVALID>", "'DODD_FRANK'", 
+                     "<INVALID>", "'FATCA'", "'FBAR'", "'T+0'", "'T+1'", 
+                     "'T+2'", "<INVALID>", "'FIX_PROTOCOL'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
@@ -422,59 +586,70 @@ class Banking_v0_85Parser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "SWIFT_CODE", "IBAN_CODE", "RTGS", "ACH", "SEPA", 
-                      "FEDWIRE", "CHAPS", "TARGET2", "CHIPS", "PCI_DSS", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "SWIFT_CODE", "IBAN_CODE", "RTGS", "ACH", 
+                      "SEPA", "FEDWIRE", "CHAPS", "TARGET2", "CHIPS", "PCI_DSS", 
                       "PII", "KYC", "AML", "CFT", "CARD_NETWORK", "EMV", 
                       "NFC", "TOKENIZATION", "PAN", "CVV_KEYWORD", "TRANSACTION_STATUS", 
                       "PAYMENT_METHOD", "APR", "APY", "DTI", "LTV", "FICO", 
                       "BASEL_III", "DODD_FRANK", "SOX", "FATCA", "FBAR", 
                       "T_PLUS_ZERO", "T_PLUS_ONE", "T_PLUS_TWO", "ISO20022", 
-                      "FIX", "MT", "MX", "STRING", "TEXT", "ENUM", "UUID", 
-                      "DATE", "NUMBER", "BOOLEAN", "IDENTIFIER", "NL", "WS", 
-                      "LINE_COMMENT", "BLOCK_COMMENT" ]
+                      "FIX", "MT", "MX", "STRING", "UUID", "DATE", "NUMBER", 
+                      "BOOLEAN", "IDENTIFIER", "NL", "WS", "LINE_COMMENT", 
+                      "BLOCK_COMMENT", "HASH_COMMENT", "ANY" ]
 
     RULE_eblDefinition = 0
-    RULE_metadata = 1
-    RULE_metadataField = 2
-    RULE_dataObject = 3
-    RULE_fieldDef = 4
-    RULE_policyDef = 5
-    RULE_resourceBlock = 6
-    RULE_resourceDef = 7
-    RULE_entity = 8
-    RULE_property = 9
-    RULE_propertyDef = 10
-    RULE_propertyAttr = 11
-    RULE_ruleStatement = 12
-    RULE_itAsset = 13
-    RULE_kvPair = 14
-    RULE_relRef = 15
-    RULE_relationshipDef = 16
-    RULE_process = 17
-    RULE_step = 18
-    RULE_inputItem = 19
-    RULE_validation = 20
-    RULE_action = 21
-    RULE_errorAction = 22
-    RULE_output = 23
-    RULE_typeDef = 24
-    RULE_event = 25
-    RULE_ruleDef = 26
-    RULE_report = 27
-    RULE_integration = 28
-    RULE_operation = 29
-    RULE_type = 30
-    RULE_fieldAttr = 31
-    RULE_value = 32
-
-    ruleNames =  [ "eblDefinition", "metadata", "metadataField", "dataObject", 
-                   "fieldDef", "policyDef", "resourceBlock", "resourceDef", 
-                   "entity", "property", "propertyDef", "propertyAttr", 
-                   "ruleStatement", "itAsset", "kvPair", "relRef", "relationshipDef", 
-                   "process", "step", "inputItem", "validation", "action", 
-                   "errorAction", "output", "typeDef", "event", "ruleDef", 
-                   "report", "integration", "operation", "type", "fieldAttr", 
-                   "value" ]
+    RULE_importDirective = 1
+    RULE_metadata = 2
+    RULE_metadataField = 3
+    RULE_dataObject = 4
+    RULE_fieldDef = 5
+    RULE_policyDef = 6
+    RULE_resourceBlock = 7
+    RULE_resourceDef = 8
+    RULE_entity = 9
+    RULE_property = 10
+    RULE_propertyDef = 11
+    RULE_propertyAttr = 12
+    RULE_expression = 13
+    RULE_ruleStatement = 14
+    RULE_itAsset = 15
+    RULE_kvPair = 16
+    RULE_relRef = 17
+    RULE_relationshipDef = 18
+    RULE_process = 19
+    RULE_processField = 20
+    RULE_step = 21
+    RULE_stepSection = 22
+    RULE_inputItem = 23
+    RULE_validation = 24
+    RULE_action = 25
+    RULE_errorAction = 26
+    RULE_output = 27
+    RULE_typeDef = 28
+    RULE_event = 29
+    RULE_ruleDef = 30
+    RULE_report = 31
+    RULE_queryLine = 32
+    RULE_integration = 33
+    RULE_operation = 34
+    RULE_text = 35
+    RULE_braced = 36
+    RULE_code = 37
+    RULE_identifier = 38
+    RULE_type = 39
+    RULE_fieldAttr = 40
+    RULE_value = 41
+
+    ruleNames =  [ "eblDefinition", "importDirective", "metadata", "metadataField", 
+                   "dataObject", "fieldDef", "policyDef", "resourceBlock", 
+                   "resourceDef", "entity", "property", "propertyDef", "propertyAttr", 
+                   "expression", "ruleStatement", "itAsset", "kvPair", "relRef", 
+                   "relationshipDef", "process", "processField", "step", 
+                   "stepSection", "inputItem", "validation", "action", "errorAction", 
+                   "output", "typeDef", "event", "ruleDef", "report", "queryLine", 
+                   "integration", "operation", "text", "braced", "code", 
+                   "identifier", "type", "fieldAttr", "value" ]
 
     EOF = Token.EOF
     T__0=1
@@ -568,61 +743,66 @@ class Banking_v0_85Parser ( Parser ):
     T__88=89
     T__89=90
     T__90=91
-    SWIFT_CODE=92
-    IBAN_CODE=93
-    RTGS=94
-    ACH=95
-    SEPA=96
-    FEDWIRE=97
-    CHAPS=98
-    TARGET2=99
-    CHIPS=100
-    PCI_DSS=101
-    PII=102
-    KYC=103
-    AML=104
-    CFT=105
-    CARD_NETWORK=106
-    EMV=107
-    NFC=108
-    TOKENIZATION=109
-    PAN=110
-    CVV_KEYWORD=111
-    TRANSACTION_STATUS=112
-    PAYMENT_METHOD=113
-    APR=114
-    APY=115
-    DTI=116
-    LTV=117
-    FICO=118
-    BASEL_III=119
-    DODD_FRANK=120
-    SOX=121
-    FATCA=122
-    FBAR=123
-    T_PLUS_ZERO=124
-    T_PLUS_ONE=125
-    T_PLUS_TWO=126
-    ISO20022=127
-    FIX=128
-    MT=129
-    MX=130
-    STRING=131
-    TEXT=132
-    ENUM=133
-    UUID=134
-    DATE=135
-    NUMBER=136
-    BOOLEAN=137
-    IDENTIFIER=138
-    NL=139
-    WS=140
-    LINE_COMMENT=141
-    BLOCK_COMMENT=142
+    T__91=92
+    T__92=93
+    T__93=94
+    T__94=95
+    T__95=96
+    SWIFT_CODE=97
+    IBAN_CODE=98
+    RTGS=99
+    ACH=100
+    SEPA=101
+    FEDWIRE=102
+    CHAPS=103
+    TARGET2=104
+    CHIPS=105
+    PCI_DSS=106
+    PII=107
+    KYC=108
+    AML=109
+    CFT=110
+    CARD_NETWORK=111
+    EMV=112
+    NFC=113
+    TOKENIZATION=114
+    PAN=115
+    CVV_KEYWORD=116
+    TRANSACTION_STATUS=117
+    PAYMENT_METHOD=118
+    APR=119
+    APY=120
+    DTI=121
+    LTV=122
+    FICO=123
+    BASEL_III=124
+    DODD_FRANK=125
+    SOX=126
+    FATCA=127
+    FBAR=128
+    T_PLUS_ZERO=129
+    T_PLUS_ONE=130
+    T_PLUS_TWO=131
+    ISO20022=132
+    FIX=133
+    MT=134
+    MX=135
+    STRING=136
+    UUID=137
+    DATE=138
+    NUMBER=139
+    BOOLEAN=140
+    IDENTIFIER=141
+    NL=142
+    WS=143
+    LINE_COMMENT=144
+    BLOCK_COMMENT=145
+    HASH_COMMENT=146
+    ANY=147
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
-        self.checkVersion("4.13.1")
+        self.checkVersion("4.13.2")
         self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
         self._predicates = None
 
@@ -636,13 +816,29 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def metadata(self):
-            return self.getTypedRuleContext(Banking_v0_85Parser.MetadataContext,0)
-
-
         def EOF(self):
             return self.getToken(Banking_v0_85Parser.EOF, 0)
 
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def importDirective(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ImportDirectiveContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ImportDirectiveContext,i)
+
+
+        def metadata(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.MetadataContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.MetadataContext,i)
+
+
         def dataObject(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(Banking_v0_85Parser.DataObjectContext)
@@ -726,71 +922,81 @@ class Banking_v0_85Parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 66
-            self.metadata()
-            self.state = 68 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 67
-                self.dataObject()
-                self.state = 70 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==3):
-                    break
-
-            self.state = 73 
+            self.state = 87
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while True:
-                self.state = 72
-                self.entity()
-                self.state = 75 
+            while _la==142:
+                self.state = 84
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 89
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==20):
-                    break
 
-            self.state = 85
+            self.state = 110
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while ((((_la - 31)) & ~0x3f) == 0 and ((1 << (_la - 31)) & 156766315521) != 0):
-                self.state = 83
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 281578060120090) != 0) or ((((_la - 67)) & ~0x3f) == 0 and ((1 << (_la - 67)) & 73) != 0):
+                self.state = 100
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
-                if token in [31]:
-                    self.state = 77
+                if token in [1]:
+                    self.state = 90
+                    self.importDirective()
+                    pass
+                elif token in [3]:
+                    self.state = 91
+                    self.metadata()
+                    pass
+                elif token in [4]:
+                    self.state = 92
+                    self.dataObject()
+                    pass
+                elif token in [22]:
+                    self.state = 93
+                    self.entity()
+                    pass
+                elif token in [36]:
+                    self.state = 94
                     self.itAsset()
                     pass
-                elif token in [44]:
-                    self.state = 78
+                elif token in [48]:
+                    self.state = 95
                     self.process()
                     pass
-                elif token in [62]:
-                    self.state = 79
+                elif token in [67]:
+                    self.state = 96
                     self.ruleDef()
                     pass
-                elif token in [41]:
-                    self.state = 80
+                elif token in [35]:
+                    self.state = 97
                     self.relationshipDef()
                     pass
-                elif token in [65]:
-                    self.state = 81
+                elif token in [70]:
+                    self.state = 98
                     self.report()
                     pass
-                elif token in [68]:
-                    self.state = 82
+                elif token in [73]:
+                    self.state = 99
                     self.integration()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 87
+                self.state = 105
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==142:
+                    self.state = 102
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 107
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 112
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 88
+            self.state = 113
             self.match(Banking_v0_85Parser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -801,6 +1007,57 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
+    class ImportDirectiveContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRING(self):
+            return self.getToken(Banking_v0_85Parser.STRING, 0)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_importDirective
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterImportDirective" ):
+                listener.enterImportDirective(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitImportDirective" ):
+                listener.exitImportDirective(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitImportDirective" ):
+                return visitor.visitImportDirective(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def importDirective(self):
+
+        localctx = Banking_v0_85Parser.ImportDirectiveContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_importDirective)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 115
+            self.match(Banking_v0_85Parser.T__0)
+            self.state = 116
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 117
+            self.match(Banking_v0_85Parser.STRING)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class MetadataContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -844,45 +1101,49 @@ class Banking_v0_85Parser ( Parser ):
     def metadata(self):
 
         localctx = Banking_v0_85Parser.MetadataContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 2, self.RULE_metadata)
+        self.enterRule(localctx, 4, self.RULE_metadata)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 90
-            self.match(Banking_v0_85Parser.T__0)
-            self.state = 91
+            self.state = 119
+            self.match(Banking_v0_85Parser.T__2)
+            self.state = 120
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 93 
+            self.state = 122 
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 92
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 95 
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 121
+                    self.match(Banking_v0_85Parser.NL)
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 124 
                 self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+                _alt = self._interp.adaptivePredict(self._input,4,self._ctx)
 
-            self.state = 105
+            self.state = 134
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==138:
-                self.state = 97
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0):
+                self.state = 126
                 self.metadataField()
-                self.state = 99 
+                self.state = 128 
                 self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while True:
-                    self.state = 98
-                    self.match(Banking_v0_85Parser.NL)
-                    self.state = 101 
+                _alt = 1
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt == 1:
+                        self.state = 127
+                        self.match(Banking_v0_85Parser.NL)
+
+                    else:
+                        raise NoViableAltException(self)
+                    self.state = 130 
                     self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-                    if not (_la==139):
-                        break
+                    _alt = self._interp.adaptivePredict(self._input,5,self._ctx)
 
-                self.state = 107
+                self.state = 136
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -902,11 +1163,12 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
 
-        def value(self):
-            return self.getTypedRuleContext(Banking_v0_85Parser.ValueContext,0)
+
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
 
 
         def getRuleIndex(self):
@@ -932,15 +1194,15 @@ class Banking_v0_85Parser ( Parser ):
     def metadataField(self):
 
         localctx = Banking_v0_85Parser.MetadataFieldContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 4, self.RULE_metadataField)
+        self.enterRule(localctx, 6, self.RULE_metadataField)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 108
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 109
+            self.state = 137
+            self.identifier()
+            self.state = 138
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 110
-            self.value()
+            self.state = 139
+            self.text()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1010,122 +1272,122 @@ class Banking_v0_85Parser ( Parser ):
     def dataObject(self):
 
         localctx = Banking_v0_85Parser.DataObjectContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 6, self.RULE_dataObject)
+        self.enterRule(localctx, 8, self.RULE_dataObject)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 112
-            self.match(Banking_v0_85Parser.T__2)
-            self.state = 113
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 114
+            self.state = 141
             self.match(Banking_v0_85Parser.T__3)
-            self.state = 116 
+            self.state = 142
+            self.match(Banking_v0_85Parser.IDENTIFIER)
+            self.state = 143
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 145 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 115
+                self.state = 144
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 118 
+                self.state = 147 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 120
-            self.match(Banking_v0_85Parser.T__4)
-            self.state = 121
+            self.state = 149
+            self.match(Banking_v0_85Parser.T__5)
+            self.state = 150
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 123 
+            self.state = 152 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 122
+                self.state = 151
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 125 
+                self.state = 154 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 128 
+            self.state = 157 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 127
+                self.state = 156
                 self.fieldDef()
-                self.state = 130 
+                self.state = 159 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==138):
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0)):
                     break
 
-            self.state = 132
-            self.match(Banking_v0_85Parser.T__5)
-            self.state = 133
+            self.state = 161
+            self.match(Banking_v0_85Parser.T__6)
+            self.state = 162
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 135 
+            self.state = 164 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 134
+                self.state = 163
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 137 
+                self.state = 166 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 140 
+            self.state = 169 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 139
+                self.state = 168
                 self.policyDef()
-                self.state = 142 
+                self.state = 171 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==11):
+                if not (_la==12):
                     break
 
-            self.state = 144
-            self.match(Banking_v0_85Parser.T__6)
-            self.state = 145
+            self.state = 173
+            self.match(Banking_v0_85Parser.T__7)
+            self.state = 174
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 147 
+            self.state = 176 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 146
+                self.state = 175
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 149 
+                self.state = 178 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 151
+            self.state = 180
             self.resourceBlock()
-            self.state = 152
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 153
+            self.state = 181
+            self.match(Banking_v0_85Parser.T__8)
+            self.state = 182
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 154
+            self.state = 183
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 156 
+            self.state = 185 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 155
+                self.state = 184
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 158 
+                self.state = 187 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 160
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 189
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1142,8 +1404,9 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
+
 
         def type_(self):
             return self.getTypedRuleContext(Banking_v0_85Parser.TypeContext,0)
@@ -1185,38 +1448,38 @@ class Banking_v0_85Parser ( Parser ):
     def fieldDef(self):
 
         localctx = Banking_v0_85Parser.FieldDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 8, self.RULE_fieldDef)
+        self.enterRule(localctx, 10, self.RULE_fieldDef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 162
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 163
+            self.state = 191
+            self.identifier()
+            self.state = 192
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 164
+            self.state = 193
             self.type_()
-            self.state = 169
+            self.state = 198
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 165
-                self.match(Banking_v0_85Parser.T__9)
-                self.state = 166
+            while _la==11:
+                self.state = 194
+                self.match(Banking_v0_85Parser.T__10)
+                self.state = 195
                 self.fieldAttr()
-                self.state = 171
+                self.state = 200
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 173 
+            self.state = 202 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 172
+                self.state = 201
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 175 
+                self.state = 204 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -1235,8 +1498,9 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -1267,24 +1531,24 @@ class Banking_v0_85Parser ( Parser ):
     def policyDef(self):
 
         localctx = Banking_v0_85Parser.PolicyDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_policyDef)
+        self.enterRule(localctx, 12, self.RULE_policyDef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 177
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 178
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 180 
+            self.state = 206
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 207
+            self.text()
+            self.state = 209 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 179
+                self.state = 208
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 182 
+                self.state = 211 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -1339,44 +1603,44 @@ class Banking_v0_85Parser ( Parser ):
     def resourceBlock(self):
 
         localctx = Banking_v0_85Parser.ResourceBlockContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_resourceBlock)
+        self.enterRule(localctx, 14, self.RULE_resourceBlock)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 184
-            self.match(Banking_v0_85Parser.T__11)
-            self.state = 185
+            self.state = 213
+            self.match(Banking_v0_85Parser.T__12)
+            self.state = 214
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 186
+            self.state = 215
             self.resourceDef()
-            self.state = 188 
+            self.state = 217 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 187
+                self.state = 216
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 190 
+                self.state = 219 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 192
-            self.match(Banking_v0_85Parser.T__12)
-            self.state = 193
+            self.state = 221
+            self.match(Banking_v0_85Parser.T__13)
+            self.state = 222
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 194
+            self.state = 223
             self.resourceDef()
-            self.state = 196 
+            self.state = 225 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 195
+                self.state = 224
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 198 
+                self.state = 227 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -1395,11 +1659,12 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
             else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
 
         def STRING(self, i:int=None):
             if i is None:
@@ -1430,59 +1695,72 @@ class Banking_v0_85Parser ( Parser ):
     def resourceDef(self):
 
         localctx = Banking_v0_85Parser.ResourceDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_resourceDef)
+        self.enterRule(localctx, 16, self.RULE_resourceDef)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 200
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 201
-            self.match(Banking_v0_85Parser.T__13)
-            self.state = 202
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 203
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 204
-            self.match(Banking_v0_85Parser.T__9)
-            self.state = 205
+            self.state = 229
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 230
             self.match(Banking_v0_85Parser.T__14)
-            self.state = 206
+            self.state = 231
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 207
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 208
-            self.match(Banking_v0_85Parser.T__9)
-            self.state = 209
+            self.state = 232
+            self.identifier()
+            self.state = 233
+            self.match(Banking_v0_85Parser.T__10)
+            self.state = 234
             self.match(Banking_v0_85Parser.T__15)
-            self.state = 210
+            self.state = 235
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 211
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 212
-            self.match(Banking_v0_85Parser.T__9)
-            self.state = 213
+            self.state = 236
+            self.identifier()
+            self.state = 237
+            self.match(Banking_v0_85Parser.T__10)
+            self.state = 238
             self.match(Banking_v0_85Parser.T__16)
-            self.state = 214
+            self.state = 239
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 215
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 216
-            self.match(Banking_v0_85Parser.T__9)
-            self.state = 217
+            self.state = 240
+            self.match(Banking_v0_85Parser.STRING)
+            self.state = 241
+            self.match(Banking_v0_85Parser.T__10)
+            self.state = 242
             self.match(Banking_v0_85Parser.T__17)
-            self.state = 218
+            self.state = 243
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 219
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 220
-            self.match(Banking_v0_85Parser.T__9)
-            self.state = 221
+            self.state = 244
+            self.identifier()
+            self.state = 245
+            self.match(Banking_v0_85Parser.T__10)
+            self.state = 246
             self.match(Banking_v0_85Parser.T__18)
-            self.state = 222
+            self.state = 247
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 223
+            self.state = 248
+            self.identifier()
+            self.state = 253
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==20:
+                self.state = 249
+                self.match(Banking_v0_85Parser.T__19)
+                self.state = 250
+                self.identifier()
+                self.state = 255
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 256
+            self.match(Banking_v0_85Parser.T__10)
+            self.state = 257
+            self.match(Banking_v0_85Parser.T__20)
+            self.state = 258
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 259
             self.match(Banking_v0_85Parser.STRING)
-            self.state = 224
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 260
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1548,128 +1826,128 @@ class Banking_v0_85Parser ( Parser ):
     def entity(self):
 
         localctx = Banking_v0_85Parser.EntityContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_entity)
+        self.enterRule(localctx, 18, self.RULE_entity)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 226
-            self.match(Banking_v0_85Parser.T__19)
-            self.state = 227
+            self.state = 262
+            self.match(Banking_v0_85Parser.T__21)
+            self.state = 263
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 228
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 230 
+            self.state = 264
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 266 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 229
+                self.state = 265
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 232 
+                self.state = 268 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 234
-            self.match(Banking_v0_85Parser.T__20)
-            self.state = 235
+            self.state = 270
+            self.match(Banking_v0_85Parser.T__22)
+            self.state = 271
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 236
+            self.state = 272
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 238 
+            self.state = 274 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 237
+                self.state = 273
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 240 
+                self.state = 276 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 242
-            self.match(Banking_v0_85Parser.T__21)
-            self.state = 243
+            self.state = 278
+            self.match(Banking_v0_85Parser.T__23)
+            self.state = 279
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 245 
+            self.state = 281 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 244
+                self.state = 280
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 247 
+                self.state = 283 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 250 
+            self.state = 286 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 249
+                self.state = 285
                 self.property_()
-                self.state = 252 
+                self.state = 288 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==138):
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0)):
                     break
 
-            self.state = 266
+            self.state = 302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==23:
-                self.state = 254
-                self.match(Banking_v0_85Parser.T__22)
-                self.state = 255
+            if _la==25:
+                self.state = 290
+                self.match(Banking_v0_85Parser.T__24)
+                self.state = 291
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 257 
+                self.state = 293 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 256
+                    self.state = 292
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 259 
+                    self.state = 295 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 262 
+                self.state = 298 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 261
+                    self.state = 297
                     self.ruleStatement()
-                    self.state = 264 
+                    self.state = 300 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
+                    if not (_la==12):
                         break
 
 
 
-            self.state = 268
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 269
+            self.state = 304
+            self.match(Banking_v0_85Parser.T__8)
+            self.state = 305
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 270
+            self.state = 306
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 272 
+            self.state = 308 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 271
+                self.state = 307
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 274 
+                self.state = 310 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 276
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 312
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1686,13 +1964,17 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
-
         def propertyDef(self):
             return self.getTypedRuleContext(Banking_v0_85Parser.PropertyDefContext,0)
 
 
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
+
         def NL(self, i:int=None):
             if i is None:
                 return self.getTokens(Banking_v0_85Parser.NL)
@@ -1722,26 +2004,36 @@ class Banking_v0_85Parser ( Parser ):
     def property_(self):
 
         localctx = Banking_v0_85Parser.PropertyContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_property)
+        self.enterRule(localctx, 20, self.RULE_property)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 278
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 279
+            self.state = 315 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 314
+                self.identifier()
+                self.state = 317 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0)):
+                    break
+
+            self.state = 319
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 280
+            self.state = 320
             self.propertyDef()
-            self.state = 282 
+            self.state = 322 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 281
+                self.state = 321
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 284 
+                self.state = 324 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -1794,32 +2086,32 @@ class Banking_v0_85Parser ( Parser ):
     def propertyDef(self):
 
         localctx = Banking_v0_85Parser.PropertyDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_propertyDef)
+        self.enterRule(localctx, 22, self.RULE_propertyDef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 286
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 287
-            self.match(Banking_v0_85Parser.T__23)
-            self.state = 288
+            self.state = 326
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 327
+            self.match(Banking_v0_85Parser.T__25)
+            self.state = 328
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 289
+            self.state = 329
             self.type_()
-            self.state = 294
+            self.state = 334
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 290
-                self.match(Banking_v0_85Parser.T__9)
-                self.state = 291
+            while _la==11:
+                self.state = 330
+                self.match(Banking_v0_85Parser.T__10)
+                self.state = 331
                 self.propertyAttr()
-                self.state = 296
+                self.state = 336
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 297
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 337
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1846,6 +2138,14 @@ class Banking_v0_85Parser ( Parser ):
                 return self.getTypedRuleContext(Banking_v0_85Parser.ValueContext,i)
 
 
+        def expression(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.ExpressionContext,0)
+
+
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
+
+
         def getRuleIndex(self):
             return Banking_v0_85Parser.RULE_propertyAttr
 
@@ -1869,63 +2169,126 @@ class Banking_v0_85Parser ( Parser ):
     def propertyAttr(self):
 
         localctx = Banking_v0_85Parser.PropertyAttrContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_propertyAttr)
+        self.enterRule(localctx, 24, self.RULE_propertyAttr)
         self._la = 0 # Token type
         try:
-            self.state = 321
+            self.state = 385
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [25]:
+            if token in [27]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 299
-                self.match(Banking_v0_85Parser.T__24)
-                self.state = 300
+                self.state = 339
+                self.match(Banking_v0_85Parser.T__26)
+                self.state = 340
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 301
+                self.state = 341
                 self.match(Banking_v0_85Parser.BOOLEAN)
                 pass
-            elif token in [26]:
+            elif token in [28]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 302
-                self.match(Banking_v0_85Parser.T__25)
-                self.state = 303
+                self.state = 342
+                self.match(Banking_v0_85Parser.T__27)
+                self.state = 343
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 304
+                self.state = 344
                 self.match(Banking_v0_85Parser.BOOLEAN)
                 pass
-            elif token in [27]:
+            elif token in [29]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 305
-                self.match(Banking_v0_85Parser.T__26)
-                self.state = 306
+                self.state = 345
+                self.match(Banking_v0_85Parser.T__28)
+                self.state = 346
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 307
+                self.state = 347
                 self.value()
                 pass
-            elif token in [28]:
+            elif token in [30]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 308
-                self.match(Banking_v0_85Parser.T__27)
-                self.state = 309
+                self.state = 348
+                self.match(Banking_v0_85Parser.T__29)
+                self.state = 349
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 310
-                self.match(Banking_v0_85Parser.T__28)
-                self.state = 311
+                self.state = 350
+                self.match(Banking_v0_85Parser.T__30)
+                self.state = 351
                 self.value()
-                self.state = 316
+                self.state = 356
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 312
-                    self.match(Banking_v0_85Parser.T__9)
-                    self.state = 313
+                while _la==11:
+                    self.state = 352
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 353
                     self.value()
-                    self.state = 318
+                    self.state = 358
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 319
-                self.match(Banking_v0_85Parser.T__29)
+                self.state = 359
+                self.match(Banking_v0_85Parser.T__31)
+                pass
+            elif token in [33]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 361
+                self.match(Banking_v0_85Parser.T__32)
+                self.state = 362
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 363
+                self.match(Banking_v0_85Parser.T__30)
+                self.state = 364
+                self.value()
+                self.state = 369
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==11:
+                    self.state = 365
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 366
+                    self.value()
+                    self.state = 371
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 372
+                self.match(Banking_v0_85Parser.T__31)
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 374
+                self.match(Banking_v0_85Parser.T__33)
+                self.state = 375
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 376
+                self.expression()
+                pass
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 377
+                self.match(Banking_v0_85Parser.T__8)
+                self.state = 378
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 383
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [13, 14, 15, 16, 17, 18, 19, 21, 26, 27, 28, 29, 30, 33, 34, 37, 38, 39, 40, 45, 46, 47, 51, 59, 63, 66, 68, 69, 71, 72, 74, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 132, 133, 134, 135, 141]:
+                    self.state = 379
+                    self.identifier()
+                    pass
+                elif token in [4]:
+                    self.state = 380
+                    self.match(Banking_v0_85Parser.T__3)
+                    pass
+                elif token in [22]:
+                    self.state = 381
+                    self.match(Banking_v0_85Parser.T__21)
+                    pass
+                elif token in [35]:
+                    self.state = 382
+                    self.match(Banking_v0_85Parser.T__34)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
                 pass
             else:
                 raise NoViableAltException(self)
@@ -1939,6 +2302,72 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
+    class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_expression
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExpression" ):
+                listener.enterExpression(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExpression" ):
+                listener.exitExpression(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpression" ):
+                return visitor.visitExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expression(self):
+
+        localctx = Banking_v0_85Parser.ExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_expression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 388 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 387
+                _la = self._input.LA(1)
+                if _la <= 0 or (((_la) & ~0x3f) == 0 and ((1 << _la) & 3104) != 0) or _la==142:
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 390 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -3106) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 1032191) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class RuleStatementContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1946,8 +2375,9 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def STRING(self):
-            return self.getToken(Banking_v0_85Parser.STRING, 0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -1978,24 +2408,24 @@ class Banking_v0_85Parser ( Parser ):
     def ruleStatement(self):
 
         localctx = Banking_v0_85Parser.RuleStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_ruleStatement)
+        self.enterRule(localctx, 28, self.RULE_ruleStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 323
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 324
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 326 
+            self.state = 392
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 393
+            self.text()
+            self.state = 395 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 325
+                self.state = 394
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 328 
+                self.state = 397 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -2063,139 +2493,139 @@ class Banking_v0_85Parser ( Parser ):
     def itAsset(self):
 
         localctx = Banking_v0_85Parser.ItAssetContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_itAsset)
+        self.enterRule(localctx, 30, self.RULE_itAsset)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 330
-            self.match(Banking_v0_85Parser.T__30)
-            self.state = 331
+            self.state = 399
+            self.match(Banking_v0_85Parser.T__35)
+            self.state = 400
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 332
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 334 
+            self.state = 401
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 403 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 333
+                self.state = 402
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 336 
+                self.state = 405 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 338
-            self.match(Banking_v0_85Parser.T__31)
-            self.state = 339
+            self.state = 407
+            self.match(Banking_v0_85Parser.T__36)
+            self.state = 408
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 340
+            self.state = 409
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 60129542144) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1924145348608) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 342 
+            self.state = 411 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 341
+                self.state = 410
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 344 
+                self.state = 413 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 346
-            self.match(Banking_v0_85Parser.T__35)
-            self.state = 347
+            self.state = 415
+            self.match(Banking_v0_85Parser.T__40)
+            self.state = 416
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 349 
+            self.state = 418 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 348
+                self.state = 417
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 351 
+                self.state = 420 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 354 
+            self.state = 423 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 353
+                self.state = 422
                 self.kvPair()
-                self.state = 356 
+                self.state = 425 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==138):
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0)):
                     break
 
-            self.state = 370
+            self.state = 439
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==37:
-                self.state = 358
-                self.match(Banking_v0_85Parser.T__36)
-                self.state = 359
+            if _la==42:
+                self.state = 427
+                self.match(Banking_v0_85Parser.T__41)
+                self.state = 428
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 361 
+                self.state = 430 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 360
+                    self.state = 429
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 363 
+                    self.state = 432 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 366 
+                self.state = 435 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 365
+                    self.state = 434
                     self.relRef()
-                    self.state = 368 
+                    self.state = 437 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
+                    if not (_la==12):
                         break
 
 
 
-            self.state = 380
+            self.state = 449
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==8:
-                self.state = 372
-                self.match(Banking_v0_85Parser.T__7)
-                self.state = 373
+            if _la==9:
+                self.state = 441
+                self.match(Banking_v0_85Parser.T__8)
+                self.state = 442
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 374
+                self.state = 443
                 self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 376 
+                self.state = 445 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 375
+                    self.state = 444
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 378 
+                    self.state = 447 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
 
 
-            self.state = 382
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 451
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2212,11 +2642,13 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
+
+
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
 
         def NL(self, i:int=None):
             if i is None:
@@ -2247,26 +2679,26 @@ class Banking_v0_85Parser ( Parser ):
     def kvPair(self):
 
         localctx = Banking_v0_85Parser.KvPairContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_kvPair)
+        self.enterRule(localctx, 32, self.RULE_kvPair)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 384
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 385
+            self.state = 453
+            self.identifier()
+            self.state = 454
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 386
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 388 
+            self.state = 455
+            self.text()
+            self.state = 457 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 387
+                self.state = 456
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 390 
+                self.state = 459 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -2320,46 +2752,46 @@ class Banking_v0_85Parser ( Parser ):
     def relRef(self):
 
         localctx = Banking_v0_85Parser.RelRefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_relRef)
+        self.enterRule(localctx, 34, self.RULE_relRef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 392
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 393
+            self.state = 461
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 462
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 394
-            self.match(Banking_v0_85Parser.T__37)
-            self.state = 395
+            self.state = 463
+            self.match(Banking_v0_85Parser.T__42)
+            self.state = 464
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 398
+            self.state = 467
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==10:
-                self.state = 396
-                self.match(Banking_v0_85Parser.T__9)
-                self.state = 397
+            if _la==11:
+                self.state = 465
+                self.match(Banking_v0_85Parser.T__10)
+                self.state = 466
                 self.match(Banking_v0_85Parser.IDENTIFIER)
 
 
-            self.state = 400
-            self.match(Banking_v0_85Parser.T__38)
-            self.state = 401
-            self.match(Banking_v0_85Parser.T__39)
-            self.state = 402
+            self.state = 469
+            self.match(Banking_v0_85Parser.T__43)
+            self.state = 470
+            self.match(Banking_v0_85Parser.T__44)
+            self.state = 471
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 403
+            self.state = 472
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 405 
+            self.state = 474 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 404
+                self.state = 473
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 407 
+                self.state = 476 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -2420,142 +2852,142 @@ class Banking_v0_85Parser ( Parser ):
     def relationshipDef(self):
 
         localctx = Banking_v0_85Parser.RelationshipDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_relationshipDef)
+        self.enterRule(localctx, 36, self.RULE_relationshipDef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 409
-            self.match(Banking_v0_85Parser.T__40)
-            self.state = 410
+            self.state = 478
+            self.match(Banking_v0_85Parser.T__34)
+            self.state = 479
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 411
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 413 
+            self.state = 480
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 482 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 412
+                self.state = 481
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 415 
+                self.state = 484 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 417
-            self.match(Banking_v0_85Parser.T__41)
-            self.state = 418
+            self.state = 486
+            self.match(Banking_v0_85Parser.T__45)
+            self.state = 487
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 419
+            self.state = 488
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 421 
+            self.state = 490 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 420
+                self.state = 489
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 423 
+                self.state = 492 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 425
-            self.match(Banking_v0_85Parser.T__42)
-            self.state = 426
+            self.state = 494
+            self.match(Banking_v0_85Parser.T__46)
+            self.state = 495
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 427
+            self.state = 496
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 429 
+            self.state = 498 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 428
+                self.state = 497
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 431 
+                self.state = 500 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 433
-            self.match(Banking_v0_85Parser.T__39)
-            self.state = 434
+            self.state = 502
+            self.match(Banking_v0_85Parser.T__44)
+            self.state = 503
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 435
+            self.state = 504
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 437 
+            self.state = 506 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 436
+                self.state = 505
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 439 
+                self.state = 508 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 453
+            self.state = 522
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==36:
-                self.state = 441
-                self.match(Banking_v0_85Parser.T__35)
-                self.state = 442
+            if _la==41:
+                self.state = 510
+                self.match(Banking_v0_85Parser.T__40)
+                self.state = 511
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 444 
+                self.state = 513 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 443
+                    self.state = 512
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 446 
+                    self.state = 515 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 449 
+                self.state = 518 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 448
+                    self.state = 517
                     self.kvPair()
-                    self.state = 451 
+                    self.state = 520 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==138):
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0)):
                         break
 
 
 
-            self.state = 463
+            self.state = 532
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==8:
-                self.state = 455
-                self.match(Banking_v0_85Parser.T__7)
-                self.state = 456
+            if _la==9:
+                self.state = 524
+                self.match(Banking_v0_85Parser.T__8)
+                self.state = 525
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 457
+                self.state = 526
                 self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 459 
+                self.state = 528 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 458
+                    self.state = 527
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 461 
+                    self.state = 530 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
 
 
-            self.state = 465
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 534
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2572,14 +3004,8 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
-            else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
-
-        def STRING(self):
-            return self.getToken(Banking_v0_85Parser.STRING, 0)
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
 
         def event(self, i:int=None):
             if i is None:
@@ -2594,6 +3020,13 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
+        def processField(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ProcessFieldContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ProcessFieldContext,i)
+
+
         def step(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(Banking_v0_85Parser.StepContext)
@@ -2624,184 +3057,86 @@ class Banking_v0_85Parser ( Parser ):
     def process(self):
 
         localctx = Banking_v0_85Parser.ProcessContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_process)
+        self.enterRule(localctx, 38, self.RULE_process)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 467
-            self.match(Banking_v0_85Parser.T__43)
-            self.state = 468
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 469
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 471 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 470
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 473 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-            self.state = 475
-            self.match(Banking_v0_85Parser.T__44)
-            self.state = 476
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 477
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 479 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 478
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 481 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-            self.state = 483
-            self.match(Banking_v0_85Parser.T__45)
-            self.state = 484
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 485
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 487 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 486
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 489 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-            self.state = 491
-            self.match(Banking_v0_85Parser.T__46)
-            self.state = 492
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 493
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 495 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 494
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 497 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-            self.state = 499
+            self.state = 536
             self.match(Banking_v0_85Parser.T__47)
-            self.state = 500
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 501
-            self.match(Banking_v0_85Parser.T__28)
-            self.state = 502
+            self.state = 537
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 507
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==10:
-                self.state = 503
-                self.match(Banking_v0_85Parser.T__9)
-                self.state = 504
-                self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 509
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-            self.state = 510
-            self.match(Banking_v0_85Parser.T__29)
-            self.state = 512 
+            self.state = 538
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 540 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 511
+                self.state = 539
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 514 
+                self.state = 542 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 516
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 517
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 518
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 520 
+            self.state = 547
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while True:
-                self.state = 519
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 522 
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 69805794224243200) != 0) or _la==141:
+                self.state = 544
+                self.processField()
+                self.state = 549
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
-                    break
 
-            self.state = 524
+            self.state = 550
             self.match(Banking_v0_85Parser.T__48)
-            self.state = 525
+            self.state = 551
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 526
+            self.state = 552
             self.event()
-            self.state = 528 
+            self.state = 554 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 527
+                self.state = 553
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 530 
+                self.state = 556 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 533 
+            self.state = 561
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while True:
-                self.state = 532
+            while _la==56:
+                self.state = 558
                 self.step()
-                self.state = 535 
+                self.state = 563
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==51):
-                    break
 
-            self.state = 537
+            self.state = 564
             self.match(Banking_v0_85Parser.T__49)
-            self.state = 538
+            self.state = 565
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 539
+            self.state = 566
             self.event()
-            self.state = 541 
+            self.state = 568 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 540
+                self.state = 567
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 543 
+                self.state = 570 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 545
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 572
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2811,15 +3146,19 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class StepContext(ParserRuleContext):
+    class ProcessFieldContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+        def text(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.TextContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,i)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -2827,272 +3166,265 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
+        def code(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.CodeContext,0)
 
-        def output(self):
-            return self.getTypedRuleContext(Banking_v0_85Parser.OutputContext,0)
 
-
-        def inputItem(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.InputItemContext)
-            else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.InputItemContext,i)
-
-
-        def validation(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.ValidationContext)
-            else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.ValidationContext,i)
-
-
-        def action(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.ActionContext)
-            else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.ActionContext,i)
-
-
-        def errorAction(self, i:int=None):
+        def IDENTIFIER(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.ErrorActionContext)
+                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
             else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.ErrorActionContext,i)
-
+                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
 
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_step
+            return Banking_v0_85Parser.RULE_processField
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterStep" ):
-                listener.enterStep(self)
+            if hasattr( listener, "enterProcessField" ):
+                listener.enterProcessField(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitStep" ):
-                listener.exitStep(self)
+            if hasattr( listener, "exitProcessField" ):
+                listener.exitProcessField(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitStep" ):
-                return visitor.visitStep(self)
+            if hasattr( visitor, "visitProcessField" ):
+                return visitor.visitProcessField(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def step(self):
+    def processField(self):
 
-        localctx = Banking_v0_85Parser.StepContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_step)
+        localctx = Banking_v0_85Parser.ProcessFieldContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_processField)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 547
-            self.match(Banking_v0_85Parser.T__50)
-            self.state = 548
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 549
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 551 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 550
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 553 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-            self.state = 567
+            self.state = 667
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==52:
-                self.state = 555
-                self.match(Banking_v0_85Parser.T__51)
-                self.state = 556
+            token = self._input.LA(1)
+            if token in [51]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 574
+                self.match(Banking_v0_85Parser.T__50)
+                self.state = 575
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 558 
+                self.state = 576
+                self.text()
+                self.state = 578 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 557
+                    self.state = 577
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 560 
+                    self.state = 580 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 563 
+                pass
+            elif token in [52]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 582
+                self.match(Banking_v0_85Parser.T__51)
+                self.state = 583
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 584
+                self.code()
+                self.state = 586 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 562
-                    self.inputItem()
-                    self.state = 565 
+                    self.state = 585
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 588 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
+                    if not (_la==142):
                         break
 
-
-
-            self.state = 581
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==53:
-                self.state = 569
+                pass
+            elif token in [53]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 590
                 self.match(Banking_v0_85Parser.T__52)
-                self.state = 570
+                self.state = 591
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 572 
+                self.state = 592
+                self.code()
+                self.state = 594 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 571
+                    self.state = 593
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 574 
+                    self.state = 596 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 577 
+                pass
+            elif token in [54]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 598
+                self.match(Banking_v0_85Parser.T__53)
+                self.state = 599
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 600
+                self.match(Banking_v0_85Parser.T__30)
+                self.state = 604
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while True:
-                    self.state = 576
-                    self.validation()
-                    self.state = 579 
+                while _la==142:
+                    self.state = 601
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 606
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
-                        break
-
 
+                self.state = 607
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                self.state = 618
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==11:
+                    self.state = 608
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 612
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==142:
+                        self.state = 609
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 614
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+                    self.state = 615
+                    self.match(Banking_v0_85Parser.IDENTIFIER)
+                    self.state = 620
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
 
-            self.state = 591
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==54:
-                self.state = 583
-                self.match(Banking_v0_85Parser.T__53)
-                self.state = 584
-                self.match(Banking_v0_85Parser.T__1)
-                self.state = 585
-                self.match(Banking_v0_85Parser.TEXT)
-                self.state = 587 
+                self.state = 624
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while True:
-                    self.state = 586
+                while _la==142:
+                    self.state = 621
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 589 
+                    self.state = 626
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
-                        break
-
 
-
-            self.state = 605
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==55:
-                self.state = 593
-                self.match(Banking_v0_85Parser.T__54)
-                self.state = 594
-                self.match(Banking_v0_85Parser.T__1)
-                self.state = 596 
+                self.state = 627
+                self.match(Banking_v0_85Parser.T__31)
+                self.state = 629 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 595
+                    self.state = 628
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 598 
+                    self.state = 631 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 601 
+                pass
+            elif token in [55]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 633
+                self.match(Banking_v0_85Parser.T__54)
+                self.state = 634
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 636 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 600
-                    self.action()
-                    self.state = 603 
+                    self.state = 635
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 638 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
+                    if not (_la==142):
                         break
 
-
-
-            self.state = 619
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==56:
-                self.state = 607
-                self.match(Banking_v0_85Parser.T__55)
-                self.state = 608
-                self.match(Banking_v0_85Parser.T__1)
-                self.state = 610 
+                self.state = 647 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 609
-                    self.match(Banking_v0_85Parser.NL)
-                    self.state = 612 
+                    self.state = 640
+                    self.match(Banking_v0_85Parser.T__11)
+                    self.state = 641
+                    self.text()
+                    self.state = 643 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    while True:
+                        self.state = 642
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 645 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==142):
+                            break
+
+                    self.state = 649 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
                         break
 
-                self.state = 615 
+                pass
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 651
+                self.match(Banking_v0_85Parser.T__8)
+                self.state = 652
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 653
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                self.state = 655 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 614
-                    self.errorAction()
-                    self.state = 617 
+                    self.state = 654
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 657 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==11):
+                    if not (_la==142):
                         break
 
-
-
-            self.state = 629
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==13:
-                self.state = 621
-                self.match(Banking_v0_85Parser.T__12)
-                self.state = 622
+                pass
+            elif token in [141]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 659
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                self.state = 660
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 623
-                self.output()
-                self.state = 625 
+                self.state = 661
+                self.text()
+                self.state = 663 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 624
+                    self.state = 662
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 627 
+                    self.state = 665 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
+                pass
+            else:
+                raise NoViableAltException(self)
 
-
-            self.state = 631
-            self.match(Banking_v0_85Parser.T__8)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -3102,18 +3434,15 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class InputItemContext(ParserRuleContext):
+    class StepContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
-            else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
 
         def NL(self, i:int=None):
             if i is None:
@@ -3121,59 +3450,80 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
+        def stepSection(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.StepSectionContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.StepSectionContext,i)
+
+
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_inputItem
+            return Banking_v0_85Parser.RULE_step
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterInputItem" ):
-                listener.enterInputItem(self)
+            if hasattr( listener, "enterStep" ):
+                listener.enterStep(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitInputItem" ):
-                listener.exitInputItem(self)
+            if hasattr( listener, "exitStep" ):
+                listener.exitStep(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitInputItem" ):
-                return visitor.visitInputItem(self)
+            if hasattr( visitor, "visitStep" ):
+                return visitor.visitStep(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def inputItem(self):
+    def step(self):
 
-        localctx = Banking_v0_85Parser.InputItemContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_inputItem)
+        localctx = Banking_v0_85Parser.StepContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_step)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 633
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 634
+            self.state = 669
+            self.match(Banking_v0_85Parser.T__55)
+            self.state = 670
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 639
+            self.state = 671
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 673 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==57:
-                self.state = 635
-                self.match(Banking_v0_85Parser.T__56)
-                self.state = 636
-                self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 641
+            while True:
+                self.state = 672
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 675 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 680
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4469822630165233664) != 0) or _la==141:
+                self.state = 677
+                self.stepSection()
+                self.state = 682
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 643 
+            self.state = 683
+            self.match(Banking_v0_85Parser.T__9)
+            self.state = 685 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 642
+                self.state = 684
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 645 
+                self.state = 687 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -3185,15 +3535,16 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class ValidationContext(ParserRuleContext):
+    class StepSectionContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -3201,67 +3552,366 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
+        def inputItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.InputItemContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.InputItemContext,i)
+
+
+        def validation(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ValidationContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ValidationContext,i)
+
+
+        def action(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ActionContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ActionContext,i)
+
+
+        def errorAction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ErrorActionContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ErrorActionContext,i)
+
+
+        def output(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.OutputContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.OutputContext,i)
+
+
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_validation
+            return Banking_v0_85Parser.RULE_stepSection
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterValidation" ):
-                listener.enterValidation(self)
+            if hasattr( listener, "enterStepSection" ):
+                listener.enterStepSection(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitValidation" ):
-                listener.exitValidation(self)
+            if hasattr( listener, "exitStepSection" ):
+                listener.exitStepSection(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitValidation" ):
-                return visitor.visitValidation(self)
+            if hasattr( visitor, "visitStepSection" ):
+                return visitor.visitStepSection(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def validation(self):
+    def stepSection(self):
 
-        localctx = Banking_v0_85Parser.ValidationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_validation)
+        localctx = Banking_v0_85Parser.StepSectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_stepSection)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 647
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 648
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 650 
+            self.state = 792
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 649
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 652 
+            token = self._input.LA(1)
+            if token in [51]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 689
+                self.match(Banking_v0_85Parser.T__50)
+                self.state = 690
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 691
+                self.text()
+                self.state = 693 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
-                    break
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
+                while True:
+                    self.state = 692
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 695 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                pass
+            elif token in [57]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 697
+                self.match(Banking_v0_85Parser.T__56)
+                self.state = 698
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 700 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 699
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 702 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                self.state = 705 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 704
+                    self.inputItem()
+                    self.state = 707 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
+                        break
+
+                pass
+            elif token in [58]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 709
+                self.match(Banking_v0_85Parser.T__57)
+                self.state = 710
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 712 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 711
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 714 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                self.state = 717 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 716
+                    self.validation()
+                    self.state = 719 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
+                        break
+
+                pass
+            elif token in [59]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 721
+                self.match(Banking_v0_85Parser.T__58)
+                self.state = 722
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 723
+                self.text()
+                self.state = 725 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 724
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 727 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                pass
+            elif token in [60]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 729
+                self.match(Banking_v0_85Parser.T__59)
+                self.state = 730
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 732 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 731
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 734 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                self.state = 742 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 736
+                    self.action()
+                    self.state = 738 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while True:
+                        self.state = 737
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 740 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==142):
+                            break
+
+                    self.state = 744 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
+                        break
+
+                pass
+            elif token in [61]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 746
+                self.match(Banking_v0_85Parser.T__60)
+                self.state = 747
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 749 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 748
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 751 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                self.state = 754 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 753
+                    self.errorAction()
+                    self.state = 756 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
+                        break
+
+                pass
+            elif token in [14]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 758
+                self.match(Banking_v0_85Parser.T__13)
+                self.state = 759
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 782
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [13, 14, 15, 16, 17, 18, 19, 21, 26, 27, 28, 29, 30, 33, 34, 37, 38, 39, 40, 45, 46, 47, 51, 59, 63, 66, 68, 69, 71, 72, 74, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 132, 133, 134, 135, 141]:
+                    self.state = 760
+                    self.output()
+                    self.state = 762 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while True:
+                        self.state = 761
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 764 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==142):
+                            break
+
+                    pass
+                elif token in [142]:
+                    self.state = 767 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while True:
+                        self.state = 766
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 769 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==142):
+                            break
+
+                    self.state = 778 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while True:
+                        self.state = 771
+                        self.match(Banking_v0_85Parser.T__11)
+                        self.state = 772
+                        self.output()
+                        self.state = 774 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        while True:
+                            self.state = 773
+                            self.match(Banking_v0_85Parser.NL)
+                            self.state = 776 
+                            self._errHandler.sync(self)
+                            _la = self._input.LA(1)
+                            if not (_la==142):
+                                break
+
+                        self.state = 780 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==12):
+                            break
+
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            elif token in [141]:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 784
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                self.state = 785
+                self.match(Banking_v0_85Parser.T__1)
+                self.state = 786
+                self.text()
+                self.state = 788 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 787
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 790 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
-    class ActionContext(ParserRuleContext):
-        __slots__ = 'parser'
+
+    class InputItemContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -3270,46 +3920,58 @@ class Banking_v0_85Parser ( Parser ):
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_action
+            return Banking_v0_85Parser.RULE_inputItem
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAction" ):
-                listener.enterAction(self)
+            if hasattr( listener, "enterInputItem" ):
+                listener.enterInputItem(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAction" ):
-                listener.exitAction(self)
+            if hasattr( listener, "exitInputItem" ):
+                listener.exitInputItem(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAction" ):
-                return visitor.visitAction(self)
+            if hasattr( visitor, "visitInputItem" ):
+                return visitor.visitInputItem(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def action(self):
+    def inputItem(self):
 
-        localctx = Banking_v0_85Parser.ActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_action)
+        localctx = Banking_v0_85Parser.InputItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_inputItem)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 654
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 655
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 657 
+            self.state = 794
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 795
+            self.identifier()
+            self.state = 800
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==62:
+                self.state = 796
+                self.match(Banking_v0_85Parser.T__61)
+                self.state = 797
+                self.identifier()
+                self.state = 802
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 804 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 656
+                self.state = 803
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 659 
+                self.state = 806 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -3321,15 +3983,16 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class ErrorActionContext(ParserRuleContext):
+    class ValidationContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -3338,46 +4001,46 @@ class Banking_v0_85Parser ( Parser ):
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_errorAction
+            return Banking_v0_85Parser.RULE_validation
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterErrorAction" ):
-                listener.enterErrorAction(self)
+            if hasattr( listener, "enterValidation" ):
+                listener.enterValidation(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitErrorAction" ):
-                listener.exitErrorAction(self)
+            if hasattr( listener, "exitValidation" ):
+                listener.exitValidation(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitErrorAction" ):
-                return visitor.visitErrorAction(self)
+            if hasattr( visitor, "visitValidation" ):
+                return visitor.visitValidation(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def errorAction(self):
+    def validation(self):
 
-        localctx = Banking_v0_85Parser.ErrorActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_errorAction)
+        localctx = Banking_v0_85Parser.ValidationContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_validation)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 661
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 662
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 664 
+            self.state = 808
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 809
+            self.text()
+            self.state = 811 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 663
+                self.state = 810
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 666 
+                self.state = 813 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
         except RecognitionException as re:
@@ -3389,52 +4052,47 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class OutputContext(ParserRuleContext):
+    class ActionContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
-
-        def typeDef(self):
-            return self.getTypedRuleContext(Banking_v0_85Parser.TypeDefContext,0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
 
 
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_output
+            return Banking_v0_85Parser.RULE_action
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterOutput" ):
-                listener.enterOutput(self)
+            if hasattr( listener, "enterAction" ):
+                listener.enterAction(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitOutput" ):
-                listener.exitOutput(self)
+            if hasattr( listener, "exitAction" ):
+                listener.exitAction(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitOutput" ):
-                return visitor.visitOutput(self)
+            if hasattr( visitor, "visitAction" ):
+                return visitor.visitAction(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def output(self):
+    def action(self):
 
-        localctx = Banking_v0_85Parser.OutputContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_output)
+        localctx = Banking_v0_85Parser.ActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_action)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 668
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 669
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 670
-            self.typeDef()
+            self.state = 815
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 816
+            self.text()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -3444,76 +4102,284 @@ class Banking_v0_85Parser ( Parser ):
         return localctx
 
 
-    class TypeDefContext(ParserRuleContext):
+    class ErrorActionContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def type_(self):
-            return self.getTypedRuleContext(Banking_v0_85Parser.TypeContext,0)
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
 
 
-        def IDENTIFIER(self):
-            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
 
         def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_typeDef
+            return Banking_v0_85Parser.RULE_errorAction
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterTypeDef" ):
-                listener.enterTypeDef(self)
+            if hasattr( listener, "enterErrorAction" ):
+                listener.enterErrorAction(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitTypeDef" ):
-                listener.exitTypeDef(self)
+            if hasattr( listener, "exitErrorAction" ):
+                listener.exitErrorAction(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitTypeDef" ):
-                return visitor.visitTypeDef(self)
+            if hasattr( visitor, "visitErrorAction" ):
+                return visitor.visitErrorAction(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def typeDef(self):
+    def errorAction(self):
 
-        localctx = Banking_v0_85Parser.TypeDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_typeDef)
+        localctx = Banking_v0_85Parser.ErrorActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_errorAction)
+        self._la = 0 # Token type
         try:
-            self.state = 683
-            self._errHandler.sync(self)
+            self.enterOuterAlt(localctx, 1)
+            self.state = 818
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 819
+            self.text()
+            self.state = 821 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 820
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 823 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OutputContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
+
+
+        def typeDef(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TypeDefContext,0)
+
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_output
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOutput" ):
+                listener.enterOutput(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOutput" ):
+                listener.exitOutput(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOutput" ):
+                return visitor.visitOutput(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def output(self):
+
+        localctx = Banking_v0_85Parser.OutputContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_output)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 825
+            self.identifier()
+            self.state = 826
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 827
+            self.typeDef()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeDefContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TypeContext,0)
+
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
+
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+
+        def output(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.OutputContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.OutputContext,i)
+
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_typeDef
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTypeDef" ):
+                listener.enterTypeDef(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTypeDef" ):
+                listener.exitTypeDef(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTypeDef" ):
+                return visitor.visitTypeDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def typeDef(self):
+
+        localctx = Banking_v0_85Parser.TypeDefContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_typeDef)
+        self._la = 0 # Token type
+        try:
+            self.state = 876
+            self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 93]:
+            if token in [82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 98]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 672
+                self.state = 829
                 self.type_()
+                self.state = 841
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==31:
+                    self.state = 830
+                    self.match(Banking_v0_85Parser.T__30)
+                    self.state = 831
+                    self.identifier()
+                    self.state = 836
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==11:
+                        self.state = 832
+                        self.match(Banking_v0_85Parser.T__10)
+                        self.state = 833
+                        self.identifier()
+                        self.state = 838
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+                    self.state = 839
+                    self.match(Banking_v0_85Parser.T__31)
+
+
                 pass
-            elif token in [58]:
+            elif token in [63]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 673
-                self.match(Banking_v0_85Parser.T__57)
-                self.state = 674
-                self.match(Banking_v0_85Parser.T__58)
-                self.state = 675
+                self.state = 843
+                self.match(Banking_v0_85Parser.T__62)
+                self.state = 844
+                self.match(Banking_v0_85Parser.T__63)
+                self.state = 845
                 self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 676
-                self.match(Banking_v0_85Parser.T__59)
+                self.state = 846
+                self.match(Banking_v0_85Parser.T__64)
                 pass
-            elif token in [4]:
+            elif token in [5]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 677
-                self.match(Banking_v0_85Parser.T__3)
-                self.state = 678
-                self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 679
-                self.match(Banking_v0_85Parser.T__1)
-                self.state = 680
-                self.type_()
-                self.state = 681
-                self.match(Banking_v0_85Parser.T__8)
+                self.state = 847
+                self.match(Banking_v0_85Parser.T__4)
+                self.state = 851
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==142:
+                    self.state = 848
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 853
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 854
+                self.output()
+                self.state = 865
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==11:
+                    self.state = 855
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 859
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==142:
+                        self.state = 856
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 861
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+                    self.state = 862
+                    self.output()
+                    self.state = 867
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 871
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==142:
+                    self.state = 868
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 873
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 874
+                self.match(Banking_v0_85Parser.T__9)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -3534,11 +4400,15 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
             else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
 
         def getRuleIndex(self):
             return Banking_v0_85Parser.RULE_event
@@ -3563,38 +4433,38 @@ class Banking_v0_85Parser ( Parser ):
     def event(self):
 
         localctx = Banking_v0_85Parser.EventContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 50, self.RULE_event)
+        self.enterRule(localctx, 58, self.RULE_event)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 685
-            self.match(Banking_v0_85Parser.T__60)
-            self.state = 686
+            self.state = 878
+            self.match(Banking_v0_85Parser.T__65)
+            self.state = 879
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 687
-            self.match(Banking_v0_85Parser.T__37)
-            self.state = 696
+            self.state = 880
+            self.match(Banking_v0_85Parser.T__42)
+            self.state = 889
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==138:
-                self.state = 688
-                self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 693
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0):
+                self.state = 881
+                self.identifier()
+                self.state = 886
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 689
-                    self.match(Banking_v0_85Parser.T__9)
-                    self.state = 690
-                    self.match(Banking_v0_85Parser.IDENTIFIER)
-                    self.state = 695
+                while _la==11:
+                    self.state = 882
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 883
+                    self.identifier()
+                    self.state = 888
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 698
-            self.match(Banking_v0_85Parser.T__38)
+            self.state = 891
+            self.match(Banking_v0_85Parser.T__43)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -3617,14 +4487,12 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
 
-        def STRING(self):
-            return self.getToken(Banking_v0_85Parser.STRING, 0)
-
-        def TEXT(self, i:int=None):
+        def text(self, i:int=None):
             if i is None:
-                return self.getTokens(Banking_v0_85Parser.TEXT)
+                return self.getTypedRuleContexts(Banking_v0_85Parser.TextContext)
             else:
-                return self.getToken(Banking_v0_85Parser.TEXT, i)
+                return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,i)
+
 
         def NL(self, i:int=None):
             if i is None:
@@ -3662,150 +4530,184 @@ class Banking_v0_85Parser ( Parser ):
     def ruleDef(self):
 
         localctx = Banking_v0_85Parser.RuleDefContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 52, self.RULE_ruleDef)
+        self.enterRule(localctx, 60, self.RULE_ruleDef)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 700
-            self.match(Banking_v0_85Parser.T__61)
-            self.state = 701
+            self.state = 893
+            self.match(Banking_v0_85Parser.T__66)
+            self.state = 894
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 702
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 704 
+            self.state = 899
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==12:
+                self.state = 895
+                self.match(Banking_v0_85Parser.T__11)
+                self.state = 896
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                self.state = 901
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 902
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 904 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 703
+                self.state = 903
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 706 
+                self.state = 906 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 708
-            self.match(Banking_v0_85Parser.T__44)
-            self.state = 709
+            self.state = 908
+            self.match(Banking_v0_85Parser.T__50)
+            self.state = 909
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 710
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 712 
+            self.state = 910
+            self.text()
+            self.state = 912 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 711
+                self.state = 911
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 714 
+                self.state = 914 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 716
-            self.match(Banking_v0_85Parser.T__62)
-            self.state = 717
+            self.state = 916
+            self.match(Banking_v0_85Parser.T__67)
+            self.state = 917
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 718
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 720 
+            self.state = 918
+            self.text()
+            self.state = 920 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 719
+                self.state = 919
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 722 
+                self.state = 922 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 739
+            self.state = 942
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==64:
-                self.state = 724
-                self.match(Banking_v0_85Parser.T__63)
-                self.state = 725
+            if _la==69:
+                self.state = 924
+                self.match(Banking_v0_85Parser.T__68)
+                self.state = 925
                 self.match(Banking_v0_85Parser.T__1)
-                self.state = 727 
+                self.state = 927 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 726
+                    self.state = 926
                     self.match(Banking_v0_85Parser.NL)
-                    self.state = 729 
+                    self.state = 929 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    if not (_la==142):
                         break
 
-                self.state = 731
-                self.match(Banking_v0_85Parser.TEXT)
-                self.state = 733 
+                self.state = 938 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 732
-                    self.match(Banking_v0_85Parser.NL)
-                    self.state = 735 
+                    self.state = 931
+                    self.match(Banking_v0_85Parser.T__11)
+                    self.state = 932
+                    self.text()
+                    self.state = 934 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==139):
+                    while True:
+                        self.state = 933
+                        self.match(Banking_v0_85Parser.NL)
+                        self.state = 936 
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if not (_la==142):
+                            break
+
+                    self.state = 940 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==12):
                         break
 
-                self.state = 741
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
 
-            self.state = 742
-            self.match(Banking_v0_85Parser.T__54)
-            self.state = 743
+
+            self.state = 944
+            self.match(Banking_v0_85Parser.T__59)
+            self.state = 945
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 745 
+            self.state = 947 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 744
+                self.state = 946
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 747 
+                self.state = 949 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 750 
+            self.state = 957 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 749
+                self.state = 951
                 self.action()
-                self.state = 752 
+                self.state = 953 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 952
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 955 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
+
+                self.state = 959 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==11):
+                if not (_la==12):
                     break
 
-            self.state = 754
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 755
+            self.state = 961
+            self.match(Banking_v0_85Parser.T__8)
+            self.state = 962
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 756
+            self.state = 963
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 758 
+            self.state = 965 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 757
+                self.state = 964
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 760 
+                self.state = 967 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 762
-            self.match(Banking_v0_85Parser.T__8)
+            self.state = 969
+            self.match(Banking_v0_85Parser.T__9)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -3828,14 +4730,12 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
 
-        def STRING(self, i:int=None):
+        def text(self, i:int=None):
             if i is None:
-                return self.getTokens(Banking_v0_85Parser.STRING)
+                return self.getTypedRuleContexts(Banking_v0_85Parser.TextContext)
             else:
-                return self.getToken(Banking_v0_85Parser.STRING, i)
+                return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,i)
 
-        def TEXT(self):
-            return self.getToken(Banking_v0_85Parser.TEXT, 0)
 
         def NL(self, i:int=None):
             if i is None:
@@ -3843,6 +4743,13 @@ class Banking_v0_85Parser ( Parser ):
             else:
                 return self.getToken(Banking_v0_85Parser.NL, i)
 
+        def queryLine(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.QueryLineContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.QueryLineContext,i)
+
+
         def getRuleIndex(self):
             return Banking_v0_85Parser.RULE_report
 
@@ -3866,102 +4773,216 @@ class Banking_v0_85Parser ( Parser ):
     def report(self):
 
         localctx = Banking_v0_85Parser.ReportContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 54, self.RULE_report)
+        self.enterRule(localctx, 62, self.RULE_report)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 764
-            self.match(Banking_v0_85Parser.T__64)
-            self.state = 765
+            self.state = 971
+            self.match(Banking_v0_85Parser.T__69)
+            self.state = 972
             self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 766
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 768 
+            self.state = 973
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 975 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 767
+                self.state = 974
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 770 
+                self.state = 977 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 772
-            self.match(Banking_v0_85Parser.T__44)
-            self.state = 773
+            self.state = 979
+            self.match(Banking_v0_85Parser.T__50)
+            self.state = 980
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 774
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 776 
+            self.state = 981
+            self.text()
+            self.state = 983 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 775
+                self.state = 982
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 778 
+                self.state = 985 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 780
-            self.match(Banking_v0_85Parser.T__65)
-            self.state = 781
+            self.state = 987
+            self.match(Banking_v0_85Parser.T__70)
+            self.state = 988
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 782
-            self.match(Banking_v0_85Parser.TEXT)
-            self.state = 784 
+            self.state = 1005
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 783
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 786 
+            token = self._input.LA(1)
+            if token in [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 143, 144, 145, 146, 147]:
+                self.state = 989
+                self.text()
+                self.state = 991 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+                while True:
+                    self.state = 990
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 993 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
 
-            self.state = 788
-            self.match(Banking_v0_85Parser.T__66)
-            self.state = 789
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 790
-            self.match(Banking_v0_85Parser.STRING)
-            self.state = 792 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 791
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 794 
+                pass
+            elif token in [142]:
+                self.state = 996 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+                while True:
+                    self.state = 995
+                    self.match(Banking_v0_85Parser.NL)
+                    self.state = 998 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==142):
+                        break
 
-            self.state = 796
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 797
+                self.state = 1001 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 1000
+                    self.queryLine()
+                    self.state = 1003 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -1570) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -257) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 1032191) != 0)):
+                        break
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self.state = 1007
+            self.match(Banking_v0_85Parser.T__71)
+            self.state = 1008
             self.match(Banking_v0_85Parser.T__1)
-            self.state = 798
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 800 
+            self.state = 1009
+            self.text()
+            self.state = 1011 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 799
+                self.state = 1010
                 self.match(Banking_v0_85Parser.NL)
-                self.state = 802 
+                self.state = 1013 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==139):
+                if not (_la==142):
                     break
 
-            self.state = 804
+            self.state = 1015
             self.match(Banking_v0_85Parser.T__8)
+            self.state = 1016
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1017
+            self.match(Banking_v0_85Parser.IDENTIFIER)
+            self.state = 1019 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1018
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1021 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1023
+            self.match(Banking_v0_85Parser.T__9)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class QueryLineContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def text(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,0)
+
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_queryLine
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterQueryLine" ):
+                listener.enterQueryLine(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitQueryLine" ):
+                listener.exitQueryLine(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitQueryLine" ):
+                return visitor.visitQueryLine(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def queryLine(self):
+
+        localctx = Banking_v0_85Parser.QueryLineContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_queryLine)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1025
+            _la = self._input.LA(1)
+            if _la <= 0 or (((_la) & ~0x3f) == 0 and ((1 << _la) & 1568) != 0) or _la==72 or _la==142:
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 1027
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -1026) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 1032191) != 0):
+                self.state = 1026
+                self.text()
+
+
+            self.state = 1030 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1029
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1032 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -3978,283 +4999,1146 @@ class Banking_v0_85Parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
-            else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+        def IDENTIFIER(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
+            else:
+                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+
+        def text(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.TextContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.TextContext,i)
+
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def operation(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.OperationContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.OperationContext,i)
+
+
+        def errorAction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.ErrorActionContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.ErrorActionContext,i)
+
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_integration
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIntegration" ):
+                listener.enterIntegration(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIntegration" ):
+                listener.exitIntegration(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIntegration" ):
+                return visitor.visitIntegration(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def integration(self):
+
+        localctx = Banking_v0_85Parser.IntegrationContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_integration)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1034
+            self.match(Banking_v0_85Parser.T__72)
+            self.state = 1035
+            self.match(Banking_v0_85Parser.IDENTIFIER)
+            self.state = 1036
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 1038 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1037
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1040 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1042
+            self.match(Banking_v0_85Parser.T__73)
+            self.state = 1043
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1044
+            self.text()
+            self.state = 1046 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1045
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1048 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1050
+            self.match(Banking_v0_85Parser.T__74)
+            self.state = 1051
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1052
+            self.text()
+            self.state = 1054 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1053
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1056 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1058
+            self.match(Banking_v0_85Parser.T__75)
+            self.state = 1059
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1061 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1060
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1063 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1066 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1065
+                self.operation()
+                self.state = 1068 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==12):
+                    break
+
+            self.state = 1070
+            self.match(Banking_v0_85Parser.T__60)
+            self.state = 1071
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1073 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1072
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1075 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1078 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1077
+                self.errorAction()
+                self.state = 1080 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==12):
+                    break
+
+            self.state = 1082
+            self.match(Banking_v0_85Parser.T__8)
+            self.state = 1083
+            self.match(Banking_v0_85Parser.T__1)
+            self.state = 1084
+            self.match(Banking_v0_85Parser.IDENTIFIER)
+            self.state = 1086 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1085
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1088 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+            self.state = 1090
+            self.match(Banking_v0_85Parser.T__9)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OperationContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_operation
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOperation" ):
+                listener.enterOperation(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOperation" ):
+                listener.exitOperation(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperation" ):
+                return visitor.visitOperation(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def operation(self):
+
+        localctx = Banking_v0_85Parser.OperationContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_operation)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1092
+            self.match(Banking_v0_85Parser.T__11)
+            self.state = 1093
+            self.match(Banking_v0_85Parser.IDENTIFIER)
+            self.state = 1094
+            self.match(Banking_v0_85Parser.T__42)
+            self.state = 1103
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -8644411104695427072) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 9223372035781032301) != 0) or ((((_la - 132)) & ~0x3f) == 0 and ((1 << (_la - 132)) & 527) != 0):
+                self.state = 1095
+                self.identifier()
+                self.state = 1100
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==11:
+                    self.state = 1096
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 1097
+                    self.identifier()
+                    self.state = 1102
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 1105
+            self.match(Banking_v0_85Parser.T__43)
+            self.state = 1107 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1106
+                self.match(Banking_v0_85Parser.NL)
+                self.state = 1109 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==142):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TextContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def braced(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.BracedContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.BracedContext,i)
+
+
+        def NL(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NL)
+            else:
+                return self.getToken(Banking_v0_85Parser.NL, i)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_text
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterText" ):
+                listener.enterText(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitText" ):
+                listener.exitText(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitText" ):
+                return visitor.visitText(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def text(self):
+
+        localctx = Banking_v0_85Parser.TextContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_text)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1113 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 1113
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [1, 2, 3, 4, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 143, 144, 145, 146, 147]:
+                    self.state = 1111
+                    _la = self._input.LA(1)
+                    if _la <= 0 or _la==5 or _la==10 or _la==142:
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    pass
+                elif token in [5]:
+                    self.state = 1112
+                    self.braced()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 1115 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -1026) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 1032191) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BracedContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def braced(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.BracedContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.BracedContext,i)
+
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_braced
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBraced" ):
+                listener.enterBraced(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBraced" ):
+                listener.exitBraced(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBraced" ):
+                return visitor.visitBraced(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def braced(self):
+
+        localctx = Banking_v0_85Parser.BracedContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_braced)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1117
+            self.match(Banking_v0_85Parser.T__4)
+            self.state = 1122
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -1026) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 1048575) != 0):
+                self.state = 1120
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [1, 2, 3, 4, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147]:
+                    self.state = 1118
+                    _la = self._input.LA(1)
+                    if _la <= 0 or _la==5 or _la==10:
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    pass
+                elif token in [5]:
+                    self.state = 1119
+                    self.braced()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 1124
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 1125
+            self.match(Banking_v0_85Parser.T__9)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CodeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(Banking_v0_85Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,i)
+
+
+        def NUMBER(self, i:int=None):
+            if i is None:
+                return self.getTokens(Banking_v0_85Parser.NUMBER)
+            else:
+                return self.getToken(Banking_v0_85Parser.NUMBER, i)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_code
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCode" ):
+                listener.enterCode(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCode" ):
+                listener.exitCode(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCode" ):
+                return visitor.visitCode(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def code(self):
+
+        localctx = Banking_v0_85Parser.CodeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_code)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1127
+            self.identifier()
+            self.state = 1135
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==12:
+                self.state = 1128
+                self.match(Banking_v0_85Parser.T__11)
+                self.state = 1131
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [13, 14, 15, 16, 17, 18, 19, 21, 26, 27, 28, 29, 30, 33, 34, 37, 38, 39, 40, 45, 46, 47, 51, 59, 63, 66, 68, 69, 71, 72, 74, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 132, 133, 134, 135, 141]:
+                    self.state = 1129
+                    self.identifier()
+                    pass
+                elif token in [139]:
+                    self.state = 1130
+                    self.match(Banking_v0_85Parser.NUMBER)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 1137
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IdentifierContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIER(self):
+            return self.getToken(Banking_v0_85Parser.IDENTIFIER, 0)
+
+        def type_(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.TypeContext,0)
+
+
+        def SWIFT_CODE(self):
+            return self.getToken(Banking_v0_85Parser.SWIFT_CODE, 0)
+
+        def IBAN_CODE(self):
+            return self.getToken(Banking_v0_85Parser.IBAN_CODE, 0)
+
+        def RTGS(self):
+            return self.getToken(Banking_v0_85Parser.RTGS, 0)
+
+        def ACH(self):
+            return self.getToken(Banking_v0_85Parser.ACH, 0)
+
+        def SEPA(self):
+            return self.getToken(Banking_v0_85Parser.SEPA, 0)
+
+        def FEDWIRE(self):
+            return self.getToken(Banking_v0_85Parser.FEDWIRE, 0)
+
+        def CHAPS(self):
+            return self.getToken(Banking_v0_85Parser.CHAPS, 0)
+
+        def TARGET2(self):
+            return self.getToken(Banking_v0_85Parser.TARGET2, 0)
+
+        def CHIPS(self):
+            return self.getToken(Banking_v0_85Parser.CHIPS, 0)
+
+        def PCI_DSS(self):
+            return self.getToken(Banking_v0_85Parser.PCI_DSS, 0)
+
+        def PII(self):
+            return self.getToken(Banking_v0_85Parser.PII, 0)
+
+        def KYC(self):
+            return self.getToken(Banking_v0_85Parser.KYC, 0)
+
+        def AML(self):
+            return self.getToken(Banking_v0_85Parser.AML, 0)
+
+        def CFT(self):
+            return self.getToken(Banking_v0_85Parser.CFT, 0)
+
+        def CARD_NETWORK(self):
+            return self.getToken(Banking_v0_85Parser.CARD_NETWORK, 0)
+
+        def EMV(self):
+            return self.getToken(Banking_v0_85Parser.EMV, 0)
+
+        def NFC(self):
+            return self.getToken(Banking_v0_85Parser.NFC, 0)
+
+        def TOKENIZATION(self):
+            return self.getToken(Banking_v0_85Parser.TOKENIZATION, 0)
+
+        def PAN(self):
+            return self.getToken(Banking_v0_85Parser.PAN, 0)
+
+        def CVV_KEYWORD(self):
+            return self.getToken(Banking_v0_85Parser.CVV_KEYWORD, 0)
+
+        def TRANSACTION_STATUS(self):
+            return self.getToken(Banking_v0_85Parser.TRANSACTION_STATUS, 0)
+
+        def PAYMENT_METHOD(self):
+            return self.getToken(Banking_v0_85Parser.PAYMENT_METHOD, 0)
+
+        def APR(self):
+            return self.getToken(Banking_v0_85Parser.APR, 0)
+
+        def APY(self):
+            return self.getToken(Banking_v0_85Parser.APY, 0)
+
+        def DTI(self):
+            return self.getToken(Banking_v0_85Parser.DTI, 0)
+
+        def LTV(self):
+            return self.getToken(Banking_v0_85Parser.LTV, 0)
+
+        def FICO(self):
+            return self.getToken(Banking_v0_85Parser.FICO, 0)
+
+        def BASEL_III(self):
+            return self.getToken(Banking_v0_85Parser.BASEL_III, 0)
+
+        def DODD_FRANK(self):
+            return self.getToken(Banking_v0_85Parser.DODD_FRANK, 0)
+
+        def SOX(self):
+            return self.getToken(Banking_v0_85Parser.SOX, 0)
+
+        def FATCA(self):
+            return self.getToken(Banking_v0_85Parser.FATCA, 0)
+
+        def FBAR(self):
+            return self.getToken(Banking_v0_85Parser.FBAR, 0)
+
+        def ISO20022(self):
+            return self.getToken(Banking_v0_85Parser.ISO20022, 0)
+
+        def FIX(self):
+            return self.getToken(Banking_v0_85Parser.FIX, 0)
+
+        def MT(self):
+            return self.getToken(Banking_v0_85Parser.MT, 0)
+
+        def MX(self):
+            return self.getToken(Banking_v0_85Parser.MX, 0)
+
+        def getRuleIndex(self):
+            return Banking_v0_85Parser.RULE_identifier
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdentifier" ):
+                listener.enterIdentifier(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdentifier" ):
+                listener.exitIdentifier(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifier" ):
+                return visitor.visitIdentifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identifier(self):
+
+        localctx = Banking_v0_85Parser.IdentifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_identifier)
+        try:
+            self.state = 1212
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,150,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 1138
+                self.match(Banking_v0_85Parser.IDENTIFIER)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 1139
+                self.type_()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 1140
+                self.match(Banking_v0_85Parser.T__50)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 1141
+                self.match(Banking_v0_85Parser.T__58)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 1142
+                self.match(Banking_v0_85Parser.T__68)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 1143
+                self.match(Banking_v0_85Parser.T__67)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 1144
+                self.match(Banking_v0_85Parser.T__12)
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 1145
+                self.match(Banking_v0_85Parser.T__13)
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 1146
+                self.match(Banking_v0_85Parser.T__14)
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 1147
+                self.match(Banking_v0_85Parser.T__15)
+                pass
+
+            elif la_ == 11:
+                self.enterOuterAlt(localctx, 11)
+                self.state = 1148
+                self.match(Banking_v0_85Parser.T__16)
+                pass
+
+            elif la_ == 12:
+                self.enterOuterAlt(localctx, 12)
+                self.state = 1149
+                self.match(Banking_v0_85Parser.T__17)
+                pass
+
+            elif la_ == 13:
+                self.enterOuterAlt(localctx, 13)
+                self.state = 1150
+                self.match(Banking_v0_85Parser.T__18)
+                pass
+
+            elif la_ == 14:
+                self.enterOuterAlt(localctx, 14)
+                self.state = 1151
+                self.match(Banking_v0_85Parser.T__20)
+                pass
+
+            elif la_ == 15:
+                self.enterOuterAlt(localctx, 15)
+                self.state = 1152
+                self.match(Banking_v0_85Parser.T__25)
+                pass
+
+            elif la_ == 16:
+                self.enterOuterAlt(localctx, 16)
+                self.state = 1153
+                self.match(Banking_v0_85Parser.T__26)
+                pass
+
+            elif la_ == 17:
+                self.enterOuterAlt(localctx, 17)
+                self.state = 1154
+                self.match(Banking_v0_85Parser.T__27)
+                pass
+
+            elif la_ == 18:
+                self.enterOuterAlt(localctx, 18)
+                self.state = 1155
+                self.match(Banking_v0_85Parser.T__28)
+                pass
+
+            elif la_ == 19:
+                self.enterOuterAlt(localctx, 19)
+                self.state = 1156
+                self.match(Banking_v0_85Parser.T__29)
+                pass
+
+            elif la_ == 20:
+                self.enterOuterAlt(localctx, 20)
+                self.state = 1157
+                self.match(Banking_v0_85Parser.T__32)
+                pass
+
+            elif la_ == 21:
+                self.enterOuterAlt(localctx, 21)
+                self.state = 1158
+                self.match(Banking_v0_85Parser.T__33)
+                pass
+
+            elif la_ == 22:
+                self.enterOuterAlt(localctx, 22)
+                self.state = 1159
+                self.match(Banking_v0_85Parser.T__76)
+                pass
+
+            elif la_ == 23:
+                self.enterOuterAlt(localctx, 23)
+                self.state = 1160
+                self.match(Banking_v0_85Parser.T__77)
+                pass
+
+            elif la_ == 24:
+                self.enterOuterAlt(localctx, 24)
+                self.state = 1161
+                self.match(Banking_v0_85Parser.T__78)
+                pass
+
+            elif la_ == 25:
+                self.enterOuterAlt(localctx, 25)
+                self.state = 1162
+                self.match(Banking_v0_85Parser.T__79)
+                pass
+
+            elif la_ == 26:
+                self.enterOuterAlt(localctx, 26)
+                self.state = 1163
+                self.match(Banking_v0_85Parser.T__80)
+                pass
+
+            elif la_ == 27:
+                self.enterOuterAlt(localctx, 27)
+                self.state = 1164
+                self.match(Banking_v0_85Parser.T__36)
+                pass
+
+            elif la_ == 28:
+                self.enterOuterAlt(localctx, 28)
+                self.state = 1165
+                self.match(Banking_v0_85Parser.T__45)
+                pass
+
+            elif la_ == 29:
+                self.enterOuterAlt(localctx, 29)
+                self.state = 1166
+                self.match(Banking_v0_85Parser.T__46)
+                pass
+
+            elif la_ == 30:
+                self.enterOuterAlt(localctx, 30)
+                self.state = 1167
+                self.match(Banking_v0_85Parser.T__44)
+                pass
+
+            elif la_ == 31:
+                self.enterOuterAlt(localctx, 31)
+                self.state = 1168
+                self.match(Banking_v0_85Parser.T__37)
+                pass
+
+            elif la_ == 32:
+                self.enterOuterAlt(localctx, 32)
+                self.state = 1169
+                self.match(Banking_v0_85Parser.T__38)
+                pass
+
+            elif la_ == 33:
+                self.enterOuterAlt(localctx, 33)
+                self.state = 1170
+                self.match(Banking_v0_85Parser.T__39)
+                pass
+
+            elif la_ == 34:
+                self.enterOuterAlt(localctx, 34)
+                self.state = 1171
+                self.match(Banking_v0_85Parser.T__62)
+                pass
+
+            elif la_ == 35:
+                self.enterOuterAlt(localctx, 35)
+                self.state = 1172
+                self.match(Banking_v0_85Parser.T__65)
+                pass
 
-        def NL(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.NL)
-            else:
-                return self.getToken(Banking_v0_85Parser.NL, i)
+            elif la_ == 36:
+                self.enterOuterAlt(localctx, 36)
+                self.state = 1173
+                self.match(Banking_v0_85Parser.T__70)
+                pass
 
-        def operation(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.OperationContext)
-            else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.OperationContext,i)
+            elif la_ == 37:
+                self.enterOuterAlt(localctx, 37)
+                self.state = 1174
+                self.match(Banking_v0_85Parser.T__71)
+                pass
 
+            elif la_ == 38:
+                self.enterOuterAlt(localctx, 38)
+                self.state = 1175
+                self.match(Banking_v0_85Parser.T__73)
+                pass
 
-        def errorAction(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(Banking_v0_85Parser.ErrorActionContext)
-            else:
-                return self.getTypedRuleContext(Banking_v0_85Parser.ErrorActionContext,i)
+            elif la_ == 39:
+                self.enterOuterAlt(localctx, 39)
+                self.state = 1176
+                self.match(Banking_v0_85Parser.SWIFT_CODE)
+                pass
 
+            elif la_ == 40:
+                self.enterOuterAlt(localctx, 40)
+                self.state = 1177
+                self.match(Banking_v0_85Parser.IBAN_CODE)
+                pass
 
-        def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_integration
+            elif la_ == 41:
+                self.enterOuterAlt(localctx, 41)
+                self.state = 1178
+                self.match(Banking_v0_85Parser.RTGS)
+                pass
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterIntegration" ):
-                listener.enterIntegration(self)
+            elif la_ == 42:
+                self.enterOuterAlt(localctx, 42)
+                self.state = 1179
+                self.match(Banking_v0_85Parser.ACH)
+                pass
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitIntegration" ):
-                listener.exitIntegration(self)
+            elif la_ == 43:
+                self.enterOuterAlt(localctx, 43)
+                self.state = 1180
+                self.match(Banking_v0_85Parser.SEPA)
+                pass
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitIntegration" ):
-                return visitor.visitIntegration(self)
-            else:
-                return visitor.visitChildren(self)
+            elif la_ == 44:
+                self.enterOuterAlt(localctx, 44)
+                self.state = 1181
+                self.match(Banking_v0_85Parser.FEDWIRE)
+                pass
 
+            elif la_ == 45:
+                self.enterOuterAlt(localctx, 45)
+                self.state = 1182
+                self.match(Banking_v0_85Parser.CHAPS)
+                pass
 
+            elif la_ == 46:
+                self.enterOuterAlt(localctx, 46)
+                self.state = 1183
+                self.match(Banking_v0_85Parser.TARGET2)
+                pass
 
+            elif la_ == 47:
+                self.enterOuterAlt(localctx, 47)
+                self.state = 1184
+                self.match(Banking_v0_85Parser.CHIPS)
+                pass
 
-    def integration(self):
+            elif la_ == 48:
+                self.enterOuterAlt(localctx, 48)
+                self.state = 1185
+                self.match(Banking_v0_85Parser.PCI_DSS)
+                pass
 
-        localctx = Banking_v0_85Parser.IntegrationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 56, self.RULE_integration)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 806
-            self.match(Banking_v0_85Parser.T__67)
-            self.state = 807
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 808
-            self.match(Banking_v0_85Parser.T__3)
-            self.state = 810 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 809
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 812 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 49:
+                self.enterOuterAlt(localctx, 49)
+                self.state = 1186
+                self.match(Banking_v0_85Parser.PII)
+                pass
 
-            self.state = 814
-            self.match(Banking_v0_85Parser.T__68)
-            self.state = 815
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 816
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 818 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 817
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 820 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 50:
+                self.enterOuterAlt(localctx, 50)
+                self.state = 1187
+                self.match(Banking_v0_85Parser.KYC)
+                pass
 
-            self.state = 822
-            self.match(Banking_v0_85Parser.T__69)
-            self.state = 823
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 824
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 826 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 825
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 828 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 51:
+                self.enterOuterAlt(localctx, 51)
+                self.state = 1188
+                self.match(Banking_v0_85Parser.AML)
+                pass
 
-            self.state = 830
-            self.match(Banking_v0_85Parser.T__70)
-            self.state = 831
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 833 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 832
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 835 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 52:
+                self.enterOuterAlt(localctx, 52)
+                self.state = 1189
+                self.match(Banking_v0_85Parser.CFT)
+                pass
 
-            self.state = 838 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 837
-                self.operation()
-                self.state = 840 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==11):
-                    break
+            elif la_ == 53:
+                self.enterOuterAlt(localctx, 53)
+                self.state = 1190
+                self.match(Banking_v0_85Parser.CARD_NETWORK)
+                pass
 
-            self.state = 842
-            self.match(Banking_v0_85Parser.T__55)
-            self.state = 843
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 845 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 844
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 847 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 54:
+                self.enterOuterAlt(localctx, 54)
+                self.state = 1191
+                self.match(Banking_v0_85Parser.EMV)
+                pass
 
-            self.state = 850 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 849
-                self.errorAction()
-                self.state = 852 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==11):
-                    break
+            elif la_ == 55:
+                self.enterOuterAlt(localctx, 55)
+                self.state = 1192
+                self.match(Banking_v0_85Parser.NFC)
+                pass
 
-            self.state = 854
-            self.match(Banking_v0_85Parser.T__7)
-            self.state = 855
-            self.match(Banking_v0_85Parser.T__1)
-            self.state = 856
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 858 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 857
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 860 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
+            elif la_ == 56:
+                self.enterOuterAlt(localctx, 56)
+                self.state = 1193
+                self.match(Banking_v0_85Parser.TOKENIZATION)
+                pass
 
-            self.state = 862
-            self.match(Banking_v0_85Parser.T__8)
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
+            elif la_ == 57:
+                self.enterOuterAlt(localctx, 57)
+                self.state = 1194
+                self.match(Banking_v0_85Parser.PAN)
+                pass
 
+            elif la_ == 58:
+                self.enterOuterAlt(localctx, 58)
+                self.state = 1195
+                self.match(Banking_v0_85Parser.CVV_KEYWORD)
+                pass
 
-    class OperationContext(ParserRuleContext):
-        __slots__ = 'parser'
+            elif la_ == 59:
+                self.enterOuterAlt(localctx, 59)
+                self.state = 1196
+                self.match(Banking_v0_85Parser.TRANSACTION_STATUS)
+                pass
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+            elif la_ == 60:
+                self.enterOuterAlt(localctx, 60)
+                self.state = 1197
+                self.match(Banking_v0_85Parser.PAYMENT_METHOD)
+                pass
 
-        def IDENTIFIER(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.IDENTIFIER)
-            else:
-                return self.getToken(Banking_v0_85Parser.IDENTIFIER, i)
+            elif la_ == 61:
+                self.enterOuterAlt(localctx, 61)
+                self.state = 1198
+                self.match(Banking_v0_85Parser.APR)
+                pass
 
-        def NL(self, i:int=None):
-            if i is None:
-                return self.getTokens(Banking_v0_85Parser.NL)
-            else:
-                return self.getToken(Banking_v0_85Parser.NL, i)
+            elif la_ == 62:
+                self.enterOuterAlt(localctx, 62)
+                self.state = 1199
+                self.match(Banking_v0_85Parser.APY)
+                pass
 
-        def getRuleIndex(self):
-            return Banking_v0_85Parser.RULE_operation
+            elif la_ == 63:
+                self.enterOuterAlt(localctx, 63)
+                self.state = 1200
+                self.match(Banking_v0_85Parser.DTI)
+                pass
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterOperation" ):
-                listener.enterOperation(self)
+            elif la_ == 64:
+                self.enterOuterAlt(localctx, 64)
+                self.state = 1201
+                self.match(Banking_v0_85Parser.LTV)
+                pass
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitOperation" ):
-                listener.exitOperation(self)
+            elif la_ == 65:
+                self.enterOuterAlt(localctx, 65)
+                self.state = 1202
+                self.match(Banking_v0_85Parser.FICO)
+                pass
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitOperation" ):
-                return visitor.visitOperation(self)
-            else:
-                return visitor.visitChildren(self)
+            elif la_ == 66:
+                self.enterOuterAlt(localctx, 66)
+                self.state = 1203
+                self.match(Banking_v0_85Parser.BASEL_III)
+                pass
 
+            elif la_ == 67:
+                self.enterOuterAlt(localctx, 67)
+                self.state = 1204
+                self.match(Banking_v0_85Parser.DODD_FRANK)
+                pass
 
+            elif la_ == 68:
+                self.enterOuterAlt(localctx, 68)
+                self.state = 1205
+                self.match(Banking_v0_85Parser.SOX)
+                pass
 
+            elif la_ == 69:
+                self.enterOuterAlt(localctx, 69)
+                self.state = 1206
+                self.match(Banking_v0_85Parser.FATCA)
+                pass
 
-    def operation(self):
+            elif la_ == 70:
+                self.enterOuterAlt(localctx, 70)
+                self.state = 1207
+                self.match(Banking_v0_85Parser.FBAR)
+                pass
 
-        localctx = Banking_v0_85Parser.OperationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 58, self.RULE_operation)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 864
-            self.match(Banking_v0_85Parser.T__10)
-            self.state = 865
-            self.match(Banking_v0_85Parser.IDENTIFIER)
-            self.state = 866
-            self.match(Banking_v0_85Parser.T__37)
-            self.state = 875
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==138:
-                self.state = 867
-                self.match(Banking_v0_85Parser.IDENTIFIER)
-                self.state = 872
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 868
-                    self.match(Banking_v0_85Parser.T__9)
-                    self.state = 869
-                    self.match(Banking_v0_85Parser.IDENTIFIER)
-                    self.state = 874
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
+            elif la_ == 71:
+                self.enterOuterAlt(localctx, 71)
+                self.state = 1208
+                self.match(Banking_v0_85Parser.ISO20022)
+                pass
 
+            elif la_ == 72:
+                self.enterOuterAlt(localctx, 72)
+                self.state = 1209
+                self.match(Banking_v0_85Parser.FIX)
+                pass
 
+            elif la_ == 73:
+                self.enterOuterAlt(localctx, 73)
+                self.state = 1210
+                self.match(Banking_v0_85Parser.MT)
+                pass
+
+            elif la_ == 74:
+                self.enterOuterAlt(localctx, 74)
+                self.state = 1211
+                self.match(Banking_v0_85Parser.MX)
+                pass
 
-            self.state = 877
-            self.match(Banking_v0_85Parser.T__38)
-            self.state = 879 
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while True:
-                self.state = 878
-                self.match(Banking_v0_85Parser.NL)
-                self.state = 881 
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if not (_la==139):
-                    break
 
         except RecognitionException as re:
             localctx.exception = re
@@ -4298,13 +6182,13 @@ class Banking_v0_85Parser ( Parser ):
     def type_(self):
 
         localctx = Banking_v0_85Parser.TypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 60, self.RULE_type)
+        self.enterRule(localctx, 78, self.RULE_type)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 883
+            self.state = 1214
             _la = self._input.LA(1)
-            if not(((((_la - 72)) & ~0x3f) == 0 and ((1 << (_la - 72)) & 2113535) != 0)):
+            if not(((((_la - 82)) & ~0x3f) == 0 and ((1 << (_la - 82)) & 81919) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -4358,79 +6242,79 @@ class Banking_v0_85Parser ( Parser ):
     def fieldAttr(self):
 
         localctx = Banking_v0_85Parser.FieldAttrContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 62, self.RULE_fieldAttr)
+        self.enterRule(localctx, 80, self.RULE_fieldAttr)
         self._la = 0 # Token type
         try:
-            self.state = 909
+            self.state = 1240
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [25]:
+            if token in [27]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 885
-                self.match(Banking_v0_85Parser.T__24)
+                self.state = 1216
+                self.match(Banking_v0_85Parser.T__26)
                 pass
-            elif token in [26]:
+            elif token in [28]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 886
-                self.match(Banking_v0_85Parser.T__25)
+                self.state = 1217
+                self.match(Banking_v0_85Parser.T__27)
                 pass
-            elif token in [86]:
+            elif token in [77]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 887
-                self.match(Banking_v0_85Parser.T__85)
-                self.state = 888
-                self.match(Banking_v0_85Parser.T__86)
-                self.state = 889
+                self.state = 1218
+                self.match(Banking_v0_85Parser.T__76)
+                self.state = 1219
+                self.match(Banking_v0_85Parser.T__95)
+                self.state = 1220
                 self.match(Banking_v0_85Parser.NUMBER)
                 pass
-            elif token in [88]:
+            elif token in [78]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 890
-                self.match(Banking_v0_85Parser.T__87)
-                self.state = 891
-                self.match(Banking_v0_85Parser.T__86)
-                self.state = 892
+                self.state = 1221
+                self.match(Banking_v0_85Parser.T__77)
+                self.state = 1222
+                self.match(Banking_v0_85Parser.T__95)
+                self.state = 1223
                 self.match(Banking_v0_85Parser.NUMBER)
                 pass
-            elif token in [28]:
+            elif token in [30]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 893
-                self.match(Banking_v0_85Parser.T__27)
-                self.state = 894
-                self.match(Banking_v0_85Parser.T__86)
-                self.state = 895
-                self.match(Banking_v0_85Parser.T__28)
-                self.state = 896
+                self.state = 1224
+                self.match(Banking_v0_85Parser.T__29)
+                self.state = 1225
+                self.match(Banking_v0_85Parser.T__95)
+                self.state = 1226
+                self.match(Banking_v0_85Parser.T__30)
+                self.state = 1227
                 self.value()
-                self.state = 901
+                self.state = 1232
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 897
-                    self.match(Banking_v0_85Parser.T__9)
-                    self.state = 898
+                while _la==11:
+                    self.state = 1228
+                    self.match(Banking_v0_85Parser.T__10)
+                    self.state = 1229
                     self.value()
-                    self.state = 903
+                    self.state = 1234
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 904
-                self.match(Banking_v0_85Parser.T__29)
+                self.state = 1235
+                self.match(Banking_v0_85Parser.T__31)
                 pass
-            elif token in [89]:
+            elif token in [79]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 906
-                self.match(Banking_v0_85Parser.T__88)
+                self.state = 1237
+                self.match(Banking_v0_85Parser.T__78)
                 pass
-            elif token in [90]:
+            elif token in [80]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 907
-                self.match(Banking_v0_85Parser.T__89)
+                self.state = 1238
+                self.match(Banking_v0_85Parser.T__79)
                 pass
-            elif token in [91]:
+            elif token in [81]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 908
-                self.match(Banking_v0_85Parser.T__90)
+                self.state = 1239
+                self.match(Banking_v0_85Parser.T__80)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -4463,12 +6347,13 @@ class Banking_v0_85Parser ( Parser ):
         def DATE(self):
             return self.getToken(Banking_v0_85Parser.DATE, 0)
 
-        def ENUM(self):
-            return self.getToken(Banking_v0_85Parser.ENUM, 0)
-
         def BOOLEAN(self):
             return self.getToken(Banking_v0_85Parser.BOOLEAN, 0)
 
+        def identifier(self):
+            return self.getTypedRuleContext(Banking_v0_85Parser.IdentifierContext,0)
+
+
         def getRuleIndex(self):
             return Banking_v0_85Parser.RULE_value
 
@@ -4492,17 +6377,44 @@ class Banking_v0_85Parser ( Parser ):
     def value(self):
 
         localctx = Banking_v0_85Parser.ValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 64, self.RULE_value)
-        self._la = 0 # Token type
+        self.enterRule(localctx, 82, self.RULE_value)
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 911
-            _la = self._input.LA(1)
-            if not(((((_la - 131)) & ~0x3f) == 0 and ((1 << (_la - 131)) & 125) != 0)):
-                self._errHandler.recoverInline(self)
+            self.state = 1248
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [136]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 1242
+                self.match(Banking_v0_85Parser.STRING)
+                pass
+            elif token in [139]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 1243
+                self.match(Banking_v0_85Parser.NUMBER)
+                pass
+            elif token in [137]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 1244
+                self.match(Banking_v0_85Parser.UUID)
+                pass
+            elif token in [138]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 1245
+                self.match(Banking_v0_85Parser.DATE)
+                pass
+            elif token in [140]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 1246
+                self.match(Banking_v0_85Parser.BOOLEAN)
+                pass
+            elif token in [13, 14, 15, 16, 17, 18, 19, 21, 26, 27, 28, 29, 30, 33, 34, 37, 38, 39, 40, 45, 46, 47, 51, 59, 63, 66, 68, 69, 71, 72, 74, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 132, 133, 134, 135, 141]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 1247
+                self.identifier()
+                pass
             else:
-                self._errHandler.reportMatch(self)
-                self.consume()
+                raise NoViableAltException(self)
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1,4 +1,4 @@
-# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.1
+# Generated from verticals/banking/grammar/Banking_v0_85.g4 by ANTLR 4.13.2
 from antlr4 import *
 if "." in __name__:
     from .Banking_v0_85Parser import Banking_v0_85Parser
@@ -14,6 +14,11 @@ class Banking_v0_85Visitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#importDirective.
+    def visitImportDirective(self, ctx:Banking_v0_85Parser.ImportDirectiveContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#metadata.
     def visitMetadata(self, ctx:Banking_v0_85Parser.MetadataContext):
         return self.visitChildren(ctx)
@@ -69,6 +74,11 @@ class Banking_v0_85Visitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#expression.
+    def visitExpression(self, ctx:Banking_v0_85Parser.ExpressionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#ruleStatement.
     def visitRuleStatement(self, ctx:Banking_v0_85Parser.RuleStatementContext):
         return self.visitChildren(ctx)
@@ -99,11 +109,21 @@ class Banking_v0_85Visitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#processField.
+    def visitProcessField(self, ctx:Banking_v0_85Parser.ProcessFieldContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#step.
     def visitStep(self, ctx:Banking_v0_85Parser.StepContext):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#stepSection.
+    def visitStepSection(self, ctx:Banking_v0_85Parser.StepSectionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#inputItem.
     def visitInputItem(self, ctx:Banking_v0_85Parser.InputItemContext):
         return self.visitChildren(ctx)
@@ -149,6 +169,11 @@ class Banking_v0_85Visitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#queryLine.
+    def visitQueryLine(self, ctx:Banking_v0_85Parser.QueryLineContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#integration.
     def visitIntegration(self, ctx:Banking_v0_85Parser.IntegrationContext):
         return self.visitChildren(ctx)
@@ -159,6 +184,26 @@ class Banking_v0_85Visitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by Banking_v0_85Parser#text.
+    def visitText(self, ctx:Banking_v0_85Parser.TextContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by Banking_v0_85Parser#braced.
+    def visitBraced(self, ctx:Banking_v0_85Parser.BracedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by Banking_v0_85Parser#code.
+    def visitCode(self, ctx:Banking_v0_85Parser.CodeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by Banking_v0_85Parser#identifier.
+    def visitIdentifier(self, ctx:Banking_v0_85Parser.IdentifierContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by Banking_v0_85Parser#type.
     def visitType(self, ctx:Banking_v0_85Parser.TypeContext):
         return self.visitChildren(ctx)
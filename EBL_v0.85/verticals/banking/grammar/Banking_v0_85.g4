@@ -9,7 +9,11 @@ grammar Banking_v0_85;
 // ===== PARSER RULES =====
 
 eblDefinition
-    : metadata dataObject+ entity+ (itAsset | process | ruleDef | relationshipDef | report | integration)* EOF
+    : NL* ((importDirective | metadata | dataObject | entity | itAsset | process | ruleDef | relationshipDef | report | integration) NL*)* EOF
+    ;
+
+importDirective
+    : 'Import' ':' STRING
     ;
 
 metadata
@@ -17,7 +21,7 @@ metadata
     ;
 
 metadataField
-    : IDENTIFIER ':' value
+    : identifier ':' text
     ;
 
 dataObject
@@ -33,11 +37,11 @@ dataObject
     ;
 
 fieldDef
-    : IDENTIFIER ':' type (',' fieldAttr)* NL+
+    : identifier ':' type (',' fieldAttr)* NL+
     ;
 
 policyDef
-    : '-' TEXT NL+
+    : '-' text NL+
     ;
 
 resourceBlock
@@ -46,11 +50,11 @@ resourceBlock
     ;
 
 resourceDef
-    : '{' 'Channel' ':' IDENTIFIER ','
-      'Protocol' ':' IDENTIFIER ','
+    : '{' 'Channel' ':' identifier ','
+      'Protocol' ':' identifier ','
       'Endpoint' ':' STRING ','
-      'Auth' ':' IDENTIFIER ','
-      'Format' ':' IDENTIFIER ','
+      'Auth' ':' identifier ','
+      'Format' ':' identifier ('|' identifier)* ','
       'SLA' ':' STRING '}'
     ;
 
@@ -65,7 +69,7 @@ entity
     ;
 
 property
-    : IDENTIFIER ':' propertyDef NL+
+    : identifier+ ':' propertyDef NL+
     ;
 
 propertyDef
@@ -77,10 +81,17 @@ propertyAttr
     | 'unique' ':' BOOLEAN
     | 'default' ':' value
     | 'values' ':' '[' value (',' value)* ']'
+    | 'range' ':' '[' value (',' value)* ']'
+    | 'calculated' ':' expression
+    | 'erMap' ':' (identifier | 'DataObject' | 'Entity' | 'Relationship')
+    ;
+
+expression
+    : ~(',' | '{' | '}' | NL)+
     ;
 
 ruleStatement
-    : '-' STRING NL+
+    : '-' text NL+
     ;
 
 itAsset
@@ -94,7 +105,7 @@ itAsset
     ;
 
 kvPair
-    : IDENTIFIER ':' TEXT NL+
+    : identifier ':' text NL+
     ;
 
 relRef
@@ -113,82 +124,98 @@ relationshipDef
 
 process
     : 'Process' IDENTIFIER '{' NL+
-      'Description' ':' STRING NL+
-      'ObjectiveID' ':' IDENTIFIER NL+
-      'BusinessGoalID' ':' IDENTIFIER NL+
-      'Actors' ':' '[' IDENTIFIER (',' IDENTIFIER)* ']' NL+
-      'erMap' ':' IDENTIFIER NL+
+      processField*
       'Starts With' ':' event NL+
-      step+
+      step*
       'Ends With' ':' event NL+
       '}'
     ;
 
+processField
+    : 'Description' ':' text NL+
+    | 'ObjectiveID' ':' code NL+
+    | 'BusinessGoalID' ':' code NL+
+    | 'Actors' ':' '[' NL* IDENTIFIER (',' NL* IDENTIFIER)* NL* ']' NL+
+    | 'Capabilities' ':' NL+ ('-' text NL+)+
+    | 'erMap' ':' IDENTIFIER NL+
+    | IDENTIFIER ':' text NL+
+    ;
+
 step
     : 'Step' IDENTIFIER '{' NL+
-      ('Inputs' ':' NL+ inputItem+)?
-      ('Validation' ':' NL+ validation+)?
-      ('Condition' ':' TEXT NL+)?
-      ('Actions' ':' NL+ action+)?
-      ('ErrorHandling' ':' NL+ errorAction+)?
-      ('Output' ':' output NL+)?
-      '}'
+      stepSection*
+      '}' NL+
+    ;
+
+stepSection
+    : 'Description' ':' text NL+
+    | 'Inputs' ':' NL+ inputItem+
+    | 'Validation' ':' NL+ validation+
+    | 'Condition' ':' text NL+
+    | 'Actions' ':' NL+ (action NL+)+
+    | 'ErrorHandling' ':' NL+ errorAction+
+    | 'Output' ':' (output NL+ | NL+ ('-' output NL+)+)
+    | IDENTIFIER ':' text NL+
     ;
 
 inputItem
-    : '-' IDENTIFIER ('.' IDENTIFIER)* NL+
+    : '-' identifier ('.' identifier)* NL+
     ;
 
 validation
-    : '-' TEXT NL+
+    : '-' text NL+
     ;
 
 action
-    : '-' TEXT NL+
+    : '-' text
     ;
 
 errorAction
-    : '-' TEXT NL+
+    : '-' text NL+
     ;
 
 output
-    : IDENTIFIER ':' typeDef
+    : identifier ':' typeDef
     ;
 
 typeDef
-    : type
+    : type ('[' identifier (',' identifier)* ']')?
     | 'Partial' '<' IDENTIFIER '>'
-    | '{' IDENTIFIER ':' type '}'
+    | '{' NL* output (',' NL* output)* NL* '}'
     ;
 
 event
-    : 'Event' IDENTIFIER '(' (IDENTIFIER (',' IDENTIFIER)*)? ')'
+    : 'Event' IDENTIFIER '(' (identifier (',' identifier)*)? ')'
     ;
 
 ruleDef
-    : 'Rule' IDENTIFIER '{' NL+
-      'Description' ':' STRING NL+
-      'Trigger' ':' TEXT NL+
-      ('Conditions' ':' NL+ TEXT NL+)*
+    : 'Rule' IDENTIFIER ('-' IDENTIFIER)* '{' NL+
+      'Description' ':' text NL+
+      'Trigger' ':' text NL+
+      ('Conditions' ':' NL+ ('-' text NL+)+)?
       'Actions' ':' NL+
-      action+
+      (action NL+)+
       'erMap' ':' IDENTIFIER NL+
       '}'
     ;
 
 report
     : 'Report' IDENTIFIER '{' NL+
-      'Description' ':' STRING NL+
-      'Query' ':' TEXT NL+
-      'Schedule' ':' STRING NL+
+      'Description' ':' text NL+
+      'Query' ':' (text NL+ | NL+ queryLine+)
+      'Schedule' ':' text NL+
       'erMap' ':' IDENTIFIER NL+
       '}'
     ;
 
+queryLine
+    : ~('Schedule' | 'erMap' | '{' | '}' | NL) text? NL+
+    ;
+
 integration
     : 'Integration' IDENTIFIER '{' NL+
-      'Provider' ':' IDENTIFIER NL+
-      'Credentials' ':' IDENTIFIER NL+
+      'Provider' ':' text NL+
+      'Credentials' ':' text NL+
       'Operations' ':' NL+
       operation+
       'ErrorHandling' ':' NL+
@@ -198,7 +225,37 @@ integration
     ;
 
 operation
-    : '-' IDENTIFIER '(' (IDENTIFIER (',' IDENTIFIER)*)? ')' NL+
+    : '-' IDENTIFIER '(' (identifier (',' identifier)*)? ')' NL+
+    ;
+
+// ===== FREE TEXT =====
+
+// Rest of a line, e.g. an unquoted description or a '- ...' item; braces may span lines
+text
+    : (~(NL | '{' | '}') | braced)+
+    ;
+
+braced
+    : '{' (~('{' | '}') | braced)* '}'
+    ;
+
+code
+    : identifier ('-' (identifier | NUMBER))*
+    ;
+
+// Names may reuse keywords (e.g. a 'Condition' or 'APR' field)
+identifier
+    : IDENTIFIER
+    | type
+    | 'Description' | 'Condition' | 'Conditions' | 'Trigger'
+    | 'Input' | 'Output' | 'Channel' | 'Protocol' | 'Endpoint' | 'Auth' | 'Format' | 'SLA'
+    | 'type' | 'required' | 'unique' | 'default' | 'values' | 'range' | 'calculated'
+    | 'min' | 'max' | 'masked' | 'encrypted' | 'pci_compliant' | 'Kind' | 'From' | 'To' | 'Type'
+    | 'Application' | 'System' | 'Platform' | 'Partial' | 'Event' | 'Query' | 'Schedule' | 'Provider'
+    | SWIFT_CODE | IBAN_CODE | RTGS | ACH | SEPA | FEDWIRE | CHAPS | TARGET2 | CHIPS
+    | PCI_DSS | PII | KYC | AML | CFT | CARD_NETWORK | EMV | NFC | TOKENIZATION | PAN | CVV_KEYWORD
+    | TRANSACTION_STATUS | PAYMENT_METHOD | APR | APY | DTI | LTV | FICO
+    | BASEL_III | DODD_FRANK | SOX | FATCA | FBAR | ISO20022 | FIX | MT | MX
     ;
 
 // ===== TYPE SYSTEM =====
@@ -237,8 +294,8 @@ value
     | NUMBER
     | UUID
     | DATE
-    | ENUM
     | BOOLEAN
+    | identifier
     ;
 
 // ===== BANKING-SPECIFIC KEYWORDS =====
@@ -297,20 +354,12 @@ STRING
     : '"' (~["\r\n])* '"'
     ;
 
-TEXT
-    : ~[\r\n]+
-    ;
-
-ENUM
-    : '[' IDENTIFIER (',' IDENTIFIER)* ']'
-    ;
-
 UUID
-    : [0-9a-fA-F]{8} '-' [0-9a-fA-F]{4} '-' [0-9a-fA-F]{4} '-' [0-9a-fA-F]{4} '-' [0-9a-fA-F]{12}
+    : HEX4 HEX4 '-' HEX4 '-' HEX4 '-' HEX4 '-' HEX4 HEX4 HEX4
     ;
 
 DATE
-    : [0-9]{4} '-' [0-9]{2} '-' [0-9]{2}
+    : DIGIT DIGIT DIGIT DIGIT '-' DIGIT DIGIT '-' DIGIT DIGIT
     ;
 
 NUMBER
@@ -341,3 +390,20 @@ LINE_COMMENT
 BLOCK_COMMENT
     : '/*' .*? '*/' -> skip
     ;
+
+HASH_COMMENT
+    : '#' ~[\r\n]* -> skip
+    ;
+
+// Any other character ('$', '%', '>', ...) is left to the free text rule
+ANY
+    : .
+    ;
+
+fragment HEX4
+    : [0-9a-fA-F] [0-9a-fA-F] [0-9a-fA-F] [0-9a-fA-F]
+    ;
+
+fragment DIGIT
+    : [0-9]
+    ;
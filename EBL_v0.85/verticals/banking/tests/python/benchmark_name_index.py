@@ -0,0 +1,98 @@
+"""
+Banking Vertical - Name Index Benchmark
+Measures per-miss "did you mean" latency on a synthetic 100k-name dictionary
+
+Usage:
+    python benchmark_name_index.py [name_count] [query_count]
+"""
+
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the shared engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from name_index import TrigramIndex, bounded_edit_distance
+from vertical_validator import canonicalize
+
+
+def synthetic_names(count: int, seed: int = 85) -> list:
+    """Combine banking dictionary vocabulary into `count` distinct names"""
+    dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+    with open(dict_path, 'r') as f:
+        domain = json.load(f)['domain']
+    words = domain['actors'] + domain['verbs'] + domain['entities']
+
+    rng = random.Random(seed)
+    names = set(words)
+    while len(names) < count:
+        names.add(rng.choice(words) + rng.choice(words) + str(rng.randint(0, 99)))
+    return sorted(names)[:count]
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Apply one random edit"""
+    i = rng.randrange(len(name))
+    op = rng.choice(('drop', 'swap', 'replace'))
+    if op == 'drop':
+        return name[:i] + name[i + 1:]
+    if op == 'swap' and i + 1 < len(name):
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + name[i + 1:]
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    name_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    names = synthetic_names(name_count)
+    rng = random.Random(7)
+    queries = [misspell(rng.choice(names), rng) for _ in range(query_count)]
+
+    start = time.perf_counter()
+    index = TrigramIndex(names, normalize=canonicalize)
+    build_s = time.perf_counter() - start
+
+    latencies = []
+    hits = 0
+    for query in queries:
+        start = time.perf_counter()
+        if index.suggest(query):
+            hits += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # Linear scan baseline over a handful of queries for comparison
+    keys = [canonicalize(n) for n in names]
+    linear = []
+    for query in queries[:20]:
+        key = canonicalize(query)
+        start = time.perf_counter()
+        for candidate in keys:
+            bounded_edit_distance(key, candidate, 2)
+        linear.append((time.perf_counter() - start) * 1000)
+
+    print("=" * 80)
+    print("NAME INDEX BENCHMARK")
+    print("=" * 80)
+    print(f"Names indexed:        {len(index):,}")
+    print(f"Index build:          {build_s:.2f} s")
+    print(f"Queries (misses):     {query_count} ({hits} with suggestions)")
+    print(f"Per-miss latency ms:  mean {statistics.mean(latencies):.3f}  "
+          f"p50 {percentile(latencies, 0.50):.3f}  p95 {percentile(latencies, 0.95):.3f}  "
+          f"p99 {percentile(latencies, 0.99):.3f}")
+    print(f"Linear scan ms:       mean {statistics.mean(linear):.1f} (20 queries)")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,23 @@ sys.path.insert(0, str(validators_path))
 from dictionary_validator import BankingDictionaryValidator
 from semantic_validator import BankingSemanticValidator
 
+VALID_PROCESS = """
+Process PaymentProcessing {
+    Description: "Screen and settle a payment"
+    ObjectiveID: OBJ_Payments
+    BusinessGoalID: BG_Payments
+    Actors: [PaymentProcessor, FraudAnalyst]
+    erMap: PaymentProcessing
+    Starts With: Event PaymentReceived(DO_TransactionData)
+    Step Screen {
+        Actions:
+            - FraudAnalyst Monitor DO_TransactionData
+            - PaymentProcessor Settle DO_TransactionData
+    }
+    Ends With: Event PaymentSettled(DO_TransactionData)
+}
+"""
+
 
 class TestBankingDictionaryValidator(unittest.TestCase):
     """Test dictionary validation"""
@@ -28,12 +45,7 @@ class TestBankingDictionaryValidator(unittest.TestCase):
 
     def test_valid_actors(self):
         """Test that valid actors pass validation"""
-        valid_content = """
-        Process PaymentProcessing {
-            Actors: [PaymentProcessor, FraudAnalyst]
-        }
-        """
-        self.validator.validate_file(valid_content)
+        self.assertTrue(self.validator.validate_file(VALID_PROCESS))
         self.assertEqual(len(self.validator.errors), 0)
 
     def test_invalid_actors(self):
@@ -60,7 +72,7 @@ class TestBankingDictionaryValidator(unittest.TestCase):
         """
         self.validator.validate_file(valid_content)
         # Should have no errors for dataRef
-        dataref_errors = [e for e in self.validator.errors if 'dataRef' in e.message]
+        dataref_errors = [e for e in self.validator.errors if e.rule == 'DICT-ENT-002']
         self.assertEqual(len(dataref_errors), 0)
 
     def test_invalid_dataref(self):
@@ -71,7 +83,7 @@ class TestBankingDictionaryValidator(unittest.TestCase):
         }
         """
         self.validator.validate_file(invalid_content)
-        dataref_errors = [e for e in self.validator.errors if 'dataRef' in e.message]
+        dataref_errors = [e for e in self.validator.errors if e.rule == 'DICT-ENT-002']
         self.assertGreater(len(dataref_errors), 0)
 
     def test_relationship_types(self):
@@ -88,6 +100,35 @@ class TestBankingDictionaryValidator(unittest.TestCase):
         self.assertTrue(True)  # Placeholder
 
 
+class TestReusableDictionaryValidator(unittest.TestCase):
+    """Test one dictionary validator across in-memory documents"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+
+    def test_validate_many(self):
+        """Test that each document gets its own errors and warnings"""
+        validator = BankingDictionaryValidator(str(self.dict_path))
+        oversized = '# Domain: Banking\n' + '{\n' * 40
+        documents = [oversized, VALID_PROCESS, oversized.encode('utf-8')]
+        results = list(validator.validate_many(documents))
+        self.assertEqual([len(errors) for errors, _ in results], [1, 0, 1])
+        self.assertEqual(results[0][0][0].rule, 'LIMIT-003')
+        self.assertIs(results[2][0], validator.errors)
+
+    def test_report(self):
+        """Test the report of the last document"""
+        validator = BankingDictionaryValidator(str(self.dict_path))
+        self.assertFalse(validator.validate_text('{\n' * 40))
+        report = validator.get_validation_report('inline.ebl')
+        self.assertIn('File: inline.ebl', report)
+        self.assertIn(f'Dictionary: {self.dict_path}', report)
+        self.assertIn('[LIMIT-003]', report)
+        self.assertTrue(validator.validate_text(''))
+        self.assertIn('VALIDATION PASSED', validator.get_validation_report())
+
+
 class TestBankingSemanticValidator(unittest.TestCase):
     """Test semantic validation rules"""
 
@@ -124,16 +165,59 @@ class TestBankingSemanticValidator(unittest.TestCase):
         self.assertGreater(len(cvv_errors), 0)
 
     def test_wire_transfer_dual_authorization(self):
-        """Test wire transfers require dual authorization"""
+        """Test wire transfers with an approval require dual authorization"""
         content_single_actor = """
         Process WireTransfer {
             Actors: [TreasuryOfficer]
+            Actions:
+                - Approve wire
         }
         """
         self.validator.validate(content_single_actor)
         wire_warnings = [i for i in self.validator.issues if i.rule.startswith('WIRE')]
         self.assertGreater(len(wire_warnings), 0)
 
+        self.validator.validate(content_single_actor.replace('- Approve wire', '- Send wire'))
+        self.assertNotIn('WIRE-001', [i.rule for i in self.validator.issues])
+        self.validator.validate(content_single_actor.replace('[TreasuryOfficer]', '[TreasuryOfficer, BranchManager]'))
+        self.assertNotIn('WIRE-001', [i.rule for i in self.validator.issues])
+
+    def test_wire_transfer_any_single_actor_list(self):
+        """Test that WIRE-001 looks at every Actors list, not only the first one"""
+        content = """
+        Process WireTransfer {
+            Actors: [TreasuryOfficer, BranchManager]
+        }
+        Process WireRelease {
+            Actors: [TreasuryOfficer]
+            Actions:
+                - Approve wire
+        }
+        """
+        self.validator.validate(content)
+        self.assertIn('WIRE-001', [i.rule for i in self.validator.issues])
+
+    def test_actor_authorization(self):
+        """Test AUTH-001: every actor of a Process must be allowed the verbs of its Actions"""
+        content = """
+        Process Payments {
+            Actors: [Teller]
+            Actions:
+                - Underwrite loan
+        }
+        """
+        self.assertFalse(self.validator.validate(content))
+        [issue] = [i for i in self.validator.issues if i.rule == 'AUTH-001']
+        self.assertEqual(issue.severity.value, 'error')
+        self.assertEqual(issue.message, "Actor 'Teller' not authorized for verb 'Underwrite'")
+
+    def test_for_each_order(self):
+        """Test that forEach issues follow the rule's keyword order, not the order in the file"""
+        self.validator.validate("IBAN: String\nSSN: String\n")
+        self.assertEqual([i.message for i in self.validator.issues if i.rule == 'DATA-001'],
+                         ["Sensitive field 'SSN' should be encrypted or masked",
+                          "Sensitive field 'IBAN' should be encrypted or masked"])
+
     def test_fraud_detection_required(self):
         """Test that high-risk transactions require fraud screening"""
         content_no_fraud_check = """
@@ -184,6 +268,32 @@ class TestBankingSemanticValidator(unittest.TestCase):
         txn_warnings = [i for i in self.validator.issues if i.rule.startswith('TXN')]
         self.assertGreater(len(txn_warnings), 0)
 
+    def test_segregation_of_duties(self):
+        """Test SOX: the same actor must not create and approve within a Process"""
+        content = (
+            "Process Payments {\n"
+            "  Actors: [Teller, BranchManager]\n"
+            "  Step Enter {\n"
+            "    Actions:\n"
+            "      - Teller CreateTransaction DO_Payment\n"
+            "      - BranchManager ApproveTransaction DO_Payment\n"
+            "  }\n"
+            "}\n"
+        )
+        self.validator.validate(content)
+        self.assertEqual([i for i in self.validator.issues if i.rule == 'SOX-001'], [])
+
+        self.validator.validate(content.replace('BranchManager ApproveTransaction', 'Teller ApproveTransaction'))
+        [issue] = [i for i in self.validator.issues if i.rule == 'SOX-001']
+        self.assertIn("'Teller' performs both CreateTransaction (line 5) and ApproveTransaction (line 6)",
+                      issue.message)
+        self.assertEqual(issue.line, 6)
+
+    def test_rule_pack_loaded_once(self):
+        """Test that every validator shares the module's rule pack"""
+        other = BankingSemanticValidator(str(self.dict_path))
+        self.assertIs(other.rule_pack, self.validator.rule_pack)
+
 
 class TestBankingIntegration(unittest.TestCase):
     """Integration tests using real example files"""
@@ -216,6 +326,21 @@ class TestBankingIntegration(unittest.TestCase):
                     print(dict_validator.get_validation_report())
                     print(semantic_validator.get_validation_report())
 
+    def test_semantic_validator_matches_engine(self):
+        """Test that the semantic validator and the engine evaluate the same banking rule pack"""
+        from vertical_engine import VerticalEngine
+
+        engine = VerticalEngine()
+        validator = BankingSemanticValidator(str(self.dict_path))
+        for ebl_file in sorted(self.examples_path.glob('*.ebl')):
+            with self.subTest(file=ebl_file.name):
+                content = ebl_file.read_text(encoding='utf-8')
+                validator.validate(content)
+                # AUTH-001 needs the dictionary, so only the validator reports it
+                issues = [i for i in validator.issues if i.rule != 'AUTH-001']
+                self.assertEqual(issues, engine.check_semantics('banking', content))
+
+
 
 def run_tests():
     """Run all tests"""
@@ -0,0 +1,153 @@
+"""
+Banking Vertical - Incremental Validation Tests
+Tests for dictionary diffing and selective revalidation
+"""
+
+import copy
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add validators to path
+validators_path = Path(__file__).parent.parent.parent / 'validators' / 'python'
+sys.path.insert(0, str(validators_path))
+
+from dictionary_validator import BankingDictionary, ValidationIssue
+from dictionary_diff import diff_dictionaries
+from incremental_validator import FileEntry, RecordingDictionary, UsageIndex, revalidate_files
+
+LENDING = """# Domain: Banking
+Process Lending {
+  Description: "Originate and review a loan"
+  ObjectiveID: OBJ_Lending
+  BusinessGoalID: BG_Lending
+  Actors: [LoanOfficer, Underwriter]
+  erMap: Lending
+  Starts With: Event LoanRequested(DO_LoanApplication)
+  Step Originate {
+    Actions:
+      - LoanOfficer Originate DO_LoanApplication
+      - Underwriter Review DO_LoanApplication
+  }
+  Ends With: Event LoanReviewed(DO_LoanApplication)
+}
+"""
+
+
+class TestDictionaryDiff(unittest.TestCase):
+    """Test dictionary diff computation"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+        with open(cls.dict_path, 'r') as f:
+            cls.data = json.load(f)
+
+    def test_identical_dictionaries(self):
+        """Test that an unchanged dictionary produces an empty diff"""
+        diff = diff_dictionaries(BankingDictionary.from_data(self.data), BankingDictionary.from_data(self.data))
+        self.assertTrue(diff.is_empty())
+        self.assertEqual(diff.changed_symbols(), set())
+
+    def test_added_actor_verb(self):
+        """Test that adding one verb to LoanOfficer only touches LoanOfficer's whitelist"""
+        edited = copy.deepcopy(self.data)
+        edited['domain']['actorVerbs']['LoanOfficer'].append('Approve')
+
+        diff = diff_dictionaries(BankingDictionary.from_data(self.data), BankingDictionary.from_data(edited))
+        self.assertEqual(diff.changed_symbols(), {'actorVerbs:loanofficer'})
+
+    def test_added_and_removed_names(self):
+        """Test that name set changes include the wildcard key"""
+        edited = copy.deepcopy(self.data)
+        edited['domain']['actors'].append('TenantAuditor')
+        edited['core']['relationshipTypes'].remove('hedges_with')
+
+        diff = diff_dictionaries(BankingDictionary.from_data(self.data), BankingDictionary.from_data(edited))
+        self.assertEqual(diff.added['actor'], {'tenantauditor'})
+        self.assertEqual(diff.removed['relationshipType'], {'hedges_with'})
+        self.assertIn('actor:*', diff.changed_symbols())
+        self.assertIn('relationshipType:*', diff.changed_symbols())
+
+
+class TestSelectiveRevalidation(unittest.TestCase):
+    """Test the usage index and selective revalidation"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+        self.examples_path = Path(__file__).parent.parent.parent / 'examples'
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_recording_dictionary(self):
+        """Test that lookups are recorded as canonical usage keys"""
+        recorder = RecordingDictionary(BankingDictionary(str(self.dict_path)))
+        self.assertTrue(recorder.has_actor('LoanOfficer'))
+        recorder.actor_allows_verb('LoanOfficer', 'Originate')
+        recorder.relationship_types
+        self.assertEqual(recorder.used, {'actor:loanofficer', 'actorVerbs:loanofficer', 'relationshipType:*'})
+
+    def test_usage_index_roundtrip(self):
+        """Test that the usage index persists symbol->file mappings"""
+        index_path = str(self.tmp / 'index.json')
+        index = UsageIndex(index_path)
+        issue = ValidationIssue(severity='error', rule='DICT-ACT-001', message='missing')
+        index.record('a.ebl', FileEntry(sha256='1', symbols=['actor:loanofficer'], errors=[issue]))
+        index.record('b.ebl', FileEntry(sha256='2', symbols=['verb:approve']))
+        index.save()
+
+        loaded = UsageIndex.load(index_path)
+        self.assertEqual(loaded.files_using(['actor:loanofficer']), {'a.ebl'})
+        self.assertEqual(loaded.files['a.ebl'].errors, [issue])
+
+        loaded.record('a.ebl', FileEntry(sha256='3', symbols=['verb:approve']))
+        self.assertEqual(loaded.files_using(['actor:loanofficer']), set())
+        self.assertEqual(loaded.files_using(['verb:approve']), {'a.ebl', 'b.ebl'})
+
+    def test_unchanged_files_are_reused(self):
+        """Test that only changed content is revalidated"""
+        index_path = str(self.tmp / 'index.json')
+        ebl_file = self.tmp / 'AFC_Fraud_SAR.ebl'
+        shutil.copy(self.examples_path / 'AFC_Fraud_SAR.ebl', ebl_file)
+
+        first = revalidate_files([str(ebl_file)], str(self.dict_path), index_path)
+        self.assertEqual(first.validated, [str(ebl_file)])
+
+        second = revalidate_files([str(ebl_file)], str(self.dict_path), index_path)
+        self.assertEqual(second.reused, [str(ebl_file)])
+
+        ebl_file.write_text(ebl_file.read_text() + "\n")
+        third = revalidate_files([str(ebl_file)], str(self.dict_path), index_path)
+        self.assertEqual(third.validated, [str(ebl_file)])
+
+    def test_dictionary_change_reuses_unaffected_files(self):
+        """Test that a dictionary edit only re-checks files using changed symbols"""
+        index_path = str(self.tmp / 'index.json')
+        fraud = self.tmp / 'AFC_Fraud_SAR.ebl'
+        shutil.copy(self.examples_path / fraud.name, fraud)
+        lending = self.tmp / 'Lending.ebl'
+        lending.write_text(LENDING)
+        paths = [str(fraud), str(lending)]
+        revalidate_files(paths, str(self.dict_path), index_path)
+
+        index = UsageIndex.load(index_path)
+        self.assertEqual(index.files_using(['actorVerbs:loanofficer']), {str(lending.resolve())})
+
+        with open(self.dict_path, 'r') as f:
+            data = json.load(f)
+        data['domain']['actorVerbs']['LoanOfficer'].append('Approve')
+        edited_dict = self.tmp / 'edited.json'
+        edited_dict.write_text(json.dumps(data))
+
+        run = revalidate_files(paths, str(edited_dict), index_path)
+        self.assertEqual(run.diff.changed_symbols(), {'actorVerbs:loanofficer'})
+        self.assertEqual(run.validated, [str(lending)])
+        self.assertEqual(run.reused, [str(fraud)])
+
+if __name__ == '__main__':
+    unittest.main()
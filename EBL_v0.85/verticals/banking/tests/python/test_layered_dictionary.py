@@ -0,0 +1,104 @@
+"""
+Banking Vertical - Layered Dictionary Tests
+Tests for per-tenant overlays on the shared banking dictionary
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add validators to path
+validators_path = Path(__file__).parent.parent.parent / 'validators' / 'python'
+sys.path.insert(0, str(validators_path))
+
+from dictionary_validator import BankingDictionary
+from layered_dictionary import LayeredDictionary, TenantDictionaryRegistry, merge_view
+
+
+OVERLAY = {
+    "domain": {
+        "actors": ["RegionalLendingDesk"],
+        "actorVerbs": {"LoanOfficer": ["Approve"], "RegionalLendingDesk": ["Originate"]},
+        "actorDataPerms": {"RegionalLendingDesk": {"read": ["DO_LoanApplicationData"]}}
+    }
+}
+
+
+class TestLayeredDictionary(unittest.TestCase):
+    """Test chained and merged tenant lookups"""
+
+    @classmethod
+    def setUpClass(cls):
+        dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+        cls.base = BankingDictionary(str(dict_path))
+        cls.overlay = BankingDictionary.from_data(OVERLAY)
+
+    def assert_tenant_view(self, view):
+        self.assertTrue(view.has_actor('RegionalLendingDesk'))
+        self.assertTrue(view.has_actor('LoanOfficer'))
+        self.assertTrue(view.actor_allows_verb('LoanOfficer', 'Approve'))
+        self.assertTrue(view.actor_allows_verb('LoanOfficer', 'Originate'))
+        self.assertFalse(view.actor_allows_verb('RegionalLendingDesk', 'Approve'))
+        self.assertTrue(view.actor_can_read('RegionalLendingDesk', 'DO_LoanApplicationData'))
+        self.assertFalse(view.actor_can_read('RegionalLendingDesk', 'DO_CreditReport'))
+
+    def test_chained_lookups(self):
+        """Test that the chained view sees overlay and base"""
+        self.assert_tenant_view(LayeredDictionary(self.base, self.overlay))
+
+    def test_merged_view(self):
+        """Test that the merged view matches the chained view"""
+        self.assert_tenant_view(merge_view(self.base, self.overlay))
+
+    def test_base_is_not_modified(self):
+        """Test that overlays never leak into the shared base"""
+        merge_view(self.base, self.overlay)
+        self.assertFalse(self.base.has_actor('RegionalLendingDesk'))
+        self.assertFalse(self.base.actor_allows_verb('LoanOfficer', 'Approve'))
+
+    def test_merged_view_shares_untouched_structures(self):
+        """Test copy-on-write: untouched structures are the base's own objects"""
+        view = merge_view(self.base, self.overlay)
+        self.assertIs(view.data_objects, self.base.data_objects)
+        self.assertIs(view.verb_permissions, self.base.verb_permissions)
+        self.assertIs(view.actor_verbs['underwriter'], self.base.actor_verbs['underwriter'])
+        self.assertIsNot(view.actors, self.base.actors)
+
+    def test_tenant_suggestions(self):
+        """Test that suggestions include tenant names"""
+        view = LayeredDictionary(self.base, self.overlay)
+        self.assertIn('RegionalLendingDesk', view.suggest_actor('RegionalLendingDsk'))
+
+
+class TestTenantDictionaryRegistry(unittest.TestCase):
+    """Test hot-view promotion and LRU eviction"""
+
+    @classmethod
+    def setUpClass(cls):
+        dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+        cls.base = BankingDictionary(str(dict_path))
+
+    def test_unknown_tenant_gets_base(self):
+        """Test that tenants without overlay share the base"""
+        registry = TenantDictionaryRegistry(self.base)
+        self.assertIs(registry.get('unknown'), self.base)
+
+    def test_hot_promotion_and_eviction(self):
+        """Test that hot tenants get merged views and cold ones are evicted"""
+        registry = TenantDictionaryRegistry(self.base, max_hot_views=1, hot_threshold=2)
+        registry.add_overlay('north', OVERLAY)
+        registry.add_overlay('south', OVERLAY)
+
+        self.assertIsInstance(registry.get('north'), LayeredDictionary)
+        hot = registry.get('north')
+        self.assertIsInstance(hot, BankingDictionary)
+        self.assertIs(registry.get('north'), hot)
+
+        registry.get('south')
+        registry.get('south')
+        self.assertEqual(registry.hot_tenants(), ['south'])
+        self.assertIsInstance(registry.get('north'), LayeredDictionary)
+
+
+if __name__ == '__main__':
+    unittest.main()
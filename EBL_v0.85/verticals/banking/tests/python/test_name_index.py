@@ -0,0 +1,70 @@
+"""
+Banking Vertical - Name Index Tests
+Tests for "did you mean" suggestions
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add validators to path
+validators_path = Path(__file__).parent.parent.parent / 'validators' / 'python'
+sys.path.insert(0, str(validators_path))
+
+from dictionary_validator import BankingDictionary
+from name_index import TrigramIndex, bounded_edit_distance
+from vertical_validator import canonicalize, did_you_mean
+
+
+class TestTrigramIndex(unittest.TestCase):
+    """Test the trigram index"""
+
+    def test_bounded_edit_distance(self):
+        """Test distance computation and early cut-off"""
+        self.assertEqual(bounded_edit_distance('underwriter', 'undrwriter', 2), 1)
+        self.assertEqual(bounded_edit_distance('approve', 'approve', 2), 0)
+        self.assertIsNone(bounded_edit_distance('approve', 'reject', 2))
+
+    def test_nearest_first(self):
+        """Test that suggestions are ranked by edit distance"""
+        index = TrigramIndex(['LoanOfficer', 'LoanProcessor', 'BSAOfficer'], normalize=canonicalize)
+        self.assertEqual(index.suggest('LoanOficer')[0], 'LoanOfficer')
+
+    def test_unrelated_name(self):
+        """Test that unrelated names get no suggestion"""
+        index = TrigramIndex(['LoanOfficer', 'Underwriter'], normalize=canonicalize)
+        self.assertEqual(index.suggest('Zebra'), [])
+
+    def test_candidate_cap(self):
+        """Test that at most max_candidates names are verified per lookup"""
+        names = [f"Officer{i:03d}" for i in range(500)]
+        index = TrigramIndex(names, max_candidates=5)
+        self.assertLessEqual(len(index.suggest('Officer00', limit=10)), 5)
+
+
+class TestDictionarySuggestions(unittest.TestCase):
+    """Test suggestions wired into the banking dictionary"""
+
+    @classmethod
+    def setUpClass(cls):
+        dict_path = Path(__file__).parent.parent.parent / 'dictionary' / 'banking_dictionary_v0.85.json'
+        cls.dictionary = BankingDictionary(str(dict_path))
+
+    def test_suggest_by_kind(self):
+        """Test actor, verb and DataObject suggestions"""
+        self.assertIn('Underwriter', self.dictionary.suggest_actor('Undrwriter'))
+        self.assertIn('Underwrite', self.dictionary.suggest_verb('Undrwrite'))
+        self.assertIn('DO_SARFiling', self.dictionary.suggest_data_object('DO_SARFilings'))
+
+    def test_did_you_mean(self):
+        """Test suggestion text formatting"""
+        self.assertEqual(did_you_mean([], "Check spelling"), "Check spelling")
+        self.assertEqual(did_you_mean(['LoanOfficer']), "Did you mean 'LoanOfficer'?")
+        self.assertEqual(
+            did_you_mean(['LoanOfficer'], "Check spelling"),
+            "Did you mean 'LoanOfficer'? Otherwise: check spelling"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Banking Vertical - Performance Budget Tests
+Parse time, peak memory and parse-tree size against performance_baselines.json
+
+Set EBL_SKIP_PERF=1 to skip this tier. After an intended change in cost,
+record new baselines with:
+    python engine/python/perf_budget.py --update verticals/banking/tests/python/performance_baselines.json
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# Add the shared engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from perf_budget import BudgetFile, Measurement, check_budgets
+
+BASELINES = Path(__file__).parent / 'performance_baselines.json'
+
+
+@unittest.skipIf(os.environ.get('EBL_SKIP_PERF'), "EBL_SKIP_PERF is set")
+class TestPerformanceBudgets(unittest.TestCase):
+    """Test every corpus file against its stored budgets"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.budgets = BudgetFile(str(BASELINES))
+        cls.measured = cls.budgets.measure_all()
+
+    def assertWithinBudget(self, metric: str):
+        breaches = [line for line in check_budgets(self.budgets, self.measured)
+                    if f" {metric}:" in line or 'no baseline' in line]
+        self.assertFalse(breaches, f"{metric} over budget:\n  " + '\n  '.join(breaches))
+
+    def test_corpus_has_baselines(self):
+        """Test that the examples and generated files are all measured"""
+        self.assertEqual(set(self.measured), set(self.budgets.baselines))
+        self.assertIn('MortgageLoanApplication.ebl', self.measured)
+        self.assertIn('Payments_Screening.ebl', self.measured)
+
+    def test_parse_time(self):
+        """Test parse time in calibration units"""
+        self.assertWithinBudget('parseUnits')
+
+    def test_peak_memory(self):
+        """Test tracemalloc peak during a parse"""
+        self.assertWithinBudget('peakKiB')
+
+    def test_node_count(self):
+        """Test parse-tree size"""
+        self.assertWithinBudget('nodes')
+
+
+class TestBudgetDiff(unittest.TestCase):
+    """Test the diff reported for a breach"""
+
+    def test_breach_lines(self):
+        """Test that each exceeded metric names baseline, budget and change"""
+        budgets = BudgetFile(str(BASELINES))
+        budgets.baselines = {'a.ebl': {'parseUnits': 10, 'peakKiB': 100, 'nodes': 1000}}
+        measured = {'a.ebl': Measurement(parseUnits=30, peakKiB=120, nodes=1000),
+                    'b.ebl': Measurement(parseUnits=1, peakKiB=1, nodes=1)}
+        lines = check_budgets(budgets, measured)
+        self.assertEqual(lines[0], "a.ebl parseUnits: 30 > budget 25 (baseline 10 x 2.5, +200% vs baseline)")
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith("b.ebl: no baseline"))
+
+
+if __name__ == '__main__':
+    unittest.main()
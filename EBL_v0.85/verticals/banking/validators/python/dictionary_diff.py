@@ -0,0 +1,131 @@
+"""
+Banking Vertical - Dictionary Diff
+Computes exactly which dictionary symbols changed between two dictionary versions
+
+Changed symbols are reported as usage keys ("<kind>:<canonical name>") so they
+can be matched directly against the symbols a validated file looked up.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from dictionary_validator import BankingDictionary
+
+
+# Name sets compared between dictionary versions, keyed by usage kind
+NAME_SETS = {
+    'actor': 'actors',
+    'verb': 'verbs',
+    'entity': 'entities',
+    'dataObject': 'data_objects',
+    'relationshipType': 'relationship_types',
+}
+
+# Per-actor / per-verb maps compared between dictionary versions
+PERMISSION_MAPS = {
+    'actorVerbs': 'actor_verbs',
+    'actorRead': 'actor_read_perms',
+    'actorWrite': 'actor_write_perms',
+    'verbPermission': 'verb_permissions',
+}
+
+
+def usage_key(kind: str, name: str) -> str:
+    """Build the usage key for a canonicalized dictionary symbol"""
+    return f"{kind}:{name}"
+
+
+def wildcard_key(kind: str) -> str:
+    """Usage key for lookups that depend on every name of a kind"""
+    return f"{kind}:*"
+
+
+@dataclass
+class DictionaryDiff:
+    """Symbols added, removed or changed between two dictionary versions"""
+    added: Dict[str, Set[str]] = field(default_factory=dict)
+    removed: Dict[str, Set[str]] = field(default_factory=dict)
+    changed_permissions: Dict[str, Set[str]] = field(default_factory=dict)
+    permitted_verbs: Set[str] = field(default_factory=set)
+    requires_full_revalidation: bool = False
+
+    def is_empty(self) -> bool:
+        """True if no symbol changed"""
+        return not (self.requires_full_revalidation or self.permitted_verbs
+                    or any(self.added.values()) or any(self.removed.values())
+                    or any(self.changed_permissions.values()))
+
+    def changed_symbols(self) -> Set[str]:
+        """Usage keys of every symbol whose lookup result may have changed"""
+        keys = set()
+        for kind in NAME_SETS:
+            names = self.added.get(kind, set()) | self.removed.get(kind, set())
+            keys.update(usage_key(kind, n) for n in names)
+            if names:
+                keys.add(wildcard_key(kind))
+        for kind, names in self.changed_permissions.items():
+            keys.update(usage_key(kind, n) for n in names)
+        keys.update(usage_key('permittedVerb', v) for v in self.permitted_verbs)
+        return keys
+
+    def summary(self) -> List[str]:
+        """Human-readable summary lines"""
+        lines = []
+        for kind in NAME_SETS:
+            for name in sorted(self.added.get(kind, ())):
+                lines.append(f"+ {kind} {name}")
+            for name in sorted(self.removed.get(kind, ())):
+                lines.append(f"- {kind} {name}")
+        for kind, names in self.changed_permissions.items():
+            for name in sorted(names):
+                lines.append(f"~ {kind} {name}")
+        if self.requires_full_revalidation:
+            lines.append("! verb whitelist emptiness changed - full revalidation required")
+        return lines
+
+
+def diff_dictionaries(old: BankingDictionary, new: BankingDictionary) -> DictionaryDiff:
+    """
+    Compare two compiled banking dictionaries
+
+    Args:
+        old: Dictionary the cached results were computed with
+        new: Dictionary to validate against now
+
+    Returns:
+        DictionaryDiff describing every changed symbol
+    """
+    diff = DictionaryDiff()
+
+    for kind, attr in NAME_SETS.items():
+        old_names, new_names = getattr(old, attr), getattr(new, attr)
+        diff.added[kind] = new_names - old_names
+        diff.removed[kind] = old_names - new_names
+
+    for kind, attr in PERMISSION_MAPS.items():
+        old_map, new_map = getattr(old, attr), getattr(new, attr)
+        diff.changed_permissions[kind] = {
+            key for key in old_map.keys() | new_map.keys()
+            if old_map.get(key) != new_map.get(key)
+        }
+
+    # verb_permitted_by_any() allows everything while no actor has a whitelist
+    old_permitted, new_permitted = old.all_permitted_verbs, new.all_permitted_verbs
+    if bool(old_permitted) != bool(new_permitted):
+        diff.requires_full_revalidation = True
+    diff.permitted_verbs = old_permitted ^ new_permitted
+
+    return diff
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python dictionary_diff.py <old_dictionary_json> <new_dictionary_json>")
+        sys.exit(1)
+
+    changes = diff_dictionaries(BankingDictionary(sys.argv[1]), BankingDictionary(sys.argv[2]))
+    if changes.is_empty():
+        print("No dictionary changes")
+    else:
+        print("\n".join(changes.summary()))
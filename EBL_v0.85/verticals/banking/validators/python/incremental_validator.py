@@ -0,0 +1,277 @@
+"""
+Banking Vertical - Incremental Dictionary Validation
+Re-checks only the files affected by a dictionary change
+
+Every validated file records the dictionary symbols it looked up. The
+symbol->file usage index and the per-file results are persisted together, so
+after a dictionary edit only files referencing a changed symbol (or whose
+content changed) are re-validated; everything else reuses the cached result.
+"""
+
+import sys
+import json
+import hashlib
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from dictionary_validator import (
+    BankingDictionary,
+    ValidationIssue,
+    check_banking_file,
+)
+from dictionary_diff import DictionaryDiff, diff_dictionaries, usage_key, wildcard_key
+from vertical_validator import canonicalize
+
+
+INDEX_FORMAT_VERSION = 1
+
+
+def fingerprint(data: Dict) -> str:
+    """Stable content hash of dictionary JSON data"""
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class RecordingDictionary:
+    """Wraps a BankingDictionary and records the usage key of every lookup"""
+
+    def __init__(self, dictionary: BankingDictionary):
+        self._dictionary = dictionary
+        self.used: Set[str] = set()
+
+    def _use(self, kind: str, name: str):
+        self.used.add(usage_key(kind, canonicalize(name)))
+
+    def has_actor(self, actor: str) -> bool:
+        self._use('actor', actor)
+        return self._dictionary.has_actor(actor)
+
+    def has_verb(self, verb: str) -> bool:
+        self._use('verb', verb)
+        return self._dictionary.has_verb(verb)
+
+    def has_entity(self, entity: str) -> bool:
+        self._use('entity', entity)
+        return self._dictionary.has_entity(entity)
+
+    def has_data_object(self, data_object: str) -> bool:
+        self._use('dataObject', data_object)
+        return self._dictionary.has_data_object(data_object)
+
+    def actor_allows_verb(self, actor: str, verb: str) -> bool:
+        self._use('actorVerbs', actor)
+        return self._dictionary.actor_allows_verb(actor, verb)
+
+    def verb_permitted_by_any(self, verb: str) -> bool:
+        self._use('permittedVerb', verb)
+        return self._dictionary.verb_permitted_by_any(verb)
+
+    def actor_can_read(self, actor: str, data_object: str) -> bool:
+        self._use('actorRead', actor)
+        return self._dictionary.actor_can_read(actor, data_object)
+
+    def actor_can_write(self, actor: str, data_object: str) -> bool:
+        self._use('actorWrite', actor)
+        return self._dictionary.actor_can_write(actor, data_object)
+
+    def is_relationship_type(self, rel_type: str) -> bool:
+        self._use('relationshipType', rel_type)
+        return self._dictionary.is_relationship_type(rel_type)
+
+    def get_verb_permission(self, verb: str) -> Optional[str]:
+        self._use('verbPermission', verb)
+        return self._dictionary.get_verb_permission(verb)
+
+    def suggest_actor(self, actor: str, limit: int = 3) -> List[str]:
+        # Nearest-match suggestions depend on every name of the kind
+        self.used.add(wildcard_key('actor'))
+        return self._dictionary.suggest_actor(actor, limit)
+
+    def suggest_verb(self, verb: str, limit: int = 3) -> List[str]:
+        self.used.add(wildcard_key('verb'))
+        return self._dictionary.suggest_verb(verb, limit)
+
+    def suggest_entity(self, entity: str, limit: int = 3) -> List[str]:
+        self.used.add(wildcard_key('entity'))
+        return self._dictionary.suggest_entity(entity, limit)
+
+    def suggest_data_object(self, data_object: str, limit: int = 3) -> List[str]:
+        self.used.add(wildcard_key('dataObject'))
+        return self._dictionary.suggest_data_object(data_object, limit)
+
+    @property
+    def relationship_types(self) -> Set[str]:
+        # Listing every type (e.g. in a suggestion) depends on the whole set
+        self.used.add(wildcard_key('relationshipType'))
+        return self._dictionary.relationship_types
+
+    def __getattr__(self, name):
+        return getattr(self._dictionary, name)
+
+
+@dataclass
+class FileEntry:
+    """Cached validation result for one file"""
+    sha256: str
+    symbols: List[str] = field(default_factory=list)
+    errors: List[ValidationIssue] = field(default_factory=list)
+    warnings: List[ValidationIssue] = field(default_factory=list)
+
+
+class UsageIndex:
+    """Persisted symbol->file usage index with cached per-file results"""
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.dictionary_data: Optional[Dict] = None
+        self.dictionary_fingerprint: Optional[str] = None
+        self.files: Dict[str, FileEntry] = {}
+        self.symbol_files: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def load(cls, index_path: str) -> 'UsageIndex':
+        """Load an index from disk, or start an empty one"""
+        index = cls(index_path)
+        if not Path(index_path).exists():
+            return index
+
+        with open(index_path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            return index
+
+        index.dictionary_data = data.get('dictionary')
+        index.dictionary_fingerprint = data.get('dictionaryFingerprint')
+        for path, entry in data.get('files', {}).items():
+            index.files[path] = FileEntry(
+                sha256=entry['sha256'],
+                symbols=entry.get('symbols', []),
+                errors=[ValidationIssue(**e) for e in entry.get('errors', [])],
+                warnings=[ValidationIssue(**w) for w in entry.get('warnings', [])],
+            )
+        index.symbol_files = {k: set(v) for k, v in data.get('symbols', {}).items()}
+        return index
+
+    def save(self):
+        """Write the index to disk"""
+        data = {
+            'version': INDEX_FORMAT_VERSION,
+            'dictionaryFingerprint': self.dictionary_fingerprint,
+            'dictionary': self.dictionary_data,
+            'files': {path: asdict(entry) for path, entry in self.files.items()},
+            'symbols': {k: sorted(v) for k, v in sorted(self.symbol_files.items())},
+        }
+        with open(self.index_path, 'w') as f:
+            json.dump(data, f)
+
+    def record(self, path: str, entry: FileEntry):
+        """Store a file's result and re-point its symbol usages"""
+        previous = self.files.get(path)
+        if previous:
+            for symbol in previous.symbols:
+                users = self.symbol_files.get(symbol)
+                if users:
+                    users.discard(path)
+                    if not users:
+                        del self.symbol_files[symbol]
+        self.files[path] = entry
+        for symbol in entry.symbols:
+            self.symbol_files.setdefault(symbol, set()).add(path)
+
+    def files_using(self, symbols: Iterable[str]) -> Set[str]:
+        """All files that looked up any of the given usage keys"""
+        users = set()
+        for symbol in symbols:
+            users.update(self.symbol_files.get(symbol, ()))
+        return users
+
+
+@dataclass
+class RevalidationResult:
+    """Outcome of an incremental validation run"""
+    results: Dict[str, Tuple[List[ValidationIssue], List[ValidationIssue]]] = field(default_factory=dict)
+    validated: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+    diff: Optional[DictionaryDiff] = None
+
+
+def revalidate_files(ebl_paths: Iterable[str], dictionary_path: str, index_path: str) -> RevalidationResult:
+    """
+    Validate files, re-checking only those affected by dictionary or content changes
+
+    Args:
+        ebl_paths: Paths to .ebl files
+        dictionary_path: Path to banking_dictionary_v0.85.json
+        index_path: Path to the persisted usage index (created if missing)
+
+    Returns:
+        RevalidationResult with per-file (errors, warnings)
+    """
+    index = UsageIndex.load(index_path)
+    with open(dictionary_path, 'r') as f:
+        data = json.load(f)
+    dictionary = BankingDictionary.from_data(data)
+    current_fingerprint = fingerprint(data)
+
+    outcome = RevalidationResult()
+    stale: Optional[Set[str]] = set()
+    if index.dictionary_data is None:
+        stale = None
+    elif index.dictionary_fingerprint != current_fingerprint:
+        outcome.diff = diff_dictionaries(BankingDictionary.from_data(index.dictionary_data), dictionary)
+        if outcome.diff.requires_full_revalidation:
+            stale = None
+        else:
+            stale = index.files_using(outcome.diff.changed_symbols())
+
+    for ebl_path in ebl_paths:
+        path = str(Path(ebl_path).resolve())
+        digest = file_digest(path)
+        cached = index.files.get(path)
+
+        if cached and cached.sha256 == digest and stale is not None and path not in stale:
+            outcome.results[ebl_path] = (cached.errors, cached.warnings)
+            outcome.reused.append(ebl_path)
+            continue
+
+        recorder = RecordingDictionary(dictionary)
+        validator = check_banking_file(path, recorder)
+        index.record(path, FileEntry(
+            sha256=digest,
+            symbols=sorted(recorder.used),
+            errors=validator.get_errors(),
+            warnings=validator.get_warnings(),
+        ))
+        outcome.results[ebl_path] = (validator.get_errors(), validator.get_warnings())
+        outcome.validated.append(ebl_path)
+
+    index.dictionary_data = data
+    index.dictionary_fingerprint = current_fingerprint
+    index.save()
+    return outcome
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Usage: python incremental_validator.py <dictionary_json> <index_json> <ebl_file> [<ebl_file> ...]")
+        sys.exit(1)
+
+    run = revalidate_files(sys.argv[3:], sys.argv[1], sys.argv[2])
+
+    if run.diff is not None:
+        print("Dictionary changes:")
+        for line in run.diff.summary() or ["(none)"]:
+            print(f"  {line}")
+    print(f"Revalidated {len(run.validated)} file(s), reused {len(run.reused)} cached result(s)")
+
+    failed = [path for path, (errors, _) in run.results.items() if errors]
+    for path in failed:
+        print(f"❌ {path}: {len(run.results[path][0])} error(s)")
+    sys.exit(1 if failed else 0)
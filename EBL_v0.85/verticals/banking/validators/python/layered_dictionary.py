@@ -0,0 +1,218 @@
+"""
+Banking Vertical - Layered Tenant Dictionaries
+Shares one immutable base dictionary across tenants with small per-tenant overlays
+
+An overlay uses the same JSON shape as banking_dictionary_v0.85.json but only
+lists what the tenant adds: extra actors, verbs, DataObjects, actorVerbs and
+actorDataPerms entries (unioned with the base) and verbPermissions (overriding
+the base). Cold tenants resolve lookups through the overlay and then the base;
+hot tenants get a precomputed merged view that shares every base structure the
+overlay does not touch. Merged views are kept in an LRU and evicted when cold.
+"""
+
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+from dictionary_validator import BankingDictionary
+from vertical_validator import canonicalize
+
+
+class LayeredDictionary:
+    """Chained lookups: tenant overlay first, then the shared base"""
+
+    def __init__(self, base: BankingDictionary, overlay: BankingDictionary):
+        self.base = base
+        self.overlay = overlay
+
+    def has_actor(self, actor: str) -> bool:
+        """Check if actor exists in overlay or base"""
+        return self.overlay.has_actor(actor) or self.base.has_actor(actor)
+
+    def has_verb(self, verb: str) -> bool:
+        """Check if verb exists in overlay or base"""
+        return self.overlay.has_verb(verb) or self.base.has_verb(verb)
+
+    def has_entity(self, entity: str) -> bool:
+        """Check if entity exists in overlay or base"""
+        return self.overlay.has_entity(entity) or self.base.has_entity(entity)
+
+    def has_data_object(self, data_object: str) -> bool:
+        """Check if DataObject exists in overlay or base"""
+        return self.overlay.has_data_object(data_object) or self.base.has_data_object(data_object)
+
+    def actor_allows_verb(self, actor: str, verb: str) -> bool:
+        """Check actor's whitelist, unioned across layers"""
+        actor_canon = canonicalize(actor)
+        base_verbs = self.base.actor_verbs.get(actor_canon)
+        tenant_verbs = self.overlay.actor_verbs.get(actor_canon)
+        if not base_verbs and not tenant_verbs:  # If no whitelist, allow all
+            return True
+        verb_canon = canonicalize(verb)
+        return verb_canon in (tenant_verbs or ()) or verb_canon in (base_verbs or ())
+
+    def verb_permitted_by_any(self, verb: str) -> bool:
+        """Check if verb is permitted by at least one actor in either layer"""
+        if not self.base.all_permitted_verbs and not self.overlay.all_permitted_verbs:
+            return True
+        verb_canon = canonicalize(verb)
+        return verb_canon in self.overlay.all_permitted_verbs or verb_canon in self.base.all_permitted_verbs
+
+    def _actor_may(self, base_perms: Dict[str, Set[str]], tenant_perms: Dict[str, Set[str]],
+                   actor: str, data_object: str) -> bool:
+        actor_canon = canonicalize(actor)
+        base_set = base_perms.get(actor_canon)
+        tenant_set = tenant_perms.get(actor_canon)
+        if not base_set and not tenant_set:  # If no explicit perms, allow
+            return True
+        do_canon = canonicalize(data_object)
+        return do_canon in (tenant_set or ()) or do_canon in (base_set or ())
+
+    def actor_can_read(self, actor: str, data_object: str) -> bool:
+        """Check read permission, unioned across layers"""
+        return self._actor_may(self.base.actor_read_perms, self.overlay.actor_read_perms, actor, data_object)
+
+    def actor_can_write(self, actor: str, data_object: str) -> bool:
+        """Check write permission, unioned across layers"""
+        return self._actor_may(self.base.actor_write_perms, self.overlay.actor_write_perms, actor, data_object)
+
+    def is_relationship_type(self, rel_type: str) -> bool:
+        """Check if relationship type is valid in either layer"""
+        return self.overlay.is_relationship_type(rel_type) or self.base.is_relationship_type(rel_type)
+
+    def get_verb_permission(self, verb: str) -> Optional[str]:
+        """Tenant verbPermissions override the base"""
+        return self.overlay.get_verb_permission(verb) or self.base.get_verb_permission(verb)
+
+    @property
+    def relationship_types(self) -> Set[str]:
+        """All relationship types across layers"""
+        return self.base.relationship_types | self.overlay.relationship_types
+
+    def names(self, kind: str) -> List[str]:
+        """Names of one kind across layers, base first"""
+        return list(dict.fromkeys(self.base.names(kind) + self.overlay.names(kind)))
+
+    def _suggest(self, kind: str, name: str, limit: int) -> List[str]:
+        nearest = self.overlay.name_index(kind).nearest(name, limit) + self.base.name_index(kind).nearest(name, limit)
+        nearest.sort(key=lambda match: match[1])
+        return list(dict.fromkeys(n for n, _ in nearest))[:limit]
+
+    def suggest_actor(self, actor: str, limit: int = 3) -> List[str]:
+        """Suggest actors close to an unknown actor"""
+        return self._suggest('actor', actor, limit)
+
+    def suggest_verb(self, verb: str, limit: int = 3) -> List[str]:
+        """Suggest verbs close to an unknown verb"""
+        return self._suggest('verb', verb, limit)
+
+    def suggest_entity(self, entity: str, limit: int = 3) -> List[str]:
+        """Suggest entities close to an unknown entity"""
+        return self._suggest('entity', entity, limit)
+
+    def suggest_data_object(self, data_object: str, limit: int = 3) -> List[str]:
+        """Suggest DataObjects close to an unknown DataObject"""
+        return self._suggest('dataObject', data_object, limit)
+
+
+def merge_view(base: BankingDictionary, overlay: BankingDictionary) -> BankingDictionary:
+    """
+    Precompute a merged dictionary for a hot tenant
+
+    Only structures the overlay touches are copied; everything else is the
+    base's own object, so base structures must never be mutated in place.
+    """
+    view = copy.copy(base)
+
+    for attr in ('actors', 'verbs', 'entities', 'data_objects', 'relationship_types', 'all_permitted_verbs'):
+        added = getattr(overlay, attr)
+        if added:
+            setattr(view, attr, getattr(base, attr) | added)
+
+    if overlay.verb_permissions:
+        view.verb_permissions = {**base.verb_permissions, **overlay.verb_permissions}
+
+    for attr in ('actor_verbs', 'actor_read_perms', 'actor_write_perms'):
+        added = getattr(overlay, attr)
+        if added:
+            merged = dict(getattr(base, attr))
+            for actor, names in added.items():
+                merged[actor] = merged.get(actor, set()) | names
+            setattr(view, attr, merged)
+
+    view._name_lists = dict(base._name_lists)
+    view._name_indexes = dict(base._name_indexes)
+    for kind, names in overlay._name_lists.items():
+        if names:
+            view._name_lists[kind] = base._name_lists[kind] + names
+            view._name_indexes.pop(kind, None)
+
+    return view
+
+
+class TenantDictionaryRegistry:
+    """Serves per-tenant dictionaries over one shared base"""
+
+    def __init__(self, base: BankingDictionary, max_hot_views: int = 32, hot_threshold: int = 16):
+        """
+        Args:
+            base: Shared, immutable base dictionary
+            max_hot_views: Maximum number of merged views kept (LRU)
+            hot_threshold: Lookups of a tenant before its merged view is built
+        """
+        self.base = base
+        self.max_hot_views = max_hot_views
+        self.hot_threshold = hot_threshold
+        self._overlays: Dict[str, BankingDictionary] = {}
+        self._layered: Dict[str, LayeredDictionary] = {}
+        self._hits: Dict[str, int] = {}
+        self._hot: 'OrderedDict[str, BankingDictionary]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_overlay(self, tenant: str, overlay_data: Dict):
+        """Register (or replace) a tenant overlay from JSON data"""
+        overlay = BankingDictionary.from_data(overlay_data)
+        with self._lock:
+            self._overlays[tenant] = overlay
+            self._layered[tenant] = LayeredDictionary(self.base, overlay)
+            self._hits[tenant] = 0
+            self._hot.pop(tenant, None)
+
+    def load_overlay(self, tenant: str, overlay_path: str):
+        """Register a tenant overlay from a JSON file"""
+        with open(overlay_path, 'r') as f:
+            self.add_overlay(tenant, json.load(f))
+
+    def get(self, tenant: Optional[str]):
+        """
+        Dictionary for a tenant
+
+        Returns the base for unknown tenants, a merged view for hot tenants and
+        a chained LayeredDictionary otherwise.
+        """
+        with self._lock:
+            if tenant not in self._overlays:
+                return self.base
+
+            view = self._hot.get(tenant)
+            if view is not None:
+                self._hot.move_to_end(tenant)
+                return view
+
+            self._hits[tenant] += 1
+            if self._hits[tenant] < self.hot_threshold:
+                return self._layered[tenant]
+
+            view = merge_view(self.base, self._overlays[tenant])
+            self._hot[tenant] = view
+            while len(self._hot) > self.max_hot_views:
+                cold, _ = self._hot.popitem(last=False)
+                self._hits[cold] = 0
+            return view
+
+    def hot_tenants(self) -> List[str]:
+        """Tenants with a merged view, least recently used first"""
+        with self._lock:
+            return list(self._hot)
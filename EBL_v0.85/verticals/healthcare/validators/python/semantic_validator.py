@@ -1,10 +1,23 @@
 """
 Healthcare Vertical - Semantic Validator
 Validates Healthcare business logic and compliance
+
+Domain-specific rules: HIPAA, PHI Protection, FDA Compliance, Clinical Trial Protocols
+Rules are data-driven: see engine/rule_packs/healthcare.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for healthcare domain
-# Domain-specific rules: HIPAA, PHI Protection, FDA Compliance, Clinical Trial Protocols
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("Healthcare Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('healthcare', sys.argv))
@@ -1,9 +1,23 @@
 """
 Insurance Vertical - Dictionary Validator
-Validates Insurance EBL files against dictionary
+Validates Insurance EBL files against the insurance_dictionary_v0.85.json
+
+Runs on the shared vertical engine (engine/python/vertical_engine.py); names,
+permissions and wording come from engine/rule_packs/insurance.json.
+
+Usage:
+    python dictionary_validator.py <ebl_file> [dictionary_json]
 """
 
-# Template - customize for insurance domain
-# See banking/validators/python/dictionary_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_dictionary_cli
+
 
-print("Insurance Dictionary Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_dictionary_cli('insurance', sys.argv))
@@ -1,10 +1,23 @@
 """
 Insurance Vertical - Semantic Validator
 Validates Insurance business logic and compliance
+
+Domain-specific rules: NAIC Compliance, Claims Validation, Fraud Detection, Reserve Requirements
+Rules are data-driven: see engine/rule_packs/insurance.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for insurance domain
-# Domain-specific rules: NAIC Compliance, Claims Validation, Fraud Detection, Reserve Requirements
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("Insurance Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('insurance', sys.argv))
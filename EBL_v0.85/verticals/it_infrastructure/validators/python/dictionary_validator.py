@@ -1,9 +1,23 @@
 """
-IT_Infrastructure Vertical - Dictionary Validator
-Validates IT_Infrastructure EBL files against dictionary
+IT Infrastructure Vertical - Dictionary Validator
+Validates IT Infrastructure EBL files against the it_infrastructure_dictionary_v0.85.json
+
+Runs on the shared vertical engine (engine/python/vertical_engine.py); names,
+permissions and wording come from engine/rule_packs/it_infrastructure.json.
+
+Usage:
+    python dictionary_validator.py <ebl_file> [dictionary_json]
 """
 
-# Template - customize for it_infrastructure domain
-# See banking/validators/python/dictionary_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_dictionary_cli
+
 
-print("IT_Infrastructure Dictionary Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_dictionary_cli('it_infrastructure', sys.argv))
@@ -1,10 +1,23 @@
 """
-IT_Infrastructure Vertical - Semantic Validator
-Validates IT_Infrastructure business logic and compliance
+IT Infrastructure Vertical - Semantic Validator
+Validates IT Infrastructure business logic and compliance
+
+Domain-specific rules: SLO Compliance, Security Controls, Change Management, Incident Response
+Rules are data-driven: see engine/rule_packs/it_infrastructure.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for it_infrastructure domain
-# Domain-specific rules: SLO Compliance, Security Controls, Change Management, Incident Response
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("IT_Infrastructure Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('it_infrastructure', sys.argv))
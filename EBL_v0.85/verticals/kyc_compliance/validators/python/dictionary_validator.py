@@ -1,9 +1,23 @@
 """
-KYC_Compliance Vertical - Dictionary Validator
-Validates KYC_Compliance EBL files against dictionary
+KYC Compliance Vertical - Dictionary Validator
+Validates KYC Compliance EBL files against the kyc_compliance_dictionary_v0.85.json
+
+Runs on the shared vertical engine (engine/python/vertical_engine.py); names,
+permissions and wording come from engine/rule_packs/kyc_compliance.json.
+
+Usage:
+    python dictionary_validator.py <ebl_file> [dictionary_json]
 """
 
-# Template - customize for kyc_compliance domain
-# See banking/validators/python/dictionary_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_dictionary_cli
+
 
-print("KYC_Compliance Dictionary Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_dictionary_cli('kyc_compliance', sys.argv))
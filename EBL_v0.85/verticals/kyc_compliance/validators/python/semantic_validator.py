@@ -1,10 +1,23 @@
 """
-KYC_Compliance Vertical - Semantic Validator
-Validates KYC_Compliance business logic and compliance
+KYC Compliance Vertical - Semantic Validator
+Validates KYC Compliance business logic and compliance
+
+Domain-specific rules: KYC/AML Rules, Sanctions Screening, PEP Checks, SAR Filing
+Rules are data-driven: see engine/rule_packs/kyc_compliance.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for kyc_compliance domain
-# Domain-specific rules: KYC/AML Rules, Sanctions Screening, PEP Checks, SAR Filing
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("KYC_Compliance Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('kyc_compliance', sys.argv))
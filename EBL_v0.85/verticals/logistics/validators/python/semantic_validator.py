@@ -1,10 +1,23 @@
 """
 Logistics Vertical - Semantic Validator
 Validates Logistics business logic and compliance
+
+Domain-specific rules: Customs Compliance, Incoterms Validation, Route Optimization, Hazmat Rules
+Rules are data-driven: see engine/rule_packs/logistics.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for logistics domain
-# Domain-specific rules: Customs Compliance, Incoterms Validation, Route Optimization, Hazmat Rules
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("Logistics Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('logistics', sys.argv))
@@ -1,10 +1,23 @@
 """
 Retail Vertical - Semantic Validator
 Validates Retail business logic and compliance
+
+Domain-specific rules: PCI Compliance, Inventory Management, Pricing Rules, Omnichannel Logic
+Rules are data-driven: see engine/rule_packs/retail.json.
+
+Usage:
+    python semantic_validator.py <ebl_file>
 """
 
-# Template - customize for retail domain
-# Domain-specific rules: PCI Compliance, Inventory Management, Pricing Rules, Omnichannel Logic
-# See banking/validators/python/semantic_validator.py for full implementation
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_path = Path(__file__).parents[4] / 'engine' / 'python'
+sys.path.insert(0, str(engine_path))
+
+from vertical_engine import run_semantic_cli
+
 
-print("Retail Semantic Validator - TODO: Implement")
+if __name__ == '__main__':
+    sys.exit(run_semantic_cli('retail', sys.argv))